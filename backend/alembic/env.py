@@ -13,6 +13,17 @@ sys.path.insert(0, str(backend_dir))
 
 from src.database import db_settings, metadata
 from sqlmodel import SQLModel
+from src.analytics import models as analytics_models  # noqa: F401
+from src.applications import models as applications_models  # noqa: F401
+from src.ats import models as ats_models  # noqa: F401
+from src.auth import models as auth_models  # noqa: F401
+from src.cache import models as cache_models  # noqa: F401
+from src.embeddings import models as embeddings_models  # noqa: F401
+from src.jobs import models as jobs_models  # noqa: F401
+from src.resumes import models as resumes_models  # noqa: F401
+from src.search import models as search_models  # noqa: F401
+from src.skills import models as skills_models  # noqa: F401
+from src.tailoring import models as tailoring_models  # noqa: F401
 
 # Import all models here so Alembic can discover them for autogenerate
 # When you create new models, import them here (e.g., from src.models import User)
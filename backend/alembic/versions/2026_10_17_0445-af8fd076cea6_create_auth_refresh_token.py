@@ -0,0 +1,37 @@
+"""create auth_refresh_token
+
+Revision ID: af8fd076cea6
+Revises: 
+Create Date: 2026-10-17 04:45:12.418306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'af8fd076cea6'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'auth_refresh_token',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('token_hash', sa.String(length=64), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id', name=op.f('auth_refresh_token_pkey')),
+        sa.UniqueConstraint('token_hash', name=op.f('auth_refresh_token_token_hash_key')),
+    )
+    op.create_index(op.f('auth_refresh_token_user_id_idx'), 'auth_refresh_token', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('auth_refresh_token_user_id_idx'), table_name='auth_refresh_token')
+    op.drop_table('auth_refresh_token')
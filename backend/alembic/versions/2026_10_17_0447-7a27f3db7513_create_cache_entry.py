@@ -0,0 +1,42 @@
+"""create cache_entry
+
+Revision ID: 7a27f3db7513
+Revises: af8fd076cea6
+Create Date: 2026-10-17 04:47:36.448249
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a27f3db7513'
+down_revision: Union[str, None] = 'af8fd076cea6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # UNLOGGED: no WAL writes, truncated after a crash and not replicated
+    op.create_table(
+        'cache_entry',
+        sa.Column('key', sa.String(length=64), nullable=False),
+        sa.Column('body', sa.LargeBinary(), nullable=False),
+        sa.Column('media_type', sa.String(length=255), nullable=False),
+        sa.Column('etag', sa.String(length=64), nullable=False),
+        sa.Column('tags', postgresql.ARRAY(sa.Text()), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key', name=op.f('cache_entry_pkey')),
+        prefixes=['UNLOGGED'],
+    )
+    op.create_index(op.f('cache_entry_expires_at_idx'), 'cache_entry', ['expires_at'], unique=False)
+    op.create_index('cache_entry_tags_idx', 'cache_entry', ['tags'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('cache_entry_tags_idx', table_name='cache_entry', postgresql_using='gin')
+    op.drop_index(op.f('cache_entry_expires_at_idx'), table_name='cache_entry')
+    op.drop_table('cache_entry')
@@ -0,0 +1,36 @@
+"""create skill_analysis
+
+Revision ID: 267386d6f0e3
+Revises: 7a27f3db7513
+Create Date: 2026-10-17 04:49:45.763285
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '267386d6f0e3'
+down_revision: Union[str, None] = '7a27f3db7513'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'skill_analysis',
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('prompt_version', sa.String(length=32), nullable=False),
+        sa.Column('skills', postgresql.ARRAY(sa.Text()), nullable=False),
+        sa.Column('related_skills', postgresql.ARRAY(sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('content_hash', 'model', 'prompt_version', name=op.f('skill_analysis_pkey')),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('skill_analysis')
@@ -0,0 +1,55 @@
+"""create job
+
+Revision ID: ebd95f62d227
+Revises: 267386d6f0e3
+Create Date: 2026-10-17 05:12:50.052484
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ebd95f62d227'
+down_revision: Union[str, None] = '267386d6f0e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('kind', sa.String(length=100), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'::jsonb"), nullable=False),
+        sa.Column('status', sa.String(length=16), server_default='queued', nullable=False),
+        sa.Column('priority', sa.SmallInteger(), server_default='0', nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('idempotency_key', sa.String(length=255), nullable=True),
+        sa.Column('attempts', sa.SmallInteger(), server_default='0', nullable=False),
+        sa.Column('max_attempts', sa.SmallInteger(), nullable=False),
+        sa.Column('run_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('locked_by', sa.String(length=100), nullable=True),
+        sa.Column('locked_until', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id', name=op.f('job_pkey')),
+    )
+    op.create_index('job_dequeue_idx', 'job', [sa.literal_column('priority DESC'), 'run_at', 'id'], unique=False, postgresql_where=sa.text("status = 'queued'"))
+    op.create_index('job_lease_idx', 'job', ['locked_until'], unique=False, postgresql_where=sa.text("status = 'running'"))
+    op.create_index('job_user_id_created_at_idx', 'job', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('job_user_id_idempotency_key_idx', 'job', ['user_id', 'idempotency_key'], unique=True, postgresql_nulls_not_distinct=True, postgresql_where=sa.text('idempotency_key IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('job_user_id_idempotency_key_idx', table_name='job', postgresql_where=sa.text('idempotency_key IS NOT NULL'))
+    op.drop_index('job_user_id_created_at_idx', table_name='job')
+    op.drop_index('job_lease_idx', table_name='job', postgresql_where=sa.text("status = 'running'"))
+    op.drop_index('job_dequeue_idx', table_name='job', postgresql_where=sa.text("status = 'queued'"))
+    op.drop_table('job')
@@ -0,0 +1,43 @@
+"""create job application
+
+Revision ID: 0ed985442c25
+Revises: ebd95f62d227
+Create Date: 2026-10-17 05:26:26.854108
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0ed985442c25'
+down_revision: Union[str, None] = 'ebd95f62d227'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_application',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('company', sa.String(length=255), nullable=False),
+        sa.Column('position', sa.String(length=255), nullable=False),
+        sa.Column('status', sa.String(length=32), server_default='applied', nullable=False),
+        sa.Column('job_url', sa.Text(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('applied_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deadline_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id', name=op.f('job_application_pkey')),
+    )
+    op.create_index('job_application_user_id_id_idx', 'job_application', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('job_application_user_id_id_idx', table_name='job_application')
+    op.drop_table('job_application')
+
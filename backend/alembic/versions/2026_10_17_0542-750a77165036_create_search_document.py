@@ -0,0 +1,46 @@
+"""create search document
+
+Revision ID: 750a77165036
+Revises: 0ed985442c25
+Create Date: 2026-10-17 05:42:13.921700
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '750a77165036'
+down_revision: Union[str, None] = '0ed985442c25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram operator classes, and GIN over the leading integer user_id
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gin')
+    op.create_table(
+        'search_document',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=32), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('company', sa.String(length=255), nullable=True),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || setweight(to_tsvector('english'::regconfig, coalesce(company, '')), 'A') || setweight(to_tsvector('english'::regconfig, body), 'B')", persisted=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id', name=op.f('search_document_pkey')),
+    )
+    op.create_index('search_document_user_id_company_idx', 'search_document', ['user_id', 'company'], unique=False, postgresql_using='gin', postgresql_ops={'company': 'gin_trgm_ops'})
+    op.create_index('search_document_user_id_search_vector_idx', 'search_document', ['user_id', 'search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('search_document_user_id_search_vector_idx', table_name='search_document', postgresql_using='gin')
+    op.drop_index('search_document_user_id_company_idx', table_name='search_document', postgresql_using='gin', postgresql_ops={'company': 'gin_trgm_ops'})
+    op.drop_table('search_document')
+    # The extensions stay: other objects may use them
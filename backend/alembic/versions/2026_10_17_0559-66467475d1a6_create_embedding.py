@@ -0,0 +1,38 @@
+"""create embedding
+
+Revision ID: 66467475d1a6
+Revises: 750a77165036
+Create Date: 2026-10-17 05:59:17.200555
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '66467475d1a6'
+down_revision: Union[str, None] = '750a77165036'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'embedding',
+        sa.Column('kind', sa.String(length=32), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('chunk', sa.SmallInteger(), server_default='0', nullable=False),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('vector', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('kind', 'model', 'key', 'chunk', name=op.f('embedding_pkey')),
+    )
+    op.create_index('embedding_kind_model_created_at_idx', 'embedding', ['kind', 'model', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('embedding_kind_model_created_at_idx', table_name='embedding')
+    op.drop_table('embedding')
@@ -0,0 +1,40 @@
+"""create tailored section
+
+Revision ID: 06938bee737e
+Revises: 66467475d1a6
+Create Date: 2026-10-17 06:02:57.523625
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '06938bee737e'
+down_revision: Union[str, None] = '66467475d1a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tailored_section',
+        sa.Column('section_hash', sa.String(length=64), nullable=False),
+        sa.Column('job_description_hash', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('prompt_version', sa.String(length=32), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('latex', sa.Text(), nullable=False),
+        sa.Column('input_tokens', sa.Integer(), nullable=False),
+        sa.Column('output_tokens', sa.Integer(), nullable=False),
+        sa.Column('latency_ms', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('section_hash', 'job_description_hash', 'model', 'prompt_version', name=op.f('tailored_section_pkey')),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('tailored_section')
+
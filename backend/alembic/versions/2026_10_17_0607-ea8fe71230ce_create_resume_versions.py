@@ -0,0 +1,59 @@
+"""create resume versions
+
+Revision ID: ea8fe71230ce
+Revises: 06938bee737e
+Create Date: 2026-10-17 06:07:23.728347
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'ea8fe71230ce'
+down_revision: Union[str, None] = '06938bee737e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'resume',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('latest_version', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id', name=op.f('resume_pkey')),
+    )
+    op.create_index('resume_user_id_id_idx', 'resume', ['user_id', 'id'], unique=False)
+    op.create_table(
+        'resume_diff',
+        sa.Column('resume_id', sa.BigInteger(), nullable=False),
+        sa.Column('from_version', sa.Integer(), nullable=False),
+        sa.Column('to_version', sa.Integer(), nullable=False),
+        sa.Column('diff', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('resume_id', 'from_version', 'to_version', name=op.f('resume_diff_pkey')),
+    )
+    op.create_table(
+        'resume_version',
+        sa.Column('resume_id', sa.BigInteger(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=16), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('section_count', sa.SmallInteger(), nullable=False),
+        sa.Column('message', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('resume_id', 'version', name=op.f('resume_version_pkey')),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('resume_version')
+    op.drop_table('resume_diff')
+    op.drop_index('resume_user_id_id_idx', table_name='resume')
+    op.drop_table('resume')
@@ -0,0 +1,38 @@
+"""create ats score
+
+Revision ID: a73f0f5f35e3
+Revises: ea8fe71230ce
+Create Date: 2026-10-17 06:13:47.004765
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a73f0f5f35e3'
+down_revision: Union[str, None] = 'ea8fe71230ce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ats_score',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('resume_id', sa.BigInteger(), nullable=False),
+        sa.Column('resume_version', sa.Integer(), nullable=False),
+        sa.Column('job_description_id', sa.BigInteger(), nullable=False),
+        sa.Column('score', sa.SmallInteger(), nullable=False),
+        sa.Column('rules_version', sa.String(length=16), nullable=False),
+        sa.Column('scored_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'resume_id', 'resume_version', 'job_description_id', name=op.f('ats_score_pkey')),
+    )
+    op.create_index('ats_score_user_id_score_idx', 'ats_score', ['user_id', 'score', 'resume_id', 'resume_version', 'job_description_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ats_score_user_id_score_idx', table_name='ats_score')
+    op.drop_table('ats_score')
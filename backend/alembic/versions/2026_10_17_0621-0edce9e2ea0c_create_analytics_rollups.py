@@ -0,0 +1,225 @@
+"""create analytics rollups
+
+Revision ID: 0edce9e2ea0c
+Revises: a73f0f5f35e3
+Create Date: 2026-10-17 06:21:07.353678
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0edce9e2ea0c'
+down_revision: Union[str, None] = 'a73f0f5f35e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (rollup, source table, key columns, counted columns, changes of a set of
+# source rows: {rows} is the transition table, {sign} 1 or -1)
+ROLLUPS = (
+    (
+        'analytics_application_week',
+        'job_application',
+        ('user_id', 'week', 'status'),
+        ('applications',),
+        'SELECT user_id, analytics_week(coalesce(applied_at, created_at)) AS week, status, '
+        '{sign} AS applications FROM {rows}',
+    ),
+    (
+        'analytics_ats_version',
+        'ats_score',
+        ('user_id', 'resume_id', 'resume_version'),
+        ('scores', 'score_total'),
+        'SELECT user_id, resume_id, resume_version, {sign} AS scores, '
+        '{sign} * score AS score_total FROM {rows}',
+    ),
+    (
+        'analytics_skill_week',
+        'analytics_document_skills',
+        ('user_id', 'week', 'skill'),
+        ('job_count',),
+        'SELECT user_id, week, unnest(skills) AS skill, {sign} AS job_count FROM {rows}',
+    ),
+)
+EVENTS = (
+    ('INSERT', 'NEW TABLE AS new_rows'),
+    ('UPDATE', 'OLD TABLE AS old_rows NEW TABLE AS new_rows'),
+    ('DELETE', 'OLD TABLE AS old_rows'),
+)
+
+# Trends: the 4 weeks up to this one (TREND_WEEKS) and the 4 before
+SKILL_DEMAND_VIEW = """
+CREATE MATERIALIZED VIEW analytics_skill_demand AS
+WITH totals AS (
+    SELECT user_id, count(*) AS job_descriptions FROM analytics_document_skills GROUP BY user_id
+)
+SELECT
+    skills.user_id,
+    skills.skill,
+    sum(skills.job_count)::integer AS job_count,
+    round(sum(skills.job_count)::numeric / totals.job_descriptions, 3)::float8 AS share,
+    coalesce(sum(skills.job_count) FILTER (
+        WHERE skills.week >= analytics_week(now()) - 21
+    ), 0)::integer AS recent,
+    coalesce(sum(skills.job_count) FILTER (
+        WHERE skills.week >= analytics_week(now()) - 49 AND skills.week < analytics_week(now()) - 21
+    ), 0)::integer AS previous,
+    now() AS refreshed_at
+FROM analytics_skill_week AS skills
+JOIN totals USING (user_id)
+GROUP BY skills.user_id, skills.skill, totals.job_descriptions
+HAVING sum(skills.job_count) > 0
+"""
+MARKET_SKILL_VIEW = """
+CREATE MATERIALIZED VIEW analytics_market_skill AS
+WITH totals AS (
+    SELECT count(*) AS job_descriptions FROM analytics_document_skills
+)
+SELECT
+    skills.skill,
+    count(DISTINCT skills.user_id) FILTER (WHERE skills.job_count > 0)::integer AS users,
+    sum(skills.job_count)::integer AS job_count,
+    round(sum(skills.job_count)::numeric / totals.job_descriptions, 3)::float8 AS share,
+    coalesce(sum(skills.job_count) FILTER (
+        WHERE skills.week >= analytics_week(now()) - 21
+    ), 0)::integer AS recent,
+    coalesce(sum(skills.job_count) FILTER (
+        WHERE skills.week >= analytics_week(now()) - 49 AND skills.week < analytics_week(now()) - 21
+    ), 0)::integer AS previous,
+    now() AS refreshed_at
+FROM analytics_skill_week AS skills
+CROSS JOIN totals
+GROUP BY skills.skill, totals.job_descriptions
+HAVING sum(skills.job_count) > 0
+"""
+
+
+def _upsert(rollup: str, keys: Sequence[str], values: Sequence[str], changes: str) -> str:
+    # Aggregate the changes per rollup row, then apply them in key order (so
+    # concurrent statements lock rollup rows in the same order)
+    key_list = ', '.join(keys)
+    return (
+        f'INSERT INTO {rollup} AS rollup ({key_list}, {", ".join(values)}) '
+        f'SELECT {key_list}, {", ".join(f"sum({value})" for value in values)} '
+        f'FROM ({changes}) AS changes GROUP BY {key_list} '
+        f'HAVING {" OR ".join(f"sum({value}) <> 0" for value in values)} '
+        f'ORDER BY {key_list} '
+        f'ON CONFLICT ({key_list}) DO UPDATE SET '
+        + ', '.join(f'{value} = rollup.{value} + excluded.{value}' for value in values)
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        'analytics_application_week',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('week', sa.Date(), nullable=False),
+        sa.Column('status', sa.String(length=32), nullable=False),
+        sa.Column('applications', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'week', 'status', name=op.f('analytics_application_week_pkey')),
+    )
+    op.create_table(
+        'analytics_ats_version',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('resume_id', sa.BigInteger(), nullable=False),
+        sa.Column('resume_version', sa.Integer(), nullable=False),
+        sa.Column('scores', sa.Integer(), nullable=False),
+        sa.Column('score_total', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'resume_id', 'resume_version', name=op.f('analytics_ats_version_pkey')),
+    )
+    op.create_table(
+        'analytics_document_skills',
+        sa.Column('document_id', sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('week', sa.Date(), nullable=False),
+        sa.Column('skills', postgresql.ARRAY(sa.Text()), nullable=False),
+        sa.Column('analysed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('document_id', name=op.f('analytics_document_skills_pkey')),
+    )
+    op.create_table(
+        'analytics_skill_week',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('week', sa.Date(), nullable=False),
+        sa.Column('skill', sa.Text(), nullable=False),
+        sa.Column('job_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'week', 'skill', name=op.f('analytics_skill_week_pkey')),
+    )
+
+    # Monday (UTC) of the week of a timestamp
+    op.execute(
+        'CREATE FUNCTION analytics_week(timestamptz) RETURNS date '
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE RETURN date_trunc('week', $1 AT TIME ZONE 'UTC')::date"
+    )
+    # Statement-level triggers: one aggregated upsert per statement, whatever
+    # the number of rows it changed (bulk imports, scoring jobs)
+    for rollup, source, keys, values, changes in ROLLUPS:
+        added = changes.format(rows='new_rows', sign='1')
+        removed = changes.format(rows='old_rows', sign='-1')
+        op.execute(
+            f'CREATE FUNCTION {rollup}_apply() RETURNS trigger LANGUAGE plpgsql AS $$\n'
+            'BEGIN\n'
+            "    IF TG_OP = 'INSERT' THEN\n"
+            f'        {_upsert(rollup, keys, values, added)};\n'
+            "    ELSIF TG_OP = 'DELETE' THEN\n"
+            f'        {_upsert(rollup, keys, values, removed)};\n'
+            '    ELSE\n'
+            f'        {_upsert(rollup, keys, values, f"{added} UNION ALL {removed}")};\n'
+            '    END IF;\n'
+            '    RETURN NULL;\n'
+            'END\n'
+            '$$'
+        )
+        for event, tables in EVENTS:
+            op.execute(
+                f'CREATE TRIGGER {rollup}_{event.lower()} AFTER {event} ON {source} '
+                f'REFERENCING {tables} FOR EACH STATEMENT EXECUTE FUNCTION {rollup}_apply()'
+            )
+        # Existing rows
+        op.execute(_upsert(rollup, keys, values, changes.format(rows=source, sign='1')))
+
+    # Skills of deleted job descriptions no longer count
+    op.execute(
+        'CREATE FUNCTION analytics_document_skills_delete() RETURNS trigger LANGUAGE plpgsql AS $$\n'
+        'BEGIN\n'
+        '    DELETE FROM analytics_document_skills WHERE document_id IN (SELECT id FROM old_rows);\n'
+        '    RETURN NULL;\n'
+        'END\n'
+        '$$'
+    )
+    op.execute(
+        'CREATE TRIGGER analytics_document_skills_delete AFTER DELETE ON search_document '
+        'REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT '
+        'EXECUTE FUNCTION analytics_document_skills_delete()'
+    )
+
+    # Unique indexes, so the views can be refreshed concurrently; in the order
+    # the dashboards read them
+    op.execute(SKILL_DEMAND_VIEW)
+    op.execute(
+        'CREATE UNIQUE INDEX analytics_skill_demand_user_id_job_count_idx '
+        'ON analytics_skill_demand (user_id, job_count DESC, skill)'
+    )
+    op.execute(MARKET_SKILL_VIEW)
+    op.execute(
+        'CREATE UNIQUE INDEX analytics_market_skill_job_count_idx '
+        'ON analytics_market_skill (job_count DESC, skill)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP MATERIALIZED VIEW analytics_market_skill')
+    op.execute('DROP MATERIALIZED VIEW analytics_skill_demand')
+    op.execute('DROP TRIGGER analytics_document_skills_delete ON search_document')
+    op.execute('DROP FUNCTION analytics_document_skills_delete()')
+    for rollup, source, _, _, _ in reversed(ROLLUPS):
+        for event, _ in EVENTS:
+            op.execute(f'DROP TRIGGER {rollup}_{event.lower()} ON {source}')
+        op.execute(f'DROP FUNCTION {rollup}_apply()')
+    op.execute('DROP FUNCTION analytics_week(timestamptz)')
+    op.drop_table('analytics_skill_week')
+    op.drop_table('analytics_document_skills')
+    op.drop_table('analytics_ats_version')
+    op.drop_table('analytics_application_week')
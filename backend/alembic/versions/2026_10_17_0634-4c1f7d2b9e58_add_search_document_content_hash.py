@@ -0,0 +1,80 @@
+"""add search document content hash
+
+Revision ID: 4c1f7d2b9e58
+Revises: 0edce9e2ea0c
+Create Date: 2026-10-17 06:34:41.508127
+
+"""
+import hashlib
+import re
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1f7d2b9e58'
+down_revision: Union[str, None] = '0edce9e2ea0c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Frozen copy of the application's job description hashing at this revision
+# (src/skills/utils.py), the key of the skill analyses: a later change to the
+# application's normalization must not change what this revision writes
+HORIZONTAL_WHITESPACE = re.compile(r'[^\S\n]+')
+BLANK_LINES = re.compile(r'\n{3,}')
+ZERO_WIDTH = dict.fromkeys(map(ord, '\u200b\u200c\u200d\u2060\ufeff'))
+
+
+def content_hash(body: str) -> str:
+    text = unicodedata.normalize('NFKC', body).translate(ZERO_WIDTH)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    lines = (HORIZONTAL_WHITESPACE.sub(' ', line).strip() for line in text.split('\n'))
+    normalized = BLANK_LINES.sub('\n\n', '\n'.join(lines)).strip()
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column('search_document', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+    # Existing job descriptions, in id order
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT id, body FROM search_document WHERE kind = 'job_description' AND id > :last_id "
+                'ORDER BY id LIMIT :limit'
+            ),
+            {'last_id': last_id, 'limit': BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            sa.text('UPDATE search_document SET content_hash = :content_hash WHERE id = :id'),
+            [
+                {'id': row.id, 'content_hash': content_hash(row.body)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    op.create_index(
+        'search_document_user_id_content_hash_idx',
+        'search_document',
+        ['user_id', 'content_hash'],
+        unique=False,
+        postgresql_where=sa.text('content_hash IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'search_document_user_id_content_hash_idx',
+        table_name='search_document',
+        postgresql_where=sa.text('content_hash IS NOT NULL'),
+    )
+    op.drop_column('search_document', 'content_hash')
@@ -0,0 +1,46 @@
+"""add embedding user id
+
+Revision ID: 9b3e6a1d4f20
+Revises: 4c1f7d2b9e58
+Create Date: 2026-10-17 06:52:13.284519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3e6a1d4f20'
+down_revision: Union[str, None] = '4c1f7d2b9e58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Passages were keyed by content hash, shared by every user who saved the
+    # job description: embed them again, per saved job description and owned
+    # by its user, with one ingestion job per user (5 attempts, the default)
+    op.execute("DELETE FROM embedding WHERE kind = 'job_description_chunk'")
+    op.execute(
+        "INSERT INTO job (kind, payload, user_id, max_attempts) "
+        "SELECT DISTINCT 'embeddings.ingest', '{\"document_ids\": null}'::jsonb, user_id, 5 "
+        "FROM search_document WHERE kind = 'job_description'"
+    )
+    op.add_column('embedding', sa.Column('user_id', sa.Integer(), nullable=True))
+    op.create_index(
+        'embedding_user_id_kind_model_idx',
+        'embedding',
+        ['user_id', 'kind', 'model'],
+        unique=False,
+        postgresql_where=sa.text('user_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'embedding_user_id_kind_model_idx',
+        table_name='embedding',
+        postgresql_where=sa.text('user_id IS NOT NULL'),
+    )
+    op.drop_column('embedding', 'user_id')
@@ -0,0 +1,278 @@
+"""
+Analytics rollups: dashboard reads vs GROUP BY on every view, and trigger cost.
+
+Generates the history of a heavy user (``--applications`` applications over
+two years, ``--job-descriptions`` saved job descriptions whose skills are
+extracted with ``extract_skills``) and of ``--users`` other users (their
+extracted skills only, ``--market-documents`` job descriptions in all), then
+reports:
+
+- inserting and updating applications with the rollup triggers, against the
+  same statements with triggers disabled (``session_replication_role``)
+- skill extraction throughput
+- refreshing the materialized views
+- p50/p95 of each dashboard query (what the endpoints run) against computing
+  the same figures from the source tables; both must agree
+
+Requires a reachable, migrated database (``DATABASE_URL`` or the ``POSTGRES_*``
+settings) whose user may set ``session_replication_role`` (a superuser). The
+benchmark users' rows are deleted before and after the run.
+
+Usage:
+    python -m benchmarks.analytics [--applications 100000] [--job-descriptions 2000]
+        [--users 2000] [--market-documents 200000] [--requests 200]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import orjson
+from sqlalchemy import text
+
+from src.analytics import get_analytics_settings
+from src.analytics.service import (
+    application_funnel,
+    extract_skills,
+    market_skill_demand,
+    refresh_views,
+    skill_demand,
+)
+from src.database import AsyncSessionLocal, close_db, get_engine, init_db
+from src.skills.constants import SKILL_ALIASES
+
+USER_ID = 2_000_000_501
+WORDS = ("backend", "platform", "services", "data", "pipelines", "reliability", "mentoring")
+# Benchmark job descriptions of other users have no search document
+MARKET_DOCUMENT_IDS = 9_000_000_000_000
+
+INSERT_APPLICATIONS = text(
+    "INSERT INTO job_application (user_id, company, position, status, applied_at) "
+    "SELECT :user_id, 'Company ' || n % 500, 'Engineer', "
+    "(ARRAY['saved', 'applied', 'interviewing', 'offer', 'rejected', 'withdrawn'])[n % 6 + 1], "
+    "now() - (n % 730) * interval '1 day' FROM generate_series(1, :rows) AS n"
+)
+FUNNEL_FROM_SOURCE = text(
+    "SELECT status, count(*) FROM job_application WHERE user_id = :user_id GROUP BY status"
+)
+DEMAND_FROM_SOURCE = text(
+    "SELECT skill, count(*) AS job_count FROM analytics_document_skills, unnest(skills) AS skill "
+    "WHERE user_id = :user_id GROUP BY skill ORDER BY job_count DESC, skill LIMIT 20"
+)
+MARKET_FROM_SOURCE = text(
+    "SELECT skill, count(*) AS job_count FROM analytics_document_skills, unnest(skills) AS skill "
+    "GROUP BY skill HAVING count(DISTINCT user_id) >= :min_users "
+    "ORDER BY job_count DESC, skill LIMIT 20"
+)
+
+
+def summary(timings: list[float]) -> str:
+    p95 = statistics.quantiles(timings, n=20)[18]
+    return f"{statistics.median(timings) * 1000:>10.2f}{p95 * 1000:>10.2f}"
+
+
+async def execute(statement: Any, parameters: dict[str, Any] | None = None) -> None:
+    async with get_engine().begin() as conn:
+        await conn.execute(statement, parameters or {})
+
+
+async def delete_rows(users: int) -> None:
+    users_range = {"first": USER_ID, "last": USER_ID + users}
+    for table in (
+        "job_application",
+        "search_document",
+        "analytics_document_skills",
+        "analytics_application_week",
+        "analytics_skill_week",
+        "job",
+    ):
+        await execute(
+            text(f"DELETE FROM {table} WHERE user_id BETWEEN :first AND :last"), users_range
+        )
+    await refresh_views(get_engine())
+
+
+async def timed_write(statement: Any, parameters: dict[str, Any], *, triggers: bool) -> float:
+    """Seconds to run a statement, with or without triggers; rolled back."""
+    async with get_engine().connect() as conn:
+        if not triggers:
+            await conn.execute(text("SET LOCAL session_replication_role = replica"))
+        started = time.perf_counter()
+        await conn.execute(statement, parameters)
+        elapsed = time.perf_counter() - started
+        await conn.rollback()
+    return elapsed
+
+
+async def time_writes(applications: int) -> None:
+    print(f"\n{'write':<44}{'triggers s':>12}{'without s':>12}")
+    insert = {"user_id": USER_ID, "rows": applications}
+    with_triggers = await timed_write(INSERT_APPLICATIONS, insert, triggers=True)
+    without = await timed_write(INSERT_APPLICATIONS, insert, triggers=False)
+    print(f"{f'insert {applications} applications':<44}{with_triggers:>12.3f}{without:>12.3f}")
+    update = text(
+        "UPDATE job_application SET status = 'rejected' "
+        "WHERE user_id = :user_id AND status = 'interviewing'"
+    )
+    with_triggers = await timed_write(update, {"user_id": USER_ID}, triggers=True)
+    without = await timed_write(update, {"user_id": USER_ID}, triggers=False)
+    print(f"{'update every interview to rejected':<44}{with_triggers:>12.3f}{without:>12.3f}")
+    one = text(
+        "UPDATE job_application SET status = 'offer' WHERE id = "
+        "(SELECT min(id) FROM job_application WHERE user_id = :user_id)"
+    )
+    timings: list[list[float]] = [[], []]
+    for _ in range(50):
+        timings[0].append(await timed_write(one, {"user_id": USER_ID}, triggers=True))
+        timings[1].append(await timed_write(one, {"user_id": USER_ID}, triggers=False))
+    print(
+        f"{'update one application (p50)':<44}{statistics.median(timings[0]):>12.4f}"
+        f"{statistics.median(timings[1]):>12.4f}"
+    )
+
+
+async def generate_skills(job_descriptions: int, users: int, market_documents: int) -> None:
+    rng = random.Random(25)
+    skills = list(SKILL_ALIASES)
+    await execute(
+        text(
+            "INSERT INTO search_document (user_id, kind, title, body, created_at) "
+            "VALUES (:user_id, 'job_description', 'Engineer', :body, :created_at)"
+        ),
+        [
+            {
+                "user_id": USER_ID,
+                "body": " ".join(rng.sample(skills, rng.randint(3, 10)) + rng.sample(WORDS, 5)),
+                "created_at": datetime(2026, rng.randint(1, 9), rng.randint(1, 28), 12, tzinfo=UTC),
+            }
+            for _ in range(job_descriptions)
+        ],
+    )
+    started = time.perf_counter()
+    extracted = await extract_skills(get_engine(), USER_ID, get_analytics_settings())
+    elapsed = time.perf_counter() - started
+    print(
+        f"\nextracted the skills of {extracted} job descriptions in {elapsed:.2f} s "
+        f"({extracted / elapsed:.0f}/s)"
+    )
+    # Other users: skills only, in one statement per 10k rows
+    rows = [
+        {
+            "document_id": MARKET_DOCUMENT_IDS + number,
+            "user_id": USER_ID + 1 + number % users,
+            "week": f"2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}",
+            "skills": rng.sample(skills, rng.randint(3, 10)),
+        }
+        for number in range(market_documents)
+    ]
+    for start in range(0, len(rows), 10_000):
+        await execute(
+            text(
+                "INSERT INTO analytics_document_skills (document_id, user_id, week, skills) "
+                "SELECT document_id, user_id, analytics_week(week::timestamptz), skills "
+                "FROM jsonb_to_recordset(CAST(:rows AS jsonb)) "
+                "AS r(document_id bigint, user_id integer, week text, skills text[])"
+            ),
+            {"rows": orjson.dumps(rows[start : start + 10_000]).decode()},
+        )
+
+
+async def compare(
+    name: str,
+    rollup: Callable[[], Awaitable[Any]],
+    source: Callable[[], Awaitable[Any]],
+    requests: int,
+) -> None:
+    assert await rollup() == await source(), name
+    rollup_timings, source_timings = [], []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await rollup()
+        rollup_timings.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        await source()
+        source_timings.append(time.perf_counter() - started)
+    print(f"{name:<28}{'rollup':<10}{summary(rollup_timings)}")
+    print(f"{'':<28}{'GROUP BY':<10}{summary(source_timings)}")
+
+
+async def time_reads(requests: int) -> None:
+    config = get_analytics_settings()
+
+    async def funnel() -> dict[str, int]:
+        async with AsyncSessionLocal() as session:
+            return (await application_funnel(session, USER_ID)).by_status
+
+    async def funnel_from_source() -> dict[str, int]:
+        async with AsyncSessionLocal() as session:
+            rows = await session.execute(FUNNEL_FROM_SOURCE, {"user_id": USER_ID})
+            return dict(rows.all())
+
+    async def demand() -> list[tuple[str, int]]:
+        async with AsyncSessionLocal() as session:
+            response = await skill_demand(session, USER_ID, 20)
+        return [(skill.skill, skill.job_count) for skill in response.skills]
+
+    async def demand_from_source() -> list[tuple[str, int]]:
+        async with AsyncSessionLocal() as session:
+            rows = await session.execute(DEMAND_FROM_SOURCE, {"user_id": USER_ID})
+            return [tuple(row) for row in rows.all()]
+
+    async def market() -> list[tuple[str, int]]:
+        async with AsyncSessionLocal() as session:
+            response = await market_skill_demand(session, 20, config)
+        return [(skill.skill, skill.job_count) for skill in response.skills]
+
+    async def market_from_source() -> list[tuple[str, int]]:
+        async with AsyncSessionLocal() as session:
+            rows = await session.execute(
+                MARKET_FROM_SOURCE, {"min_users": config.analytics_market_min_users}
+            )
+            return [tuple(row) for row in rows.all()]
+
+    print(f"\n{'dashboard query':<28}{'from':<10}{'p50 ms':>10}{'p95 ms':>10}")
+    await compare("application funnel", funnel, funnel_from_source, requests)
+    await compare("skill demand (user)", demand, demand_from_source, requests)
+    await compare("skill demand (market)", market, market_from_source, max(requests // 10, 20))
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    await init_db()
+    await delete_rows(arguments.users)
+    try:
+        await execute(INSERT_APPLICATIONS, {"user_id": USER_ID, "rows": arguments.applications})
+        print(
+            f"{arguments.applications} applications and {arguments.job_descriptions} job "
+            f"descriptions of one user; {arguments.market_documents} job descriptions of "
+            f"{arguments.users} other users"
+        )
+        await time_writes(arguments.applications)
+        await generate_skills(
+            arguments.job_descriptions, arguments.users, arguments.market_documents
+        )
+        started = time.perf_counter()
+        await refresh_views(get_engine())
+        print(f"refreshed the materialized views in {time.perf_counter() - started:.2f} s")
+        await time_reads(arguments.requests)
+    finally:
+        await delete_rows(arguments.users)
+        await execute(
+            text("DELETE FROM analytics_document_skills WHERE document_id >= :first"),
+            {"first": MARKET_DOCUMENT_IDS},
+        )
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--applications", type=int, default=100_000)
+    parser.add_argument("--job-descriptions", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--market-documents", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,186 @@
+"""
+ATS scoring: a 10k x 10k matrix of resumes and job descriptions, in batches.
+
+Generates ``--resumes`` resumes and ``--job-descriptions`` job descriptions
+(skills, a Zipf-distributed vocabulary of industry and filler words) and times
+``AtsScorer``:
+
+- tokenizing every document (cold cache), then scoring every pair
+- scoring every pair again with the features cached, in the calling thread
+  and with ``--workers`` processes over shared memory
+- scoring again after 1% of the resumes were edited (only those are tokenized)
+- scoring pair by pair in Python on a sample, extrapolated to the full matrix,
+  for comparison
+
+The parallel scores must equal the single-threaded ones. No database is needed.
+
+Usage:
+    python -m benchmarks.ats [--resumes 10000] [--job-descriptions 10000]
+        [--workers 0] [--sample-pairs 200000]
+"""
+
+import argparse
+import os
+import random
+import time
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.ats import AtsConfig
+from src.ats.engine import AtsScorer
+from src.skills.constants import SKILL_ALIASES
+
+RESUME_WORDS = 400
+JOB_DESCRIPTION_WORDS = 250
+INDUSTRY = [
+    "backend",
+    "frontend",
+    "platform",
+    "data",
+    "pipeline",
+    "service",
+    "api",
+    "latency",
+    "throughput",
+    "scalability",
+    "reliability",
+    "observability",
+    "monitoring",
+    "deployment",
+    "migration",
+    "architecture",
+    "design",
+    "microservice",
+    "database",
+    "cache",
+    "queue",
+    "streaming",
+    "analytics",
+    "dashboard",
+    "payment",
+    "billing",
+    "security",
+    "compliance",
+    "testing",
+    "automation",
+    "infrastructure",
+    "cloud",
+    "cost",
+    "performance",
+    "mentoring",
+    "leadership",
+    "stakeholder",
+    "roadmap",
+    "customer",
+    "product",
+    "experiment",
+    "growth",
+]
+SYLLABLES = ("ka", "ro", "mi", "tu", "le", "sa", "no", "vi", "de", "po", "ga", "fe")
+FILLER = [a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES]
+
+
+def generate(count: int, words: int, rng: random.Random) -> list[str]:
+    vocabulary = INDUSTRY + FILLER
+    # Zipf: a few words are everywhere, most are rare
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    skills = list(SKILL_ALIASES)
+    documents = []
+    for _ in range(count):
+        text = rng.choices(vocabulary, weights=weights, k=words)
+        text += rng.sample(skills, rng.randint(3, 8))
+        rng.shuffle(text)
+        documents.append(" ".join(text) + ".")
+    return documents
+
+
+def score_pairwise(
+    scorer: AtsScorer, resumes: Sequence[str], jobs: Sequence[str], pairs: int
+) -> float:
+    """Seconds to score ``pairs`` pairs one at a time (features cached)."""
+    resume_features = scorer.features(resumes)
+    job_features = scorer.features(jobs)
+    rng = random.Random(24)
+    sample = [
+        (rng.randrange(len(resume_features)), rng.randrange(len(job_features)))
+        for _ in range(pairs)
+    ]
+    started = time.perf_counter()
+    for row, column in sample:
+        terms = resume_features[row].terms
+        round(100 * sum(w for term, w in job_features[column].weights.items() if term in terms))
+    return time.perf_counter() - started
+
+
+def report(name: str, seconds: float, pairs: int) -> None:
+    print(f"{name:<44}{seconds:>10.2f}{pairs / seconds / 1e6:>14.1f}")
+
+
+def main(arguments: argparse.Namespace) -> None:
+    rng = random.Random(24)
+    started = time.perf_counter()
+    resumes = generate(arguments.resumes, RESUME_WORDS, rng)
+    jobs = generate(arguments.job_descriptions, JOB_DESCRIPTION_WORDS, rng)
+    pairs = len(resumes) * len(jobs)
+    workers = arguments.workers or os.cpu_count() or 1
+    print(
+        f"{len(resumes)} resumes x {len(jobs)} job descriptions = {pairs:,} pairs "
+        f"(generated in {time.perf_counter() - started:.1f} s); {workers} workers, "
+        f"{os.cpu_count()} CPUs"
+    )
+    print(f"{'run':<44}{'seconds':>10}{'M pairs/s':>14}")
+
+    inline = AtsScorer(AtsConfig(ATS_WORKERS=1))
+    started = time.perf_counter()
+    inline.features([*resumes, *jobs])
+    tokenized = time.perf_counter() - started
+    print(f"{'tokenize every document':<44}{tokenized:>10.2f}")
+    started = time.perf_counter()
+    expected = inline.score(resumes, jobs)
+    report("score every pair, cached features, 1 thread", time.perf_counter() - started, pairs)
+    print(
+        f"  {expected.terms} terms, scores {expected.scores.nbytes / 2**20:.0f} MB, "
+        f"mean {expected.scores.mean():.1f}, max {expected.scores.max()}"
+    )
+
+    parallel = AtsScorer(
+        AtsConfig(ATS_WORKERS=workers, ATS_PARALLEL_MIN_PAIRS=1, ATS_PARALLEL_MIN_DOCUMENTS=1)
+    )
+    try:
+        parallel.score(resumes[:100], jobs[:100])  # start the pool
+        started = time.perf_counter()
+        parallel.features([*resumes, *jobs])
+        name = f"tokenize every document, {workers} processes"
+        print(f"{name:<44}{time.perf_counter() - started:>10.2f}")
+        started = time.perf_counter()
+        matrix = parallel.score(resumes, jobs)
+        report(f"score every pair, {workers} processes", time.perf_counter() - started, pairs)
+        assert np.array_equal(matrix.scores, expected.scores)
+    finally:
+        parallel.close()
+
+    edited = list(resumes)
+    for row in rng.sample(range(len(resumes)), len(resumes) // 100):
+        edited[row] = edited[row] + " Kubernetes platform migration."
+    before = inline.tokenized
+    started = time.perf_counter()
+    inline.score(edited, jobs)
+    report(
+        f"1% of resumes edited ({inline.tokenized - before} tokenized)",
+        time.perf_counter() - started,
+        pairs,
+    )
+
+    sample = min(arguments.sample_pairs, pairs)
+    seconds = score_pairwise(inline, resumes, jobs, sample) * pairs / sample
+    report(f"pair by pair in Python (from {sample:,} pairs)", seconds, pairs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=10_000)
+    parser.add_argument("--job-descriptions", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=0, help="0: one per CPU")
+    parser.add_argument("--sample-pairs", type=int, default=200_000)
+    main(parser.parse_args())
@@ -0,0 +1,145 @@
+"""
+Per-request access token verification cost.
+
+Times verifying a bearer token with:
+
+- uncached: full verification (signature, claims) with the precomputed key
+- per-call key: the same, but deriving the HMAC key for every token, as a
+  decoder that takes the secret per call does
+- cached: a token already in the verified-token LRU (repeat requests)
+
+and the end-to-end cost of the ``parse_jwt_data`` dependency, comparing the same
+route with and without it driven directly through ASGI.
+
+The JWT_* settings default to benchmark values when they are not set.
+
+Usage:
+    python -m benchmarks.auth_overhead [--tokens 10000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import hmac
+import os
+import time
+import timeit
+
+import orjson
+from fastapi import Depends, FastAPI
+
+from src.auth import JWTData, create_access_token, parse_jwt_data, verify_access_token
+from src.auth.config import get_auth_settings
+from src.auth.constants import JWT_DIGESTS
+from src.auth.jwt import _b64decode
+from src.auth.service import get_token_cache
+
+
+def verify_with_per_call_key(token: str) -> JWTData:
+    settings = get_auth_settings()
+    header, payload, signature = token.split(".")
+    orjson.loads(_b64decode(header))
+    expected = hmac.new(
+        settings.JWT_SECRET.encode(),
+        f"{header}.{payload}".encode(),
+        JWT_DIGESTS[settings.JWT_ALG],
+    ).digest()
+    if not hmac.compare_digest(_b64decode(signature), expected):
+        raise ValueError
+    return JWTData.model_validate(orjson.loads(_b64decode(payload)))
+
+
+def measure_verification(tokens: list[str], repeat: int) -> None:
+    cache = get_token_cache()
+
+    def uncached() -> None:
+        for token in tokens:
+            cache.clear()
+            verify_access_token(token)
+
+    def per_call_key() -> None:
+        for token in tokens:
+            verify_with_per_call_key(token)
+
+    # Only as many distinct tokens as the cache holds, so every lookup hits
+    cached_tokens = tokens[: cache.maxsize]
+
+    def cached() -> None:
+        for token in cached_tokens:
+            verify_access_token(token)
+
+    print(f"Token verification, {len(tokens)} tokens (best of {repeat}, µs/token)")
+    for name, function in (("uncached", uncached), ("per-call key", per_call_key)):
+        best = min(timeit.repeat(function, number=1, repeat=repeat))
+        print(f"  {name:<14}{best / len(tokens) * 1e6:>8.2f}")
+
+    cache.clear()
+    cached()  # fill the cache
+    best = min(timeit.repeat(cached, number=1, repeat=repeat))
+    print(f"  {'cached':<14}{best / len(cached_tokens) * 1e6:>8.2f}")
+
+
+async def measure_dependency(token: str, requests: int, repeat: int) -> None:
+    app = FastAPI()
+
+    @app.get("/public")
+    async def public() -> dict[str, int]:
+        return {"id": 1}
+
+    @app.get("/private")
+    async def private(jwt_data: JWTData = Depends(parse_jwt_data)) -> dict[str, int]:
+        return {"id": jwt_data.user_id}
+
+    async def receive() -> dict[str, object]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, object]) -> None:
+        pass
+
+    def scope(path: str) -> dict[str, object]:
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"testserver"), (b"authorization", f"Bearer {token}".encode())],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+
+    scopes = {"no auth": scope("/public"), "parse_jwt_data": scope("/private")}
+    best: dict[str, float] = {}
+    for _ in range(repeat):
+        for name, request_scope in scopes.items():
+            started = time.perf_counter()
+            for _ in range(requests):
+                await app(request_scope, receive, send)
+            elapsed = (time.perf_counter() - started) / requests
+            best[name] = min(best.get(name, elapsed), elapsed)
+
+    print(f"\nASGI request, {requests} requests (best of {repeat}, µs/request)")
+    for name, seconds in best.items():
+        print(f"  {name:<16}{seconds * 1e6:>8.2f}")
+    print(f"  {'overhead':<16}{(best['parse_jwt_data'] - best['no auth']) * 1e6:>8.2f}")
+
+
+def main(token_count: int, repeat: int) -> None:
+    os.environ.setdefault("JWT_ALG", "HS256")
+    os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+    os.environ.setdefault("REFRESH_TOKEN_KEY", "refreshToken")
+
+    tokens = [create_access_token(user_id)[0] for user_id in range(token_count)]
+    measure_verification(tokens, repeat)
+    asyncio.run(measure_dependency(tokens[0], 10_000, repeat))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.tokens, args.repeat)
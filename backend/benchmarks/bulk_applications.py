@@ -0,0 +1,304 @@
+"""
+Bulk application import/export: COPY streaming vs the ORM, with a memory ceiling.
+
+Imports ``--rows`` generated applications through ``POST /v1/applications/import``
+(the CSV is generated while it is sent, so the client holds one chunk), then
+exports them through ``GET /v1/applications/export`` as CSV and NDJSON,
+discarding each chunk as it arrives. Requests go straight to the ASGI app;
+``httpx.ASGITransport`` would buffer whole responses.
+
+Before that, a file whose last row is invalid, several import batches long,
+must be refused with nothing imported: the batches before it were copied in
+the same transaction.
+
+Peak RSS growth of each phase (from ``/proc/self/status``, Linux only) must stay
+under ``--memory-ceiling-mb``, whatever the row count: the benchmark exits with
+an error otherwise. For comparison, ``--orm-rows`` rows are imported with
+``AsyncSessionLocal`` (csv.DictReader, per-row parsing, ``add_all`` and a commit
+per batch) and exported by loading the models and writing CSV into memory.
+
+Requires a reachable, migrated database (``DATABASE_URL`` or the ``POSTGRES_*``
+settings) and the auth settings. Rows are imported for a benchmark user and
+deleted afterwards.
+
+Usage:
+    python -m benchmarks.bulk_applications [--rows 1000000] [--orm-rows 20000]
+        [--memory-ceiling-mb 64]
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import sys
+import time
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import delete, func, select
+
+from src.applications import JobApplication, get_applications_settings
+from src.auth.service import create_access_token
+from src.database import AsyncSessionLocal, close_db, init_db
+from src.datetime import parse_datetime_iso
+from src.main import app
+
+USER_ID = 2_000_000_001
+CHUNK_ROWS = 1000
+STATUSES = ("saved", "applied", "interviewing", "offer", "rejected", "withdrawn")
+HEADER = "company,position,status,job_url,notes,applied_at,deadline_at\n"
+
+
+def generate_row(index: int) -> str:
+    day = index % 28 + 1
+    return (
+        f"Company {index % 5000},Engineer {index % 300},{STATUSES[index % 6]},"
+        f'https://jobs.example/{index},"Referral, round {index % 4}",'
+        f"2024-{index % 12 + 1:02d}-{day:02d}T09:30:00Z,"
+        f"{'' if index % 3 else f'2024-12-{day:02d}T00:00:00Z'}\n"
+    )
+
+
+async def generate_csv(rows: int) -> AsyncIterator[bytes]:
+    yield HEADER.encode()
+    for start in range(0, rows, CHUNK_ROWS):
+        end = min(start + CHUNK_ROWS, rows)
+        yield "".join(generate_row(index) for index in range(start, end)).encode()
+
+
+def reset_peak_rss() -> None:
+    # Writing 5 resets VmHWM, the peak resident set size
+    Path("/proc/self/clear_refs").write_text("5")
+
+
+def rss_mb(field: str) -> float:
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith(field):
+            return int(line.split()[1]) / 1024
+    message = f"{field} not found in /proc/self/status"
+    raise RuntimeError(message)
+
+
+async def measure(operation: Callable[[], Any]) -> tuple[Any, float, float]:
+    """Run ``operation``; return its result, seconds taken and peak RSS growth in MB."""
+    reset_peak_rss()
+    baseline = rss_mb("VmRSS:")
+    started = time.perf_counter()
+    result = await operation()
+    return result, time.perf_counter() - started, rss_mb("VmHWM:") - baseline
+
+
+async def call(
+    method: str, path: str, token: str, body: AsyncIterator[bytes] | None = None
+) -> tuple[int, int, bytes]:
+    """Send one request to the app; return the status, body size and first 200 bytes."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path.split("?")[0],
+        "raw_path": path.split("?")[0].encode(),
+        "query_string": path.partition("?")[2].encode(),
+        "headers": [(b"authorization", f"Bearer {token}".encode()), (b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    response = {"status": 0, "size": 0, "head": b""}
+    body_sent = False
+    finished = asyncio.Event()
+
+    async def receive() -> dict[str, Any]:
+        nonlocal body_sent
+        if body_sent:
+            # Like a server: nothing more until the client goes away
+            await finished.wait()
+            return {"type": "http.disconnect"}
+        chunk = None if body is None else await anext(body, None)
+        if chunk is None:
+            body_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        return {"type": "http.request", "body": chunk, "more_body": True}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            chunk = message.get("body", b"")
+            if len(response["head"]) < 200:  # noqa: PLR2004
+                response["head"] += chunk[:200]
+            response["size"] += len(chunk)
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        finished.set()
+    return response["status"], response["size"], response["head"]
+
+
+async def orm_import(rows: int) -> int:
+    reader = csv.DictReader(io.StringIO(HEADER + "".join(generate_row(i) for i in range(rows))))
+    async with AsyncSessionLocal() as session:
+        batch = []
+        for record in reader:
+            batch.append(
+                JobApplication(
+                    user_id=USER_ID + 1,
+                    company=record["company"],
+                    position=record["position"],
+                    status=record["status"] or "applied",
+                    job_url=record["job_url"] or None,
+                    notes=record["notes"] or None,
+                    applied_at=parse_datetime_iso(record["applied_at"]),
+                    deadline_at=(
+                        parse_datetime_iso(record["deadline_at"]) if record["deadline_at"] else None
+                    ),
+                )
+            )
+            if len(batch) == 5000:  # noqa: PLR2004
+                session.add_all(batch)
+                await session.commit()
+                batch = []
+        session.add_all(batch)
+        await session.commit()
+    return rows
+
+
+async def orm_export() -> int:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(JobApplication)
+            .where(JobApplication.user_id == USER_ID + 1)
+            .order_by(JobApplication.id)
+        )
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for application in result.scalars():
+            writer.writerow(
+                [
+                    application.id,
+                    application.company,
+                    application.position,
+                    application.status,
+                    application.job_url,
+                    application.notes,
+                    application.applied_at,
+                    application.deadline_at,
+                    application.created_at,
+                    application.updated_at,
+                ]
+            )
+    return len(buffer.getvalue())
+
+
+async def delete_rows() -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            delete(JobApplication).where(JobApplication.user_id.in_([USER_ID, USER_ID + 1]))
+        )
+        await session.commit()
+
+
+async def count_rows() -> int:
+    async with AsyncSessionLocal() as session:
+        statement = select(func.count()).where(JobApplication.user_id == USER_ID)
+        return (await session.execute(statement)).scalar_one()
+
+
+async def check_atomic_import(token: str) -> str | None:
+    """Import a file whose last row is invalid; return a failure, if any."""
+    rows = 3 * get_applications_settings().application_import_batch_rows
+
+    async def invalid_csv() -> AsyncIterator[bytes]:
+        async for chunk in generate_csv(rows):
+            yield chunk
+        yield b"Company,Engineer,not-a-status,,,,\n"
+
+    status, _, head = await call("POST", "/v1/applications/import", token, invalid_csv())
+    imported = await count_rows()
+    if status != 422 or imported:  # noqa: PLR2004
+        return f"invalid last row: {status} {head.decode()!r}, {imported} rows imported"
+    print(f"invalid last row after {rows} valid rows: 422, nothing imported")
+    return None
+
+
+def report(name: str, rows: int, seconds: float, peak_mb: float, extra: str = "") -> None:
+    print(
+        f"{name:<24}{rows:>9} rows {seconds:>8.2f} s {rows / seconds:>10.0f} rows/s "
+        f"{peak_mb:>8.1f} MB peak{extra}"
+    )
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    await init_db()
+    token, _ = create_access_token(USER_ID)
+    await delete_rows()
+    failures = []
+    try:
+        # Warm up: imports, pool connections, statement caches
+        await call("POST", "/v1/applications/import", token, generate_csv(100))
+        await call("GET", "/v1/applications/export", token)
+        await delete_rows()
+        atomic_failure = await check_atomic_import(token)
+        await delete_rows()
+
+        print(f"{arguments.rows} rows, memory ceiling {arguments.memory_ceiling_mb} MB per phase")
+        response, seconds, peak = await measure(
+            lambda: call("POST", "/v1/applications/import", token, generate_csv(arguments.rows))
+        )
+        status, _, head = response
+        if status != 201:  # noqa: PLR2004
+            message = f"Import failed with {status}: {head.decode()}"
+            raise RuntimeError(message)
+        report("COPY import", arguments.rows, seconds, peak)
+        phases = [("COPY import", peak)]
+
+        for file_format in ("csv", "ndjson"):
+            response, seconds, peak = await measure(
+                lambda file_format=file_format: call(
+                    "GET", f"/v1/applications/export?format={file_format}", token
+                )
+            )
+            _, size, _ = response
+            name = f"COPY export ({file_format})"
+            report(name, arguments.rows, seconds, peak, f"   {size / 2**20:.0f} MB sent")
+            phases.append((name, peak))
+
+        if arguments.orm_rows:
+            rows, seconds, peak = await measure(lambda: orm_import(arguments.orm_rows))
+            report("ORM import", rows, seconds, peak)
+            size, seconds, peak = await measure(orm_export)
+            report(
+                "ORM export (in memory)",
+                arguments.orm_rows,
+                seconds,
+                peak,
+                f"   ~{peak / arguments.orm_rows * 1_000_000:.0f} MB per 1M rows",
+            )
+
+        failures = [
+            f"{name}: {peak:.1f} MB > {arguments.memory_ceiling_mb} MB"
+            for name, peak in phases
+            if peak > arguments.memory_ceiling_mb
+        ]
+        if atomic_failure is not None:
+            failures.append(atomic_failure)
+    finally:
+        await delete_rows()
+        await close_db()
+
+    if failures:
+        print("Failed: " + "; ".join(failures), file=sys.stderr)
+        return 1
+    print("OK: the import is atomic and every COPY phase stayed under the memory ceiling")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--orm-rows", type=int, default=20_000)
+    parser.add_argument("--memory-ceiling-mb", type=float, default=64.0)
+    sys.exit(asyncio.run(main(parser.parse_args())))
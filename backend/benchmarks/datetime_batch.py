@@ -0,0 +1,129 @@
+"""
+Datetime parsing/formatting: previous strptime/strftime functions vs fast paths and batches.
+
+Times converting ``--count`` values (the size of a large application import or
+export) with:
+
+- previous: the strptime/strftime implementations the single-value functions used
+- single: the current single-value functions (fixed-layout fast paths), one call per value
+- batch: the ``*_batch`` functions returning lists
+- batch numpy: the ``*_batch`` functions with ``datetime64`` arrays
+
+Usage:
+    python -m benchmarks.datetime_batch [--count 100000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+from collections.abc import Callable
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+
+from src.datetime import (
+    DATE_FORMAT,
+    DATETIME_FORMAT_UTC,
+    TIME_FORMAT,
+    format_date_iso,
+    format_datetime_iso,
+    format_datetime_iso_batch,
+    parse_date_iso,
+    parse_date_iso_batch,
+    parse_datetime_iso,
+    parse_datetime_iso_batch,
+    parse_time_iso,
+    parse_time_iso_batch,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def previous_format_datetime_iso(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    elif dt.tzinfo != UTC:
+        dt = dt.astimezone(UTC)
+    return dt.strftime(DATETIME_FORMAT_UTC)
+
+
+def previous_format_date_iso(d: date) -> str:
+    return d.strftime(DATE_FORMAT)
+
+
+def previous_parse_date_iso(date_str: str) -> date:
+    return datetime.strptime(date_str, DATE_FORMAT).date()
+
+
+def previous_parse_time_iso(time_str: str) -> time:
+    return datetime.strptime(time_str, TIME_FORMAT).time()
+
+
+def best_ms(run: Callable[[], Any], repeat: int) -> float:
+    return min(timeit.repeat(run, number=1, repeat=repeat)) * 1000
+
+
+def report(title: str, variants: dict[str, Callable[[], Any]], repeat: int) -> None:
+    print(title)
+    baseline = None
+    for name, run in variants.items():
+        ms = best_ms(run, repeat)
+        baseline = baseline or ms
+        print(f"  {name:<14} {ms:9.2f} ms  {baseline / ms:6.1f}x")
+
+
+def main(count: int, repeat: int) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    datetimes = [start + timedelta(minutes=17 * index) for index in range(count)]
+    datetime_strings = [format_datetime_iso(dt) for dt in datetimes]
+    dates = [dt.date() for dt in datetimes]
+    date_strings = [format_date_iso(d) for d in dates]
+    time_strings = [dt.strftime(TIME_FORMAT) for dt in datetimes]
+    print(f"{count} values, best of {repeat}\n")
+
+    datetime_array = parse_datetime_iso_batch(datetime_strings, as_array=True) if np else None
+
+    parse_datetime = {
+        "single": lambda: [parse_datetime_iso(value) for value in datetime_strings],
+        "batch": lambda: parse_datetime_iso_batch(datetime_strings),
+    }
+    format_datetime = {
+        "previous": lambda: [previous_format_datetime_iso(dt) for dt in datetimes],
+        "single": lambda: [format_datetime_iso(dt) for dt in datetimes],
+        "batch": lambda: format_datetime_iso_batch(datetimes),
+    }
+    parse_date = {
+        "previous": lambda: [previous_parse_date_iso(value) for value in date_strings],
+        "single": lambda: [parse_date_iso(value) for value in date_strings],
+        "batch": lambda: parse_date_iso_batch(date_strings),
+    }
+    format_date = {
+        "previous": lambda: [previous_format_date_iso(d) for d in dates],
+        "single": lambda: [format_date_iso(d) for d in dates],
+    }
+    parse_time = {
+        "previous": lambda: [previous_parse_time_iso(value) for value in time_strings],
+        "single": lambda: [parse_time_iso(value) for value in time_strings],
+        "batch": lambda: parse_time_iso_batch(time_strings),
+    }
+    if np is not None:
+        parse_datetime["batch numpy"] = lambda: parse_datetime_iso_batch(
+            datetime_strings, as_array=True
+        )
+        format_datetime["batch numpy"] = lambda: format_datetime_iso_batch(datetime_array)
+        parse_date["batch numpy"] = lambda: parse_date_iso_batch(date_strings, as_array=True)
+
+    report("parse datetime (already fromisoformat-based)", parse_datetime, repeat)
+    report("format datetime", format_datetime, repeat)
+    report("parse date", parse_date, repeat)
+    report("format date", format_date, repeat)
+    report("parse time", parse_time, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.count, args.repeat)
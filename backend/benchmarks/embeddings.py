@@ -0,0 +1,158 @@
+"""
+Embeddings: batched embedder calls and top-k search over a mapped vector index.
+
+Three measurements, none of which needs a database:
+
+- embedding ``--texts`` job description passages one text per embedder call vs
+  ``--batch-size`` texts per call, with ``--latency-ms`` added to every call to
+  stand in for a hosted embedding API round trip
+- top-k cosine search over ``--vectors`` random unit vectors in a
+  ``VectorIndex`` that was compacted and mapped again (as a restarted worker
+  would), one query per call vs ``--queries`` queries per call, against a brute
+  force full sort of the scores
+- the nearest skill names of a few misspelled or variant names, with the
+  offline hashing embedder (aliases such as k8s are resolved before embedding)
+
+Usage:
+    python -m benchmarks.embeddings [--texts 512] [--batch-size 64]
+        [--latency-ms 50] [--vectors 200000] [--dimensions 256] [--queries 64]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.embeddings.embedder import HashingEmbedder
+from src.embeddings.index import VectorIndex, normalize_rows
+from src.embeddings.utils import chunk_text
+from src.skills.constants import SKILL_ALIASES
+
+K = 10
+WORDS = ("python", "kafka", "postgresql", "pipelines", "services", "team", "design", "scale")
+VARIANTS = ("Postgres", "python3", "ReactJS", "Kubernets", "Typescript", "Elastic Search")
+
+
+class SlowEmbedder:
+    """The hashing embedder behind a fixed per-call latency, like a remote API."""
+
+    def __init__(self, latency: float, dimensions: int) -> None:
+        self._embedder = HashingEmbedder(dimensions)
+        self.model = self._embedder.model
+        self.dimensions = dimensions
+        self._latency = latency
+        self.calls = 0
+
+    async def embed(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        self.calls += 1
+        await asyncio.sleep(self._latency)
+        return self._embedder.embed_batch(texts)
+
+
+async def time_embedding(arguments: argparse.Namespace) -> None:
+    rng = random.Random(21)
+    description = "\n\n".join(
+        " ".join(rng.choices(WORDS, k=120)) + "." for _ in range(arguments.texts)
+    )
+    passages = chunk_text(description, 1000)[: arguments.texts]
+    print(
+        f"Embedding {len(passages)} passages, {arguments.latency_ms:.0f} ms per embedder call "
+        f"(hashing embedder, {arguments.dimensions} dimensions)"
+    )
+    for batch_size in (1, arguments.batch_size):
+        embedder = SlowEmbedder(arguments.latency_ms / 1000, arguments.dimensions)
+        started = time.perf_counter()
+        for start in range(0, len(passages), batch_size):
+            await embedder.embed(passages[start : start + batch_size])
+        seconds = time.perf_counter() - started
+        print(
+            f"  batch size {batch_size:<6}{embedder.calls:>6} calls {seconds:>8.2f} s "
+            f"{len(passages) / seconds:>10.0f} texts/s"
+        )
+
+
+def time_search(arguments: argparse.Namespace) -> None:
+    rng = np.random.default_rng(21)
+    dimensions = arguments.dimensions
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "vectors"
+        index = VectorIndex(path, dimensions, compact_rows=arguments.vectors + 1)
+        started = time.perf_counter()
+        for start in range(0, arguments.vectors, 50_000):
+            count = min(50_000, arguments.vectors - start)
+            vectors = rng.standard_normal((count, dimensions), dtype=np.float32)
+            index.add([f"vector-{start + row}" for row in range(count)], vectors)
+        index.compact()
+        index = VectorIndex.open(path, dimensions)
+        print(
+            f"\nSearching {len(index):,} vectors of {dimensions} dimensions "
+            f"({len(index) * dimensions * 4 / 2**20:.0f} MB mapped), top {K} "
+            f"(built and mapped in {time.perf_counter() - started:.1f} s)"
+        )
+        queries = rng.standard_normal((arguments.queries, dimensions), dtype=np.float32)
+        matrix = np.asarray(index._matrix())
+
+        def brute_force(query: NDArray[np.float32]) -> list[int]:
+            return np.argsort(-(matrix @ normalize_rows(query)[0]))[:K].tolist()
+
+        expected = brute_force(queries[0])
+        found = [int(key.split("-")[1]) for key, _ in index.search(queries[0], K)[0]]
+        assert found == expected, (found, expected)
+
+        single = []
+        for query in queries:
+            started = time.perf_counter()
+            index.search(query, K)
+            single.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        index.search(queries, K)
+        batched = time.perf_counter() - started
+        started = time.perf_counter()
+        for query in queries[:8]:
+            brute_force(query)
+        sort = (time.perf_counter() - started) / 8
+
+        print(f"  {'full sort, per query':<30}{sort * 1000:>10.2f} ms")
+        print(
+            f"  {'search(), one query':<30}{statistics.median(single) * 1000:>10.2f} ms "
+            f"(p95 {statistics.quantiles(single, n=20)[18] * 1000:.2f} ms)"
+        )
+        print(
+            f"  {f'search(), {len(queries)} queries at once':<30}{batched * 1000:>10.2f} ms "
+            f"({batched / len(queries) * 1000:.2f} ms per query)"
+        )
+
+
+def show_similar_skills() -> None:
+    embedder = HashingEmbedder()
+    with tempfile.TemporaryDirectory() as directory:
+        index = VectorIndex(Path(directory) / "skills", embedder.dimensions)
+        names = list(SKILL_ALIASES)
+        index.add(names, embedder.embed_batch(names))
+        print(f"\nNearest of {len(names)} canonical skills (hashing embedder, no aliases)")
+        for variant, found in zip(
+            VARIANTS, index.search(embedder.embed_batch(VARIANTS), k=2), strict=True
+        ):
+            neighbors = ", ".join(f"{name} {score:.2f}" for name, score in found)
+            print(f"  {variant:<16}{neighbors}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--texts", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--vectors", type=int, default=200_000)
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(time_embedding(args))
+    time_search(args)
+    show_similar_skills()
@@ -0,0 +1,108 @@
+"""
+Import time of ``src.main``, measured with ``python -X importtime``.
+
+Imports the application module in fresh interpreters (``--runs`` times) and
+reports the median total import time and the modules with the largest
+cumulative import time. Worker boot time is dominated by this import.
+
+With ``--check`` it exits non-zero when the median exceeds ``--budget-ms`` or
+when a module that must load on first use (database driver, migrations, NumPy,
+AI/document tooling) is imported at boot. Run it in CI to keep startup lean.
+
+Usage:
+    python -m benchmarks.import_time [--runs 5] [--top 15] [--check] [--budget-ms 1500]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# backend/, so ``src`` is importable regardless of the working directory
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+TARGET_MODULE = "src.main"
+
+# Top-level packages that must not be imported when the application module loads
+DEFERRED_PACKAGES = (
+    "alembic",
+    "asyncpg",
+    "numpy",
+    "langchain",
+    "langchain_core",
+    "langgraph",
+    "openai",
+    "pylatex",
+)
+
+DEFAULT_BUDGET_MS = 1500.0
+
+
+def profile_import() -> dict[str, tuple[int, int]]:
+    """
+    Import the target module in a fresh interpreter.
+
+    Returns:
+        Mapping of module name to (self, cumulative) import time in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET_MODULE}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main(runs: int, top: int, check: bool, budget_ms: float) -> int:
+    profiles = [profile_import() for _ in range(runs)]
+    totals_ms = [sum(self_us for self_us, _ in profile.values()) / 1000 for profile in profiles]
+    median_ms = statistics.median(totals_ms)
+
+    print(f"import {TARGET_MODULE}: median {median_ms:.1f} ms over {runs} runs")
+    print(f"  runs: {', '.join(f'{total:.1f}' for total in totals_ms)} ms")
+
+    last = profiles[-1]
+    print(f"\nTop {top} modules by cumulative import time (last run):")
+    ranked = sorted(last.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (_, cumulative_us) in ranked[:top]:
+        print(f"  {cumulative_us / 1000:>8.1f} ms  {name}")
+
+    deferred = sorted(
+        {name.split(".")[0] for name in last if name.split(".")[0] in DEFERRED_PACKAGES}
+    )
+    if deferred:
+        print(f"\nImported at boot but expected to load on first use: {', '.join(deferred)}")
+    if not check:
+        return 0
+
+    failures = []
+    if median_ms > budget_ms:
+        failures.append(f"median import time {median_ms:.1f} ms exceeds {budget_ms:.0f} ms")
+    if deferred:
+        failures.append(f"deferred packages imported at boot: {', '.join(deferred)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print(f"\nOK: within {budget_ms:.0f} ms budget, no deferred packages imported")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--check", action="store_true", help="Fail if the budget is exceeded")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+    sys.exit(main(args.runs, args.top, args.check, args.budget_ms))
@@ -0,0 +1,225 @@
+"""
+Background job queue: enqueue rate, drain throughput and pickup latency.
+
+Runs against the ``job`` table (jobs of kind ``bench.*``, deleted afterwards)
+and reports:
+
+- enqueue: jobs/s from concurrent clients, one INSERT + NOTIFY each
+- drain, naive: claimers taking one job per statement with a plain
+  ``FOR UPDATE``, so concurrent claimers queue up behind the same row
+- drain, JobWorker: workers claiming a batch with ``FOR UPDATE SKIP LOCKED``
+- pickup latency: enqueue to handler start for an idle worker whose poll
+  interval is 5 s, i.e. how quickly LISTEN/NOTIFY wakes it
+
+The queue gets its own engine with a pool as large as the number of
+concurrent claimers and clients (``--pool-size``): every running job briefly
+holds a connection to record its outcome, and a smaller pool spends the run
+opening and closing overflow connections.
+
+Requires a reachable, migrated database (``DATABASE_URL`` or the ``POSTGRES_*``
+settings).
+
+Usage:
+    python -m benchmarks.job_queue [--jobs 5000] [--workers 2] [--concurrency 8]
+        [--clients 8] [--handler-ms 0] [--latency-jobs 50] [--pool-size N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database import close_db, get_engine, init_db
+from src.jobs import ClaimedJob, JobHandlers, JobQueue, JobsConfig, JobWorker
+
+KIND = "bench.noop"
+
+NAIVE_CLAIM = text(
+    """
+    UPDATE job SET status = 'running', attempts = attempts + 1, locked_by = :worker,
+        locked_until = now() + interval '60 seconds', started_at = now()
+    WHERE id = (
+        SELECT id FROM job WHERE status = 'queued' AND kind = :kind AND run_at <= now()
+        ORDER BY priority DESC, run_at, id LIMIT 1 FOR UPDATE
+    )
+    RETURNING id
+    """
+)
+NAIVE_COMPLETE = text(
+    "UPDATE job SET status = 'succeeded', finished_at = now(), locked_by = NULL, "
+    "locked_until = NULL WHERE id = :id"
+)
+
+
+async def delete_jobs(queue: JobQueue) -> None:
+    async with queue.engine.connect() as conn:
+        await conn.execute(text("DELETE FROM job WHERE kind LIKE 'bench.%'"))
+
+
+async def succeeded(queue: JobQueue) -> int:
+    async with queue.engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT count(*) FROM job WHERE kind = :kind AND status = 'succeeded'"),
+            {"kind": KIND},
+        )
+    return result.scalar_one()
+
+
+async def enqueue(queue: JobQueue, jobs: int, clients: int) -> float:
+    remaining = iter(range(jobs))
+
+    async def client() -> None:
+        for index in remaining:
+            await queue.enqueue(KIND, {"index": index})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return jobs / (time.perf_counter() - started)
+
+
+async def drain_naive(queue: JobQueue, claimers: int, handler_seconds: float) -> tuple[float, int]:
+    empty_claims = 0
+
+    async def claimer(name: str) -> None:
+        nonlocal empty_claims
+        # Stop after a few consecutive empty claims: the queue is drained
+        misses = 0
+        while misses < 3:  # noqa: PLR2004
+            async with queue.engine.connect() as conn:
+                job_id = (await conn.execute(NAIVE_CLAIM, {"worker": name, "kind": KIND})).scalar()
+            if job_id is None:
+                empty_claims += 1
+                misses += 1
+                continue
+            misses = 0
+            await asyncio.sleep(handler_seconds)
+            async with queue.engine.connect() as conn:
+                await conn.execute(NAIVE_COMPLETE, {"id": job_id})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(claimer(f"bench-naive-{index}") for index in range(claimers)))
+    return time.perf_counter() - started, empty_claims
+
+
+async def drain_workers(
+    queue: JobQueue,
+    config: JobsConfig,
+    jobs: int,
+    workers: int,
+    concurrency: int,
+    handler_seconds: float,
+) -> float:
+    handlers = JobHandlers()
+
+    async def handler(_: ClaimedJob) -> None:
+        await asyncio.sleep(handler_seconds)
+
+    handlers.register(KIND, handler, None)
+    pool = [
+        JobWorker(queue, handlers, config, name=f"bench-{index}", concurrency=concurrency)
+        for index in range(workers)
+    ]
+    started = time.perf_counter()
+    for worker in pool:
+        worker.start()
+    while await succeeded(queue) < jobs:
+        await asyncio.sleep(0.02)
+    elapsed = time.perf_counter() - started
+    for worker in pool:
+        await worker.stop()
+    return elapsed
+
+
+async def pickup_latency(queue: JobQueue, config: JobsConfig, jobs: int) -> list[float]:
+    handlers = JobHandlers()
+    enqueued: dict[int, float] = {}
+    latencies: list[float] = []
+
+    async def handler(job: ClaimedJob) -> None:
+        latencies.append(time.perf_counter() - enqueued[job.payload["index"]])
+
+    handlers.register(KIND, handler, None)
+    worker = JobWorker(queue, handlers, config, name="bench-latency", concurrency=1)
+    worker.start()
+    # Let the listener connect before the first enqueue
+    await asyncio.sleep(0.5)
+    for index in range(jobs):
+        enqueued[index] = time.perf_counter()
+        await queue.enqueue(KIND, {"index": index})
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(0.5)
+    await worker.stop()
+    return latencies
+
+
+def report_drain(name: str, jobs: int, elapsed: float, extra: str = "") -> None:
+    print(f"{name:<28}{jobs / elapsed:>9.0f} jobs/s   {elapsed:>7.2f} s{extra}")
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    await init_db()
+    config = JobsConfig(JOB_POLL_INTERVAL_SECONDS=5.0)
+    claimers = arguments.workers * arguments.concurrency
+    pool_size = arguments.pool_size or max(claimers, arguments.clients) + arguments.workers
+    engine = create_async_engine(get_engine().url, pool_size=pool_size, max_overflow=0)
+    queue = JobQueue(engine, config)
+    handler_seconds = arguments.handler_ms / 1000
+    await delete_jobs(queue)
+    try:
+        print(
+            f"{arguments.jobs} jobs, handler {arguments.handler_ms:g} ms, "
+            f"{arguments.workers} workers x {arguments.concurrency} concurrent, "
+            f"pool of {pool_size}"
+        )
+
+        rate = await enqueue(queue, arguments.jobs, arguments.clients)
+        print(f"{'enqueue':<28}{rate:>9.0f} jobs/s   ({arguments.clients} clients)")
+
+        elapsed, empty_claims = await drain_naive(queue, claimers, handler_seconds)
+        report_drain(
+            f"drain, naive x {claimers}",
+            arguments.jobs,
+            elapsed,
+            f"   {empty_claims} empty claims",
+        )
+
+        await delete_jobs(queue)
+        await enqueue(queue, arguments.jobs, arguments.clients)
+        elapsed = await drain_workers(
+            queue,
+            config,
+            arguments.jobs,
+            arguments.workers,
+            arguments.concurrency,
+            handler_seconds,
+        )
+        report_drain("drain, JobWorker", arguments.jobs, elapsed)
+
+        await delete_jobs(queue)
+        latencies = sorted(await pickup_latency(queue, config, arguments.latency_jobs))
+        if latencies:
+            p95 = latencies[int(len(latencies) * 0.95) - 1]
+            print(
+                f"{'pickup latency (idle)':<28}p50 {statistics.median(latencies) * 1000:.1f} ms   "
+                f"p95 {p95 * 1000:.1f} ms   ({len(latencies)}/{arguments.latency_jobs} "
+                f"picked up, poll interval {config.job_poll_interval_seconds:g} s)"
+            )
+    finally:
+        await delete_jobs(queue)
+        await engine.dispose()
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--handler-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jobs", type=int, default=50)
+    parser.add_argument("--pool-size", type=int, default=None)
+    asyncio.run(main(parser.parse_args()))
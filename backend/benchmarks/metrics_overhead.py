@@ -0,0 +1,162 @@
+"""
+Request metrics overhead: the same app with and without MetricsMiddleware.
+
+Drives a minimal FastAPI app (one route with a path parameter) directly through
+its ASGI interface, without a server or HTTP client, so the per-request cost of
+the middleware is not hidden by network or parsing time. Also times the
+middleware around a bare ASGI app (its intrinsic cost, without FastAPI noise),
+a single histogram record and rendering the Prometheus text for many routes.
+
+Usage:
+    python -m benchmarks.metrics_overhead [--requests 20000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import timeit
+
+from fastapi import FastAPI
+from starlette.types import Message, Receive, Scope, Send
+
+from src.metrics import LatencyHistogram, MetricsMiddleware, MetricsRegistry, RequestTimings
+
+
+def build_app(*, instrumented: bool, registry: MetricsRegistry) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware, registry=registry)
+    return app
+
+
+async def drive(app: FastAPI, requests: int) -> float:
+    """Send ``requests`` GET requests through the ASGI app; return seconds per request."""
+
+    async def receive() -> dict[str, object]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, object]) -> None:
+        pass
+
+    scopes = [
+        {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/items/{index}",
+            "raw_path": f"/items/{index}".encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"testserver")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        for index in range(requests)
+    ]
+
+    started = time.perf_counter()
+    for scope in scopes:
+        await app(scope, receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+async def measure(requests: int, repeat: int) -> None:
+    registry = MetricsRegistry()
+    apps = {
+        "baseline": build_app(instrumented=False, registry=registry),
+        "instrumented": build_app(instrumented=True, registry=registry),
+    }
+    # Warm up routing and middleware stacks
+    for app in apps.values():
+        await drive(app, 500)
+
+    # Interleave runs so drift (CPU frequency, GC) affects both variants alike
+    samples: dict[str, list[float]] = {name: [] for name in apps}
+    for _ in range(repeat):
+        for name, app in apps.items():
+            samples[name].append(await drive(app, requests))
+
+    print(f"ASGI request, {requests} requests x {repeat} runs (µs/request)")
+    print(f"  {'':<14}{'best':>8}{'median':>10}")
+    for name, values in samples.items():
+        print(f"  {name:<14}{min(values) * 1e6:>8.2f}{statistics.median(values) * 1e6:>10.2f}")
+    # Best-of-runs is the least noisy estimate of the per-request cost
+    baseline = min(samples["baseline"])
+    overhead = min(samples["instrumented"]) - baseline
+    print(f"  {'overhead':<14}{overhead * 1e6:>8.2f}  ({overhead / baseline:+.1%})")
+
+
+async def measure_bare(requests: int, repeat: int) -> None:
+    """Per-request cost of the middleware around an ASGI app that does nothing."""
+
+    async def bare_app(_scope: Scope, _receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async def receive() -> Message:
+        return {}
+
+    async def send(message: Message) -> None:
+        pass
+
+    scope: Scope = {"type": "http", "method": "GET", "path": "/items/1"}
+    apps = {
+        "bare app": bare_app,
+        "instrumented": MetricsMiddleware(bare_app, registry=MetricsRegistry()),
+    }
+    best = {}
+    for name, app in apps.items():
+        runs = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(requests):
+                await app(scope, receive, send)
+            runs.append((time.perf_counter() - started) / requests)
+        best[name] = min(runs)
+
+    print("\nMiddleware around a bare ASGI app (best of runs, µs/request)")
+    for name, seconds in best.items():
+        print(f"  {name:<14}{seconds * 1e6:>8.2f}")
+    print(f"  {'overhead':<14}{(best['instrumented'] - best['bare app']) * 1e6:>8.2f}")
+
+
+def measure_recording(repeat: int) -> None:
+    histogram = LatencyHistogram()
+    registry = MetricsRegistry()
+    timings = RequestTimings()
+    number = 200_000
+
+    record = min(timeit.repeat(lambda: histogram.record(0.0123), number=number, repeat=repeat))
+    observe = min(
+        timeit.repeat(
+            lambda: registry.observe("GET", "/items/{item_id}", 200, 0.0123, timings),
+            number=number,
+            repeat=repeat,
+        )
+    )
+    print("\nRecording (best of runs, ns/call)")
+    print(f"  {'histogram':<14}{record / number * 1e9:>8.0f}")
+    print(f"  {'registry':<14}{observe / number * 1e9:>8.0f}")
+
+    for index in range(200):
+        registry.observe("GET", f"/route/{index}", 200, 0.01, timings)
+    render = min(timeit.repeat(registry.render_prometheus, number=10, repeat=repeat)) / 10
+    print(f"\nPrometheus text for 200 routes: {render * 1000:.2f} ms per scrape")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(measure(args.requests, args.repeat))
+    asyncio.run(measure_bare(args.requests, args.repeat))
+    measure_recording(args.repeat)
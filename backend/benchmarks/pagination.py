@@ -0,0 +1,136 @@
+"""
+Keyset pagination vs LIMIT/OFFSET on a seeded table.
+
+Seeds ``bench_page_item`` with ``--rows`` rows and an index on (created_at, id),
+then times fetching one page at increasing depths with OFFSET and with
+``src.pagination.paginate``. Also compares ``estimate_total`` with COUNT(*).
+
+Requires a reachable database (``DATABASE_URL`` or the ``POSTGRES_*`` settings).
+
+Usage:
+    python -m benchmarks.pagination [--rows 500000] [--page-size 50]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, MetaData, Table, Text, func, select
+from sqlalchemy import text as sql_text
+
+from src.database import AsyncSessionLocal, engine
+from src.pagination import (
+    KeysetParams,
+    estimate_total,
+    get_keyset_params,
+    order_fingerprint,
+    paginate,
+)
+
+bench_metadata = MetaData()
+item = Table(
+    "bench_page_item",
+    bench_metadata,
+    Column("id", BigInteger, primary_key=True),
+    Column("user_id", Integer, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("title", Text, nullable=False),
+)
+ORDER_BY = [item.c.created_at.desc(), item.c.id.desc()]
+FILTER_USER_ID = 7
+
+
+async def seed(rows: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(bench_metadata.drop_all)
+        await conn.run_sync(bench_metadata.create_all)
+        await conn.execute(
+            sql_text(
+                "INSERT INTO bench_page_item (id, user_id, created_at, title) "
+                "SELECT g, g % 100, now() - make_interval(secs => g), 'item ' || g "
+                "FROM generate_series(1, :rows) AS g"
+            ),
+            {"rows": rows},
+        )
+        await conn.execute(sql_text("CREATE INDEX ON bench_page_item (created_at DESC, id DESC)"))
+        await conn.execute(sql_text("ANALYZE bench_page_item"))
+
+
+async def best_of(run: Callable[[], Awaitable[Any]], repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await run()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings) * 1000
+
+
+async def main(rows: int, page_size: int) -> None:
+    print(f"seeding {rows} rows...")
+    await seed(rows)
+
+    statement = select(item)
+    fingerprint = order_fingerprint(ORDER_BY)
+    depths = [depth for depth in (0, 1_000, 10_000, 100_000, rows - page_size) if depth < rows]
+
+    print(f"{'depth':>10} {'offset ms':>10} {'keyset ms':>10}")
+    async with AsyncSessionLocal() as session:
+        for depth in depths:
+            offset_query = statement.order_by(*ORDER_BY).offset(depth).limit(page_size)
+
+            async def fetch_offset(query: Any = offset_query) -> None:
+                (await session.execute(query)).all()
+
+            params = KeysetParams(limit=page_size)
+            if depth:
+                key_query = select(item.c.created_at, item.c.id).order_by(*ORDER_BY)
+                key = (await session.execute(key_query.offset(depth - 1).limit(1))).one()
+                params = KeysetParams(
+                    limit=page_size, after=list(key), order_fingerprint=fingerprint
+                )
+
+            async def fetch_keyset(page_params: KeysetParams = params) -> None:
+                await paginate(session, statement, ORDER_BY, page_params)
+
+            offset_ms = await best_of(fetch_offset)
+            keyset_ms = await best_of(fetch_keyset)
+            print(f"{depth:>10} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+
+        filtered = statement.where(item.c.user_id == FILTER_USER_ID)
+        for label, query in (("all rows", statement), (f"user_id = {FILTER_USER_ID}", filtered)):
+            count_query = select(func.count()).select_from(query.subquery())
+            exact = (await session.execute(count_query)).scalar_one()
+            estimate = await estimate_total(session, query)
+
+            async def run_count(count_query: Any = count_query) -> None:
+                await session.execute(count_query)
+
+            async def run_estimate(query: Any = query) -> None:
+                await estimate_total(session, query)
+
+            count_ms = await best_of(run_count)
+            estimate_ms = await best_of(run_estimate)
+            print(
+                f"total ({label}): COUNT(*)={exact} in {count_ms:.2f} ms, "
+                f"estimate={estimate} in {estimate_ms:.2f} ms"
+            )
+
+        # Follow a real cursor through the dependency to check pages line up
+        first = await paginate(session, statement, ORDER_BY, KeysetParams(limit=page_size))
+        params = get_keyset_params(limit=page_size, cursor=first.next_cursor, include_total=False)
+        second = await paginate(session, statement, ORDER_BY, params)
+        assert second.items[0]["id"] == first.items[-1]["id"] + 1
+
+    async with engine.begin() as conn:
+        await conn.run_sync(bench_metadata.drop_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.page_size))
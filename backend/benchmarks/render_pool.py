@@ -0,0 +1,247 @@
+"""
+LaTeX rendering: event loop stalls, preamble formats, back-pressure and PDF cache.
+
+Renders resumes (one preamble, different bodies) and reports the longest event
+loop stall measured by a 10 ms ticker, throughput and latency for:
+
+- blocking: ``subprocess.run`` in the request handler, as ``check_migrations``
+  used to run alembic
+- RenderService, cold: every document compiled with its preamble; then warm,
+  with the preamble preloaded from a format file
+- a burst larger than workers + queue: how many requests are rejected (429)
+- exporting the same documents again: served from the PDF cache
+- a document that never finishes: killed at the timeout
+
+By default the engine is a fake ``pdflatex`` (a Python script that burns CPU
+for a fixed preamble and body cost and honours ``-ini``/``-fmt``), so no TeX
+distribution is needed; ``--engine pdflatex`` renders real documents instead.
+
+Usage:
+    python -m benchmarks.render_pool [--documents 24] [--workers 4] [--queue 8]
+        [--preamble-ms 400] [--body-ms 100] [--engine PATH]
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.render import (
+    RenderConfig,
+    RenderQueueFull,
+    RenderService,
+    RenderTimeout,
+    build_render_service,
+)
+
+TIMEOUT_SECONDS = 2.0
+
+FAKE_ENGINE = """\
+import os, sys, time
+preamble_ms, body_ms = {preamble_ms}, {body_ms}
+
+def burn(ms):
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+args = sys.argv[1:]
+source = open(args[-1]).read()
+if r"\\hang" in source:
+    time.sleep(3600)
+if "-ini" in args:
+    name = next(a.split("=", 1)[1] for a in args if a.startswith("-jobname="))
+    burn(preamble_ms)
+    open(name + ".fmt", "w").write("format")
+    sys.exit(0)
+fmt = next((a.split("=", 1)[1] for a in args if a.startswith("-fmt=")), None)
+formats = os.environ.get("TEXFORMATS", "").split(os.pathsep)[0]
+if not (fmt and os.path.exists(os.path.join(formats, fmt + ".fmt"))):
+    burn(preamble_ms)
+burn(body_ms)
+open("document.pdf", "wb").write(b"%PDF-1.5 fake " + source.encode()[-64:])
+"""
+
+PREAMBLE = r"""\documentclass[11pt]{article}
+\usepackage[margin=0.75in]{geometry}
+\usepackage{enumitem}
+\usepackage{hyperref}
+\usepackage[T1]{fontenc}
+\usepackage{lmodern}
+"""
+
+
+def document(index: int, variant: str = "") -> str:
+    return (
+        PREAMBLE
+        + "\\begin{document}\n"
+        + f"\\section*{{Candidate {index}}}\n"
+        + "\\begin{itemize}\n"
+        + "".join(f"\\item Achievement {index}.{item} {variant}\n" for item in range(10))
+        + "\\end{itemize}\n\\end{document}\n"
+    )
+
+
+class LoopMonitor:
+    """Measures how late a 10 ms ticker wakes up (the longest event loop stall)."""
+
+    def __init__(self) -> None:
+        self.max_stall = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    async def _tick(self) -> None:
+        while True:
+            expected = time.perf_counter() + 0.01
+            await asyncio.sleep(0.01)
+            self.max_stall = max(self.max_stall, time.perf_counter() - expected)
+
+    async def __aenter__(self) -> "LoopMonitor":
+        self._task = asyncio.create_task(self._tick())
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        # Let a tick that is already late record its stall
+        await asyncio.sleep(0.02)
+        self._task.cancel()
+
+
+def build_service(
+    engine: str, cache_dir: Path, arguments: argparse.Namespace, *, preload_formats: bool
+) -> RenderService:
+    return build_render_service(
+        RenderConfig(
+            LATEX_ENGINE=engine,
+            RENDER_WORKERS=arguments.workers,
+            RENDER_QUEUE_SIZE=arguments.queue,
+            RENDER_TIMEOUT_SECONDS=TIMEOUT_SECONDS,
+            RENDER_CACHE_DIR=cache_dir,
+            RENDER_PRELOAD_FORMATS=preload_formats,
+        )
+    )
+
+
+def report(name: str, latencies: list[float], elapsed: float, monitor: LoopMonitor) -> None:
+    print(f"{name:<22}{len(latencies) / elapsed:>7.1f} docs/s   "
+          f"p50 {statistics.median(latencies) * 1000:>7.1f} ms   "
+          f"max {max(latencies) * 1000:>7.1f} ms   "
+          f"longest loop stall {monitor.max_stall * 1000:>7.1f} ms")  # fmt: skip
+
+
+async def run_blocking(engine: str, documents: list[str], workers: int) -> None:
+    semaphore = asyncio.Semaphore(workers)
+    latencies = []
+
+    async def handler(tex: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            with tempfile.TemporaryDirectory() as directory:
+                Path(directory, "document.tex").write_text(tex)
+                subprocess.run(
+                    [engine, "-interaction=nonstopmode", "document.tex"],
+                    cwd=directory,
+                    check=False,
+                    capture_output=True,
+                )
+            latencies.append(time.perf_counter() - started)
+
+    async with LoopMonitor() as monitor:
+        started = time.perf_counter()
+        await asyncio.gather(*(handler(tex) for tex in documents))
+        elapsed = time.perf_counter() - started
+    report("blocking handler", latencies, elapsed, monitor)
+
+
+async def run_service(
+    name: str, service: RenderService, documents: list[str], capacity: int
+) -> None:
+    latencies = []
+
+    async def handler(tex: str) -> None:
+        started = time.perf_counter()
+        await service.render(tex, template="classic@1")
+        latencies.append(time.perf_counter() - started)
+
+    async with LoopMonitor() as monitor:
+        started = time.perf_counter()
+        # Admitted in waves of the service's capacity, so none are rejected here
+        for offset in range(0, len(documents), capacity):
+            await asyncio.gather(*(handler(tex) for tex in documents[offset : offset + capacity]))
+        elapsed = time.perf_counter() - started
+    report(name, latencies, elapsed, monitor)
+
+
+async def run_burst(service: RenderService, documents: list[str]) -> None:
+    async def handler(tex: str) -> float | None:
+        started = time.perf_counter()
+        try:
+            await service.render(tex, template="classic@1")
+        except RenderQueueFull:
+            return time.perf_counter() - started
+        return None
+
+    results = await asyncio.gather(*(handler(tex) for tex in documents))
+    rejected = [seconds for seconds in results if seconds is not None]
+    print(f"burst of {len(documents):<13}{len(documents) - len(rejected):>7} rendered   "
+          f"{len(rejected)} rejected with 429 in "
+          f"{max(rejected, default=0) * 1000:.2f} ms or less")  # fmt: skip
+
+
+async def run_timeout(service: RenderService) -> None:
+    started = time.perf_counter()
+    try:
+        await service.render(document(0, "\\hang"), template="classic@1")
+    except RenderTimeout:
+        print(f"hanging document      killed after {time.perf_counter() - started:.2f} s "
+              f"(timeout {TIMEOUT_SECONDS:.0f} s)")  # fmt: skip
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        engine = arguments.engine
+        if engine is None:
+            engine = str(root / "pdflatex")
+            source = FAKE_ENGINE.format(
+                preamble_ms=arguments.preamble_ms, body_ms=arguments.body_ms
+            )
+            Path(engine).write_text(f"#!{sys.executable}\n{source}")
+            Path(engine).chmod(0o755)
+            print(f"Fake engine: preamble {arguments.preamble_ms:.0f} ms, "
+                  f"body {arguments.body_ms:.0f} ms of CPU")  # fmt: skip
+        print(f"{arguments.documents} documents, {arguments.workers} workers, "
+              f"queue {arguments.queue}\n")  # fmt: skip
+
+        documents = [document(index) for index in range(arguments.documents)]
+        await run_blocking(engine, documents, arguments.workers)
+
+        cold_dir, warm_dir = root / "cold", root / "warm"
+        capacity = arguments.workers + arguments.queue
+        cold = build_service(engine, cold_dir, arguments, preload_formats=False)
+        await run_service("service, full runs", cold, documents, capacity)
+
+        warm = build_service(engine, warm_dir, arguments, preload_formats=True)
+        await warm.warm(documents[0])
+        revised = [document(index, "v2") for index in range(arguments.documents)]
+        await run_service("service, warm format", warm, revised, capacity)
+        await run_service("service, cached PDFs", warm, revised, capacity)
+        print(f"  formats built {warm.engine.formats_built}, "
+              f"engine runs {warm.renders}, cache hits {warm.hits}\n")  # fmt: skip
+
+        burst = [document(index, "v3") for index in range(arguments.documents * 2)]
+        await run_burst(warm, burst)
+        await run_timeout(warm)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=24)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue", type=int, default=8)
+    parser.add_argument("--preamble-ms", type=float, default=400.0)
+    parser.add_argument("--body-ms", type=float, default=100.0)
+    parser.add_argument("--engine", default=None, help="TeX engine (default: a fake engine)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,234 @@
+"""
+Resume versioning: storage size and diff latency over a long version history.
+
+Saves ``--versions`` versions of one generated resume through
+``POST /v1/resumes/{id}/versions``, each with the edits a user typically makes
+between two saves (mostly one bullet rewritten; now and then a section added,
+removed or moved), then reports:
+
+- the bytes stored for the versions (snapshots every ``RESUME_SNAPSHOT_INTERVAL``
+  versions, deltas in between) and for the precomputed diffs, against storing
+  every version in full (measured by storing the full copies in a temporary
+  table, so both sides are compressed by Postgres the same way)
+- p50/p95 latency of ``GET /v1/resumes/{id}/versions/{version}`` for random
+  versions, which must match the sections that were saved
+- p50/p95 latency of ``GET /v1/resumes/{id}/diff`` for consecutive versions
+  (diffs stored when saving), and for random pairs of versions on first
+  request (computed and stored) and on a repeat request
+
+Requires a reachable, migrated database (``DATABASE_URL`` or the ``POSTGRES_*``
+settings) and the auth settings. The benchmark user's resumes are deleted
+before and after the run.
+
+Usage:
+    python -m benchmarks.resume_versions [--versions 500] [--sections 12]
+        [--requests 200]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Any
+
+import httpx
+import orjson
+from sqlalchemy import text
+
+from src.auth.service import create_access_token
+from src.database import close_db, get_engine, init_db
+from src.main import app
+from src.resumes import get_resumes_settings
+from src.tailoring import SectionKind
+
+USER_ID = 2_000_000_201
+KINDS = (SectionKind.EXPERIENCE, SectionKind.PROJECTS, SectionKind.SKILLS, SectionKind.EDUCATION)
+VERBS = ("Built", "Led", "Designed", "Migrated", "Scaled", "Automated", "Reduced", "Shipped")
+OBJECTS = ("billing services", "a data pipeline", "the CI/CD setup", "search", "an API gateway")
+RESULTS = ("cutting latency by 40%", "for 2M users", "saving $200k a year", "with zero downtime")
+
+Section = dict[str, Any]
+
+
+def bullet(rng: random.Random) -> str:
+    return f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(RESULTS)}"
+
+
+def new_section(rng: random.Random, number: int) -> Section:
+    bullets = [bullet(rng) for _ in range(rng.randint(3, 6))]
+    return {
+        "kind": KINDS[number % len(KINDS)].value,
+        "title": f"Section {number}",
+        "content": f"Role {number}, Company {number} (2018-2024)\n" + "\n".join(bullets),
+    }
+
+
+def edit(sections: list[Section], rng: random.Random, number: int) -> tuple[list[Section], str]:
+    """The next version: usually one bullet rewritten, sometimes a section added or moved."""
+    sections = list(sections)
+    roll = rng.random()
+    if roll < 0.05:  # noqa: PLR2004
+        sections.insert(rng.randint(1, len(sections)), new_section(rng, number))
+        return sections, "added a section"
+    if roll < 0.08 and len(sections) > 3:  # noqa: PLR2004
+        del sections[rng.randrange(1, len(sections))]
+        return sections, "removed a section"
+    if roll < 0.10:  # noqa: PLR2004
+        moved = sections.pop(rng.randrange(1, len(sections)))
+        sections.insert(rng.randint(1, len(sections)), moved)
+        return sections, "moved a section"
+    position = rng.randrange(1, len(sections))
+    lines = sections[position]["content"].split("\n")
+    lines[rng.randrange(1, len(lines))] = bullet(rng) + f" (v{number})"
+    sections[position] = {**sections[position], "content": "\n".join(lines)}
+    return sections, "rewrote a bullet"
+
+
+def summary(timings: list[float]) -> str:
+    p95 = statistics.quantiles(timings, n=20)[18]
+    return f"{statistics.median(timings) * 1000:>10.2f}{p95 * 1000:>10.2f}"
+
+
+async def delete_resumes() -> None:
+    async with get_engine().begin() as conn:
+        ids = "SELECT id FROM resume WHERE user_id = :user_id"
+        for table in ("resume_diff", "resume_version"):
+            await conn.execute(
+                text(f"DELETE FROM {table} WHERE resume_id IN ({ids})"),
+                {"user_id": USER_ID},
+            )
+        await conn.execute(
+            text("DELETE FROM resume WHERE user_id = :user_id"), {"user_id": USER_ID}
+        )
+
+
+async def storage(resume_id: int, versions: list[list[Section]]) -> None:
+    async with get_engine().connect() as conn:
+        stored = await conn.execute(
+            text(
+                "SELECT sum(pg_column_size(payload)), "
+                "count(*) FILTER (WHERE kind = 'snapshot') "
+                "FROM resume_version WHERE resume_id = :resume_id"
+            ),
+            {"resume_id": resume_id},
+        )
+        stored_bytes, snapshots = stored.one()
+        diffs = await conn.execute(
+            text("SELECT sum(pg_column_size(diff)) FROM resume_diff WHERE resume_id = :resume_id"),
+            {"resume_id": resume_id},
+        )
+        diff_bytes = diffs.scalar_one()
+        await conn.execute(text("CREATE TEMP TABLE full_copy (payload jsonb NOT NULL)"))
+        await conn.execute(
+            text("INSERT INTO full_copy SELECT CAST(:payload AS jsonb)"),
+            [{"payload": orjson.dumps(sections).decode()} for sections in versions],
+        )
+        full = await conn.execute(text("SELECT sum(pg_column_size(payload)) FROM full_copy"))
+        full_bytes = full.scalar_one()
+        await conn.rollback()
+
+    print(f"\n{'storage':<34}{'KiB':>10}{'vs full':>10}")
+    print(f"{'every version in full':<34}{full_bytes / 1024:>10.1f}{1:>10.2f}")
+    print(
+        f"{f'{snapshots} snapshots + deltas':<34}{stored_bytes / 1024:>10.1f}"
+        f"{stored_bytes / full_bytes:>10.2f}"
+    )
+    print(
+        f"{'+ consecutive diffs':<34}{(stored_bytes + diff_bytes) / 1024:>10.1f}"
+        f"{(stored_bytes + diff_bytes) / full_bytes:>10.2f}"
+    )
+
+
+async def time_reads(
+    client: httpx.AsyncClient, base: str, versions: list[list[Section]], requests: int
+) -> None:
+    rng = random.Random(24)
+    reads = []
+    for _ in range(requests):
+        version = rng.randint(1, len(versions))
+        started = time.perf_counter()
+        response = await client.get(f"{base}/versions/{version}")
+        reads.append(time.perf_counter() - started)
+        response.raise_for_status()
+        assert response.json()["sections"] == versions[version - 1], version
+    print(f"{'read a version':<34}{summary(reads)}")
+
+    async def diff(params: dict[str, int]) -> float:
+        started = time.perf_counter()
+        response = await client.get(f"{base}/diff", params=params)
+        elapsed = time.perf_counter() - started
+        response.raise_for_status()
+        return elapsed
+
+    consecutive = []
+    for _ in range(requests):
+        version = rng.randint(2, len(versions))
+        consecutive.append(await diff({"from_version": version - 1, "to_version": version}))
+    print(f"{'diff, consecutive (stored)':<34}{summary(consecutive)}")
+
+    pairs = set()
+    while len(pairs) < min(requests, (len(versions) - 1) * (len(versions) - 2) // 4):
+        first, second = sorted(rng.sample(range(1, len(versions) + 1), 2))
+        if second - first > 1:
+            pairs.add((first, second))
+    first_requests = [
+        await diff({"from_version": first, "to_version": second}) for first, second in pairs
+    ]
+    repeats = [await diff({"from_version": first, "to_version": second}) for first, second in pairs]
+    print(f"{'diff, random pair, first request':<34}{summary(first_requests)}")
+    print(f"{'diff, random pair, repeated':<34}{summary(repeats)}")
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    rng = random.Random(23)
+    headers = {"Authorization": f"Bearer {create_access_token(USER_ID)[0]}"}
+    interval = get_resumes_settings().resume_snapshot_interval
+    await init_db()
+    await delete_resumes()
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", headers=headers
+        ) as client:
+            sections = [{"kind": SectionKind.HEADER.value, "title": "", "content": "Ada Lovelace"}]
+            sections += [new_section(rng, number) for number in range(arguments.sections - 1)]
+            response = await client.post(
+                "/v1/resumes", json={"name": "Benchmark", "sections": sections}
+            )
+            response.raise_for_status()
+            resume_id = response.json()["id"]
+            base = f"/v1/resumes/{resume_id}"
+
+            versions = [sections]
+            saves = []
+            for number in range(arguments.sections, arguments.sections + arguments.versions - 1):
+                sections, message = edit(sections, rng, number)
+                started = time.perf_counter()
+                response = await client.post(
+                    f"{base}/versions", json={"sections": sections, "message": message}
+                )
+                saves.append(time.perf_counter() - started)
+                response.raise_for_status()
+                versions.append(sections)
+            print(
+                f"{len(versions)} versions of {arguments.sections} sections (more or less), "
+                f"a snapshot every {interval}; {arguments.requests} requests per measurement"
+            )
+            await storage(resume_id, versions)
+
+            print(f"\n{'request':<34}{'p50 ms':>10}{'p95 ms':>10}")
+            print(f"{'save a version':<34}{summary(saves)}")
+
+            await time_reads(client, base, versions, arguments.requests)
+    finally:
+        await delete_resumes()
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--versions", type=int, default=500)
+    parser.add_argument("--sections", type=int, default=12)
+    parser.add_argument("--requests", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
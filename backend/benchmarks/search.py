@@ -0,0 +1,234 @@
+"""
+Document search: ranked full-text and fuzzy company queries over 1M documents.
+
+Loads ``--documents`` generated job descriptions and resumes, spread over
+``--users`` benchmark users, with ``COPY`` (Postgres derives the search vectors
+and maintains the GIN indexes), then times ``GET /v1/search`` end to end for a
+mix of queries, each for a random benchmark user:
+
+- a common word (in roughly a third of the documents) and a rare one
+- several words, a quoted phrase and an exclusion
+- a keyword with a misspelled company name (pg_trgm)
+- deep pagination: the fifth page of a common word, through the cursors
+
+Every query must have a p95 under ``--budget-ms``: the benchmark exits with an
+error otherwise. The same user's searches are also timed with the plan forced
+off the indexes (``enable_bitmapscan = off``), for comparison.
+
+Requires a reachable, migrated database (``DATABASE_URL`` or the ``POSTGRES_*``
+settings) with the pg_trgm and btree_gin extensions, and the auth settings.
+Documents are deleted afterwards unless ``--keep`` is given; a later run with
+the same ``--documents`` and ``--users`` reuses kept documents.
+
+Usage:
+    python -m benchmarks.search [--documents 1000000] [--users 1000]
+        [--queries 200] [--budget-ms 50] [--keep]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+from sqlalchemy import text
+
+from src.auth.service import create_access_token
+from src.database import close_db, get_engine, init_db
+from src.main import app
+from src.search import DocumentKind, SearchDocument
+
+USER_ID = 2_000_000_001
+COPY_BATCH = 10_000
+WORDS_PER_DOCUMENT = 80
+
+SKILLS = ("python", "java", "golang", "typescript", "postgresql", "kafka", "kubernetes", "aws")
+COMMON = ("team", "experience", "services", "product", "design", "scale", "data", "monitor")
+# Filler: 1728 made-up words, so documents have realistic vocabularies
+SYLLABLES = ("ka", "ro", "mi", "tu", "le", "sa", "no", "vi", "de", "po", "ga", "fe")
+FILLER = [a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES]
+PHRASES = ("machine learning", "distributed systems", "code review", "on call")
+# Long tail: rare words, each in a few hundred documents per million
+RARE = [f"{a}{b}" for a in ("zor", "quel", "brin", "tova", "mek") for b in range(200)]
+COMPANY_PARTS = (
+    ("Acme", "Globex", "Initech", "Umbrella", "Hooli", "Vandelay", "Stark", "Wayne", "Wonka"),
+    ("Labs", "Systems", "Cloud", "Analytics", "Robotics", "Health", "Finance", "Media"),
+)
+TITLES = ("Backend Engineer", "Data Engineer", "Frontend Developer", "SRE", "ML Engineer")
+
+QUERIES: list[tuple[str, dict[str, str]]] = [
+    ("common word", {"q": "python"}),
+    ("rare word", {"q": "zor7"}),
+    ("three words", {"q": "kubernetes postgresql monitor"}),
+    ("phrase", {"q": '"machine learning"'}),
+    ("exclusion", {"q": "python -java"}),
+    ("fuzzy company", {"q": "engineer", "company": "Globx"}),
+]
+DEEP_PAGES = 5
+
+
+def generate_document(rng: random.Random, user_id: int) -> tuple[Any, ...]:
+    words = rng.choices(FILLER, k=WORDS_PER_DOCUMENT - 15)
+    words += rng.choices(COMMON, k=10)
+    words += rng.choices(SKILLS, k=3)
+    words += rng.choices(RARE, k=2)
+    if rng.random() < 0.3:  # noqa: PLR2004
+        words.append(rng.choice(PHRASES))
+    rng.shuffle(words)
+    kind = DocumentKind.RESUME if rng.random() < 0.2 else DocumentKind.JOB_DESCRIPTION  # noqa: PLR2004
+    company = " ".join(rng.choice(part) for part in COMPANY_PARTS)
+    return (user_id, kind.value, rng.choice(TITLES), company, " ".join(words) + ".")
+
+
+def generate_batches(documents: int, users: int) -> Iterator[list[tuple[Any, ...]]]:
+    rng = random.Random(20)
+    for start in range(0, documents, COPY_BATCH):
+        yield [
+            generate_document(rng, USER_ID + index % users)
+            for index in range(start, min(start + COPY_BATCH, documents))
+        ]
+
+
+async def count_documents(users: int) -> int:
+    async with get_engine().connect() as conn:
+        result = await conn.execute(
+            text("SELECT count(*) FROM search_document WHERE user_id BETWEEN :first AND :last"),
+            {"first": USER_ID, "last": USER_ID + users - 1},
+        )
+        return result.scalar_one()
+
+
+async def load_documents(documents: int, users: int) -> float:
+    started = time.perf_counter()
+    async with get_engine().begin() as conn:
+        driver = (await conn.get_raw_connection()).driver_connection
+        for batch in generate_batches(documents, users):
+            await driver.copy_records_to_table(
+                SearchDocument.__tablename__,
+                records=batch,
+                columns=("user_id", "kind", "title", "company", "body"),
+            )
+    async with get_engine().connect() as conn:
+        await conn.execute(text("ANALYZE search_document"))
+    return time.perf_counter() - started
+
+
+async def delete_documents(users: int) -> None:
+    async with get_engine().begin() as conn:
+        await conn.execute(
+            text("DELETE FROM search_document WHERE user_id BETWEEN :first AND :last"),
+            {"first": USER_ID, "last": USER_ID + users - 1},
+        )
+
+
+async def search(
+    client: httpx.AsyncClient, user_id: int, params: dict[str, str], pages: int = 1
+) -> tuple[float, int]:
+    """Fetch ``pages`` pages of a search; return the seconds the last one took and its hits."""
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)[0]}"}
+    cursor = None
+    for _ in range(pages):
+        started = time.perf_counter()
+        response = await client.get(
+            "/v1/search",
+            params={**params, **({"cursor": cursor} if cursor else {})},
+            headers=headers,
+        )
+        elapsed = time.perf_counter() - started
+        response.raise_for_status()
+        page = response.json()
+        cursor = page["next_cursor"]
+    return elapsed, len(page["items"])
+
+
+async def time_queries(
+    client: httpx.AsyncClient, users: int, queries: int, budget_ms: float
+) -> list[str]:
+    rng = random.Random(21)
+    failures = []
+    runs = [(name, params, 1) for name, params in QUERIES]
+    runs.append((f"page {DEEP_PAGES} of common word", {"q": "python"}, DEEP_PAGES))
+    print(f"{'query':<28}{'hits/page':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for name, params, pages in runs:
+        timings, hits = [], []
+        for _ in range(queries):
+            seconds, count = await search(client, USER_ID + rng.randrange(users), params, pages)
+            timings.append(seconds * 1000)
+            hits.append(count)
+        p95 = statistics.quantiles(timings, n=20)[18]
+        print(
+            f"{name:<28}{statistics.mean(hits):>10.1f}{statistics.median(timings):>10.2f}"
+            f"{p95:>10.2f}{max(timings):>10.2f}"
+        )
+        if p95 > budget_ms:
+            failures.append(f"{name}: p95 {p95:.1f} ms > {budget_ms} ms")
+    return failures
+
+
+async def time_without_indexes(users: int, queries: int) -> None:
+    """Time the common-word search with bitmap scans disabled (sequential scans)."""
+    statement = text(
+        "SELECT id FROM search_document WHERE user_id = :user_id "
+        "AND search_vector @@ websearch_to_tsquery('english', 'python') "
+        "ORDER BY ts_rank_cd(search_vector, websearch_to_tsquery('english', 'python'), 1) "
+        "DESC, id DESC LIMIT 21"
+    )
+    rng = random.Random(22)
+    async with get_engine().connect() as conn:
+        await conn.execute(text("SET enable_bitmapscan = off"))
+        await conn.execute(text("SET enable_indexscan = off"))
+        timings = []
+        for _ in range(max(queries // 20, 3)):
+            started = time.perf_counter()
+            await conn.execute(statement, {"user_id": USER_ID + rng.randrange(users)})
+            timings.append((time.perf_counter() - started) * 1000)
+        await conn.rollback()
+    print(f"{'common word, no index (SQL)':<28}{'':>10}{statistics.median(timings):>10.2f}")
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    await init_db()
+    try:
+        existing = await count_documents(arguments.users)
+        if existing != arguments.documents:
+            await delete_documents(arguments.users)
+            seconds = await load_documents(arguments.documents, arguments.users)
+            print(
+                f"Loaded {arguments.documents} documents in {seconds:.0f} s "
+                f"({arguments.documents / seconds:.0f}/s)"
+            )
+        per_user = arguments.documents // arguments.users
+        print(f"{arguments.documents} documents, {per_user} per user, {arguments.queries} queries")
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # Warm up: imports, pool connections, statement caches
+            await search(client, USER_ID, {"q": "python"})
+            failures = await time_queries(
+                client, arguments.users, arguments.queries, arguments.budget_ms
+            )
+        await time_without_indexes(arguments.users, arguments.queries)
+    finally:
+        if not arguments.keep:
+            await delete_documents(arguments.users)
+        await close_db()
+
+    if failures:
+        print("Over budget: " + "; ".join(failures), file=sys.stderr)
+        return 1
+    print(f"OK: every query's p95 is under {arguments.budget_ms} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--keep", action="store_true", help="Keep the documents for later runs")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,143 @@
+"""
+Response serialization: previous CustomBaseModel path vs serializer-level datetimes.
+
+Serializes a page of application records (each with nested status events) the
+way a handler returning a model would:
+
+- previous: model_dump override + jsonable_encoder + JSONResponse (json.dumps)
+- new: model_dump(mode="json") with UTCDatetime + ORJSONResponse
+- new, direct: model_dump_json() bytes straight from pydantic-core
+
+Usage:
+    python -m benchmarks.serialization [--items 1000] [--repeat 50]
+"""
+
+import argparse
+import timeit
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+
+from src.models import CustomBaseModel, UTCDatetime, datetime_to_utc_str
+
+
+class LegacyBaseModel(BaseModel):
+    """CustomBaseModel as it was before serializer-level datetime handling."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        result = super().model_dump(**kwargs)
+        if kwargs.get("mode", "python") == "json":
+            for key, value in result.items():
+                if isinstance(value, datetime):
+                    result[key] = datetime_to_utc_str(value)
+        return result
+
+    def serializable_dict(self, **kwargs: Any) -> dict:
+        return jsonable_encoder(self.model_dump(mode="json", **kwargs))
+
+
+class LegacyEvent(LegacyBaseModel):
+    status: str
+    note: str
+    occurred_at: datetime
+
+
+class LegacyApplication(LegacyBaseModel):
+    id: int
+    company: str
+    position: str
+    status: str
+    applied_at: datetime
+    updated_at: datetime
+    events: list[LegacyEvent]
+
+
+class LegacyPage(LegacyBaseModel):
+    items: list[LegacyApplication]
+    generated_at: datetime
+
+
+class Event(CustomBaseModel):
+    status: str
+    note: str
+    occurred_at: UTCDatetime
+
+
+class Application(CustomBaseModel):
+    id: int
+    company: str
+    position: str
+    status: str
+    applied_at: UTCDatetime
+    updated_at: UTCDatetime
+    events: list[Event]
+
+
+class Page(CustomBaseModel):
+    items: list[Application]
+    generated_at: UTCDatetime
+
+
+def build_payload(items: int) -> dict[str, Any]:
+    base = datetime(2024, 1, 1, microsecond=123456, tzinfo=UTC)
+    statuses = ["applied", "screening", "interview", "offer"]
+    return {
+        "generated_at": base,
+        "items": [
+            {
+                "id": index,
+                "company": f"Company {index}",
+                "position": "Backend Engineer",
+                "status": statuses[index % 4],
+                "applied_at": base + timedelta(hours=index),
+                "updated_at": base + timedelta(hours=index, minutes=30),
+                "events": [
+                    {
+                        "status": status,
+                        "note": f"{status} update",
+                        "occurred_at": base + timedelta(hours=index, minutes=step),
+                    }
+                    for step, status in enumerate(statuses)
+                ],
+            }
+            for index in range(items)
+        ],
+    }
+
+
+def main(items: int, repeat: int) -> None:
+    payload = build_payload(items)
+    legacy_page = LegacyPage.model_validate(payload)
+    page = Page.model_validate(payload)
+
+    paths = {
+        "previous (override + jsonable_encoder + json)": lambda: JSONResponse(
+            legacy_page.serializable_dict()
+        ).body,
+        "new (model_dump json + orjson)": lambda: ORJSONResponse(page.model_dump(mode="json")).body,
+        "new, direct (model_dump_json)": lambda: page.model_dump_json().encode(),
+    }
+
+    print(f"{items} application records x {repeat} runs")
+    baseline = None
+    for name, path in paths.items():
+        seconds = min(timeit.repeat(path, number=1, repeat=repeat))
+        baseline = baseline or seconds
+        print(f"{name:<48} {seconds * 1000:8.2f} ms  {baseline / seconds:5.1f}x")
+
+    sample = page.model_dump(mode="json")["items"][0]["events"][0]["occurred_at"]
+    legacy_sample = legacy_page.model_dump(mode="json")["items"][0]["events"][0]["occurred_at"]
+    print(f"nested datetime: previous={legacy_sample!r} new={sample!r}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    main(args.items, args.repeat)
@@ -0,0 +1,143 @@
+"""
+Round-trips per request for the session dependencies.
+
+Compares the previous always-commit dependency with the write-tracking
+``get_db_session`` and the read-only session modes, for handlers that do not
+touch the database, read one row, or insert one row.
+
+Requires a reachable database (``DATABASE_URL`` or the ``POSTGRES_*`` settings).
+
+Usage:
+    python -m benchmarks.session_round_trips [--requests 500]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import AsyncReadSessionLocal, AsyncSessionLocal, ReadOnlyMode, engine
+from src.database.connection import get_db_session
+from src.database.constants import READ_ONLY_EXECUTION_OPTIONS
+from src.database.replicas import ReplicaRouter
+
+TABLE = "bench_session_item"
+
+round_trips = 0
+
+
+def _count(*_: Any) -> None:
+    global round_trips  # noqa: PLW0603
+    round_trips += 1
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _attach_query_logger(dbapi_connection: Any, _: Any) -> None:
+    # BEGIN/COMMIT/ROLLBACK and pings go through asyncpg's execute path
+    dbapi_connection._connection.add_query_logger(_count)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count_statement(*_: Any) -> None:
+    # Application statements run as prepared statements, which bypass the logger
+    _count()
+
+
+async def legacy_get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """The previous dependency: commit unconditionally."""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+def read_only_dependency(
+    mode: ReadOnlyMode,
+) -> Callable[[], AsyncGenerator[AsyncSession, None]]:
+    router = ReplicaRouter(
+        primary=engine,
+        replicas=[],
+        cooldown_seconds=1.0,
+        execution_options=READ_ONLY_EXECUTION_OPTIONS[mode],
+    )
+
+    async def dependency() -> AsyncGenerator[AsyncSession, None]:
+        session = await router.open_session(AsyncReadSessionLocal)
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    return dependency
+
+
+async def handle_noop(session: AsyncSession) -> None:  # noqa: ARG001
+    return None
+
+
+async def handle_read(session: AsyncSession) -> None:
+    await session.execute(text(f"SELECT id, name FROM {TABLE} WHERE id = 1"))
+
+
+async def handle_write(session: AsyncSession) -> None:
+    await session.execute(text(f"INSERT INTO {TABLE} (name) VALUES ('x')"))
+
+
+async def run_requests(
+    dependency: Callable[[], AsyncGenerator[AsyncSession, None]],
+    handler: Callable[[AsyncSession], Awaitable[None]],
+    requests: int,
+) -> tuple[float, float]:
+    """Drive the dependency like FastAPI does; return (round-trips, ms) per request."""
+    global round_trips  # noqa: PLW0603
+    round_trips = 0
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        generator = dependency()
+        session = await anext(generator)
+        await handler(session)
+        await generator.aclose()
+    elapsed = time.perf_counter() - started_at
+    return round_trips / requests, elapsed * 1000 / requests
+
+
+async def main(requests: int) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        await conn.execute(text(f"CREATE TABLE {TABLE} (id serial PRIMARY KEY, name text)"))
+        await conn.execute(text(f"INSERT INTO {TABLE} (name) VALUES ('seed')"))
+
+    dependencies = {
+        "always commit (previous)": legacy_get_db_session,
+        "get_db_session": get_db_session,
+        "read-only autocommit": read_only_dependency(ReadOnlyMode.AUTOCOMMIT),
+        "read-only transaction": read_only_dependency(ReadOnlyMode.TRANSACTION),
+    }
+    handlers = {"no db": handle_noop, "read": handle_read, "write": handle_write}
+
+    print(f"{'dependency':<26} {'handler':<8} {'round-trips/req':>16} {'ms/req':>8}")
+    for dependency_name, dependency in dependencies.items():
+        for handler_name, handler in handlers.items():
+            if handler_name == "write" and dependency_name.startswith("read-only"):
+                continue
+            await run_requests(dependency, handler, 20)  # warm up pool and caches
+            per_request, ms = await run_requests(dependency, handler, requests)
+            print(f"{dependency_name:<26} {handler_name:<8} {per_request:>16.2f} {ms:>8.3f}")
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE {TABLE}"))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
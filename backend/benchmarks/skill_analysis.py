@@ -0,0 +1,165 @@
+"""
+Skill analysis cache: LLM calls, hit rate and latency under repeated postings.
+
+Submits job descriptions drawn from a Zipf distribution over a fixed set of
+postings (a few popular postings, many rare ones), each copy with different
+whitespace, line endings and non-breaking spaces, as pasted by different users.
+A fake LLM with a fixed latency stands in for the model. Compares calling the
+model for every request with ``SkillAnalysisService`` (content-addressed table
+plus in-process LRU and single-flight) and reports latency of cached and computed requests.
+
+Requires a migrated database (DATABASE_URL); rows written under the fake model
+name are deleted before and after the run.
+
+Usage:
+    python -m benchmarks.skill_analysis [--requests 2000] [--postings 200]
+        [--concurrency 50] [--llm-latency-ms 200]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import delete
+
+from src.database import close_db, get_engine
+from src.skills import SkillAnalysis, SkillAnalysisService
+from src.skills.models import SkillAnalysisRecord
+
+FAKE_MODEL = "benchmark-fake-llm"
+# Probability of each kind of change to a pasted copy
+PERTURBATION_RATE = 0.5
+
+VOCABULARY = [
+    "Python", "FastAPI", "Django", "PostgreSQL", "Redis", "Docker", "Kubernetes",
+    "AWS", "GCP", "Terraform", "React", "TypeScript", "GraphQL", "Kafka", "Spark",
+    "Airflow", "Go", "Rust", "Java", "Kotlin", "CI/CD", "Linux", "Pandas", "NumPy",
+    "PyTorch", "LangChain", "Elasticsearch", "RabbitMQ", "gRPC", "Celery",
+]  # fmt: skip
+
+
+class FakeSkillExtractor:
+    """LLM stand-in: waits a fixed latency, then returns the vocabulary words it finds."""
+
+    def __init__(self, latency_seconds: float) -> None:
+        self.model = FAKE_MODEL
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    async def extract(self, job_description: str) -> SkillAnalysis:
+        self.calls += 1
+        await asyncio.sleep(self.latency_seconds)
+        words = set(job_description.replace(",", " ").split())
+        skills = [skill for skill in VOCABULARY if skill in words]
+        return SkillAnalysis(skills=skills, related_skills=["Git", "SQL"])
+
+
+def build_postings(count: int, rng: random.Random) -> list[str]:
+    return [
+        f"Senior Engineer #{index}\n\nWe are hiring. Requirements: "
+        + ", ".join(rng.sample(VOCABULARY, 6))
+        + ".\n\nBenefits: remote work, learning budget."
+        for index in range(count)
+    ]
+
+
+def perturb(text: str, rng: random.Random) -> str:
+    """A copy of ``text`` as another user might paste it."""
+    variant = text
+    if rng.random() < PERTURBATION_RATE:
+        variant = variant.replace("\n", "\r\n")
+    if rng.random() < PERTURBATION_RATE:
+        variant = variant.replace(" ", "  ", 3)
+    if rng.random() < PERTURBATION_RATE:
+        variant = variant.replace(" ", "\u00a0", 1)
+    return "\n " * rng.randint(0, 2) + variant + " \t" * rng.randint(0, 2)
+
+
+def build_workload(postings: list[str], requests: int, rng: random.Random) -> list[str]:
+    weights = [1 / (rank + 1) ** 1.1 for rank in range(len(postings))]
+    chosen = rng.choices(postings, weights=weights, k=requests)
+    return [perturb(text, rng) for text in chosen]
+
+
+def percentiles(values: list[float]) -> str:
+    if not values:
+        return "-"
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50 {statistics.median(ordered) * 1000:8.2f} ms   p95 {p95 * 1000:8.2f} ms"
+
+
+async def run_uncached(workload: list[str], concurrency: int, latency: float) -> None:
+    extractor = FakeSkillExtractor(latency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(text: str) -> None:
+        async with semaphore:
+            await extractor.extract(text)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request(text) for text in workload))
+    elapsed = time.perf_counter() - started
+    print(f"No cache:      {extractor.calls:>6} LLM calls   total {elapsed:7.2f} s")
+
+
+async def run_cached(workload: list[str], concurrency: int, latency: float) -> None:
+    extractor = FakeSkillExtractor(latency)
+    service = SkillAnalysisService(get_engine(), extractor)
+    semaphore = asyncio.Semaphore(concurrency)
+    cached: list[float] = []
+    computed: list[float] = []
+
+    async def request(text: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            result = await service.analyze(text)
+            (cached if result.cached else computed).append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request(text) for text in workload))
+    elapsed = time.perf_counter() - started
+
+    reused = service.memory_hits + service.hits + service.coalesced
+    print(f"Content cache: {extractor.calls:>6} LLM calls   total {elapsed:7.2f} s")
+    print(f"  hit rate     {reused / len(workload):>6.1%}  ({service.memory_hits} in memory, "
+          f"{service.hits} stored, {service.coalesced} coalesced in flight, "
+          f"{service.misses} computed)")  # fmt: skip
+    print(f"  cached       {len(cached):>6} requests   {percentiles(cached)}")
+    print(f"  computed     {len(computed):>6} requests   {percentiles(computed)}")
+
+
+async def main(requests: int, postings: int, concurrency: int, latency_ms: float) -> None:
+    rng = random.Random(42)
+    workload = build_workload(build_postings(postings, rng), requests, rng)
+    distinct = len({text.split()[2] for text in workload})
+    print(f"{requests} requests, {distinct} distinct postings, concurrency {concurrency}, "
+          f"fake LLM latency {latency_ms:.0f} ms\n")  # fmt: skip
+
+    cleanup = delete(SkillAnalysisRecord.__table__).where(
+        SkillAnalysisRecord.__table__.c.model == FAKE_MODEL
+    )
+    async with get_engine().begin() as conn:
+        await conn.execute(cleanup)
+    try:
+        await run_uncached(workload, concurrency, latency_ms / 1000)
+        await run_cached(workload, concurrency, latency_ms / 1000)
+        # Another worker: every posting is stored, but its in-process LRU is empty
+        print("\nSecond worker (warm table, cold memory):")
+        await run_cached(workload, concurrency, latency_ms / 1000)
+    finally:
+        async with get_engine().begin() as conn:
+            await conn.execute(cleanup)
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--postings", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--llm-latency-ms", type=float, default=200.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.postings, args.concurrency, args.llm_latency_ms))
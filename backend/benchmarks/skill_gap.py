@@ -0,0 +1,98 @@
+"""
+Skill gap comparison: one user against N job descriptions.
+
+Builds an in-memory ``SkillGapIndex`` of N synthetic job descriptions (8-20
+required skills each, drawn from a Zipf-distributed vocabulary, so a few skills
+appear in most postings) and times comparing one user's skills with all of them:
+
+- python sets: a set intersection per job description (the naive baseline)
+- bitsets: popcount over the words of the bitset matrix the user has bits in
+- postings: ``bincount`` over the inverted index of the user's skills
+- compare(): the full call (automatic strategy, top 20 decoded into names)
+
+No database is needed.
+
+Usage:
+    python -m benchmarks.skill_gap [--sizes 1000 10000 100000] [--vocabulary 2000]
+        [--user-skills 15] [--repeat 5]
+"""
+
+import argparse
+import itertools
+import random
+import time
+import timeit
+
+import numpy as np
+
+from src.skills.index import SkillGapIndex
+
+ZIPF_EXPONENT = 1.1
+
+
+def build(
+    size: int, vocabulary: list[str], cum_weights: list[float], rng: random.Random
+) -> tuple[SkillGapIndex, list[frozenset[str]], float]:
+    """Generate the job descriptions first, so only indexing is timed."""
+    job_skills = [
+        frozenset(rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(8, 20)))
+        for _ in range(size)
+    ]
+    related = [rng.choices(vocabulary, cum_weights=cum_weights, k=3) for _ in range(size)]
+
+    index = SkillGapIndex()
+    started = time.perf_counter()
+    for job, skills in enumerate(job_skills):
+        index.add(f"job-{job}", skills, related=related[job])
+    return index, job_skills, time.perf_counter() - started
+
+
+def measure(size: int, vocabulary_size: int, user_skill_count: int, repeat: int) -> None:
+    rng = random.Random(size)
+    vocabulary = [f"skill-{rank}" for rank in range(vocabulary_size)]
+    cum_weights = list(
+        itertools.accumulate(1 / (rank + 1) ** ZIPF_EXPONENT for rank in range(vocabulary_size))
+    )
+    index, job_skills, build_seconds = build(size, vocabulary, cum_weights, rng)
+
+    user_skills = set(rng.choices(vocabulary, cum_weights=cum_weights, k=user_skill_count * 2))
+    user_skills = set(list(user_skills)[:user_skill_count])
+    user_ids, _ = index.resolve(user_skills)
+    user_set = frozenset(name.casefold() for name in user_skills)
+    normalized_jobs = [frozenset(name.casefold() for name in skills) for skills in job_skills]
+
+    bitsets = index.matched_counts_bitset(user_ids)
+    postings = index.matched_counts_postings(user_ids)
+    naive = np.array([len(skills & user_set) for skills in normalized_jobs], dtype=np.int32)
+    assert np.array_equal(bitsets, naive)
+    assert np.array_equal(postings, naive)
+
+    timings = {
+        "python sets": lambda: [len(skills & user_set) for skills in normalized_jobs],
+        "bitsets": lambda: index.matched_counts_bitset(user_ids),
+        "postings": lambda: index.matched_counts_postings(user_ids),
+        "compare()": lambda: index.compare(user_skills, limit=20),
+    }
+    # Every posting of the user's skills adds one to some job's count
+    posting_total = int(postings.sum())
+    print(
+        f"\nN = {size:,} jobs (indexed in {build_seconds:.2f} s), user has {len(user_ids)} skills "
+        f"in {len({skill_id // 64 for skill_id in user_ids})} bitset words, "
+        f"{posting_total:,} postings"
+    )
+    baseline = None
+    for name, function in timings.items():
+        best = min(timeit.repeat(function, number=1, repeat=repeat))
+        baseline = baseline or best
+        print(f"  {name:<12}{best * 1000:>10.3f} ms   {baseline / best:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    parser.add_argument("--vocabulary", type=int, default=2000)
+    parser.add_argument("--user-skills", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for size in args.sizes:
+        measure(size, args.vocabulary, args.user_skills, args.repeat)
@@ -0,0 +1,214 @@
+"""
+Streaming responses: time to first byte and first token, buffered JSON vs SSE.
+
+Runs a fake two-node pipeline (a "draft" node and a "review" node, each a fake
+chat model with a fixed time to first token and a fixed delay between tokens)
+behind one endpoint that answers either JSON, after the whole pipeline ran, or
+Server-Sent Events (``Accept: text/event-stream``) with every token and node
+output as it is produced. The application is driven directly through ASGI, so
+only the application's own latency is measured:
+
+- buffered JSON: time to first byte (= total time)
+- SSE: time to first byte (headers), first token and last event
+- SSE with the client disconnecting after the first token: how long the
+  pipeline kept running and how many tokens it still generated
+
+No database or model is needed.
+
+Usage:
+    python -m benchmarks.sse_ttft [--runs 5] [--first-token-ms 300]
+        [--token-ms 20] [--tokens 50]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, Response
+
+from src.streaming import EventStreamResponse, accepts_event_stream, graph_events
+
+NODES = ("draft", "review")
+
+
+class FakeChunk:
+    """Message chunk as streamed by a LangChain chat model."""
+
+    __slots__ = ("content",)
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+
+class FakeGraph:
+    """Compiled-graph stand-in: each node streams tokens from a fake model."""
+
+    def __init__(self, first_token: float, per_token: float, tokens: int) -> None:
+        self.first_token = first_token
+        self.per_token = per_token
+        self.tokens = tokens
+        self.generated = 0
+        self.stopped_at: float | None = None
+
+    async def astream(
+        self,
+        input: Any,
+        config: Any = None,  # noqa: ARG002
+        *,
+        stream_mode: Any = None,
+    ) -> AsyncIterator[Any]:
+        try:
+            state = dict(input)
+            for node in NODES:
+                await asyncio.sleep(self.first_token)
+                parts = []
+                for index in range(self.tokens):
+                    if index:
+                        await asyncio.sleep(self.per_token)
+                    self.generated += 1
+                    parts.append(f"tok{index} ")
+                    if "messages" in stream_mode:
+                        yield "messages", (FakeChunk(parts[-1]), {"langgraph_node": node})
+                state[node] = "".join(parts)
+                yield "updates", {node: {node: state[node]}}
+        finally:
+            self.stopped_at = time.perf_counter()
+
+    async def ainvoke(self, input: Any) -> dict[str, Any]:
+        state: dict[str, Any] = {}
+        async for _, chunk in self.astream(input, stream_mode=["updates"]):
+            for output in chunk.values():
+                state.update(output)
+        return state
+
+
+def build_app(graph: FakeGraph) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/tailor")
+    async def tailor(request: Request) -> Response:
+        inputs = {"resume_id": 1}
+        if accepts_event_stream(request):
+            return EventStreamResponse(graph_events(graph, inputs))
+        return ORJSONResponse(await graph.ainvoke(inputs))
+
+    return app
+
+
+class Client:
+    """Minimal ASGI client recording when each part of the response arrives."""
+
+    def __init__(self, app: FastAPI, *, accept: str, disconnect_on_token: bool = False) -> None:
+        self.app = app
+        self.accept = accept
+        self.disconnect_on_token = disconnect_on_token
+        self.disconnected = asyncio.Event()
+        self.requested = False
+        self.first_byte: float | None = None
+        self.first_token: float | None = None
+        self.last_body: float | None = None
+        self.disconnected_at: float | None = None
+        self.body = b""
+
+    async def receive(self) -> dict[str, Any]:
+        if not self.requested:
+            self.requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message: dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if message["type"] == "http.response.start":
+            self.first_byte = now
+            return
+        body = message.get("body", b"")
+        if not body:
+            return
+        self.body += body
+        self.last_body = now
+        if self.first_token is None and (
+            b"event: token" in body or self.accept != "text/event-stream"
+        ):
+            self.first_token = now
+            if self.disconnect_on_token:
+                self.disconnected_at = now
+                self.disconnected.set()
+
+    async def request(self) -> float:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.4"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/tailor",
+            "raw_path": b"/tailor",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"bench"), (b"accept", self.accept.encode())],
+            "client": ("127.0.0.1", 1),
+            "server": ("bench", 80),
+        }
+        started = time.perf_counter()
+        await self.app(scope, self.receive, self.send)
+        self.disconnected.set()
+        return started
+
+
+def ms(values: list[float]) -> str:
+    return f"{statistics.median(values) * 1000:9.1f} ms"
+
+
+async def main(runs: int, first_token_ms: float, token_ms: float, tokens: int) -> None:
+    first_token, per_token = first_token_ms / 1000, token_ms / 1000
+    print(f"{len(NODES)} nodes x {tokens} tokens, first token after {first_token_ms:.0f} ms, "
+          f"{token_ms:.0f} ms per token; median of {runs} runs\n")  # fmt: skip
+
+    buffered_ttfb = []
+    for _ in range(runs):
+        graph = FakeGraph(first_token, per_token, tokens)
+        client = Client(build_app(graph), accept="application/json")
+        started = await client.request()
+        buffered_ttfb.append(client.first_byte - started)
+        assert len(orjson.loads(client.body)) == len(NODES)
+    print(f"Buffered JSON  first byte {ms(buffered_ttfb)}   (= complete response)")
+
+    ttfb, ttft, total = [], [], []
+    for _ in range(runs):
+        graph = FakeGraph(first_token, per_token, tokens)
+        client = Client(build_app(graph), accept="text/event-stream")
+        started = await client.request()
+        ttfb.append(client.first_byte - started)
+        ttft.append(client.first_token - started)
+        total.append(client.last_body - started)
+        assert client.body.count(b"event: token") == len(NODES) * tokens
+        assert client.body.endswith(b"event: done\ndata: {}\n\n")
+    print(f"SSE            first byte {ms(ttfb)}   first token {ms(ttft)}   done {ms(total)}")
+
+    stop_delay, after = [], []
+    for _ in range(runs):
+        graph = FakeGraph(first_token, per_token, tokens)
+        client = Client(build_app(graph), accept="text/event-stream", disconnect_on_token=True)
+        await client.request()
+        stop_delay.append(graph.stopped_at - client.disconnected_at)
+        # Tokens generated after the one that made the client leave
+        after.append(graph.generated - 1)
+    print(f"SSE, client leaves after the first token: pipeline stopped {ms(stop_delay)} later, "
+          f"{statistics.median(after):.0f} more tokens generated "
+          f"(of {len(NODES) * tokens - 1} without cancellation)")  # fmt: skip
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--first-token-ms", type=float, default=300.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--tokens", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.runs, args.first_token_ms, args.token_ms, args.tokens))
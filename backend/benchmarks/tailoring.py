@@ -0,0 +1,180 @@
+"""
+Resume re-tailoring: LLM calls, tokens and latency saved by section-level caching.
+
+Tailors a generated resume (a header and ``--sections`` other sections) with
+``TailoringService`` through a sequence of edits a user typically makes, and
+reports for each run the sections sent to the LLM, the tokens spent and saved
+and the run's duration:
+
+- first tailoring for a job description
+- the same request again
+- one bullet of one experience edited
+- the same job description pasted again with different whitespace
+- a different job description
+
+A fake LLM stands in for the model: it waits ``--llm-latency-ms`` plus
+``--ms-per-token`` per output token and counts about 4 characters per token.
+Each run is compared with regenerating the whole resume in one call, which
+sends the resume and the job description every time.
+
+Requires a migrated database (DATABASE_URL); rows written under the fake model
+name are deleted before and after the run.
+
+Usage:
+    python -m benchmarks.tailoring [--sections 10] [--llm-latency-ms 500]
+        [--ms-per-token 10]
+"""
+
+import argparse
+import asyncio
+import random
+
+from sqlalchemy import delete
+
+from src.database import close_db, get_engine
+from src.render import render_key
+from src.tailoring import (
+    TEMPLATE,
+    ResumeSection,
+    SectionKind,
+    SectionTailoring,
+    TailoredSectionRecord,
+    TailoringService,
+    TailorResumeRequest,
+    get_tailoring_settings,
+)
+
+FAKE_MODEL = "benchmark-fake-llm"
+CHARACTERS_PER_TOKEN = 4
+PROMPT_TOKENS = 150  # system prompt
+
+VERBS = ("Built", "Led", "Designed", "Migrated", "Scaled", "Automated", "Reduced", "Shipped")
+OBJECTS = ("billing services", "a data pipeline", "the CI/CD setup", "search", "an API gateway")
+RESULTS = ("cutting latency by 40%", "for 2M users", "saving $200k a year", "with zero downtime")
+KINDS = (SectionKind.EXPERIENCE, SectionKind.PROJECTS, SectionKind.SKILLS, SectionKind.EDUCATION)
+
+
+def tokens(text: str) -> int:
+    return len(text) // CHARACTERS_PER_TOKEN + 1
+
+
+class FakeSectionTailorer:
+    """LLM stand-in: latency grows with the output, token counts with the text."""
+
+    def __init__(self, latency_seconds: float, seconds_per_token: float) -> None:
+        self.model = FAKE_MODEL
+        self.latency_seconds = latency_seconds
+        self.seconds_per_token = seconds_per_token
+        self.calls = 0
+
+    async def tailor(self, section: ResumeSection, job_description: str) -> SectionTailoring:
+        self.calls += 1
+        # Depends on the job description, like a real tailoring
+        focus = job_description.rstrip(".").rsplit(", ", 1)[-1]
+        content = "\n".join([*reversed(section.content.splitlines()), f"- Focus: {focus}"])
+        await asyncio.sleep(self.latency_seconds + tokens(content) * self.seconds_per_token)
+        return SectionTailoring(
+            content=content,
+            input_tokens=PROMPT_TOKENS + tokens(job_description) + tokens(section.content),
+            output_tokens=tokens(content),
+        )
+
+
+def build_resume(sections: int, rng: random.Random) -> list[ResumeSection]:
+    resume = [ResumeSection(kind=SectionKind.HEADER, content="Ada Lovelace\nada@example.com")]
+    for index in range(sections):
+        bullets = [
+            f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(RESULTS)}"
+            for _ in range(rng.randint(3, 6))
+        ]
+        resume.append(
+            ResumeSection(
+                kind=KINDS[index % len(KINDS)],
+                title=f"Section {index}",
+                content=f"Role {index}, Company {index} (2018-2024)\n" + "\n".join(bullets),
+            )
+        )
+    return resume
+
+
+def build_job_description(rng: random.Random) -> str:
+    words = [rng.choice(OBJECTS + RESULTS) for _ in range(60)]
+    return "Senior Engineer\n\nRequirements: " + ", ".join(words) + "."
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    rng = random.Random(22)
+    tailorer = FakeSectionTailorer(arguments.llm_latency_ms / 1000, arguments.ms_per_token / 1000)
+    service = TailoringService(get_engine(), tailorer, get_tailoring_settings())
+    resume = build_resume(arguments.sections, rng)
+    job_description = build_job_description(rng)
+
+    edited = list(resume)
+    section = edited[1]
+    first, *rest = section.content.split("\n- ")
+    rest[0] = "Rewrote " + rest[0]
+    edited[1] = section.model_copy(update={"content": "\n- ".join([first, *rest])})
+    pasted = "  " + job_description.replace("\n", "\r\n").replace(" ", "\u00a0", 5) + " \n"
+    runs = [
+        ("first tailoring", resume, job_description),
+        ("same request", resume, job_description),
+        ("one bullet edited", edited, job_description),
+        ("job description re-pasted", edited, pasted),
+        ("other job description", edited, build_job_description(rng)),
+    ]
+
+    async with get_engine().begin() as conn:
+        await conn.execute(
+            delete(TailoredSectionRecord).where(TailoredSectionRecord.model == FAKE_MODEL)
+        )
+    print(
+        f"{len(resume)} sections, LLM {arguments.llm_latency_ms:.0f} ms + "
+        f"{arguments.ms_per_token:.0f} ms/token; whole-resume regeneration per run for comparison"
+    )
+    print(
+        f"{'run':<28}{'LLM calls':>10}{'tokens':>9}{'saved':>9}{'whole':>9}"
+        f"{'seconds':>9}{'whole s':>9}  PDF"
+    )
+    previous_key = None
+    totals = [0, 0]
+    try:
+        for name, sections, text in runs:
+            calls = tailorer.calls
+            result = await service.tailor(
+                TailorResumeRequest(job_description=text, sections=sections)
+            )
+            report = result.report
+            # One call with the whole resume in and out
+            resume_tokens = sum(tokens(section.content) for section in sections)
+            whole_tokens = PROMPT_TOKENS + tokens(text) + 2 * resume_tokens
+            whole_seconds = (
+                arguments.llm_latency_ms / 1000 + resume_tokens * arguments.ms_per_token / 1000
+            )
+            spent = report.input_tokens + report.output_tokens
+            totals[0] += spent
+            totals[1] += whole_tokens
+            key = render_key(TEMPLATE, result.latex, "pdflatex")
+            pdf = "cached" if key == previous_key else "render"
+            previous_key = key
+            print(
+                f"{name:<28}{tailorer.calls - calls:>10}{spent:>9}{report.tokens_saved:>9}"
+                f"{whole_tokens:>9}{report.seconds:>9.2f}{whole_seconds:>9.2f}  {pdf}"
+            )
+        print(
+            f"Total tokens: {totals[0]} section by section, {totals[1]} regenerating the whole "
+            f"resume every run"
+        )
+    finally:
+        async with get_engine().begin() as conn:
+            await conn.execute(
+                delete(TailoredSectionRecord).where(TailoredSectionRecord.model == FAKE_MODEL)
+            )
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=10)
+    parser.add_argument("--llm-latency-ms", type=float, default=500.0)
+    parser.add_argument("--ms-per-token", type=float, default=10.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,42 @@
+"""Application, ATS score and skill demand analytics, served from pre-aggregated rollups."""
+
+from .config import AnalyticsConfig, get_analytics_settings
+from .constants import ANALYTICS_REFRESH_JOB, ANALYTICS_SKILLS_JOB, MATERIALIZED_VIEWS
+from .models import ApplicationWeek, AtsVersionScores, DocumentSkills, SkillWeek
+from .router import router
+from .schemas import (
+    ApplicationFunnel,
+    ApplicationWeekRead,
+    AtsVersionTrend,
+    MarketSkillDemand,
+    MarketSkillDemandResponse,
+    SkillDemand,
+    SkillDemandResponse,
+    SkillWeekRead,
+)
+from .service import enqueue_skill_extraction, extract_skills, refresh_views, schedule_refresh
+
+__all__ = [
+    "ANALYTICS_REFRESH_JOB",
+    "ANALYTICS_SKILLS_JOB",
+    "MATERIALIZED_VIEWS",
+    "AnalyticsConfig",
+    "ApplicationFunnel",
+    "ApplicationWeek",
+    "ApplicationWeekRead",
+    "AtsVersionScores",
+    "AtsVersionTrend",
+    "DocumentSkills",
+    "MarketSkillDemand",
+    "MarketSkillDemandResponse",
+    "SkillDemand",
+    "SkillDemandResponse",
+    "SkillWeek",
+    "SkillWeekRead",
+    "enqueue_skill_extraction",
+    "extract_skills",
+    "get_analytics_settings",
+    "refresh_views",
+    "router",
+    "schedule_refresh",
+]
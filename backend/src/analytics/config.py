@@ -0,0 +1,42 @@
+"""Analytics configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class AnalyticsConfig(BaseSettings):
+    """Analytics configuration loaded from environment variables."""
+
+    # The materialized views are refreshed at most this often, after skills changed
+    analytics_refresh_interval_seconds: float = Field(
+        default=300.0, gt=0, alias="ANALYTICS_REFRESH_INTERVAL_SECONDS"
+    )
+    # Market demand only lists skills asked for by job descriptions of this many
+    # users, so it never reveals what one user saved
+    analytics_market_min_users: int = Field(default=5, ge=1, alias="ANALYTICS_MARKET_MIN_USERS")
+    # Job descriptions whose skills are extracted and written per statement
+    analytics_skills_batch_size: int = Field(default=500, ge=1, alias="ANALYTICS_SKILLS_BATCH_SIZE")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_analytics_settings() -> AnalyticsConfig:
+    """Get the global analytics configuration, loaded from the environment on first use."""
+    return AnalyticsConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``analytics_settings`` is built on first access
+    if name == "analytics_settings":
+        return get_analytics_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -0,0 +1,23 @@
+"""Constants for the analytics rollups."""
+
+# Kind of the background job that extracts the skills of saved job descriptions
+ANALYTICS_SKILLS_JOB = "analytics.skills"
+# Kind of the background job that refreshes the materialized views
+ANALYTICS_REFRESH_JOB = "analytics.refresh"
+
+# Materialized views over the skill rollups, refreshed by ANALYTICS_REFRESH_JOB.
+# Each has a unique index, so it is refreshed concurrently, without blocking reads.
+SKILL_DEMAND_VIEW = "analytics_skill_demand"  # per user
+MARKET_SKILL_VIEW = "analytics_market_skill"  # across all users
+MATERIALIZED_VIEWS = (SKILL_DEMAND_VIEW, MARKET_SKILL_VIEW)
+# Cache tag of the market demand responses, invalidated by every refresh
+MARKET_SKILL_CACHE_TAG = "market-skill-demand"
+
+# Trends compare the last TREND_WEEKS weeks with the TREND_WEEKS weeks before
+# (part of the materialized view definitions: changing it needs a migration)
+TREND_WEEKS = 4
+
+# Longest weekly series a request may ask for: two years
+MAX_WEEKS = 104
+# Skills listed in one demand response
+MAX_SKILLS = 200
@@ -0,0 +1,38 @@
+"""
+Analytics job handlers.
+
+Imported by every worker: ``src.analytics.jobs`` is in the default
+``JOB_HANDLER_MODULES``.
+"""
+
+import time
+from typing import Any
+
+from ..database import get_engine
+from ..jobs import ClaimedJob, PermanentJobError, job_handler
+from .config import get_analytics_settings
+from .constants import ANALYTICS_REFRESH_JOB, ANALYTICS_SKILLS_JOB, MATERIALIZED_VIEWS
+from .service import extract_skills, refresh_views, schedule_refresh
+
+
+@job_handler(ANALYTICS_SKILLS_JOB, timeout_seconds=600)
+async def extract_document_skills(job: ClaimedJob) -> dict[str, Any]:
+    """Extract the skills of a user's job descriptions, then schedule a view refresh."""
+    if job.user_id is None:
+        message = "Skill extraction jobs belong to a user"
+        raise PermanentJobError(message)
+    config = get_analytics_settings()
+    documents = await extract_skills(
+        get_engine(), job.user_id, config, job.payload.get("document_ids")
+    )
+    if documents:
+        await schedule_refresh(config)
+    return {"documents": documents}
+
+
+@job_handler(ANALYTICS_REFRESH_JOB, timeout_seconds=1800)
+async def refresh_materialized_views(job: ClaimedJob) -> dict[str, Any]:  # noqa: ARG001
+    """Refresh the materialized views."""
+    started = time.perf_counter()
+    await refresh_views(get_engine())
+    return {"views": list(MATERIALIZED_VIEWS), "seconds": round(time.perf_counter() - started, 3)}
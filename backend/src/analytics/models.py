@@ -0,0 +1,83 @@
+"""
+Analytics rollup database models.
+
+The rollups are kept up to date by statement-level triggers (see the
+migration that creates them), in the transaction of every change: an
+application imported, updated or deleted, an ATS score stored, the skills of a
+job description written. A trigger aggregates all the rows its statement
+changed before touching the rollup, so a bulk import or a scoring job of a
+million rows updates a few rollup rows once. Dashboards read the rollups,
+never the source tables.
+"""
+
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Column, Date, DateTime, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import Field, SQLModel
+
+
+class ApplicationWeek(SQLModel, table=True):
+    """
+    Applications of a user per week and current status.
+
+    The week (a Monday, UTC) is that of ``applied_at``, or of ``created_at``
+    for applications not sent yet. Summed over the weeks, the counts are the
+    status funnel.
+    """
+
+    __tablename__ = "analytics_application_week"
+
+    user_id: int = Field(sa_column=Column(Integer, primary_key=True))
+    week: date = Field(sa_column=Column(Date, primary_key=True))
+    status: str = Field(sa_column=Column(String(32), primary_key=True))
+    applications: int = Field(sa_column=Column(Integer, nullable=False))
+
+
+class DocumentSkills(SQLModel, table=True):
+    """
+    Skills found in a saved job description, written by skill extraction jobs.
+
+    Deleted with the job description (by a trigger on ``search_document``).
+    """
+
+    __tablename__ = "analytics_document_skills"
+
+    # A search document of kind job_description
+    document_id: int = Field(sa_column=Column(BigInteger, primary_key=True, autoincrement=False))
+    user_id: int = Field(sa_column=Column(Integer, nullable=False))
+    # Week the job description was saved (a Monday, UTC)
+    week: date = Field(sa_column=Column(Date, nullable=False))
+    skills: list[str] = Field(sa_column=Column(ARRAY(Text), nullable=False))
+    # Job descriptions updated since are extracted again
+    analysed_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
+
+
+class SkillWeek(SQLModel, table=True):
+    """Job descriptions a user saved per week that ask for a skill."""
+
+    __tablename__ = "analytics_skill_week"
+
+    user_id: int = Field(sa_column=Column(Integer, primary_key=True))
+    week: date = Field(sa_column=Column(Date, primary_key=True))
+    skill: str = Field(sa_column=Column(Text, primary_key=True))
+    job_count: int = Field(sa_column=Column(Integer, nullable=False))
+
+
+class AtsVersionScores(SQLModel, table=True):
+    """
+    Count and sum of the stored ATS scores of a resume version.
+
+    Their ratio, version after version, is how the resume's scores trend.
+    """
+
+    __tablename__ = "analytics_ats_version"
+
+    user_id: int = Field(sa_column=Column(Integer, primary_key=True))
+    resume_id: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    resume_version: int = Field(sa_column=Column(Integer, primary_key=True))
+    scores: int = Field(sa_column=Column(Integer, nullable=False))
+    score_total: int = Field(sa_column=Column(BigInteger, nullable=False))
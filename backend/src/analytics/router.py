@@ -0,0 +1,289 @@
+"""Analytics dashboard endpoints."""
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..auth import parse_jwt_data
+from ..auth.schemas import JWTData
+from ..cache import CachedRoute, cache_response
+from ..database import get_read_db_session
+from ..jobs import JobRead
+from ..pagination import CursorPage, KeysetParams, get_keyset_params, paginate
+from .config import get_analytics_settings
+from .constants import ANALYTICS_SKILLS_JOB, MARKET_SKILL_CACHE_TAG, MAX_SKILLS, MAX_WEEKS
+from .schemas import (
+    ApplicationFunnel,
+    ApplicationWeekRead,
+    AtsVersionTrend,
+    MarketSkillDemandResponse,
+    SkillDemandResponse,
+    SkillWeekRead,
+)
+from .service import (
+    application_funnel,
+    application_weeks,
+    ats_trend_statement,
+    enqueue_skill_extraction,
+    market_skill_demand,
+    skill_demand,
+    skill_weeks,
+)
+
+router = APIRouter(prefix="/analytics", tags=["analytics"], route_class=CachedRoute)
+
+
+@router.get(
+    "/applications/funnel",
+    response_model=ApplicationFunnel,
+    status_code=status.HTTP_200_OK,
+    summary="Application funnel",
+    description=(
+        "Counts the user's applications by current status, and the share of sent "
+        "applications that reached an interview or an offer. Statuses are current: "
+        "an application rejected after its interviews counts as sent, not as "
+        "interviewed."
+    ),
+    responses={
+        200: {
+            "description": "The funnel",
+            "content": {
+                "application/json": {
+                    "example": ApplicationFunnel.model_config["json_schema_extra"]["example"]
+                }
+            },
+        }
+    },
+)
+async def get_application_funnel(
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> ApplicationFunnel:
+    """
+    Application funnel endpoint.
+
+    Sums the user's weekly status rollup: a few rows per week, however many
+    applications.
+    """
+    return await application_funnel(session, jwt_data.user_id)
+
+
+@router.get(
+    "/applications/weekly",
+    response_model=list[ApplicationWeekRead],
+    status_code=status.HTTP_200_OK,
+    summary="Applications per week",
+    description=(
+        "Counts the user's applications of the last weeks by week (of applied_at, or "
+        "of created_at for saved ones) and current status, oldest week first. Weeks "
+        "without applications are left out."
+    ),
+    responses={
+        200: {
+            "description": "Applications per week",
+            "content": {
+                "application/json": {
+                    "example": [ApplicationWeekRead.model_config["json_schema_extra"]["example"]]
+                }
+            },
+        }
+    },
+)
+async def get_application_weeks(
+    weeks: int = Query(26, ge=1, le=MAX_WEEKS, description="Weeks to cover, this one included"),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> list[ApplicationWeekRead]:
+    """
+    Weekly applications endpoint.
+
+    One primary key range scan of the weekly status rollup.
+    """
+    return await application_weeks(session, jwt_data.user_id, weeks)
+
+
+@router.get(
+    "/skills/weekly",
+    response_model=list[SkillWeekRead],
+    status_code=status.HTTP_200_OK,
+    summary="Skills asked for per week",
+    description=(
+        "Counts, for each week, the job descriptions the user saved that ask for each "
+        "skill: oldest week first, then the most asked-for skills. Pass skill for the "
+        "series of one skill. Skills are extracted by a background job shortly after "
+        "a job description is saved."
+    ),
+    responses={
+        200: {
+            "description": "Skills per week",
+            "content": {
+                "application/json": {
+                    "example": [SkillWeekRead.model_config["json_schema_extra"]["example"]]
+                }
+            },
+        }
+    },
+)
+async def get_skill_weeks(
+    weeks: int = Query(12, ge=1, le=MAX_WEEKS, description="Weeks to cover, this one included"),
+    skill: str | None = Query(None, max_length=100, description="Only this skill"),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> list[SkillWeekRead]:
+    """
+    Weekly skills endpoint.
+
+    One primary key range scan of the weekly skill rollup.
+    """
+    return await skill_weeks(session, jwt_data.user_id, weeks, skill)
+
+
+@router.get(
+    "/skills/demand",
+    response_model=SkillDemandResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Skills the user's job descriptions ask for",
+    description=(
+        "Ranks the skills asked for by the job descriptions the user saved, over their "
+        "whole history, with how many asked for each in the last 4 weeks and in the 4 "
+        "weeks before. Computed periodically: refreshed_at tells when."
+    ),
+    responses={
+        200: {
+            "description": "Most asked-for skills first",
+            "content": {
+                "application/json": {
+                    "example": SkillDemandResponse.model_config["json_schema_extra"]["example"]
+                }
+            },
+        }
+    },
+)
+async def get_skill_demand(
+    limit: int = Query(20, ge=1, le=MAX_SKILLS, description="Number of skills to return"),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> SkillDemandResponse:
+    """
+    Skill demand endpoint.
+
+    Reads the top of the user's rows of a materialized view, in index order.
+    """
+    return await skill_demand(session, jwt_data.user_id, limit)
+
+
+@router.get(
+    "/market/skills",
+    response_model=MarketSkillDemandResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Skills the market asks for",
+    description=(
+        "Ranks the skills asked for by the job descriptions of all users, with their "
+        "4-week trend. Only skills asked for by several users' job descriptions are "
+        "listed. Computed periodically: refreshed_at tells when."
+    ),
+    responses={
+        200: {
+            "description": "Most asked-for skills first",
+            "content": {
+                "application/json": {
+                    "example": MarketSkillDemandResponse.model_config["json_schema_extra"][
+                        "example"
+                    ]
+                }
+            },
+        }
+    },
+)
+@cache_response(ttl_seconds=60, tags=(MARKET_SKILL_CACHE_TAG,), shared=True)
+async def get_market_skill_demand(
+    limit: int = Query(20, ge=1, le=MAX_SKILLS, description="Number of skills to return"),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> MarketSkillDemandResponse:
+    """
+    Market skill demand endpoint.
+
+    Reads the top of a materialized view, in index order; responses are cached
+    until the view is refreshed.
+    """
+    return await market_skill_demand(session, limit, get_analytics_settings())
+
+
+@router.get(
+    "/ats",
+    response_model=CursorPage[AtsVersionTrend],
+    status_code=status.HTTP_200_OK,
+    summary="ATS scores per resume version",
+    description=(
+        "Averages the stored ATS scores of each version of the user's resumes (see "
+        "POST /v1/ats/scores/jobs), in resume then version order: how each resume's "
+        "scores changed from version to version."
+    ),
+    responses={
+        200: {
+            "description": "A page of resume versions",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "items": [AtsVersionTrend.model_config["json_schema_extra"]["example"]],
+                        "next_cursor": None,
+                        "has_more": False,
+                        "estimated_total": None,
+                    }
+                }
+            },
+        }
+    },
+)
+async def list_ats_trend(
+    resume_id: int | None = Query(None, description="Only versions of this resume"),
+    params: KeysetParams = Depends(get_keyset_params),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> CursorPage[AtsVersionTrend]:
+    """
+    ATS trend endpoint.
+
+    Keyset-paginated over the per-version score rollup.
+    """
+    statement, order_by = ats_trend_statement(jwt_data.user_id, resume_id=resume_id)
+    return await paginate(session, statement, order_by=order_by, params=params)
+
+
+@router.post(
+    "/skills/jobs",
+    response_model=JobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Enqueue a skill extraction job",
+    description=(
+        "Enqueues a background job that extracts the skills of the user's job "
+        "descriptions not extracted yet or updated since, e.g. those saved before "
+        "analytics were enabled. Saving a job description enqueues one already. Poll "
+        "the job with GET /v1/jobs/{job_id}."
+    ),
+    responses={
+        202: {
+            "description": "The queued job",
+            "content": {
+                "application/json": {
+                    "example": {
+                        **JobRead.model_config["json_schema_extra"]["example"],
+                        "kind": ANALYTICS_SKILLS_JOB,
+                        "status": "queued",
+                        "attempts": 0,
+                        "result": None,
+                        "started_at": None,
+                        "finished_at": None,
+                    }
+                }
+            },
+        }
+    },
+)
+async def enqueue_extraction(jwt_data: JWTData = Depends(parse_jwt_data)) -> JobRead:
+    """
+    Skill extraction job endpoint.
+
+    One INSERT into the job queue; a worker with ``src.analytics.jobs`` in
+    ``JOB_HANDLER_MODULES`` runs it.
+    """
+    return await enqueue_skill_extraction(jwt_data.user_id)
@@ -0,0 +1,174 @@
+"""Analytics dashboard response models."""
+
+from datetime import date
+
+from pydantic import ConfigDict, Field
+
+from ..models import CustomBaseModel, UTCDatetime
+
+
+class ApplicationFunnel(CustomBaseModel):
+    """How far the user's applications went."""
+
+    total: int = Field(..., description="Applications, saved ones included")
+    by_status: dict[str, int] = Field(..., description="Applications by current status")
+    applied: int = Field(..., description="Applications sent (every status but saved)")
+    interviewing: int = Field(..., description="Applications at interview or offer")
+    offers: int = Field(..., description="Applications with an offer")
+    interview_rate: float | None = Field(
+        ..., description="Share of sent applications that reached an interview"
+    )
+    offer_rate: float | None = Field(
+        ..., description="Share of sent applications that got an offer"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "total": 48,
+                "by_status": {
+                    "saved": 6,
+                    "applied": 25,
+                    "interviewing": 4,
+                    "offer": 1,
+                    "rejected": 11,
+                    "withdrawn": 1,
+                },
+                "applied": 42,
+                "interviewing": 5,
+                "offers": 1,
+                "interview_rate": 0.119,
+                "offer_rate": 0.024,
+            }
+        }
+    )
+
+
+class ApplicationWeekRead(CustomBaseModel):
+    """Applications of one week, by current status."""
+
+    week: date = Field(..., description="Monday of the week (UTC)")
+    applications: int = Field(..., description="Applications of the week")
+    by_status: dict[str, int] = Field(..., description="Applications by current status")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "week": "2026-02-02",
+                "applications": 7,
+                "by_status": {"applied": 5, "interviewing": 1, "rejected": 1},
+            }
+        }
+    )
+
+
+class SkillWeekRead(CustomBaseModel):
+    """Job descriptions of one week that ask for a skill."""
+
+    week: date = Field(..., description="Monday of the week (UTC)")
+    skill: str = Field(..., description="Skill")
+    job_count: int = Field(..., description="Job descriptions saved that week asking for it")
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"week": "2026-02-02", "skill": "Python", "job_count": 4}}
+    )
+
+
+class SkillDemand(CustomBaseModel):
+    """How often a skill is asked for, and its trend."""
+
+    skill: str = Field(..., description="Skill")
+    job_count: int = Field(..., description="Job descriptions asking for it")
+    share: float = Field(..., description="Share of the job descriptions asking for it")
+    recent: int = Field(..., description="Job descriptions of the last 4 weeks asking for it")
+    previous: int = Field(..., description="Job descriptions of the 4 weeks before")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "skill": "Python",
+                "job_count": 31,
+                "share": 0.62,
+                "recent": 9,
+                "previous": 5,
+            }
+        },
+    )
+
+
+class MarketSkillDemand(SkillDemand):
+    """How often a skill is asked for across all users, and its trend."""
+
+    users: int = Field(..., description="Users who saved job descriptions asking for it")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                **SkillDemand.model_config["json_schema_extra"]["example"],
+                "job_count": 12_480,
+                "share": 0.41,
+                "recent": 1_210,
+                "previous": 1_105,
+                "users": 3_905,
+            }
+        },
+    )
+
+
+class SkillDemandResponse(CustomBaseModel):
+    """The most asked-for skills, most first."""
+
+    refreshed_at: UTCDatetime | None = Field(
+        ..., description="When the figures were computed; null before any job description"
+    )
+    skills: list[SkillDemand] = Field(..., description="Skills, most asked for first")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "refreshed_at": "2026-02-01T00:05:00Z",
+                "skills": [SkillDemand.model_config["json_schema_extra"]["example"]],
+            }
+        }
+    )
+
+
+class MarketSkillDemandResponse(CustomBaseModel):
+    """The most asked-for skills across all users, most first."""
+
+    refreshed_at: UTCDatetime | None = Field(
+        ..., description="When the figures were computed; null before any job description"
+    )
+    skills: list[MarketSkillDemand] = Field(..., description="Skills, most asked for first")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "refreshed_at": "2026-02-01T00:05:00Z",
+                "skills": [MarketSkillDemand.model_config["json_schema_extra"]["example"]],
+            }
+        }
+    )
+
+
+class AtsVersionTrend(CustomBaseModel):
+    """Stored ATS scores of a resume version, averaged."""
+
+    resume_id: int = Field(..., description="Resume ID")
+    resume_version: int = Field(..., description="Resume version")
+    scores: int = Field(..., description="Job descriptions it was scored against")
+    average_score: float = Field(..., description="Mean score, 0 to 100")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "resume_id": 7,
+                "resume_version": 12,
+                "scores": 42,
+                "average_score": 61.4,
+            }
+        },
+    )
@@ -0,0 +1,320 @@
+"""
+Dashboard figures, read from the analytics rollups and materialized views.
+
+Application and ATS score rollups are maintained by triggers, so they are up
+to date as soon as a change commits. Skills need Python to extract, so saving
+a job description enqueues a skill extraction job (``extract_skills``) in the
+same transaction; a trigger then counts the extracted skills. The heavier
+demand figures, ranked over the whole history with their trends, are
+materialized views refreshed by a job that extraction schedules: at most one
+refresh per ``ANALYTICS_REFRESH_INTERVAL_SECONDS``, however many job
+descriptions were saved.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import ColumnElement, Numeric, Select, cast, column, func, select, table, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ..ats.features import extract_features
+from ..cache import get_cache_settings, get_response_cache
+from ..datetime.utils import get_current_utc_datetime
+from ..jobs import JobRead, get_job_queue
+from ..search.constants import DocumentKind
+from ..search.models import SearchDocument
+from .config import AnalyticsConfig
+from .constants import (
+    ANALYTICS_REFRESH_JOB,
+    ANALYTICS_SKILLS_JOB,
+    MARKET_SKILL_CACHE_TAG,
+    MARKET_SKILL_VIEW,
+    MATERIALIZED_VIEWS,
+    SKILL_DEMAND_VIEW,
+)
+from .models import ApplicationWeek, AtsVersionScores, DocumentSkills, SkillWeek
+from .schemas import (
+    ApplicationFunnel,
+    ApplicationWeekRead,
+    MarketSkillDemand,
+    MarketSkillDemandResponse,
+    SkillDemand,
+    SkillDemandResponse,
+    SkillWeekRead,
+)
+
+_DEMAND_COLUMNS = ("skill", "job_count", "share", "recent", "previous", "refreshed_at")
+_skill_demand = table(SKILL_DEMAND_VIEW, column("user_id"), *map(column, _DEMAND_COLUMNS))
+_market_skill = table(MARKET_SKILL_VIEW, column("users"), *map(column, _DEMAND_COLUMNS))
+
+# Statuses past each funnel stage; history is not kept, so an application
+# rejected after its interviews counts as sent, not as interviewed
+_SAVED = "saved"
+_INTERVIEWED = ("interviewing", "offer")
+_OFFER = "offer"
+# Rates are rounded to this many decimals
+_RATE_DIGITS = 3
+
+
+def first_week(weeks: int) -> date:
+    """Monday (UTC) of the first of the last ``weeks`` weeks, this one included."""
+    today = get_current_utc_datetime().date()
+    return today - timedelta(days=today.weekday() + 7 * (weeks - 1))
+
+
+def _rate(count: int, total: int) -> float | None:
+    return round(count / total, _RATE_DIGITS) if total else None
+
+
+async def application_funnel(session: AsyncSession, user_id: int) -> ApplicationFunnel:
+    """A user's applications by current status, and how far they went."""
+    statement = (
+        select(ApplicationWeek.status, func.sum(ApplicationWeek.applications))
+        .where(ApplicationWeek.user_id == user_id)
+        .group_by(ApplicationWeek.status)
+    )
+    by_status = {
+        status: count for status, count in (await session.execute(statement)).all() if count
+    }
+    total = sum(by_status.values())
+    applied = total - by_status.get(_SAVED, 0)
+    interviewing = sum(by_status.get(status, 0) for status in _INTERVIEWED)
+    offers = by_status.get(_OFFER, 0)
+    return ApplicationFunnel(
+        total=total,
+        by_status=by_status,
+        applied=applied,
+        interviewing=interviewing,
+        offers=offers,
+        interview_rate=_rate(interviewing, applied),
+        offer_rate=_rate(offers, applied),
+    )
+
+
+async def application_weeks(
+    session: AsyncSession, user_id: int, weeks: int
+) -> list[ApplicationWeekRead]:
+    """A user's applications of the last ``weeks`` weeks, by week, oldest first."""
+    statement = (
+        select(ApplicationWeek.week, ApplicationWeek.status, ApplicationWeek.applications)
+        .where(
+            ApplicationWeek.user_id == user_id,
+            ApplicationWeek.week >= first_week(weeks),
+            ApplicationWeek.applications > 0,
+        )
+        .order_by(ApplicationWeek.week, ApplicationWeek.status)
+    )
+    by_week: defaultdict[date, dict[str, int]] = defaultdict(dict)
+    for week, status, applications in (await session.execute(statement)).all():
+        by_week[week][status] = applications
+    return [
+        ApplicationWeekRead(week=week, applications=sum(by_status.values()), by_status=by_status)
+        for week, by_status in by_week.items()
+    ]
+
+
+async def skill_weeks(
+    session: AsyncSession, user_id: int, weeks: int, skill: str | None = None
+) -> list[SkillWeekRead]:
+    """
+    Skills of the job descriptions a user saved in the last ``weeks`` weeks.
+
+    Oldest week first, then the most asked-for skills first.
+    """
+    statement = (
+        select(SkillWeek.week, SkillWeek.skill, SkillWeek.job_count)
+        .where(
+            SkillWeek.user_id == user_id,
+            SkillWeek.week >= first_week(weeks),
+            SkillWeek.job_count > 0,
+        )
+        .order_by(SkillWeek.week, SkillWeek.job_count.desc(), SkillWeek.skill)
+    )
+    if skill is not None:
+        statement = statement.where(SkillWeek.skill == skill)
+    rows = (await session.execute(statement)).mappings().all()
+    return [SkillWeekRead.model_validate(row) for row in rows]
+
+
+async def skill_demand(session: AsyncSession, user_id: int, limit: int) -> SkillDemandResponse:
+    """The skills the job descriptions of a user ask for most (materialized)."""
+    statement = (
+        select(_skill_demand)
+        .where(_skill_demand.c.user_id == user_id)
+        .order_by(_skill_demand.c.job_count.desc(), _skill_demand.c.skill)
+        .limit(limit)
+    )
+    rows = (await session.execute(statement)).mappings().all()
+    return SkillDemandResponse(
+        refreshed_at=rows[0]["refreshed_at"] if rows else None,
+        skills=[SkillDemand.model_validate(row) for row in rows],
+    )
+
+
+async def market_skill_demand(
+    session: AsyncSession, limit: int, config: AnalyticsConfig
+) -> MarketSkillDemandResponse:
+    """The skills the job descriptions of all users ask for most (materialized)."""
+    statement = (
+        select(_market_skill)
+        .where(_market_skill.c.users >= config.analytics_market_min_users)
+        .order_by(_market_skill.c.job_count.desc(), _market_skill.c.skill)
+        .limit(limit)
+    )
+    rows = (await session.execute(statement)).mappings().all()
+    return MarketSkillDemandResponse(
+        refreshed_at=rows[0]["refreshed_at"] if rows else None,
+        skills=[MarketSkillDemand.model_validate(row) for row in rows],
+    )
+
+
+def ats_trend_statement(
+    user_id: int, resume_id: int | None = None
+) -> tuple[Select[Any], list[ColumnElement[Any]]]:
+    """A user's average ATS score per resume version, for ``paginate``."""
+    statement = select(
+        AtsVersionScores.resume_id,
+        AtsVersionScores.resume_version,
+        AtsVersionScores.scores,
+        func.round(cast(AtsVersionScores.score_total, Numeric) / AtsVersionScores.scores, 1).label(
+            "average_score"
+        ),
+    ).where(AtsVersionScores.user_id == user_id, AtsVersionScores.scores > 0)
+    if resume_id is not None:
+        statement = statement.where(AtsVersionScores.resume_id == resume_id)
+    return statement, [AtsVersionScores.resume_id, AtsVersionScores.resume_version]
+
+
+async def enqueue_skill_extraction(
+    user_id: int, document_ids: list[int] | None = None, session: AsyncSession | None = None
+) -> JobRead:
+    """
+    Enqueue the extraction of the skills of a user's job descriptions.
+
+    Args:
+        user_id: Owner of the job descriptions.
+        document_ids: These job descriptions; by default every one not
+            extracted yet or updated since.
+        session: Enqueue in this session's transaction, e.g. the one saving
+            the job descriptions.
+
+    Returns:
+        The queued job.
+    """
+    job, _ = await get_job_queue().enqueue(
+        ANALYTICS_SKILLS_JOB, {"document_ids": document_ids}, user_id=user_id, session=session
+    )
+    return job
+
+
+def _extract(texts: list[str]) -> list[list[str]]:
+    return [sorted(extract_features(text).skills) for text in texts]
+
+
+async def extract_skills(
+    engine: AsyncEngine,
+    user_id: int,
+    config: AnalyticsConfig,
+    document_ids: list[int] | None = None,
+) -> int:
+    """
+    Extract and store the skills of a user's job descriptions.
+
+    Only job descriptions never extracted or updated since are read, so a
+    repeated job does nothing. Each batch is extracted in a thread and
+    written in one statement (one trigger run).
+
+    Args:
+        engine: Database engine.
+        user_id: Owner of the job descriptions.
+        config: Batch size.
+        document_ids: Only these job descriptions (ignored if not the user's).
+
+    Returns:
+        Job descriptions extracted.
+    """
+    extracted = DocumentSkills.__table__.c
+    statement = (
+        select(
+            SearchDocument.id,
+            SearchDocument.body,
+            # SQL function of the rollup migration: Monday (UTC) of the week
+            func.analytics_week(SearchDocument.created_at, type_=extracted.week.type).label("week"),
+        )
+        .outerjoin_from(SearchDocument, DocumentSkills, extracted.document_id == SearchDocument.id)
+        .where(
+            SearchDocument.user_id == user_id,
+            SearchDocument.kind == DocumentKind.JOB_DESCRIPTION.value,
+            (extracted.document_id.is_(None)) | (extracted.analysed_at < SearchDocument.updated_at),
+        )
+        .order_by(SearchDocument.id)
+        .limit(config.analytics_skills_batch_size)
+    )
+    if document_ids is not None:
+        statement = statement.where(SearchDocument.id.in_(document_ids))
+
+    count = 0
+    last_id = 0
+    while True:
+        async with engine.connect() as conn:
+            rows = (await conn.execute(statement.where(SearchDocument.id > last_id))).all()
+        if not rows:
+            return count
+        skills = await asyncio.to_thread(_extract, [row.body for row in rows])
+        upsert = insert(DocumentSkills).values(
+            [
+                {
+                    "document_id": row.id,
+                    "user_id": user_id,
+                    "week": row.week,
+                    "skills": document_skills,
+                }
+                for row, document_skills in zip(rows, skills, strict=True)
+            ]
+        )
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[extracted.document_id],
+            set_={
+                "week": upsert.excluded.week,
+                "skills": upsert.excluded.skills,
+                "analysed_at": func.now(),
+            },
+        )
+        async with engine.begin() as conn:
+            await conn.execute(upsert)
+        count += len(rows)
+        last_id = rows[-1].id
+
+
+async def schedule_refresh(config: AnalyticsConfig) -> None:
+    """
+    Enqueue a refresh of the materialized views at the end of this interval.
+
+    Idempotent per interval: every call until then returns the same job.
+    """
+    interval = config.analytics_refresh_interval_seconds
+    now = time.time()
+    slot = int(now // interval) + 1
+    await get_job_queue().enqueue(
+        ANALYTICS_REFRESH_JOB,
+        idempotency_key=f"{ANALYTICS_REFRESH_JOB}:{slot}",
+        delay_seconds=slot * interval - now,
+    )
+
+
+async def refresh_views(engine: AsyncEngine) -> None:
+    """
+    Refresh the materialized views, each in its own transaction, without blocking reads.
+
+    Cached market demand responses (of every worker) are invalidated once the
+    refreshed views are visible.
+    """
+    for view in MATERIALIZED_VIEWS:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+    if get_cache_settings().cache_enabled:
+        await get_response_cache().invalidate(MARKET_SKILL_CACHE_TAG)
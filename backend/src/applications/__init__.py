@@ -0,0 +1,25 @@
+"""Job application tracking: bulk import and export."""
+
+from .bulk import export_applications, import_applications
+from .config import ApplicationsConfig, get_applications_settings
+from .constants import ApplicationStatus, BulkFormat
+from .exceptions import ImportFileTooLarge, ImportTooLarge, ImportUploadTimeout, InvalidImport
+from .models import JobApplication
+from .router import router
+from .schemas import ApplicationImportResult
+
+__all__ = [
+    "ApplicationImportResult",
+    "ApplicationStatus",
+    "ApplicationsConfig",
+    "BulkFormat",
+    "ImportFileTooLarge",
+    "ImportTooLarge",
+    "ImportUploadTimeout",
+    "InvalidImport",
+    "JobApplication",
+    "export_applications",
+    "get_applications_settings",
+    "import_applications",
+    "router",
+]
@@ -0,0 +1,201 @@
+"""
+Bulk import and export of job applications with ``COPY``.
+
+Both directions run on the asyncpg connection under a pooled SQLAlchemy
+connection, since the ORM cannot issue ``COPY``:
+
+- import: the file is received in full first (in memory, then in a temporary
+  file past ``APPLICATION_IMPORT_SPOOL_MEMORY_BYTES``), so a slow upload never
+  holds a pooled connection and an open transaction. Validated batches from
+  ``read_import`` are then written with binary ``COPY FROM STDIN`` in one
+  transaction, so an invalid row anywhere in the file imports nothing.
+- export: ``COPY (SELECT ...) TO STDOUT`` output is handed to the client chunk
+  by chunk through a small queue. When the client reads slowly the queue
+  fills, asyncpg stops reading and Postgres waits, so an export never holds
+  more than a few chunks in memory however many rows it has.
+"""
+
+import asyncio
+import contextlib
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import IO, Any
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ..datetime import get_current_utc_datetime
+from .config import ApplicationsConfig
+from .constants import EXPORT_COLUMNS, IMPORT_COLUMNS, BulkFormat
+from .exceptions import ImportFileTooLarge, ImportUploadTimeout
+from .models import JobApplication
+from .readers import read_import
+
+_TABLE = JobApplication.__tablename__
+_COPY_COLUMNS = ("user_id", *IMPORT_COLUMNS)
+
+# Datetimes in the API's ISO 8601 UTC format ("2024-01-01T00:00:00Z"), formatted
+# by Postgres, so the file can be imported again as is
+_UTC_FORMAT = """'YYYY-MM-DD"T"HH24:MI:SS"Z"'"""
+_EXPORT_SELECT = "SELECT {columns} FROM {table} WHERE user_id = $1 ORDER BY id".format(
+    columns=", ".join(
+        f"to_char({column} AT TIME ZONE 'UTC', {_UTC_FORMAT}) AS {column}"
+        if column.endswith("_at")
+        else column
+        for column in EXPORT_COLUMNS
+    ),
+    table=_TABLE,
+)
+_EXPORT_QUERIES = {
+    BulkFormat.CSV: _EXPORT_SELECT,
+    BulkFormat.NDJSON: f"SELECT row_to_json(application) FROM ({_EXPORT_SELECT}) AS application",
+}
+_COPY_OPTIONS: dict[BulkFormat, dict[str, Any]] = {
+    BulkFormat.CSV: {"format": "csv", "header": True},
+    # One JSON document per line, verbatim: the text format would escape the
+    # backslashes of JSON escapes, and CSV only quotes a value containing its
+    # quote or delimiter character, which JSON never contains as raw bytes
+    BulkFormat.NDJSON: {"format": "csv", "quote": "\x01", "delimiter": "\x02"},
+}
+
+_END = object()
+# Spooled import files are read back in chunks of this size
+_SPOOL_READ_BYTES = 1024 * 1024
+
+
+async def _driver_connection(conn: AsyncConnection) -> Any:
+    raw = await conn.get_raw_connection()
+    return raw.driver_connection
+
+
+async def _receive(chunks: AsyncIterable[bytes], spool: IO[bytes], max_bytes: int) -> None:
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if size > max_bytes:
+            raise ImportFileTooLarge
+        # Buffered writes, absorbed by the page cache once on disk
+        spool.write(chunk)
+
+
+async def _spool(
+    chunks: AsyncIterable[bytes], spool: IO[bytes], config: ApplicationsConfig
+) -> None:
+    try:
+        async with asyncio.timeout(config.application_import_upload_timeout_seconds):
+            await _receive(chunks, spool, config.application_import_max_bytes)
+    except TimeoutError:
+        raise ImportUploadTimeout from None
+    spool.seek(0)
+
+
+async def _read_spool(spool: IO[bytes]) -> AsyncIterator[bytes]:
+    while chunk := await asyncio.to_thread(spool.read, _SPOOL_READ_BYTES):
+        yield chunk
+
+
+async def import_applications(
+    engine: AsyncEngine,
+    config: ApplicationsConfig,
+    chunks: AsyncIterable[bytes],
+    file_format: BulkFormat,
+    user_id: int,
+) -> int:
+    """
+    Import applications from a CSV or NDJSON stream.
+
+    Args:
+        engine: Primary database engine.
+        config: Batch size, limits and upload timeout.
+        chunks: The request body.
+        file_format: File format.
+        user_id: Owner of the imported applications.
+
+    Returns:
+        Number of applications imported.
+
+    Raises:
+        InvalidImport: If the file cannot be decoded or a row is invalid.
+        ImportTooLarge: If the file has too many rows.
+        ImportFileTooLarge: If the file has too many bytes.
+        ImportUploadTimeout: If the file was not received in time.
+    """
+    imported_at = get_current_utc_datetime()
+    max_size = config.application_import_spool_memory_bytes
+    with tempfile.SpooledTemporaryFile(max_size=max_size) as spool:
+        await _spool(chunks, spool, config)
+        batches = read_import(
+            _read_spool(spool),
+            file_format,
+            user_id=user_id,
+            batch_rows=config.application_import_batch_rows,
+            max_rows=config.application_import_max_rows,
+            imported_at=imported_at,
+        )
+        imported = 0
+        async with engine.connect() as conn:
+            driver = await _driver_connection(conn)
+            # Begun on the asyncpg connection: SQLAlchemy only sends BEGIN before
+            # a statement of its own, and COPY is not one, so every batch would
+            # otherwise commit on its own
+            async with driver.transaction():
+                async for rows in batches:
+                    await driver.copy_records_to_table(_TABLE, records=rows, columns=_COPY_COLUMNS)
+                    imported += len(rows)
+    return imported
+
+
+async def export_applications(
+    engine: AsyncEngine, config: ApplicationsConfig, file_format: BulkFormat, user_id: int
+) -> AsyncIterator[bytes]:
+    """
+    Stream a user's applications, oldest first.
+
+    The export reads one consistent snapshot. Closing or cancelling the
+    generator (the client disconnected) cancels the ``COPY``.
+
+    Args:
+        engine: Database engine to read from.
+        config: Read-ahead buffer size.
+        file_format: CSV with a header row, or one JSON object per line.
+        user_id: Owner of the applications.
+
+    Yields:
+        Chunks of the file.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=config.application_export_buffer_chunks)
+
+    async def write(data: bytearray) -> None:
+        # asyncpg hands over a bytearray; the response needs bytes
+        await queue.put(bytes(data))
+
+    async def produce() -> None:
+        try:
+            async with engine.connect() as conn:
+                driver = await _driver_connection(conn)
+                await driver.copy_from_query(
+                    _EXPORT_QUERIES[file_format],
+                    user_id,
+                    output=write,
+                    **_COPY_OPTIONS[file_format],
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_END)
+
+    producer = asyncio.create_task(produce(), name="application-export")
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is _END:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        if not producer.done():
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
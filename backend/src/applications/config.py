@@ -0,0 +1,58 @@
+"""Job application configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ApplicationsConfig(BaseSettings):
+    """Job application configuration loaded from environment variables."""
+
+    # Imported rows validated and copied together; bounds import memory
+    application_import_batch_rows: int = Field(
+        default=5000, ge=1, alias="APPLICATION_IMPORT_BATCH_ROWS"
+    )
+    # Larger imports are rejected (413) and nothing is imported
+    application_import_max_rows: int = Field(
+        default=1_000_000, ge=1, alias="APPLICATION_IMPORT_MAX_ROWS"
+    )
+    # Import files are received in full before the transaction starts: in memory
+    # up to this size, then in a temporary file
+    application_import_spool_memory_bytes: int = Field(
+        default=8 * 1024 * 1024, ge=0, alias="APPLICATION_IMPORT_SPOOL_MEMORY_BYTES"
+    )
+    # Larger import files are rejected (413) while they are received
+    application_import_max_bytes: int = Field(
+        default=512 * 1024 * 1024, ge=1, alias="APPLICATION_IMPORT_MAX_BYTES"
+    )
+    # Time to receive an import file; slower uploads are rejected (408)
+    application_import_upload_timeout_seconds: float = Field(
+        default=300.0, gt=0, alias="APPLICATION_IMPORT_UPLOAD_TIMEOUT_SECONDS"
+    )
+    # Export chunks read ahead of a slow client before the COPY waits for it
+    application_export_buffer_chunks: int = Field(
+        default=16, ge=1, alias="APPLICATION_EXPORT_BUFFER_CHUNKS"
+    )
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_applications_settings() -> ApplicationsConfig:
+    """Get the global job application configuration, loaded from the environment on first use."""
+    return ApplicationsConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``applications_settings`` is built on first access
+    if name == "applications_settings":
+        return get_applications_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
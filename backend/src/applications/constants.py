@@ -0,0 +1,61 @@
+"""Constants for job application tracking."""
+
+from enum import Enum
+
+
+class ApplicationStatus(str, Enum):
+    """Where an application stands."""
+
+    SAVED = "saved"  # bookmarked, not applied yet
+    APPLIED = "applied"
+    INTERVIEWING = "interviewing"
+    OFFER = "offer"
+    REJECTED = "rejected"
+    WITHDRAWN = "withdrawn"
+
+
+class BulkFormat(str, Enum):
+    """File formats for bulk import and export."""
+
+    CSV = "csv"  # with a header row
+    NDJSON = "ndjson"  # one JSON object per line
+
+
+BULK_MEDIA_TYPES = {
+    BulkFormat.CSV: "text/csv; charset=utf-8",
+    BulkFormat.NDJSON: "application/x-ndjson",
+}
+
+# Columns an import may set, in COPY order after user_id
+IMPORT_COLUMNS = (
+    "company",
+    "position",
+    "status",
+    "job_url",
+    "notes",
+    "applied_at",
+    "deadline_at",
+    "created_at",
+)
+# Must be present and non-empty in every imported row
+REQUIRED_COLUMNS = ("company", "position")
+# Parsed with the ISO 8601 parsers; empty values are NULL
+DATETIME_COLUMNS = ("applied_at", "deadline_at", "created_at")
+# Exported but assigned by the database on import, so exports can be re-imported
+IGNORED_IMPORT_COLUMNS = ("id", "updated_at")
+
+EXPORT_COLUMNS = (
+    "id",
+    "company",
+    "position",
+    "status",
+    "job_url",
+    "notes",
+    "applied_at",
+    "deadline_at",
+    "created_at",
+    "updated_at",
+)
+
+# Maximum length of company and position names
+NAME_MAX_LENGTH = 255
@@ -0,0 +1,38 @@
+"""Job application exceptions."""
+
+from fastapi import status
+
+from ..exceptions import DetailedHTTPException
+
+
+class InvalidImport(DetailedHTTPException):
+    """Raised when an import file cannot be read or a row is invalid; nothing is imported."""
+
+    STATUS_CODE = status.HTTP_422_UNPROCESSABLE_CONTENT
+    DETAIL = "Invalid import file"
+
+    def __init__(self, message: str, row: int | None = None) -> None:
+        super().__init__()
+        self.row = row
+        self.detail = message if row is None else f"Row {row}: {message}"
+
+
+class ImportTooLarge(DetailedHTTPException):
+    """Raised when an import has more rows than ``APPLICATION_IMPORT_MAX_ROWS``."""
+
+    STATUS_CODE = status.HTTP_413_CONTENT_TOO_LARGE
+    DETAIL = "Too many rows to import"
+
+
+class ImportFileTooLarge(DetailedHTTPException):
+    """Raised when an import file is larger than ``APPLICATION_IMPORT_MAX_BYTES``."""
+
+    STATUS_CODE = status.HTTP_413_CONTENT_TOO_LARGE
+    DETAIL = "Import file is too large"
+
+
+class ImportUploadTimeout(DetailedHTTPException):
+    """Raised when an import file is not received within ``APPLICATION_IMPORT_UPLOAD_TIMEOUT_SECONDS``."""
+
+    STATUS_CODE = status.HTTP_408_REQUEST_TIMEOUT
+    DETAIL = "The import file was not received in time"
@@ -0,0 +1,43 @@
+"""Job application database models."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, Text, func
+from sqlmodel import Field, SQLModel
+
+from .constants import NAME_MAX_LENGTH, ApplicationStatus
+
+
+class JobApplication(SQLModel, table=True):
+    """A job the user applied to (or plans to), with its status and dates."""
+
+    __tablename__ = "job_application"
+    __table_args__ = (
+        # A user's applications in id order: exports and listings
+        Index("job_application_user_id_id_idx", "user_id", "id"),
+    )
+
+    id: int | None = Field(default=None, sa_column=Column(BigInteger, primary_key=True))
+    user_id: int = Field(sa_column=Column(Integer, nullable=False))
+    company: str = Field(sa_column=Column(String(NAME_MAX_LENGTH), nullable=False))
+    position: str = Field(sa_column=Column(String(NAME_MAX_LENGTH), nullable=False))
+    status: ApplicationStatus = Field(
+        sa_column=Column(String(32), nullable=False, server_default=ApplicationStatus.APPLIED.value)
+    )
+    job_url: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+    notes: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+
+    applied_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+    deadline_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
@@ -0,0 +1,292 @@
+"""
+Streaming readers for bulk application imports.
+
+The request body is decoded as it arrives and cut into batches of rows, so an
+import of any size holds one batch in memory. Each batch is validated column by
+column rather than row by row: presence and length checks run over a whole
+column at once, and datetime columns are parsed with ``parse_datetime_iso_batch``.
+Validated rows come out as tuples in COPY column order.
+
+Rows are numbered from 1 in error messages, not counting the CSV header or
+blank lines.
+"""
+
+import codecs
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Sequence
+from datetime import datetime
+from itertools import repeat
+from typing import Any
+
+import orjson
+
+from ..datetime import parse_datetime_iso_batch
+from ..datetime.exceptions import DateTimeParseError
+from .constants import (
+    DATETIME_COLUMNS,
+    IGNORED_IMPORT_COLUMNS,
+    IMPORT_COLUMNS,
+    NAME_MAX_LENGTH,
+    REQUIRED_COLUMNS,
+    ApplicationStatus,
+    BulkFormat,
+)
+from .exceptions import ImportTooLarge, InvalidImport
+
+# Columns of a batch, by name; absent columns are missing
+Columns = dict[str, Sequence[Any]]
+
+_KNOWN_COLUMNS = frozenset(IMPORT_COLUMNS) | frozenset(IGNORED_IMPORT_COLUMNS)
+_STATUSES = frozenset(status.value for status in ApplicationStatus)
+_TEXT_COLUMNS = ("job_url", "notes")
+
+
+async def read_import(
+    chunks: AsyncIterable[bytes],
+    file_format: BulkFormat,
+    *,
+    user_id: int,
+    batch_rows: int,
+    max_rows: int,
+    imported_at: datetime,
+) -> AsyncIterator[list[tuple[Any, ...]]]:
+    """
+    Read and validate an import file as it is received.
+
+    Args:
+        chunks: The request body.
+        file_format: CSV with a header row, or one JSON object per line.
+        user_id: Owner of the imported applications.
+        batch_rows: Rows per yielded batch (the last one may be smaller).
+        max_rows: Maximum number of rows in the file.
+        imported_at: ``created_at`` of rows that do not set it.
+
+    Yields:
+        Batches of ``(user_id, *IMPORT_COLUMNS)`` tuples.
+
+    Raises:
+        InvalidImport: If the file cannot be decoded or a row is invalid.
+        ImportTooLarge: If the file has more than ``max_rows`` rows.
+    """
+    batches = _csv_batches if file_format is BulkFormat.CSV else _ndjson_batches
+    first_row = 1
+    async for columns, count in batches(chunks, batch_rows, first_row):
+        if first_row - 1 + count > max_rows:
+            raise ImportTooLarge
+        yield _validate(columns, count, first_row, user_id, imported_at)
+        first_row += count
+
+
+async def _decode(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    # Characters split across chunks are carried over; a BOM is dropped
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    try:
+        async for chunk in chunks:
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+    except UnicodeDecodeError as e:
+        message = "The file is not valid UTF-8"
+        raise InvalidImport(message) from e
+
+
+def _complete_records_end(text: str) -> int:
+    """Index just past the last line break outside a quoted CSV field (0 if none)."""
+    end = text.rfind("\n")
+    if end < 0:
+        return 0
+    # Quotes are balanced at a record boundary; escaped quotes ("") come in pairs
+    quotes = text.count('"', 0, end)
+    while quotes % 2:
+        previous = text.rfind("\n", 0, end)
+        if previous < 0:
+            return 0
+        quotes -= text.count('"', previous, end)
+        end = previous
+    return end + 1
+
+
+def _parse_csv(text: str) -> list[list[str]]:
+    try:
+        return [record for record in csv.reader(io.StringIO(text, newline="")) if record]
+    except csv.Error as e:
+        message = f"Malformed CSV: {e}"
+        raise InvalidImport(message) from e
+
+
+async def _csv_records(chunks: AsyncIterable[bytes]) -> AsyncIterator[list[list[str]]]:
+    # Only whole records are parsed: a quoted field may span lines and chunks
+    buffer = ""
+    async for text in _decode(chunks):
+        buffer += text
+        end = _complete_records_end(buffer)
+        if end:
+            yield _parse_csv(buffer[:end])
+            buffer = buffer[end:]
+    if buffer.strip():
+        yield _parse_csv(buffer)
+
+
+def _csv_header(record: list[str]) -> dict[str, int]:
+    header: dict[str, int] = {}
+    for index, name in enumerate(record):
+        column = name.strip().lower()
+        if column not in _KNOWN_COLUMNS:
+            message = f"Unknown column {name!r}; expected {', '.join(IMPORT_COLUMNS)}"
+            raise InvalidImport(message)
+        if column in header:
+            message = f"Duplicate column {name!r}"
+            raise InvalidImport(message)
+        header[column] = index
+    for column in REQUIRED_COLUMNS:
+        if column not in header:
+            message = f"Missing column {column!r}"
+            raise InvalidImport(message)
+    return header
+
+
+def _csv_columns(header: dict[str, int], rows: list[list[str]], first_row: int) -> Columns:
+    width = len(header)
+    if any(len(row) != width for row in rows):
+        index = next(index for index, row in enumerate(rows) if len(row) != width)
+        message = f"Expected {width} fields, got {len(rows[index])}"
+        raise InvalidImport(message, first_row + index)
+    transposed = list(zip(*rows, strict=True))
+    return {
+        column: transposed[index] for column, index in header.items() if column in IMPORT_COLUMNS
+    }
+
+
+async def _csv_batches(
+    chunks: AsyncIterable[bytes], batch_rows: int, first_row: int
+) -> AsyncIterator[tuple[Columns, int]]:
+    header: dict[str, int] | None = None
+    rows: list[list[str]] = []
+    async for records in _csv_records(chunks):
+        if header is None and records:
+            header = _csv_header(records.pop(0))
+        rows.extend(records)
+        while len(rows) >= batch_rows:
+            batch, rows = rows[:batch_rows], rows[batch_rows:]
+            yield _csv_columns(header, batch, first_row), batch_rows
+            first_row += batch_rows
+    if header is None:
+        message = "The file has no header row"
+        raise InvalidImport(message)
+    if rows:
+        yield _csv_columns(header, rows, first_row), len(rows)
+
+
+def _ndjson_columns(objects: list[dict[str, Any]], first_row: int) -> Columns:
+    for index, item in enumerate(objects):
+        unknown = item.keys() - _KNOWN_COLUMNS
+        if unknown:
+            message = f"Unknown field {min(unknown)!r}; expected {', '.join(IMPORT_COLUMNS)}"
+            raise InvalidImport(message, first_row + index)
+    columns: Columns = {}
+    for column in IMPORT_COLUMNS:
+        values = [item.get(column) for item in objects]
+        if not all(value is None or type(value) is str for value in values):
+            index = next(
+                index
+                for index, value in enumerate(values)
+                if value is not None and type(value) is not str
+            )
+            message = f"{column} must be a string"
+            raise InvalidImport(message, first_row + index)
+        columns[column] = values
+    return columns
+
+
+async def _ndjson_batches(
+    chunks: AsyncIterable[bytes], batch_rows: int, first_row: int
+) -> AsyncIterator[tuple[Columns, int]]:
+    # JSON escapes line breaks inside strings, so every line is one object
+    buffer = ""
+    objects: list[dict[str, Any]] = []
+
+    def parse(lines: list[str]) -> None:
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                item = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                message = f"Invalid JSON: {e}"
+                raise InvalidImport(message, first_row + len(objects)) from e
+            if not isinstance(item, dict):
+                message = "Expected a JSON object"
+                raise InvalidImport(message, first_row + len(objects))
+            objects.append(item)
+
+    async for text in _decode(chunks):
+        lines = (buffer + text).split("\n")
+        buffer = lines.pop()
+        parse(lines)
+        while len(objects) >= batch_rows:
+            batch = objects[:batch_rows]
+            del objects[:batch_rows]
+            yield _ndjson_columns(batch, first_row), batch_rows
+            first_row += batch_rows
+    parse([buffer])
+    if objects:
+        yield _ndjson_columns(objects, first_row), len(objects)
+
+
+def _first_index(values: Sequence[Any], predicate: Callable[[Any], bool]) -> int:
+    return next(index for index, value in enumerate(values) if predicate(value))
+
+
+def _validate(
+    columns: Columns, count: int, first_row: int, user_id: int, imported_at: datetime
+) -> list[tuple[Any, ...]]:
+    validated: dict[str, Sequence[Any]] = {}
+    for column in REQUIRED_COLUMNS:
+        values = columns[column]
+        if not all(values):
+            message = f"{column} is required"
+            raise InvalidImport(message, first_row + _first_index(values, lambda value: not value))
+        if max(map(len, values)) > NAME_MAX_LENGTH:
+            message = f"{column} is longer than {NAME_MAX_LENGTH} characters"
+            index = _first_index(values, lambda value: len(value) > NAME_MAX_LENGTH)
+            raise InvalidImport(message, first_row + index)
+        validated[column] = values
+
+    statuses = [value or ApplicationStatus.APPLIED.value for value in columns.get("status", ())]
+    if not set(statuses) <= _STATUSES:
+        message = f"status must be one of {', '.join(sorted(_STATUSES))}"
+        index = _first_index(statuses, lambda value: value not in _STATUSES)
+        raise InvalidImport(message, first_row + index)
+    validated["status"] = statuses or [ApplicationStatus.APPLIED.value] * count
+
+    for column in _TEXT_COLUMNS:
+        values = columns.get(column)
+        validated[column] = [value or None for value in values] if values else repeat(None)
+
+    for column in DATETIME_COLUMNS:
+        validated[column] = _parse_datetimes(columns.get(column), column, count, first_row)
+    validated["created_at"] = [value or imported_at for value in validated["created_at"]]
+
+    return list(zip(repeat(user_id), *(validated[column] for column in IMPORT_COLUMNS)))
+
+
+def _parse_datetimes(
+    values: Sequence[str | None] | None, column: str, count: int, first_row: int
+) -> list[datetime | None]:
+    # Empty values are NULL; the rest are parsed in one batch call
+    present = [index for index, value in enumerate(values or ()) if value]
+    if not present:
+        return [None] * count
+    try:
+        if len(present) == count:
+            return parse_datetime_iso_batch(values)
+        parsed: list[datetime | None] = [None] * count
+        for index, value in zip(
+            present, parse_datetime_iso_batch([values[index] for index in present]), strict=True
+        ):
+            parsed[index] = value
+    except DateTimeParseError as e:
+        index = e.index if len(present) == count else present[e.index]
+        message = f"{column} is not an ISO 8601 datetime: {e.value!r}"
+        raise InvalidImport(message, first_row + index) from e
+    return parsed
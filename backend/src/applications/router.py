@@ -0,0 +1,142 @@
+"""Job application bulk import and export endpoints."""
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from ..auth import parse_jwt_data
+from ..auth.schemas import JWTData
+from ..database import get_engine
+from .bulk import export_applications, import_applications
+from .config import get_applications_settings
+from .constants import BULK_MEDIA_TYPES, EXPORT_COLUMNS, IMPORT_COLUMNS, BulkFormat
+from .schemas import ApplicationImportResult
+
+router = APIRouter(prefix="/applications", tags=["applications"])
+
+_FORMAT_DESCRIPTION = "csv (with a header row) or ndjson (one JSON object per line)"
+
+
+@router.post(
+    "/import",
+    response_model=ApplicationImportResult,
+    status_code=status.HTTP_201_CREATED,
+    summary="Import applications",
+    description=(
+        "Imports applications from a CSV or NDJSON file sent as the request body. "
+        f"Columns: {', '.join(IMPORT_COLUMNS)}; company and position are required, "
+        "status defaults to applied and datetimes are ISO 8601 (UTC if no offset). "
+        "id and updated_at columns, as in exports, are ignored. The file is received "
+        "in full, then validated and copied in one transaction: if any row is "
+        "invalid, nothing is imported and the error names the row (numbered from 1, "
+        "not counting the header)."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                BULK_MEDIA_TYPES[BulkFormat.CSV]: {"schema": {"type": "string"}},
+                BULK_MEDIA_TYPES[BulkFormat.NDJSON]: {"schema": {"type": "string"}},
+            },
+        }
+    },
+    responses={
+        201: {
+            "description": "Every row was imported",
+            "content": {
+                "application/json": {
+                    "example": ApplicationImportResult.model_config["json_schema_extra"]["example"]
+                }
+            },
+        },
+        408: {
+            "description": "The file was not received in time",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "The import file was not received in time"}
+                }
+            },
+        },
+        413: {
+            "description": "The file has more rows or bytes than allowed",
+            "content": {"application/json": {"example": {"detail": "Too many rows to import"}}},
+        },
+        422: {
+            "description": "The file cannot be read or a row is invalid",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Row 42: applied_at is not an ISO 8601 datetime: '2024-13-01'"
+                    }
+                }
+            },
+        },
+    },
+)
+async def import_applications_endpoint(
+    request: Request,
+    file_format: BulkFormat = Query(
+        BulkFormat.CSV, alias="format", description=_FORMAT_DESCRIPTION
+    ),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+) -> ApplicationImportResult:
+    """
+    Bulk import endpoint.
+
+    Spools the body (to disk past a size), then copies it in binary COPY batches:
+    memory use does not grow with the file, and a slow upload holds no connection.
+    """
+    imported = await import_applications(
+        get_engine(),
+        get_applications_settings(),
+        request.stream(),
+        file_format,
+        jwt_data.user_id,
+    )
+    return ApplicationImportResult(imported=imported)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Export applications",
+    description=(
+        "Exports all of the user's applications, oldest first, as CSV or NDJSON. "
+        f"Columns: {', '.join(EXPORT_COLUMNS)}. The file can be imported again as is."
+    ),
+    responses={
+        200: {
+            "description": "The applications, streamed",
+            "content": {
+                BULK_MEDIA_TYPES[BulkFormat.CSV]: {
+                    "example": (
+                        f"{','.join(EXPORT_COLUMNS)}\n"
+                        "1,Acme,Backend Engineer,interviewing,https://acme.example/jobs/1,,"
+                        "2026-01-05T09:00:00Z,2026-01-20T00:00:00Z,2026-01-04T18:30:00Z,"
+                        "2026-01-12T10:00:00Z\n"
+                    )
+                },
+                BULK_MEDIA_TYPES[BulkFormat.NDJSON]: {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def export_applications_endpoint(
+    file_format: BulkFormat = Query(
+        BulkFormat.CSV, alias="format", description=_FORMAT_DESCRIPTION
+    ),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+) -> StreamingResponse:
+    """
+    Bulk export endpoint.
+
+    Streams COPY output to the client as Postgres produces it, with back-pressure.
+    """
+    chunks = export_applications(
+        get_engine(), get_applications_settings(), file_format, jwt_data.user_id
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=BULK_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="applications.{file_format.value}"'},
+    )
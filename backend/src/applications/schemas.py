@@ -0,0 +1,13 @@
+"""Job application request and response models."""
+
+from pydantic import ConfigDict, Field
+
+from ..models import CustomBaseModel
+
+
+class ApplicationImportResult(CustomBaseModel):
+    """Outcome of a bulk import."""
+
+    imported: int = Field(..., description="Applications created")
+
+    model_config = ConfigDict(json_schema_extra={"example": {"imported": 1250}})
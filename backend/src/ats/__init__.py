@@ -0,0 +1,50 @@
+"""Deterministic ATS scoring of resume versions against job descriptions, in batches."""
+
+from .config import AtsConfig, get_ats_settings
+from .constants import ATS_RULES_VERSION, ATS_SCORE_JOB
+from .exceptions import TooManyPairs
+from .features import Features, PairDetails, explain, extract_features
+from .models import AtsScore
+from .router import router
+from .schemas import (
+    AtsPairScore,
+    AtsScoreJobRequest,
+    AtsScoreRead,
+    AtsScoreRequest,
+    AtsScoreResponse,
+    AtsSelection,
+)
+from .service import (
+    close_ats_scorer,
+    count_pairs,
+    get_ats_scorer,
+    load_documents,
+    score_selection,
+    store_scores,
+)
+
+__all__ = [
+    "ATS_RULES_VERSION",
+    "ATS_SCORE_JOB",
+    "AtsConfig",
+    "AtsPairScore",
+    "AtsScore",
+    "AtsScoreJobRequest",
+    "AtsScoreRead",
+    "AtsScoreRequest",
+    "AtsScoreResponse",
+    "AtsSelection",
+    "Features",
+    "PairDetails",
+    "TooManyPairs",
+    "close_ats_scorer",
+    "count_pairs",
+    "explain",
+    "extract_features",
+    "get_ats_scorer",
+    "get_ats_settings",
+    "load_documents",
+    "router",
+    "score_selection",
+    "store_scores",
+]
@@ -0,0 +1,43 @@
+"""ATS scoring configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class AtsConfig(BaseSettings):
+    """ATS scoring configuration loaded from environment variables."""
+
+    # Processes that tokenize documents and score blocks of a large matrix
+    # (0: one per CPU); smaller batches are scored in a thread of the caller
+    ats_workers: int = Field(default=0, ge=0, alias="ATS_WORKERS")
+    # Batches with at least this many pairs (or documents to tokenize) use the processes
+    ats_parallel_min_pairs: int = Field(default=1_000_000, ge=1, alias="ATS_PARALLEL_MIN_PAIRS")
+    ats_parallel_min_documents: int = Field(default=2000, ge=1, alias="ATS_PARALLEL_MIN_DOCUMENTS")
+    # Tokenized documents kept in memory, by content hash
+    ats_feature_cache_size: int = Field(default=50_000, ge=0, alias="ATS_FEATURE_CACHE_SIZE")
+    # Larger selections are scored by a background job
+    ats_max_sync_pairs: int = Field(default=100_000, ge=1, alias="ATS_MAX_SYNC_PAIRS")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_ats_settings() -> AtsConfig:
+    """Get the global ATS scoring configuration, loaded from the environment on first use."""
+    return AtsConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``ats_settings`` is built on first access
+    if name == "ats_settings":
+        return get_ats_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
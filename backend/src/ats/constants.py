@@ -0,0 +1,175 @@
+"""Constants for ATS scoring."""
+
+# Stored with every score: bump it whenever the scoring rules below or the
+# tokenization change, and enqueue scoring jobs to recompute stored scores
+ATS_RULES_VERSION = "1"
+
+# Kind of the background job that scores and stores a user's pairs
+ATS_SCORE_JOB = "ats.score"
+
+# Resumes or job descriptions selected by id in one request
+MAX_SELECTED_IDS = 10_000
+# Longest delay before a scoring job runs: a week
+MAX_JOB_DELAY_SECONDS = 7 * 24 * 3600
+
+# Share of a score from the job description's skills found in the resume; the
+# rest is from its keywords (all of it when the job description names no skill)
+SKILL_WEIGHT = 0.6
+# Keywords of a job description that count, most frequent first
+MAX_KEYWORDS = 40
+# A keyword's weight grows with its count in the job description, up to this
+MAX_KEYWORD_COUNT = 3
+# Prefix of skill terms, which never clash with keywords (no ":" in a token)
+SKILL_TERM_PREFIX = "skill:"
+
+# Single-word skills that are also common words ("go", "rest", "next"): in
+# lowercase they are read as words, as "Go" or "REST" as skills
+CASE_SENSITIVE_SKILL_WORDS = frozenset(
+    {"ai", "es", "go", "ml", "net", "next", "node", "py", "rest", "ts"}
+)
+
+STOP_WORDS = frozenset(
+    [
+        "a",
+        "about",
+        "above",
+        "after",
+        "again",
+        "all",
+        "also",
+        "am",
+        "an",
+        "and",
+        "any",
+        "are",
+        "as",
+        "at",
+        "be",
+        "because",
+        "been",
+        "before",
+        "being",
+        "below",
+        "between",
+        "both",
+        "but",
+        "by",
+        "can",
+        "could",
+        "did",
+        "do",
+        "does",
+        "doing",
+        "down",
+        "during",
+        "each",
+        "etc",
+        "few",
+        "for",
+        "from",
+        "further",
+        "had",
+        "has",
+        "have",
+        "having",
+        "he",
+        "her",
+        "here",
+        "hers",
+        "him",
+        "his",
+        "how",
+        "i",
+        "if",
+        "in",
+        "into",
+        "is",
+        "it",
+        "its",
+        "itself",
+        "just",
+        "me",
+        "more",
+        "most",
+        "must",
+        "my",
+        "no",
+        "nor",
+        "not",
+        "now",
+        "of",
+        "off",
+        "on",
+        "once",
+        "only",
+        "or",
+        "other",
+        "our",
+        "ours",
+        "out",
+        "over",
+        "own",
+        "per",
+        "plus",
+        "same",
+        "she",
+        "should",
+        "so",
+        "some",
+        "such",
+        "than",
+        "that",
+        "the",
+        "their",
+        "theirs",
+        "them",
+        "then",
+        "there",
+        "these",
+        "they",
+        "this",
+        "those",
+        "through",
+        "to",
+        "too",
+        "under",
+        "until",
+        "up",
+        "us",
+        "very",
+        "via",
+        "was",
+        "we",
+        "well",
+        "were",
+        "what",
+        "when",
+        "where",
+        "which",
+        "while",
+        "who",
+        "whom",
+        "why",
+        "will",
+        "with",
+        "within",
+        "without",
+        "would",
+        "you",
+        "your",
+        "yours",
+        "ability",
+        "able",
+        "across",
+        "experience",
+        "including",
+        "join",
+        "looking",
+        "role",
+        "strong",
+        "team",
+        "work",
+        "working",
+        "years",
+    ]
+)
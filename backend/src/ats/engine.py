@@ -0,0 +1,276 @@
+"""
+Batch ATS scoring of resumes against job descriptions.
+
+Every document is tokenized once (``extract_features``) and its features are
+kept in an LRU cache by content hash, so scoring the same resumes against new
+job descriptions, or again after a save, only tokenizes what changed. A batch
+is then scored as one matrix product:
+
+- the columns are the terms the job descriptions weigh that at least one
+  resume contains; every other term scores nothing
+- a ``(terms, job descriptions)`` float32 matrix holds each job description's
+  term weights (summing to 1)
+- each resume is a row of ones at the terms it contains, so a block of resume
+  rows times the weight matrix is the block's scores, rounded to 0-100
+
+Large batches are split into blocks of resume rows scored by a process pool;
+the matrices live in shared memory, so workers neither copy nor pickle them.
+Documents are tokenized in the pool too when there are enough of them.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .config import AtsConfig
+from .features import Features, extract_features
+
+# Resume rows multiplied at once: bounds the dense block to rows x terms floats
+_BLOCK_ROWS = 512
+# Blocks per worker, so a slow worker does not hold up the batch
+_TASKS_PER_WORKER = 4
+
+
+class ScoreMatrix(NamedTuple):
+    """Scores of every resume (rows) against every job description (columns)."""
+
+    scores: NDArray[np.uint8]  # 0-100
+    resumes: list[Features]
+    job_descriptions: list[Features]
+    terms: int  # columns of the weight matrix
+
+    def best(self, limit: int) -> list[tuple[int, int, int]]:
+        """(row, column, score) of the best pairs; ties in row then column order."""
+        order = np.argsort(-self.scores.ravel().astype(np.int16), kind="stable")[:limit]
+        rows, columns = np.unravel_index(order, self.scores.shape)
+        return [
+            (int(row), int(column), int(self.scores[row, column]))
+            for row, column in zip(rows, columns, strict=True)
+        ]
+
+
+class _SharedArray(NamedTuple):
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+def _share(stack: ExitStack, array: NDArray[Any]) -> tuple[_SharedArray, NDArray[Any]]:
+    """Copy an array into new shared memory, unlinked when the stack closes."""
+    memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+    stack.callback(memory.unlink)
+    stack.callback(memory.close)
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+    shared[...] = array
+    return _SharedArray(memory.name, array.shape, array.dtype.str), shared
+
+
+def _attach(stack: ExitStack, spec: _SharedArray) -> NDArray[Any]:
+    memory = SharedMemory(name=spec.name)
+    stack.callback(memory.close)
+    return np.ndarray(spec.shape, dtype=np.dtype(spec.dtype), buffer=memory.buf)
+
+
+def _score_rows(
+    weights: NDArray[np.float32],
+    indptr: NDArray[np.int64],
+    indices: NDArray[np.int32],
+    output: NDArray[np.uint8],
+    start: int,
+    stop: int,
+) -> None:
+    """Score resume rows ``start:stop`` into ``output``; resume terms are in CSR form."""
+    for block_start in range(start, stop, _BLOCK_ROWS):
+        block_stop = min(block_start + _BLOCK_ROWS, stop)
+        counts = np.diff(indptr[block_start : block_stop + 1])
+        presence = np.zeros((block_stop - block_start, weights.shape[0]), dtype=np.float32)
+        presence[
+            np.repeat(np.arange(block_stop - block_start), counts),
+            indices[indptr[block_start] : indptr[block_stop]],
+        ] = 1.0
+        scores = presence @ weights
+        np.multiply(scores, 100, out=scores)
+        output[block_start:block_stop] = np.rint(scores, out=scores)
+
+
+def _score_shared(
+    weights: _SharedArray,
+    indptr: _SharedArray,
+    indices: _SharedArray,
+    output: _SharedArray,
+    start: int,
+    stop: int,
+) -> None:
+    # Runs in a pool process
+    with ExitStack() as stack:
+        _score_rows(
+            _attach(stack, weights),
+            _attach(stack, indptr),
+            _attach(stack, indices),
+            _attach(stack, output),
+            start,
+            stop,
+        )
+
+
+def _content_hash(text: str) -> bytes:
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class AtsScorer:
+    """
+    Scores batches of resumes against batches of job descriptions.
+
+    Thread-safe: batches can be scored from several threads at once.
+
+    Example:
+        >>> scorer = AtsScorer(AtsConfig())
+        >>> matrix = scorer.score(
+        ...     ["Python and PostgreSQL. Built data pipelines.", "Java developer"],
+        ...     ["Python, PostgreSQL and Kafka. You build data pipelines."],
+        ... )
+        >>> matrix.scores.tolist()
+        [[80], [0]]
+    """
+
+    def __init__(self, config: AtsConfig) -> None:
+        self._config = config
+        self.workers = config.ats_workers or os.cpu_count() or 1
+        self._features: OrderedDict[bytes, Features] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self.tokenized = 0  # documents tokenized (cache misses)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # Not forked: the parent runs an event loop and threads
+                self._pool = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def close(self) -> None:
+        """Stop the worker processes, if any were started."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def features(self, texts: Sequence[str]) -> list[Features]:
+        """Features of documents, tokenizing only those not in the cache."""
+        keys = [_content_hash(text) for text in texts]
+        found: dict[bytes, Features] = {}
+        with self._lock:
+            for key in keys:
+                features = self._features.get(key)
+                if features is not None:
+                    self._features.move_to_end(key)
+                    found[key] = features
+        missing = {key: text for key, text in zip(keys, texts, strict=True) if key not in found}
+
+        if self.workers > 1 and len(missing) >= self._config.ats_parallel_min_documents:
+            chunksize = -(-len(missing) // (self.workers * _TASKS_PER_WORKER))
+            extracted = self._get_pool().map(
+                extract_features, missing.values(), chunksize=chunksize
+            )
+        else:
+            extracted = map(extract_features, missing.values())
+        for key, features in zip(missing, extracted, strict=True):
+            found[key] = features
+
+        size = self._config.ats_feature_cache_size
+        with self._lock:
+            self.tokenized += len(missing)
+            for key in missing:
+                self._features[key] = found[key]
+            while len(self._features) > size:
+                self._features.popitem(last=False)
+        return [found[key] for key in keys]
+
+    def score(self, resumes: Sequence[str], job_descriptions: Sequence[str]) -> ScoreMatrix:
+        """
+        Score every resume against every job description.
+
+        Args:
+            resumes: Resume texts.
+            job_descriptions: Job description texts.
+
+        Returns:
+            A ``(resumes, job descriptions)`` matrix of scores from 0 to 100,
+            with the features of the documents (for ``explain``).
+        """
+        resume_features = self.features(resumes)
+        job_features = self.features(job_descriptions)
+
+        # Only terms that some resume has can score
+        present = frozenset().union(*(features.terms for features in resume_features))
+        columns: dict[str, int] = {}
+        rows: list[int] = []
+        jobs: list[int] = []
+        values: list[float] = []
+        for job, features in enumerate(job_features):
+            for term, weight in features.weights.items():
+                if term in present:
+                    rows.append(columns.setdefault(term, len(columns)))
+                    jobs.append(job)
+                    values.append(weight)
+        weights = np.zeros((len(columns), len(job_features)), dtype=np.float32)
+        weights[rows, jobs] = values
+
+        indices = [
+            [columns[term] for term in features.terms if term in columns]
+            for features in resume_features
+        ]
+        indptr = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in indices], out=indptr[1:])
+        flat = np.fromiter(
+            (column for row in indices for column in row), dtype=np.int32, count=int(indptr[-1])
+        )
+
+        pairs = len(resume_features) * len(job_features)
+        if self.workers > 1 and pairs >= self._config.ats_parallel_min_pairs:
+            scores = self._score_parallel(weights, indptr, flat)
+        else:
+            scores = np.zeros((len(resume_features), len(job_features)), dtype=np.uint8)
+            _score_rows(weights, indptr, flat, scores, 0, len(resume_features))
+        return ScoreMatrix(scores, resume_features, job_features, len(columns))
+
+    def _score_parallel(
+        self, weights: NDArray[np.float32], indptr: NDArray[np.int64], indices: NDArray[np.int32]
+    ) -> NDArray[np.uint8]:
+        count = len(indptr) - 1
+        with ExitStack() as stack:
+            shared_weights, _ = _share(stack, weights)
+            shared_indptr, _ = _share(stack, indptr)
+            shared_indices, _ = _share(stack, indices)
+            shared_output, output = _share(
+                stack, np.zeros((count, weights.shape[1]), dtype=np.uint8)
+            )
+            step = max(-(-count // (self.workers * _TASKS_PER_WORKER)), _BLOCK_ROWS)
+            pool = self._get_pool()
+            futures = [
+                pool.submit(
+                    _score_shared,
+                    shared_weights,
+                    shared_indptr,
+                    shared_indices,
+                    shared_output,
+                    start,
+                    min(start + step, count),
+                )
+                for start in range(0, count, step)
+            ]
+            for future in futures:
+                future.result()
+            return output.copy()
@@ -0,0 +1,9 @@
+"""ATS scoring exceptions."""
+
+from ..exceptions import BadRequest
+
+
+class TooManyPairs(BadRequest):
+    """Raised when a selection has more pairs than ``ATS_MAX_SYNC_PAIRS`` to score at once."""
+
+    DETAIL = "Too many resume and job description pairs to score at once; enqueue a scoring job"
@@ -0,0 +1,152 @@
+"""
+Deterministic ATS features of a document: the skills and keywords it contains.
+
+A document is tokenized once into words (NFKC, case-folded, plurals reduced to
+the singular); runs of words that spell a known skill or one of its aliases
+("k8s", "node js") become that skill, and the remaining words other than stop
+words and numbers are its keywords. Matching is by presence, like an ATS: the
+same resume scores the same against a job description whatever else is scored.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from typing import NamedTuple
+
+from ..skills.constants import SKILL_ALIASES
+from .constants import (
+    CASE_SENSITIVE_SKILL_WORDS,
+    MAX_KEYWORD_COUNT,
+    MAX_KEYWORDS,
+    SKILL_TERM_PREFIX,
+    SKILL_WEIGHT,
+    STOP_WORDS,
+)
+
+# Words keep inner dots and trailing +/# ("node.js", "c++", "c#")
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]", re.IGNORECASE)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Words of a text, with their case.
+
+    Example:
+        >>> tokenize("Built CI/CD in C++ and Node.js.")
+        ['Built', 'CI', 'CD', 'in', 'C++', 'and', 'Node.js']
+    """
+    return _TOKEN.findall(unicodedata.normalize("NFKC", text))
+
+
+def stem(word: str) -> str:
+    """
+    Singular of a case-folded word, approximately.
+
+    Example:
+        >>> [stem(word) for word in ("pipelines", "technologies", "business", "kubernetes")]
+        ['pipeline', 'technology', 'business', 'kubernete']
+    """
+    if len(word) > 4 and word.endswith("ies"):  # noqa: PLR2004
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):  # noqa: PLR2004
+        return word[:-1]
+    return word
+
+
+def _skill_key(name: str) -> tuple[str, ...]:
+    return tuple(stem(word.casefold()) for word in tokenize(name))
+
+
+# Skill names and aliases as word sequences -> canonical skill name
+_SKILLS = {
+    _skill_key(name): canonical
+    for canonical, aliases in SKILL_ALIASES.items()
+    for name in (canonical, *aliases)
+}
+_MAX_SKILL_WORDS = max(map(len, _SKILLS))
+
+
+class Features(NamedTuple):
+    """What an ATS reads in a document."""
+
+    skills: frozenset[str]  # canonical names
+    keywords: dict[str, int]  # stemmed word -> count, in order of first use
+    # Skills (prefixed) and keywords: what a resume is matched on
+    terms: frozenset[str]
+    # What a job description asks for: the terms of its skills and most
+    # frequent keywords, weighted to sum to 1
+    weights: dict[str, float]
+
+
+def extract_features(text: str) -> Features:
+    """
+    Tokenize a document and find its skills and keywords.
+
+    Example:
+        >>> features = extract_features("Python and k8s. Build data pipelines; own the pipeline.")
+        >>> sorted(features.skills), features.keywords
+        (['Kubernetes', 'Python'], {'build': 1, 'data': 1, 'pipeline': 2})
+        >>> features.weights["skill:Python"], round(features.weights["pipeline"], 2)
+        (0.3, 0.2)
+    """
+    tokens = tokenize(text)
+    words = [stem(token.casefold()) for token in tokens]
+    skills: dict[str, None] = {}
+    in_skill = [False] * len(words)
+    # Longest skill names first, so "google cloud" is not read as "google" + "cloud"
+    for size in range(min(_MAX_SKILL_WORDS, len(words)), 0, -1):
+        for start in range(len(words) - size + 1):
+            skill = _SKILLS.get(tuple(words[start : start + size]))
+            if skill is None or any(in_skill[start : start + size]):
+                continue
+            if size == 1 and words[start] in CASE_SENSITIVE_SKILL_WORDS and tokens[start].islower():
+                continue
+            skills[skill] = None
+            in_skill[start : start + size] = [True] * size
+
+    keywords = Counter(
+        word
+        for word, skill_word in zip(words, in_skill, strict=True)
+        if not skill_word and len(word) > 1 and word not in STOP_WORDS and not word.isdigit()
+    )
+    terms = frozenset([*(SKILL_TERM_PREFIX + skill for skill in skills), *keywords])
+    return Features(frozenset(skills), dict(keywords), terms, _weights(skills, keywords))
+
+
+def _weights(skills: dict[str, None], keywords: Counter[str]) -> dict[str, float]:
+    counted = {
+        keyword: min(count, MAX_KEYWORD_COUNT)
+        for keyword, count in keywords.most_common(MAX_KEYWORDS)
+    }
+    skill_share = (SKILL_WEIGHT if counted else 1.0) if skills else 0.0
+    keyword_total = sum(counted.values())
+    weights = {SKILL_TERM_PREFIX + skill: skill_share / len(skills) for skill in skills}
+    weights.update(
+        (keyword, (1 - skill_share) * count / keyword_total) for keyword, count in counted.items()
+    )
+    return weights
+
+
+class PairDetails(NamedTuple):
+    """Why a resume scored what it did against a job description."""
+
+    matched_skills: list[str]
+    missing_skills: list[str]
+    matched_keywords: list[str]
+    missing_keywords: list[str]
+
+
+def explain(resume: Features, job_description: Features, limit: int = 10) -> PairDetails:
+    """
+    The job description's skills and keywords found and not found in a resume.
+
+    Skills are sorted by name; keywords by weight, at most ``limit`` of each.
+    """
+    keywords = [term for term in job_description.weights if term in job_description.keywords]
+    keywords.sort(key=job_description.weights.__getitem__, reverse=True)
+    return PairDetails(
+        matched_skills=sorted(job_description.skills & resume.skills),
+        missing_skills=sorted(job_description.skills - resume.skills),
+        matched_keywords=[keyword for keyword in keywords if keyword in resume.terms][:limit],
+        missing_keywords=[keyword for keyword in keywords if keyword not in resume.terms][:limit],
+    )
@@ -0,0 +1,26 @@
+"""
+ATS scoring job handler.
+
+Imported by every worker: ``src.ats.jobs`` is in the default
+``JOB_HANDLER_MODULES``.
+"""
+
+from typing import Any
+
+from ..database import get_engine, get_session_factory
+from ..jobs import ClaimedJob, PermanentJobError, job_handler
+from .constants import ATS_SCORE_JOB
+from .schemas import AtsSelection
+from .service import get_ats_scorer, load_documents, store_scores
+
+
+@job_handler(ATS_SCORE_JOB, timeout_seconds=3600)
+async def score_pairs(job: ClaimedJob) -> dict[str, Any]:
+    """Score and store the pairs of the job's selection (an ``AtsSelection``)."""
+    if job.user_id is None:
+        message = "ATS scoring jobs belong to a user"
+        raise PermanentJobError(message)
+    selection = AtsSelection.model_validate(job.payload)
+    async with get_session_factory()() as session:
+        documents = await load_documents(session, job.user_id, selection)
+    return await store_scores(get_engine(), job.user_id, documents, get_ats_scorer())
@@ -0,0 +1,41 @@
+"""ATS scoring database models."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, SmallInteger, String, func
+from sqlmodel import Field, SQLModel
+
+
+class AtsScore(SQLModel, table=True):
+    """
+    The ATS score of a resume version against one of the user's job descriptions.
+
+    Written by scoring jobs, which replace the scores of the pairs they score,
+    so a job run again after the rules changed updates them in place.
+    """
+
+    __tablename__ = "ats_score"
+    __table_args__ = (
+        # A user's scores, best first (keyset pagination)
+        Index(
+            "ats_score_user_id_score_idx",
+            "user_id",
+            "score",
+            "resume_id",
+            "resume_version",
+            "job_description_id",
+        ),
+    )
+
+    user_id: int = Field(sa_column=Column(Integer, primary_key=True))
+    resume_id: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    resume_version: int = Field(sa_column=Column(Integer, primary_key=True))
+    # A search document of kind job_description
+    job_description_id: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    score: int = Field(sa_column=Column(SmallInteger, nullable=False))
+    # ATS_RULES_VERSION the score was computed with
+    rules_version: str = Field(sa_column=Column(String(16), nullable=False))
+    scored_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
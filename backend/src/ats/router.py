@@ -0,0 +1,163 @@
+"""ATS scoring endpoints."""
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..auth import parse_jwt_data
+from ..auth.schemas import JWTData
+from ..database import get_read_db_session
+from ..jobs import JobRead, get_job_queue
+from ..pagination import CursorPage, KeysetParams, get_keyset_params, paginate
+from .config import get_ats_settings
+from .constants import ATS_SCORE_JOB
+from .schemas import AtsScoreJobRequest, AtsScoreRead, AtsScoreRequest, AtsScoreResponse
+from .service import get_ats_scorer, score_selection, scores_statement
+
+router = APIRouter(prefix="/ats", tags=["ats"])
+
+
+@router.post(
+    "/scores",
+    response_model=AtsScoreResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Score resumes against job descriptions",
+    description=(
+        "Scores the selected resume versions against the selected saved job "
+        "descriptions, every pair, like an applicant tracking system: the share of "
+        "each job description's skills and most frequent keywords the resume contains, "
+        "from 0 to 100. Returns the best pairs with their matched and missing skills "
+        "and keywords. Scores are deterministic and not stored; for larger selections, "
+        "or to store the scores, enqueue a scoring job."
+    ),
+    responses={
+        200: {
+            "description": "The scores",
+            "content": {
+                "application/json": {
+                    "example": AtsScoreResponse.model_config["json_schema_extra"]["example"]
+                }
+            },
+        },
+        400: {
+            "description": "The selection has too many pairs to score at once",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many resume and job description pairs to score at "
+                        "once; enqueue a scoring job"
+                    }
+                }
+            },
+        },
+    },
+)
+async def score_pairs(
+    request: AtsScoreRequest,
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> AtsScoreResponse:
+    """
+    ATS scoring endpoint.
+
+    Tokenizes only documents the scorer has not seen, then scores the whole
+    selection as one matrix product, off the event loop.
+    """
+    return await score_selection(
+        session, jwt_data.user_id, request, get_ats_scorer(), get_ats_settings()
+    )
+
+
+@router.post(
+    "/scores/jobs",
+    response_model=JobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Enqueue a scoring job",
+    description=(
+        "Enqueues a background job that scores the selected pairs and stores every "
+        "score, replacing earlier scores of the same pairs. Enqueue one again to "
+        "rescore, e.g. after new job descriptions were saved or the scoring rules "
+        "changed. Poll the job with GET /v1/jobs/{job_id}; list the stored scores "
+        "with GET /v1/ats/scores."
+    ),
+    responses={
+        202: {
+            "description": "The queued job",
+            "content": {
+                "application/json": {
+                    "example": {
+                        **JobRead.model_config["json_schema_extra"]["example"],
+                        "kind": ATS_SCORE_JOB,
+                        "status": "queued",
+                        "attempts": 0,
+                        "result": None,
+                        "started_at": None,
+                        "finished_at": None,
+                    }
+                }
+            },
+        }
+    },
+)
+async def enqueue_scoring(
+    request: AtsScoreJobRequest,
+    jwt_data: JWTData = Depends(parse_jwt_data),
+) -> JobRead:
+    """
+    Scoring job endpoint.
+
+    One INSERT into the job queue; a worker with ``src.ats.jobs`` in
+    ``JOB_HANDLER_MODULES`` runs it.
+    """
+    job, _ = await get_job_queue().enqueue(
+        ATS_SCORE_JOB,
+        request.model_dump(exclude={"delay_seconds"}),
+        user_id=jwt_data.user_id,
+        delay_seconds=request.delay_seconds,
+    )
+    return job
+
+
+@router.get(
+    "/scores",
+    response_model=CursorPage[AtsScoreRead],
+    status_code=status.HTTP_200_OK,
+    summary="List stored scores",
+    description=(
+        "Lists the scores stored by scoring jobs, best first, optionally for one "
+        "resume or one job description. rules_version tells which scoring rules "
+        "each score was computed with."
+    ),
+    responses={
+        200: {
+            "description": "A page of scores",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "items": [AtsScoreRead.model_config["json_schema_extra"]["example"]],
+                        "next_cursor": None,
+                        "has_more": False,
+                        "estimated_total": None,
+                    }
+                }
+            },
+        }
+    },
+)
+async def list_scores(
+    resume_id: int | None = Query(None, description="Only scores of this resume"),
+    job_description_id: int | None = Query(
+        None, description="Only scores against this job description"
+    ),
+    params: KeysetParams = Depends(get_keyset_params),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> CursorPage[AtsScoreRead]:
+    """
+    Stored score list endpoint.
+
+    Keyset-paginated over the (user_id, score, ...) index.
+    """
+    statement, order_by = scores_statement(
+        jwt_data.user_id, resume_id=resume_id, job_description_id=job_description_id
+    )
+    return await paginate(session, statement, order_by=order_by, params=params)
@@ -0,0 +1,141 @@
+"""ATS scoring request and response models."""
+
+from pydantic import ConfigDict, Field
+
+from ..models import CustomBaseModel, UTCDatetime
+from .constants import MAX_JOB_DELAY_SECONDS, MAX_SELECTED_IDS
+
+
+class AtsSelection(CustomBaseModel):
+    """Which of the user's resumes and job descriptions to score against each other."""
+
+    resume_ids: list[int] | None = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_SELECTED_IDS,
+        description="Resumes to score; by default all of the user's resumes",
+    )
+    job_description_ids: list[int] | None = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_SELECTED_IDS,
+        description="Saved job descriptions to score against; by default all of them",
+    )
+    all_versions: bool = Field(
+        default=False, description="Score every version of the resumes, not only the latest"
+    )
+
+
+class AtsScoreRequest(AtsSelection):
+    """Pairs to score now."""
+
+    limit: int = Field(default=20, ge=1, le=100, description="Best pairs to return")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "resume_ids": [7],
+                "job_description_ids": None,
+                "all_versions": False,
+                "limit": 20,
+            }
+        }
+    )
+
+
+class AtsScoreJobRequest(AtsSelection):
+    """Pairs to score and store in the background."""
+
+    delay_seconds: float = Field(
+        default=0.0, ge=0, le=MAX_JOB_DELAY_SECONDS, description="Do not start before this delay"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "resume_ids": None,
+                "job_description_ids": None,
+                "all_versions": True,
+                "delay_seconds": 0,
+            }
+        }
+    )
+
+
+class AtsPairScore(CustomBaseModel):
+    """The score of a resume version against a job description, and why."""
+
+    resume_id: int = Field(..., description="Resume ID")
+    resume_version: int = Field(..., description="Resume version")
+    job_description_id: int = Field(..., description="Saved job description ID")
+    score: int = Field(..., description="0 to 100")
+    matched_skills: list[str] = Field(..., description="Skills of the job in the resume")
+    missing_skills: list[str] = Field(..., description="Skills of the job not in the resume")
+    matched_keywords: list[str] = Field(
+        ..., description="Most weighted keywords of the job in the resume"
+    )
+    missing_keywords: list[str] = Field(
+        ..., description="Most weighted keywords of the job not in the resume"
+    )
+
+
+class AtsScoreResponse(CustomBaseModel):
+    """Scores of every selected pair, summarized, with the best pairs."""
+
+    rules_version: str = Field(..., description="Version of the scoring rules")
+    resumes: int = Field(..., description="Resume versions scored")
+    job_descriptions: int = Field(..., description="Job descriptions scored against")
+    pairs: int = Field(..., description="Pairs scored")
+    average_score: float | None = Field(..., description="Mean score; null without pairs")
+    seconds: float = Field(..., description="Time spent scoring")
+    best: list[AtsPairScore] = Field(..., description="Best pairs, best first")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "rules_version": "1",
+                "resumes": 1,
+                "job_descriptions": 42,
+                "pairs": 42,
+                "average_score": 51.3,
+                "seconds": 0.012,
+                "best": [
+                    {
+                        "resume_id": 7,
+                        "resume_version": 12,
+                        "job_description_id": 311,
+                        "score": 78,
+                        "matched_skills": ["PostgreSQL", "Python"],
+                        "missing_skills": ["Kubernetes"],
+                        "matched_keywords": ["backend", "pipeline"],
+                        "missing_keywords": ["kafka"],
+                    }
+                ],
+            }
+        }
+    )
+
+
+class AtsScoreRead(CustomBaseModel):
+    """A stored score."""
+
+    resume_id: int = Field(..., description="Resume ID")
+    resume_version: int = Field(..., description="Resume version")
+    job_description_id: int = Field(..., description="Saved job description ID")
+    score: int = Field(..., description="0 to 100")
+    rules_version: str = Field(..., description="Version of the rules it was scored with")
+    scored_at: UTCDatetime = Field(..., description="When it was scored")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "resume_id": 7,
+                "resume_version": 12,
+                "job_description_id": 311,
+                "score": 78,
+                "rules_version": "1",
+                "scored_at": "2026-02-01T00:00:00Z",
+            }
+        },
+    )
@@ -0,0 +1,282 @@
+"""
+ATS scores of a user's resume versions against their saved job descriptions.
+
+Scoring now (``score_selection``) returns the best pairs with their matched
+and missing skills and keywords, for selections of up to
+``ATS_MAX_SYNC_PAIRS`` pairs. Scoring jobs (``store_scores``) score any number
+of pairs and store every score, replacing those of earlier runs; enqueue one
+again after ``ATS_RULES_VERSION`` changes to bring stored scores up to date.
+Scoring runs in a thread (and worker processes for large batches), never on
+the event loop. NumPy is imported when the scorer is first used.
+"""
+
+import asyncio
+import time
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from sqlalchemy import ColumnElement, Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ..resumes.models import Resume
+from ..resumes.service import read_all_sections, read_latest_sections
+from ..search.constants import DocumentKind
+from ..search.models import SearchDocument
+from .config import AtsConfig, get_ats_settings
+from .constants import ATS_RULES_VERSION
+from .exceptions import TooManyPairs
+from .features import explain
+from .models import AtsScore
+from .schemas import AtsPairScore, AtsScoreRequest, AtsScoreResponse, AtsSelection
+
+if TYPE_CHECKING:
+    from .engine import AtsScorer, ScoreMatrix
+
+_TABLE = AtsScore.__tablename__
+_COPY_COLUMNS = (
+    "user_id",
+    "resume_id",
+    "resume_version",
+    "job_description_id",
+    "score",
+    "rules_version",
+)
+# Scores are copied into a temporary table, then upserted in one statement
+_CREATE_LOAD_TABLE = text(
+    f"CREATE TEMPORARY TABLE {_TABLE}_load (LIKE {_TABLE} INCLUDING DEFAULTS) ON COMMIT DROP"
+)
+_UPSERT = text(
+    f"INSERT INTO {_TABLE} ({', '.join(_COPY_COLUMNS)}) "
+    f"SELECT {', '.join(_COPY_COLUMNS)} FROM {_TABLE}_load "
+    "ON CONFLICT (user_id, resume_id, resume_version, job_description_id) DO UPDATE "
+    "SET score = excluded.score, rules_version = excluded.rules_version, scored_at = now()"
+)
+
+
+class Documents(NamedTuple):
+    """Texts of the selected resume versions and job descriptions."""
+
+    resumes: list[tuple[int, int]]  # (resume id, version)
+    resume_texts: list[str]
+    job_descriptions: list[int]
+    job_description_texts: list[str]
+
+    @property
+    def pairs(self) -> int:
+        return len(self.resumes) * len(self.job_descriptions)
+
+
+def resume_text(sections: list[dict[str, Any]]) -> str:
+    """Plain text of a resume version: each section's title, then its content."""
+    return "\n\n".join(
+        f"{section['title']}\n{section['content']}" if section["title"] else section["content"]
+        for section in sections
+    )
+
+
+def _selected_resumes(user_id: int, selection: AtsSelection) -> list[ColumnElement[bool]]:
+    criteria = [Resume.user_id == user_id]
+    if selection.resume_ids is not None:
+        criteria.append(Resume.id.in_(selection.resume_ids))
+    return criteria
+
+
+def _selected_job_descriptions(user_id: int, selection: AtsSelection) -> list[ColumnElement[bool]]:
+    criteria = [
+        SearchDocument.user_id == user_id,
+        SearchDocument.kind == DocumentKind.JOB_DESCRIPTION.value,
+    ]
+    if selection.job_description_ids is not None:
+        criteria.append(SearchDocument.id.in_(selection.job_description_ids))
+    return criteria
+
+
+async def count_pairs(session: AsyncSession, user_id: int, selection: AtsSelection) -> int:
+    """
+    Number of pairs a selection of a user's documents makes, without reading them.
+
+    Two counts, reading no text: resume versions (every version of a resume
+    is stored, so a resume has ``latest_version`` of them) and job descriptions.
+    """
+    versions = func.sum(Resume.latest_version) if selection.all_versions else func.count()
+    resumes = (
+        await session.execute(
+            select(versions).select_from(Resume).where(*_selected_resumes(user_id, selection))
+        )
+    ).scalar_one()
+    job_descriptions = (
+        await session.execute(
+            select(func.count())
+            .select_from(SearchDocument)
+            .where(*_selected_job_descriptions(user_id, selection))
+        )
+    ).scalar_one()
+    return (resumes or 0) * job_descriptions
+
+
+async def load_documents(session: AsyncSession, user_id: int, selection: AtsSelection) -> Documents:
+    """
+    Read the selected resume versions and job descriptions of a user.
+
+    Three queries, however many resumes are selected. Ids of other users'
+    documents, or of no document, are ignored.
+    """
+    statement = (
+        select(Resume.id, Resume.latest_version)
+        .where(*_selected_resumes(user_id, selection))
+        .order_by(Resume.id)
+    )
+    selected = (await session.execute(statement)).all()
+    resumes: list[tuple[int, int]] = []
+    resume_texts: list[str] = []
+    if selection.all_versions:
+        all_sections = await read_all_sections(session, [row.id for row in selected])
+        for resume_id, _ in selected:
+            versions = all_sections.get(resume_id, [])
+            resumes.extend((resume_id, version) for version in range(1, len(versions) + 1))
+            resume_texts.extend(map(resume_text, versions))
+    else:
+        latest_sections = await read_latest_sections(session, [row.id for row in selected])
+        for resume_id, latest_version in selected:
+            resumes.append((resume_id, latest_version))
+            resume_texts.append(resume_text(latest_sections[resume_id]))
+
+    statement = (
+        select(SearchDocument.id, SearchDocument.body)
+        .where(*_selected_job_descriptions(user_id, selection))
+        .order_by(SearchDocument.id)
+    )
+    rows = (await session.execute(statement)).all()
+    return Documents(resumes, resume_texts, [row.id for row in rows], [row.body for row in rows])
+
+
+async def _score(scorer: "AtsScorer", documents: Documents) -> tuple["ScoreMatrix", float]:
+    started = time.perf_counter()
+    matrix = await asyncio.to_thread(
+        scorer.score, documents.resume_texts, documents.job_description_texts
+    )
+    return matrix, round(time.perf_counter() - started, 3)
+
+
+async def score_selection(
+    session: AsyncSession,
+    user_id: int,
+    request: AtsScoreRequest,
+    scorer: "AtsScorer",
+    config: AtsConfig,
+) -> AtsScoreResponse:
+    """
+    Score the selected pairs now.
+
+    Args:
+        session: Database session.
+        user_id: Owner of the documents.
+        request: The selection and the number of best pairs to detail.
+        scorer: The process-wide scorer (``get_ats_scorer``).
+        config: Limit on the pairs scored at once.
+
+    Returns:
+        The number of pairs, their mean score and the best pairs.
+
+    Raises:
+        TooManyPairs: If the selection has more than ``ATS_MAX_SYNC_PAIRS`` pairs.
+    """
+    # Counted first, so an oversized selection is refused without reading it
+    if await count_pairs(session, user_id, request) > config.ats_max_sync_pairs:
+        raise TooManyPairs
+    documents = await load_documents(session, user_id, request)
+    matrix, seconds = await _score(scorer, documents)
+
+    best = []
+    for row, column, score in matrix.best(request.limit):
+        resume_id, version = documents.resumes[row]
+        details = explain(matrix.resumes[row], matrix.job_descriptions[column])
+        best.append(
+            AtsPairScore(
+                resume_id=resume_id,
+                resume_version=version,
+                job_description_id=documents.job_descriptions[column],
+                score=score,
+                **details._asdict(),
+            )
+        )
+    return AtsScoreResponse(
+        rules_version=ATS_RULES_VERSION,
+        resumes=len(documents.resumes),
+        job_descriptions=len(documents.job_descriptions),
+        pairs=documents.pairs,
+        average_score=round(float(matrix.scores.mean()), 1) if documents.pairs else None,
+        seconds=seconds,
+        best=best,
+    )
+
+
+def _score_records(
+    user_id: int, documents: Documents, matrix: "ScoreMatrix"
+) -> Iterator[tuple[int, int, int, int, int, str]]:
+    for (resume_id, version), scores in zip(documents.resumes, matrix.scores.tolist(), strict=True):
+        for job_description_id, score in zip(documents.job_descriptions, scores, strict=True):
+            yield (user_id, resume_id, version, job_description_id, score, ATS_RULES_VERSION)
+
+
+async def store_scores(
+    engine: AsyncEngine, user_id: int, documents: Documents, scorer: "AtsScorer"
+) -> dict[str, Any]:
+    """
+    Score every selected pair and store the scores, replacing earlier ones.
+
+    Safe to repeat, as scoring jobs must be.
+
+    Returns:
+        The job result: pairs scored, rules version and seconds spent.
+    """
+    matrix, seconds = await _score(scorer, documents)
+    async with engine.begin() as conn:
+        await conn.execute(_CREATE_LOAD_TABLE)
+        driver = (await conn.get_raw_connection()).driver_connection
+        await driver.copy_records_to_table(
+            f"{_TABLE}_load",
+            records=_score_records(user_id, documents, matrix),
+            columns=_COPY_COLUMNS,
+        )
+        await conn.execute(_UPSERT)
+    return {"pairs": documents.pairs, "rules_version": ATS_RULES_VERSION, "seconds": seconds}
+
+
+def scores_statement(
+    user_id: int, *, resume_id: int | None = None, job_description_id: int | None = None
+) -> tuple[Select[Any], list[ColumnElement[Any]]]:
+    """A user's stored scores for ``paginate``, best first."""
+    statement = select(
+        AtsScore.resume_id,
+        AtsScore.resume_version,
+        AtsScore.job_description_id,
+        AtsScore.score,
+        AtsScore.rules_version,
+        AtsScore.scored_at,
+    ).where(AtsScore.user_id == user_id)
+    if resume_id is not None:
+        statement = statement.where(AtsScore.resume_id == resume_id)
+    if job_description_id is not None:
+        statement = statement.where(AtsScore.job_description_id == job_description_id)
+    return statement, [
+        AtsScore.score.desc(),
+        AtsScore.resume_id.desc(),
+        AtsScore.resume_version.desc(),
+        AtsScore.job_description_id.desc(),
+    ]
+
+
+@lru_cache
+def get_ats_scorer() -> "AtsScorer":
+    """Get the process-wide scorer (loads NumPy on first use)."""
+    from .engine import AtsScorer  # noqa: PLC0415
+
+    return AtsScorer(get_ats_settings())
+
+
+def close_ats_scorer() -> None:
+    """Stop the scorer's worker processes (a scorer that was never created is skipped)."""
+    if get_ats_scorer.cache_info().currsize:
+        get_ats_scorer().close()
@@ -0,0 +1,20 @@
+"""Auth module: access token verification and refresh token rotation."""
+
+from .dependencies import parse_jwt_data, parse_jwt_data_optional
+from .router import router
+from .schemas import JWTData
+from .service import (
+    create_access_token,
+    create_refresh_token,
+    verify_access_token,
+)
+
+__all__ = [
+    "JWTData",
+    "create_access_token",
+    "create_refresh_token",
+    "parse_jwt_data",
+    "parse_jwt_data_optional",
+    "router",
+    "verify_access_token",
+]
@@ -1,10 +1,16 @@
+"""Auth configuration loaded from environment variables."""
+
 from datetime import timedelta
+from functools import lru_cache
+from typing import Any
 
 from pydantic_settings import BaseSettings
 
+from .constants import JWTAlgorithm
+
 
 class AuthConfig(BaseSettings):
-    JWT_ALG: str
+    JWT_ALG: JWTAlgorithm
     JWT_SECRET: str
     JWT_EXP: int = 5  # minutes
 
@@ -13,5 +19,24 @@ class AuthConfig(BaseSettings):
 
     SECURE_COOKIES: bool = True
 
+    # Verified access tokens kept in memory so repeat requests skip signature checks
+    TOKEN_CACHE_SIZE: int = 4096
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_auth_settings() -> AuthConfig:
+    return AuthConfig()
+
 
-auth_settings = AuthConfig()
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``auth_settings`` is built on first access
+    if name == "auth_settings":
+        return get_auth_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
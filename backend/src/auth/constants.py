@@ -0,0 +1,21 @@
+"""Constants for the auth module."""
+
+from enum import Enum
+
+
+class JWTAlgorithm(str, Enum):
+    """Supported JWT signing algorithms (HMAC with SHA-2)."""
+
+    HS256 = "HS256"
+    HS384 = "HS384"
+    HS512 = "HS512"
+
+
+# hashlib digest used by each algorithm
+JWT_DIGESTS = {
+    JWTAlgorithm.HS256: "sha256",
+    JWTAlgorithm.HS384: "sha384",
+    JWTAlgorithm.HS512: "sha512",
+}
+
+TOKEN_TYPE = "bearer"
@@ -0,0 +1,21 @@
+"""Auth exceptions."""
+
+from ..exceptions import NotAuthenticated
+
+
+class InvalidToken(NotAuthenticated):
+    """Raised when an access token is malformed or its signature does not match."""
+
+    DETAIL = "Invalid token"
+
+
+class TokenExpired(NotAuthenticated):
+    """Raised when an access token has expired."""
+
+    DETAIL = "Token has expired"
+
+
+class RefreshTokenNotValid(NotAuthenticated):
+    """Raised when a refresh token is missing, unknown, expired or already used."""
+
+    DETAIL = "Refresh token is not valid"
@@ -0,0 +1,144 @@
+"""
+JSON Web Token encoding and verification (HMAC-SHA2, RFC 7519).
+
+The signing key is turned into an HMAC object once per process; each token
+only copies its precomputed inner/outer key state instead of re-deriving it.
+Tokens that use the codec's own header (every token it issued) skip header
+parsing, and any other algorithm, including ``none``, is rejected.
+"""
+
+import base64
+import hmac
+import time
+from collections import OrderedDict
+from typing import Any, Generic, TypeVar
+
+import orjson
+
+from .constants import JWT_DIGESTS, JWTAlgorithm
+from .exceptions import InvalidToken, TokenExpired
+
+T = TypeVar("T")
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class JWTCodec:
+    """
+    Encode and verify compact JWTs signed with a shared secret.
+
+    Example:
+        >>> codec = JWTCodec("secret", JWTAlgorithm.HS256)
+        >>> token = codec.encode({"sub": "42", "exp": 4102444800})
+        >>> codec.decode(token)["sub"]
+        '42'
+    """
+
+    def __init__(self, secret: str, algorithm: JWTAlgorithm) -> None:
+        self.algorithm = JWTAlgorithm(algorithm)
+        self._mac = hmac.new(secret.encode(), digestmod=JWT_DIGESTS[self.algorithm])
+        header = {"alg": self.algorithm.value, "typ": "JWT"}
+        self._header = _b64encode(orjson.dumps(header))
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        """Sign ``claims`` into a compact JWT."""
+        signing_input = f"{self._header}.{_b64encode(orjson.dumps(claims))}"
+        return f"{signing_input}.{_b64encode(self._sign(signing_input.encode()))}"
+
+    def decode(self, token: str, *, now: float | None = None) -> dict[str, Any]:
+        """
+        Verify a token's signature and expiry and return its claims.
+
+        Args:
+            token: Compact JWT.
+            now: Current Unix time (defaults to ``time.time()``).
+
+        Returns:
+            The token claims.
+
+        Raises:
+            InvalidToken: If the token is malformed, uses another algorithm, or
+                its signature does not match.
+            TokenExpired: If the ``exp`` claim is in the past.
+        """
+        try:
+            header, payload, signature = token.split(".")
+            if header != self._header:
+                self._check_header(header)
+            expected = self._sign(f"{header}.{payload}".encode())
+            if not hmac.compare_digest(_b64decode(signature), expected):
+                raise InvalidToken
+            claims = orjson.loads(_b64decode(payload))
+        except (ValueError, TypeError) as e:
+            # ValueError covers bad base64, bad JSON and a wrong number of segments
+            raise InvalidToken from e
+
+        if not isinstance(claims, dict):
+            raise InvalidToken
+        exp = claims.get("exp")
+        if not isinstance(exp, int | float):
+            raise InvalidToken
+        if exp <= (time.time() if now is None else now):
+            raise TokenExpired
+        return claims
+
+    def _check_header(self, header: str) -> None:
+        # Same claims, different serialization (another issuer library): accept
+        # only if it names this codec's algorithm.
+        data = orjson.loads(_b64decode(header))
+        if not isinstance(data, dict) or data.get("alg") != self.algorithm.value:
+            raise InvalidToken
+
+
+class ExpiringLRUCache(Generic[T]):
+    """
+    LRU cache whose entries also expire at a per-entry Unix timestamp.
+
+    Used to remember verified tokens until their ``exp``, so a cached token can
+    never outlive its own expiry. Not thread-safe; use from the event loop.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[T, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, now: float) -> T | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at <= now:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: T, expires_at: float) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,27 @@
+"""Auth database models."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, String, func
+from sqlmodel import Field, SQLModel
+
+
+class RefreshToken(SQLModel, table=True):
+    """
+    Issued refresh token.
+
+    Only the SHA-256 digest of the token is stored. Rotation deletes the row of
+    the presented token and inserts its replacement, so a token is usable once.
+    """
+
+    __tablename__ = "auth_refresh_token"
+
+    id: int | None = Field(default=None, primary_key=True)
+    user_id: int = Field(index=True)
+    # Unique index: the single lookup made when a token is rotated or revoked
+    token_hash: str = Field(sa_column=Column(String(64), nullable=False, unique=True))
+    expires_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
@@ -0,0 +1,157 @@
+"""
+Token issuing, verification and refresh-token rotation.
+
+Access tokens are verified without touching the database: the signature and
+expiry are checked in process, and verified tokens are remembered in an LRU
+cache until they expire, so repeat requests with the same token skip the
+signature check as well. Refresh tokens are opaque random strings stored as
+SHA-256 digests; rotating one is a single statement on a unique index.
+"""
+
+import hashlib
+import secrets
+import time
+from datetime import UTC, datetime
+from functools import lru_cache
+
+from pydantic import ValidationError
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import get_auth_settings
+from .exceptions import InvalidToken, RefreshTokenNotValid
+from .jwt import ExpiringLRUCache, JWTCodec
+from .models import RefreshToken
+from .schemas import JWTData
+
+# Random bytes in a refresh token (URL-safe base64 encoded)
+REFRESH_TOKEN_BYTES = 32
+
+
+@lru_cache
+def get_jwt_codec() -> JWTCodec:
+    """Get the process-wide codec; the HMAC key state is derived once here."""
+    settings = get_auth_settings()
+    return JWTCodec(settings.JWT_SECRET, settings.JWT_ALG)
+
+
+@lru_cache
+def get_token_cache() -> ExpiringLRUCache[JWTData]:
+    """Get the process-wide cache of verified access tokens."""
+    return ExpiringLRUCache(get_auth_settings().TOKEN_CACHE_SIZE)
+
+
+def create_access_token(user_id: int) -> tuple[str, int]:
+    """
+    Issue a signed access token.
+
+    Args:
+        user_id: ID of the authenticated user (the ``sub`` claim).
+
+    Returns:
+        Tuple of (token, lifetime in seconds).
+    """
+    lifetime = get_auth_settings().JWT_EXP * 60
+    now = int(time.time())
+    token = get_jwt_codec().encode({"sub": str(user_id), "iat": now, "exp": now + lifetime})
+    return token, lifetime
+
+
+def verify_access_token(token: str) -> JWTData:
+    """
+    Verify an access token and return its claims.
+
+    The cache is keyed by the whole token, not just its signature, so a cached
+    entry is only ever returned for the exact bytes that were verified.
+
+    Raises:
+        InvalidToken: If the token is malformed, forged or lacks required claims.
+        TokenExpired: If the token has expired.
+    """
+    now = time.time()
+    cache = get_token_cache()
+    cached = cache.get(token, now)
+    if cached is not None:
+        return cached
+
+    claims = get_jwt_codec().decode(token, now=now)
+    try:
+        jwt_data = JWTData.model_validate(claims)
+    except ValidationError as e:
+        raise InvalidToken from e
+
+    cache.set(token, jwt_data, jwt_data.exp)
+    return jwt_data
+
+
+def _hash_refresh_token(refresh_token: str) -> str:
+    # Only digests are stored, so a database leak exposes no usable tokens
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+def _new_refresh_token() -> tuple[str, datetime]:
+    expires_at = datetime.now(UTC) + get_auth_settings().REFRESH_TOKEN_EXP
+    return secrets.token_urlsafe(REFRESH_TOKEN_BYTES), expires_at
+
+
+async def create_refresh_token(session: AsyncSession, user_id: int) -> str:
+    """Issue and store a refresh token for ``user_id``."""
+    refresh_token, expires_at = _new_refresh_token()
+    await session.execute(
+        insert(RefreshToken).values(
+            user_id=user_id,
+            token_hash=_hash_refresh_token(refresh_token),
+            expires_at=expires_at,
+        )
+    )
+    return refresh_token
+
+
+async def rotate_refresh_token(session: AsyncSession, refresh_token: str) -> tuple[int, str]:
+    """
+    Exchange a refresh token for a new one.
+
+    The presented token is deleted and its replacement inserted in a single
+    statement (``WITH used AS (DELETE ... RETURNING user_id) INSERT ...``), so
+    rotation costs one round-trip and one unique-index lookup, and concurrent
+    rotations of the same token cannot both succeed.
+
+    Returns:
+        Tuple of (user ID, new refresh token).
+
+    Raises:
+        RefreshTokenNotValid: If the token is unknown, expired or already used.
+    """
+    new_token, expires_at = _new_refresh_token()
+    used = (
+        delete(RefreshToken)
+        .where(
+            RefreshToken.token_hash == _hash_refresh_token(refresh_token),
+            RefreshToken.expires_at > func.now(),
+        )
+        .returning(RefreshToken.user_id)
+        .cte("used")
+    )
+    statement = (
+        insert(RefreshToken)
+        .from_select(
+            ["user_id", "token_hash", "expires_at"],
+            select(
+                used.c.user_id,
+                literal(_hash_refresh_token(new_token)),
+                literal(expires_at),
+            ),
+        )
+        .returning(RefreshToken.user_id)
+    )
+    user_id = (await session.execute(statement)).scalar_one_or_none()
+    if user_id is None:
+        raise RefreshTokenNotValid
+    return user_id, new_token
+
+
+async def revoke_refresh_token(session: AsyncSession, refresh_token: str) -> None:
+    """Delete a refresh token (logout); unknown tokens are ignored."""
+    await session.execute(
+        delete(RefreshToken).where(RefreshToken.token_hash == _hash_refresh_token(refresh_token))
+    )
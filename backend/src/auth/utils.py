@@ -0,0 +1,36 @@
+"""Auth helpers."""
+
+from typing import Any
+
+from .config import get_auth_settings
+
+# Refresh token cookies are only sent to the token endpoints
+REFRESH_TOKEN_COOKIE_PATH = "/v1/auth"
+
+
+def get_refresh_token_cookie_settings(
+    refresh_token: str, *, expired: bool = False
+) -> dict[str, Any]:
+    """
+    Build keyword arguments for ``Response.set_cookie`` carrying a refresh token.
+
+    Args:
+        refresh_token: Token value (ignored when ``expired``).
+        expired: Build a cookie that makes the client delete the token.
+    """
+    settings = get_auth_settings()
+    base_cookie = {
+        "key": settings.REFRESH_TOKEN_KEY,
+        "path": REFRESH_TOKEN_COOKIE_PATH,
+        "httponly": True,
+        "samesite": "lax",
+        "secure": settings.SECURE_COOKIES,
+    }
+    if expired:
+        return base_cookie
+
+    return {
+        **base_cookie,
+        "value": refresh_token,
+        "max_age": int(settings.REFRESH_TOKEN_EXP.total_seconds()),
+    }
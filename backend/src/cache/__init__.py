@@ -0,0 +1,20 @@
+"""Response cache: in-process and Postgres tiers with tag invalidation and ETags."""
+
+from .config import CacheConfig, get_cache_settings
+from .constants import CacheStatus
+from .memory import CachedResponse, MemoryCache
+from .routing import CachedRoute, CachePolicy, cache_response
+from .service import ResponseCache, get_response_cache
+
+__all__ = [
+    "CacheConfig",
+    "CachePolicy",
+    "CacheStatus",
+    "CachedResponse",
+    "CachedRoute",
+    "MemoryCache",
+    "ResponseCache",
+    "cache_response",
+    "get_cache_settings",
+    "get_response_cache",
+]
@@ -0,0 +1,53 @@
+"""Response cache configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class CacheConfig(BaseSettings):
+    """Response cache configuration loaded from environment variables."""
+
+    # Serve endpoints decorated with ``cache_response`` from the cache
+    cache_enabled: bool = Field(default=True, alias="CACHE_ENABLED")
+    # TTL for endpoints that do not set their own
+    cache_default_ttl_seconds: float = Field(default=60.0, gt=0, alias="CACHE_DEFAULT_TTL_SECONDS")
+
+    # In-process tier: total size of cached bodies per worker (0 disables the tier)
+    cache_memory_max_bytes: int = Field(
+        default=64 * 1024 * 1024, ge=0, alias="CACHE_MEMORY_MAX_BYTES"
+    )
+    # Larger responses are not cached in either tier
+    cache_max_entry_bytes: int = Field(default=1024 * 1024, ge=1, alias="CACHE_MAX_ENTRY_BYTES")
+
+    # Shared tier: UNLOGGED Postgres table read by every worker
+    cache_shared_enabled: bool = Field(default=True, alias="CACHE_SHARED_ENABLED")
+    # How often each worker deletes expired shared entries
+    cache_purge_interval_seconds: float = Field(
+        default=300.0, gt=0, alias="CACHE_PURGE_INTERVAL_SECONDS"
+    )
+    # Delay before reconnecting the LISTEN connection after it fails
+    cache_listen_retry_seconds: float = Field(default=5.0, gt=0, alias="CACHE_LISTEN_RETRY_SECONDS")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_cache_settings() -> CacheConfig:
+    """Get the global cache configuration, loaded from the environment on first use."""
+    return CacheConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``cache_settings`` is built on first access
+    if name == "cache_settings":
+        return get_cache_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -0,0 +1,33 @@
+"""Constants for the response cache."""
+
+from enum import Enum
+
+
+class CacheStatus(str, Enum):
+    """Which tier served a response (reported in the ``X-Cache`` header)."""
+
+    MEMORY = "memory"
+    SHARED = "shared"
+    MISS = "miss"
+
+
+CACHE_STATUS_HEADER = "X-Cache"
+
+# Clients may keep the body but must revalidate it (If-None-Match -> 304) on every
+# use: entries are invalidated by tag on the server before their TTL ends
+CACHE_CONTROL = "no-cache"
+
+# Postgres channel that carries tag invalidations between workers
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+# Invalidation payload that clears every entry (used when the tag list does not
+# fit in a NOTIFY payload, which Postgres limits to 8000 bytes)
+INVALIDATE_ALL = "*"
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+# Approximate memory held by one in-process entry besides its body (record
+# object, key string, OrderedDict and tag index slots)
+ENTRY_OVERHEAD_BYTES = 512
+
+# Attribute set on endpoint functions by ``cache_response``
+CACHE_POLICY_ATTRIBUTE = "__cache_policy__"
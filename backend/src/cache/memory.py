@@ -0,0 +1,112 @@
+"""In-process tier of the response cache: TTL + LRU bounded by size in bytes."""
+
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from .constants import ENTRY_OVERHEAD_BYTES
+
+
+class CachedResponse:
+    """A cached response body with the metadata needed to serve and invalidate it."""
+
+    __slots__ = ("body", "etag", "expires_at", "media_type", "tags")
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str,
+        etag: str,
+        tags: tuple[str, ...],
+        expires_at: float,
+    ) -> None:
+        self.body = body
+        self.media_type = media_type
+        self.etag = etag
+        self.tags = tags
+        self.expires_at = expires_at  # Unix time
+
+    @property
+    def size(self) -> int:
+        """Approximate memory held by the entry, in bytes."""
+        return len(self.body) + ENTRY_OVERHEAD_BYTES
+
+
+class MemoryCache:
+    """
+    LRU cache of responses with per-entry expiry and a total size cap.
+
+    Least recently used entries are evicted until the cached bodies fit in
+    ``max_bytes``; expired entries are dropped when they are read. A tag index
+    makes invalidation proportional to the number of matching entries. Not
+    thread-safe; use from the event loop.
+
+    Example:
+        >>> cache = MemoryCache(max_bytes=1024 * 1024)
+        >>> cache.set("key", CachedResponse(b"{}", "application/json", '"e"', ("t",), 2e9))
+        >>> cache.get("key", now=0.0).body
+        b'{}'
+        >>> cache.invalidate_tags(["t"])
+        1
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, now: float) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= now:
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if entry.size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self.size_bytes += entry.size
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while self.size_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Remove every entry carrying any of ``tags``; return how many were removed."""
+        keys = set()
+        for tag in tags:
+            keys.update(self._keys_by_tag.get(tag, ()))
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_tag.clear()
+        self.size_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.size_bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def __len__(self) -> int:
+        return len(self._entries)
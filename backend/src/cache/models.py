@@ -0,0 +1,34 @@
+"""Response cache database models."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, LargeBinary, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import Field, SQLModel
+
+
+class CacheEntry(SQLModel, table=True):
+    """
+    Shared tier of the response cache.
+
+    The table is UNLOGGED: writes skip the WAL, so caching a response is cheap,
+    but the table is truncated after a crash and is not replicated. Always read
+    it from the primary, never through the replica router.
+    """
+
+    __tablename__ = "cache_entry"
+    __table_args__ = (
+        # Tag invalidation: DELETE ... WHERE tags && ARRAY[...]
+        Index("cache_entry_tags_idx", "tags", postgresql_using="gin"),
+        {"prefixes": ["UNLOGGED"]},
+    )
+
+    # SHA-256 of the request identity (method, path, query and varied headers)
+    key: str = Field(sa_column=Column(String(64), primary_key=True))
+    body: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    media_type: str = Field(sa_column=Column(String(255), nullable=False))
+    etag: str = Field(sa_column=Column(String(64), nullable=False))
+    tags: list[str] = Field(sa_column=Column(ARRAY(Text), nullable=False))
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True)
+    )
@@ -0,0 +1,209 @@
+"""
+Response caching for GET endpoints.
+
+Mark an endpoint with ``cache_response`` and give its router ``CachedRoute`` as
+the route class. The route caches the response FastAPI produced (after
+``response_model`` serialization), answers conditional requests with 304, and
+adds ``ETag``, ``Cache-Control`` and ``X-Cache`` headers::
+
+    router = APIRouter(prefix="/templates", route_class=CachedRoute)
+
+    @router.get("/{template_id}")
+    @cache_response(ttl_seconds=300, tags=("templates", "template:{template_id}"))
+    async def get_template(template_id: int) -> TemplateResponse: ...
+
+Tags are formatted with the request's path parameters. Responses are cached per
+user: the key holds the user id of a valid access token (anonymous callers
+share theirs), and a request with an invalid token bypasses the cache. Pass
+``shared=True`` for responses that are the same for every caller.
+"""
+
+import hashlib
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette import status
+
+from ..auth.dependencies import parse_jwt_data_optional
+from ..exceptions import NotAuthenticated
+from .config import get_cache_settings
+from .constants import CACHE_CONTROL, CACHE_POLICY_ATTRIBUTE, CACHE_STATUS_HEADER, CacheStatus
+from .memory import CachedResponse
+from .service import get_response_cache
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class CachePolicy:
+    """How the responses of one endpoint are cached."""
+
+    __slots__ = ("shared", "tags", "ttl_seconds", "vary")
+
+    def __init__(
+        self,
+        ttl_seconds: float | None,
+        tags: tuple[str, ...],
+        vary: tuple[str, ...],
+        *,
+        shared: bool = False,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.tags = tags
+        self.shared = shared
+        vary = tuple(header.lower() for header in vary)
+        # Per-user responses depend on the access token
+        if not shared and "authorization" not in vary:
+            vary = (*vary, "authorization")
+        self.vary = vary
+
+
+def cache_response(
+    *,
+    ttl_seconds: float | None = None,
+    tags: tuple[str, ...] = (),
+    vary: tuple[str, ...] = (),
+    shared: bool = False,
+) -> Callable[[F], F]:
+    """
+    Cache the endpoint's successful responses (requires ``CachedRoute``).
+
+    Args:
+        ttl_seconds: Entry lifetime (defaults to ``CACHE_DEFAULT_TTL_SECONDS``).
+        tags: Invalidation tags, formatted with the path parameters
+            (e.g. ``"template:{template_id}"``).
+        vary: Request headers that are part of the cache key.
+        shared: Serve one response to every caller instead of one per user;
+            only for endpoints whose response does not depend on the caller.
+
+    Returns:
+        Decorator returning the endpoint unchanged apart from the cache policy.
+    """
+
+    def decorator(endpoint: F) -> F:
+        setattr(
+            endpoint, CACHE_POLICY_ATTRIBUTE, CachePolicy(ttl_seconds, tags, vary, shared=shared)
+        )
+        return endpoint
+
+    return decorator
+
+
+def build_cache_key(request: Request, vary: tuple[str, ...], user_id: int | None = None) -> str:
+    """
+    Hash the method, path, sorted query parameters and varied headers of a request.
+
+    ``user_id`` (of per-user responses) replaces the ``Authorization`` header,
+    so a user's responses are shared by all of their access tokens.
+    """
+    parts = [
+        request.method,
+        request.url.path,
+        urlencode(sorted(request.query_params.multi_items())),
+        "" if user_id is None else str(user_id),
+        *(
+            request.headers.get(header, "")
+            for header in vary
+            if user_id is None or header != "authorization"
+        ),
+    ]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong validator for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag`` (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
+
+
+class CachedRoute(APIRoute):
+    """Route class that serves endpoints marked with ``cache_response`` from the cache."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        policy: CachePolicy | None = getattr(self.endpoint, CACHE_POLICY_ATTRIBUTE, None)
+        if policy is None or self.methods != {"GET"}:
+            return handler
+
+        async def cached_handler(request: Request) -> Response:
+            settings = get_cache_settings()
+            if not settings.cache_enabled:
+                return await handler(request)
+
+            user_id = None
+            if not policy.shared:
+                try:
+                    jwt_data = await parse_jwt_data_optional(request)
+                except NotAuthenticated:
+                    # Let the endpoint reject the token (or ignore it)
+                    return await handler(request)
+                user_id = None if jwt_data is None else jwt_data.user_id
+
+            cache = get_response_cache()
+            key = build_cache_key(request, policy.vary, user_id)
+            cached = await cache.get(key)
+            if cached is not None:
+                entry, cache_status = cached
+                return _build_response(request, entry, cache_status, policy)
+
+            invalidations = cache.invalidations
+            response = await handler(request)
+            body = getattr(response, "body", None)
+            # Only complete bodies (not streaming responses) of successful requests
+            if (
+                response.status_code != status.HTTP_200_OK
+                or not isinstance(body, bytes)
+                or len(body) > settings.cache_max_entry_bytes
+            ):
+                return response
+
+            ttl_seconds = policy.ttl_seconds or settings.cache_default_ttl_seconds
+            entry = CachedResponse(
+                body=body,
+                media_type=response.media_type or response.headers.get("content-type", ""),
+                etag=compute_etag(body),
+                tags=tuple(tag.format_map(request.path_params) for tag in policy.tags),
+                expires_at=time.time() + ttl_seconds,
+            )
+            cache.set(key, entry, invalidations)
+            if etag_matches(request.headers.get("if-none-match"), entry.etag):
+                return _build_response(request, entry, CacheStatus.MISS, policy)
+            response.headers.update(_cache_headers(entry, CacheStatus.MISS, policy))
+            return response
+
+        return cached_handler
+
+
+def _cache_headers(
+    entry: CachedResponse, cache_status: CacheStatus, policy: CachePolicy
+) -> dict[str, str]:
+    headers = {
+        "ETag": entry.etag,
+        "Cache-Control": CACHE_CONTROL,
+        CACHE_STATUS_HEADER: cache_status.value,
+    }
+    if policy.vary:
+        headers["Vary"] = ", ".join(policy.vary)
+    return headers
+
+
+def _build_response(
+    request: Request, entry: CachedResponse, cache_status: CacheStatus, policy: CachePolicy
+) -> Response:
+    headers = _cache_headers(entry, cache_status, policy)
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type=entry.media_type, headers=headers)
@@ -0,0 +1,215 @@
+"""
+Two-tier response cache with tag invalidation over Postgres LISTEN/NOTIFY.
+
+Lookups read the in-process tier first and then the shared UNLOGGED table,
+promoting shared hits into memory. Misses are stored in both; the shared write
+happens in the background so it never delays the response.
+
+Invalidating a tag deletes the shared entries and sends a NOTIFY; every worker
+(including the sender) listens on a dedicated connection and drops its own
+in-process entries. When the listener reconnects, notifications sent while it
+was down are lost, so the in-process tier is cleared.
+
+Invalidate from the transaction that changes the data, so other workers only
+drop their entries once the change is visible::
+
+    async with session.begin():
+        template.name = name
+        tags = ("templates", f"template:{template.id}")
+        await get_response_cache().invalidate(*tags, session=session)
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ..database import get_engine
+from .config import CacheConfig, get_cache_settings
+from .constants import INVALIDATE_ALL, INVALIDATION_CHANNEL, CacheStatus
+from .memory import CachedResponse, MemoryCache
+from .shared import SharedCache, invalidation_statements
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """In-process and shared response cache kept consistent across workers."""
+
+    def __init__(self, engine: AsyncEngine, config: CacheConfig) -> None:
+        self._engine = engine
+        self._config = config
+        self.memory = MemoryCache(config.cache_memory_max_bytes)
+        self.shared = SharedCache(engine) if config.cache_shared_enabled else None
+        # Incremented by every invalidation this worker applies; a response
+        # computed while it changed may be stale and is not stored
+        self.invalidations = 0
+        self._writes: set[asyncio.Task[None]] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    async def get(self, key: str) -> tuple[CachedResponse, CacheStatus] | None:
+        """
+        Look up a cached response.
+
+        Returns:
+            The entry and the tier that served it, or None on a miss. A failing
+            shared tier is logged and treated as a miss.
+        """
+        now = time.time()
+        entry = self.memory.get(key, now)
+        if entry is not None:
+            return entry, CacheStatus.MEMORY
+        if self.shared is None:
+            return None
+
+        try:
+            entry = await self.shared.get(key)
+        except Exception as e:
+            logger.warning(f"Shared cache read failed: {e!r}")
+            return None
+        if entry is None:
+            return None
+        self.memory.set(key, entry)
+        return entry, CacheStatus.SHARED
+
+    def set(self, key: str, entry: CachedResponse, invalidations: int) -> None:
+        """
+        Store a response computed after ``invalidations`` invalidations were seen.
+
+        If any invalidation arrived in the meantime, the response may have been
+        built from data that was changed since, and it is dropped.
+        """
+        if invalidations != self.invalidations:
+            return
+        self.memory.set(key, entry)
+        if self.shared is not None:
+            task = asyncio.create_task(self._write_shared(key, entry))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+
+    async def _write_shared(self, key: str, entry: CachedResponse) -> None:
+        try:
+            await self.shared.set(key, entry)
+        except Exception as e:
+            logger.warning(f"Shared cache write failed: {e!r}")
+
+    async def invalidate(self, *tags: str, session: AsyncSession | None = None) -> None:
+        """
+        Invalidate every cached response carrying any of ``tags``, in all workers.
+
+        Args:
+            tags: Tags to invalidate.
+            session: Run the invalidation in this session's transaction, so it
+                takes effect for other workers when the transaction commits.
+                Without a session it runs immediately in autocommit mode.
+        """
+        if not tags:
+            return
+        self._apply_invalidation(tags)
+        statements = invalidation_statements(tags)
+        if session is not None:
+            for statement in statements:
+                await session.execute(statement)
+            return
+
+        engine = self._engine.execution_options(isolation_level="AUTOCOMMIT")
+        async with engine.connect() as conn:
+            for statement in statements:
+                await conn.execute(statement)
+
+    def _apply_invalidation(self, tags: tuple[str, ...] | None) -> None:
+        # None clears every entry
+        self.invalidations += 1
+        if tags is None:
+            self.memory.clear()
+        else:
+            self.memory.invalidate_tags(tags)
+
+    def _on_notification(self, _connection: Any, _pid: int, _channel: str, payload: str) -> None:
+        if payload == INVALIDATE_ALL:
+            self._apply_invalidation(None)
+            return
+        try:
+            tags = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Ignoring malformed cache invalidation: {payload!r}")
+            return
+        self._apply_invalidation(tuple(tags))
+
+    async def _listen(self) -> None:
+        import asyncpg  # noqa: PLC0415
+
+        # asyncpg takes a libpq-style DSN; the SQLAlchemy URL names the dialect
+        dsn = self._engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        connected_before = False
+        while True:
+            try:
+                connection = await asyncpg.connect(dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Cache invalidation listener cannot connect: {e!r}")
+                await asyncio.sleep(self._config.cache_listen_retry_seconds)
+                continue
+
+            try:
+                await self._serve(connection, missed_invalidations=connected_before)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Cache invalidation listener failed: {e!r}")
+            finally:
+                with contextlib.suppress(Exception):
+                    await connection.close(timeout=1)
+            connected_before = True
+            logger.warning("Cache invalidation listener disconnected, reconnecting")
+            await asyncio.sleep(self._config.cache_listen_retry_seconds)
+
+    async def _serve(self, connection: Any, *, missed_invalidations: bool) -> None:
+        # Receive notifications on ``connection`` until it closes, purging
+        # expired shared entries in between
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+        await connection.add_listener(INVALIDATION_CHANNEL, self._on_notification)
+        if missed_invalidations:
+            # Invalidations sent while disconnected were lost
+            self._apply_invalidation(None)
+        while not closed.is_set():
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self._config.cache_purge_interval_seconds):
+                    await closed.wait()
+            if not closed.is_set():
+                await self._purge_expired()
+
+    async def _purge_expired(self) -> None:
+        if self.shared is None:
+            return
+        try:
+            deleted = await self.shared.purge_expired()
+        except Exception as e:
+            logger.warning(f"Shared cache purge failed: {e!r}")
+        else:
+            logger.debug(f"Purged {deleted} expired shared cache entries")
+
+    def start(self) -> None:
+        """Start listening for invalidations from other workers."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._listen(), name="response-cache-listener")
+
+    async def stop(self) -> None:
+        """Stop listening and wait for pending shared-tier writes."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+    """Get the response cache for the primary engine, started from the app lifespan."""
+    return ResponseCache(get_engine(), get_cache_settings())
@@ -0,0 +1,87 @@
+"""Shared tier of the response cache, stored in an UNLOGGED Postgres table."""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import orjson
+from sqlalchemy import Executable, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .constants import INVALIDATE_ALL, INVALIDATION_CHANNEL, MAX_NOTIFY_PAYLOAD_BYTES
+from .memory import CachedResponse
+from .models import CacheEntry
+
+_table = CacheEntry.__table__
+
+
+def invalidation_statements(tags: Sequence[str]) -> tuple[Executable, Executable]:
+    """
+    Build the statements that invalidate ``tags`` in every tier of every worker.
+
+    The first deletes the shared entries; the second notifies all workers, which
+    drop their in-process entries. Run in the caller's transaction, the
+    notification is only delivered if that transaction commits.
+
+    Returns:
+        The DELETE and the ``pg_notify`` SELECT, to execute in this order.
+    """
+    payload = orjson.dumps(list(tags)).decode()
+    if len(payload.encode()) > MAX_NOTIFY_PAYLOAD_BYTES:
+        payload = INVALIDATE_ALL
+    return (
+        delete(_table).where(_table.c.tags.overlap(list(tags))),
+        select(func.pg_notify(INVALIDATION_CHANNEL, payload)),
+    )
+
+
+class SharedCache:
+    """
+    Response cache entries shared by all workers.
+
+    Every operation is a single autocommit statement (no BEGIN/COMMIT). The
+    table is unlogged and therefore not readable on replicas, so the engine
+    must be the primary.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+    async def get(self, key: str) -> CachedResponse | None:
+        statement = select(
+            _table.c.body,
+            _table.c.media_type,
+            _table.c.etag,
+            _table.c.tags,
+            _table.c.expires_at,
+        ).where(_table.c.key == key, _table.c.expires_at > func.now())
+        async with self._engine.connect() as conn:
+            row = (await conn.execute(statement)).first()
+        if row is None:
+            return None
+        return CachedResponse(
+            body=row.body,
+            media_type=row.media_type,
+            etag=row.etag,
+            tags=tuple(row.tags),
+            expires_at=row.expires_at.timestamp(),
+        )
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        values = {
+            "body": entry.body,
+            "media_type": entry.media_type,
+            "etag": entry.etag,
+            "tags": list(entry.tags),
+            "expires_at": datetime.fromtimestamp(entry.expires_at, UTC),
+        }
+        statement = insert(_table).values(key=key, **values)
+        statement = statement.on_conflict_do_update(index_elements=[_table.c.key], set_=values)
+        async with self._engine.connect() as conn:
+            await conn.execute(statement)
+
+    async def purge_expired(self) -> int:
+        """Delete expired entries; return how many were deleted."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(delete(_table).where(_table.c.expires_at <= func.now()))
+        return result.rowcount
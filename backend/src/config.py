@@ -1,5 +1,8 @@
 """Main application configuration."""
 
+from functools import lru_cache
+from typing import Any
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -10,6 +13,9 @@ class Config(BaseSettings):
     # Application configuration
     app_version: str = Field(default="1.0.0", alias="APP_VERSION")
 
+    # Secret used to sign opaque pagination cursors (must match across workers)
+    cursor_secret: str = Field(default="change-me-cursor-secret", alias="CURSOR_SECRET")
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -18,5 +24,15 @@ class Config(BaseSettings):
         extra = "ignore"  # Ignore extra environment variables not defined in the model
 
 
-# Global application configuration instance
-settings = Config()
+@lru_cache
+def get_settings() -> Config:
+    """Get the global application configuration, loaded from the environment on first use."""
+    return Config()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``settings`` is built on first access
+    if name == "settings":
+        return get_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -1,24 +1,70 @@
 """Database module for connection management and configuration."""
 
-from .config import DatabaseConfig, db_settings
+from typing import Any
+
+from . import config, connection
+from .config import DatabaseConfig, get_db_settings
 from .connection import (
     POSTGRES_INDEXES_NAMING_CONVENTION,
-    AsyncSessionLocal,
+    AsyncReadSessionLocal,
     close_db,
-    engine,
     get_db_session,
+    get_engine,
+    get_engine_pool_stats,
+    get_read_db_session,
+    get_replica_router,
+    get_session_factory,
     init_db,
     metadata,
 )
+from .constants import MigrationState, ReadOnlyMode
+from .migrations import check_migrations, get_migration_status
+from .profiler import (
+    QueryProfiler,
+    QueryProfilerMiddleware,
+    fingerprint_statement,
+    get_query_profiler,
+)
+from .transactions import TrackedSession, has_pending_writes, mark_writes
 
 __all__ = [
     "POSTGRES_INDEXES_NAMING_CONVENTION",
+    "AsyncReadSessionLocal",
     "AsyncSessionLocal",
     "DatabaseConfig",
+    "MigrationState",
+    "QueryProfiler",
+    "QueryProfilerMiddleware",
+    "ReadOnlyMode",
+    "TrackedSession",
+    "check_migrations",
     "close_db",
     "db_settings",
     "engine",
+    "fingerprint_statement",
     "get_db_session",
+    "get_db_settings",
+    "get_engine",
+    "get_engine_pool_stats",
+    "get_migration_status",
+    "get_query_profiler",
+    "get_read_db_session",
+    "get_replica_router",
+    "get_session_factory",
+    "has_pending_writes",
     "init_db",
+    "mark_writes",
     "metadata",
+    "replica_router",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Settings, engine, session factory and replica router are built on first
+    # access (PEP 562), so importing the package does not load the DB driver.
+    if name == "db_settings":
+        return config.get_db_settings()
+    if name in ("engine", "AsyncSessionLocal", "replica_router"):
+        return getattr(connection, name)
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -1,8 +1,13 @@
 """Database configuration loaded from environment variables."""
 
+from functools import lru_cache
+from typing import Any
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from .constants import ReadOnlyMode
+
 
 class DatabaseConfig(BaseSettings):
     """Database configuration loaded from environment variables."""
@@ -14,6 +19,46 @@ class DatabaseConfig(BaseSettings):
     postgres_port: int = Field(default=5432, alias="POSTGRES_PORT")
     database_url: str | None = Field(default=None, alias="DATABASE_URL")
 
+    # Read replicas (comma-separated URLs, same format as DATABASE_URL)
+    database_replica_urls: str | None = Field(default=None, alias="DATABASE_REPLICA_URLS")
+    db_replica_cooldown_seconds: float = Field(
+        default=30.0, gt=0, alias="DB_REPLICA_COOLDOWN_SECONDS"
+    )
+
+    # Connection pool configuration
+    db_pool_size: int = Field(default=5, ge=1, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, ge=0, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=30.0, gt=0, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")  # seconds, -1 disables
+    # Pre-ping costs extra round-trips on every checkout; pool_recycle covers stale connections
+    db_pool_pre_ping: bool = Field(default=False, alias="DB_POOL_PRE_PING")
+
+    # asyncpg prepared statement caches (per connection, 0 disables)
+    db_statement_cache_size: int = Field(default=100, ge=0, alias="DB_STATEMENT_CACHE_SIZE")
+    db_prepared_statement_cache_size: int = Field(
+        default=100, ge=0, alias="DB_PREPARED_STATEMENT_CACHE_SIZE"
+    )
+    db_echo: bool = Field(default=False, alias="DB_ECHO")
+
+    # Query profiler (opt-in): slow-query log and N+1 detection per request
+    db_profiler_enabled: bool = Field(default=False, alias="DB_PROFILER_ENABLED")
+    db_slow_query_threshold_ms: float = Field(
+        default=200.0, ge=0, alias="DB_SLOW_QUERY_THRESHOLD_MS"
+    )
+    # Flag a request that runs the same statement fingerprint more than this many times
+    db_n_plus_one_threshold: int = Field(default=10, ge=1, alias="DB_N_PLUS_ONE_THRESHOLD")
+    # How many slow queries and N+1 incidents are kept in memory
+    db_profiler_max_records: int = Field(default=200, ge=1, alias="DB_PROFILER_MAX_RECORDS")
+    # How many statement fingerprints have statistics; the least recently run are evicted
+    db_profiler_max_fingerprints: int = Field(
+        default=2048, ge=1, alias="DB_PROFILER_MAX_FINGERPRINTS"
+    )
+
+    # Read-only sessions (get_read_db_session)
+    db_read_only_mode: ReadOnlyMode = Field(
+        default=ReadOnlyMode.AUTOCOMMIT, alias="DB_READ_ONLY_MODE"
+    )
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -31,6 +76,44 @@ class DatabaseConfig(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
+    def get_replica_urls(self) -> list[str]:
+        """Parse the configured read replica URLs."""
+        if not self.database_replica_urls:
+            return []
+
+        return [url.strip() for url in self.database_replica_urls.split(",") if url.strip()]
+
+    def get_engine_options(self) -> dict[str, Any]:
+        """
+        Build keyword arguments for ``create_async_engine``.
+
+        ``statement_cache_size`` is asyncpg's own cache, while
+        ``prepared_statement_cache_size`` is the SQLAlchemy asyncpg dialect
+        cache. Both must be 0 when running behind PgBouncer in transaction mode.
+        """
+        return {
+            "echo": self.db_echo,
+            "pool_size": self.db_pool_size,
+            "max_overflow": self.db_max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle,
+            "pool_pre_ping": self.db_pool_pre_ping,
+            "connect_args": {
+                "statement_cache_size": self.db_statement_cache_size,
+                "prepared_statement_cache_size": self.db_prepared_statement_cache_size,
+            },
+        }
+
+
+@lru_cache
+def get_db_settings() -> DatabaseConfig:
+    """Get the global database configuration, loaded from the environment on first use."""
+    return DatabaseConfig()
+
 
-# Global database configuration instance
-db_settings = DatabaseConfig()
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``db_settings`` is built on first access
+    if name == "db_settings":
+        return get_db_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -15,13 +15,24 @@ Database Naming Conventions:
 - Primary keys: %(table_name)s_pkey
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
+from functools import lru_cache
+from typing import Any
 
 from sqlalchemy import MetaData, text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlmodel import SQLModel
 
-from .config import db_settings
+from .config import get_db_settings
+from .constants import READ_ONLY_EXECUTION_OPTIONS
+from .pool import InstrumentedAsyncQueuePool, get_pool_stats
+from .replicas import ReplicaRouter
+from .transactions import TrackedSession, has_pending_writes
 
 # PostgreSQL naming conventions for database keys
 POSTGRES_INDEXES_NAMING_CONVENTION = {
@@ -38,33 +49,89 @@ metadata = MetaData(naming_convention=POSTGRES_INDEXES_NAMING_CONVENTION)
 # Configure SQLModel to use the custom metadata
 SQLModel.metadata = metadata
 
-# Create async engine
-engine = create_async_engine(
-    db_settings.get_database_url(),
-    echo=False,  # Set to True for SQL query logging
-    future=True,
-)
-
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
+# Unbound session factory for read sessions; the router picks the engine per session
+AsyncReadSessionLocal = async_sessionmaker(
     class_=AsyncSession,
     expire_on_commit=False,
-    autocommit=False,
     autoflush=False,
 )
 
 
+def _create_engine(url: str) -> AsyncEngine:
+    """Create an async engine; pool sizing and statement caches come from DatabaseConfig."""
+    return create_async_engine(
+        url,
+        future=True,
+        poolclass=InstrumentedAsyncQueuePool,
+        **get_db_settings().get_engine_options(),
+    )
+
+
+@lru_cache
+def get_engine() -> AsyncEngine:
+    """
+    Get the application engine, creating it on first use.
+
+    Creating the engine imports the asyncpg driver, so it is deferred until the
+    first database access instead of happening when the module is imported.
+    """
+    return _create_engine(get_db_settings().get_database_url())
+
+
+@lru_cache
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory bound to the application engine."""
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        sync_session_class=TrackedSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+@lru_cache
+def get_replica_router() -> ReplicaRouter:
+    """Get the read replica router; replica engines share the primary's settings."""
+    settings = get_db_settings()
+    return ReplicaRouter(
+        primary=get_engine(),
+        replicas=[_create_engine(url) for url in settings.get_replica_urls()],
+        cooldown_seconds=settings.db_replica_cooldown_seconds,
+        execution_options=READ_ONLY_EXECUTION_OPTIONS[settings.db_read_only_mode],
+    )
+
+
+# Module attributes built on first access (PEP 562), so existing imports such as
+# ``from src.database import engine`` keep working without eager construction.
+_LAZY_ATTRIBUTES: dict[str, Callable[[], Any]] = {
+    "engine": get_engine,
+    "AsyncSessionLocal": get_session_factory,
+    "replica_router": get_replica_router,
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function to get database session.
 
-    Use this in FastAPI route dependencies.
+    Use this in FastAPI route dependencies. The transaction starts lazily on
+    first use and is committed only if the handler left pending changes or
+    wrote something; otherwise it is simply released.
     """
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
-            await session.commit()
+            if has_pending_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -72,13 +139,39 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get a read-only database session.
+
+    The session is bound to a healthy read replica when replicas are configured,
+    otherwise to the primary. It runs in the configured read-only mode
+    (``DB_READ_ONLY_MODE``): autocommit skips the BEGIN/COMMIT round-trips, while
+    ``transaction`` uses a BEGIN READ ONLY transaction. It is never committed,
+    so use it only for handlers that do not write. Replicas may lag slightly
+    behind the primary.
+    """
+    session = await get_replica_router().open_session(AsyncReadSessionLocal)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+def get_engine_pool_stats() -> dict[str, Any]:
+    """Get connection pool statistics for the application engine."""
+    return get_pool_stats(get_engine().pool)
+
+
 async def init_db() -> None:
     """Initialize database connection."""
     # Test connection
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.execute(text("SELECT 1"))
 
 
 async def close_db() -> None:
-    """Close database connections."""
-    await engine.dispose()
+    """Close database connections (engines that were never created are skipped)."""
+    if get_replica_router.cache_info().currsize:
+        await get_replica_router().dispose()
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
@@ -0,0 +1,28 @@
+"""Constants for database module."""
+
+from enum import Enum
+
+
+class ReadOnlyMode(str, Enum):
+    """How read-only sessions talk to the database."""
+
+    # No BEGIN/COMMIT round-trips; each statement runs in its own implicit transaction
+    AUTOCOMMIT = "autocommit"
+    # BEGIN READ ONLY transaction; consistent snapshot across statements
+    TRANSACTION = "transaction"
+
+
+READ_ONLY_EXECUTION_OPTIONS: dict[ReadOnlyMode, dict[str, str | bool]] = {
+    ReadOnlyMode.AUTOCOMMIT: {"isolation_level": "AUTOCOMMIT"},
+    ReadOnlyMode.TRANSACTION: {"postgresql_readonly": True},
+}
+
+
+class MigrationState(str, Enum):
+    """Database schema state relative to the Alembic migration scripts."""
+
+    UP_TO_DATE = "up_to_date"
+    # The database is behind (or ahead of) the migration script heads
+    OUT_OF_DATE = "out_of_date"
+    # The check could not run (database or script directory unavailable)
+    UNKNOWN = "unknown"
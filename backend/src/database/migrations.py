@@ -0,0 +1,113 @@
+"""
+In-process migration status check.
+
+Compares the revisions recorded in the ``alembic_version`` table with the heads
+of the Alembic script directory, using the application engine. This replaces
+running ``alembic current`` in a subprocess, which blocked the event loop and
+started a second interpreter on every boot.
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.engine import Connection
+
+from .connection import get_engine
+from .constants import MigrationState
+
+logger = logging.getLogger(__name__)
+
+# backend/alembic.ini, resolved independently of the working directory
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# Result of the last check, served by get_migration_status()
+_migration_status: dict[str, Any] | None = None
+
+
+def _import_alembic() -> None:
+    """
+    Import Alembic, which is slow to import, on first check instead of at boot.
+
+    Everything is imported in one thread before the check runs: importing the
+    same modules concurrently from the worker thread and the event loop thread
+    can deadlock on the import locks.
+    """
+    import alembic.config  # noqa: PLC0415
+    import alembic.runtime.migration  # noqa: PLC0415
+    import alembic.script  # noqa: F401, PLC0415
+
+
+def _get_script_heads() -> tuple[str, ...]:
+    """Read head revisions from the migration scripts (file I/O, run in a thread)."""
+    from alembic.config import Config  # noqa: PLC0415
+    from alembic.script import ScriptDirectory  # noqa: PLC0415
+
+    config = Config(str(ALEMBIC_INI_PATH))
+    config.set_main_option("script_location", str(ALEMBIC_INI_PATH.parent / "alembic"))
+    return tuple(ScriptDirectory.from_config(config).get_heads())
+
+
+def _get_current_revisions(connection: Connection) -> tuple[str, ...]:
+    from alembic.runtime.migration import MigrationContext  # noqa: PLC0415
+
+    return tuple(MigrationContext.configure(connection).get_current_heads())
+
+
+async def _read_current_revisions() -> tuple[str, ...]:
+    async with get_engine().connect() as conn:
+        return await conn.run_sync(_get_current_revisions)
+
+
+async def check_migrations() -> dict[str, Any]:
+    """
+    Check whether the database schema matches the migration script heads.
+
+    The script directory is read in a worker thread and the database revision
+    is read over the application engine, so the event loop is never blocked.
+    The result is cached for ``get_migration_status``.
+
+    Returns:
+        Dictionary with the migration state, current database revisions and
+        script head revisions.
+    """
+    global _migration_status  # noqa: PLW0603
+
+    try:
+        await asyncio.to_thread(_import_alembic)
+        heads, current = await asyncio.gather(
+            asyncio.to_thread(_get_script_heads),
+            _read_current_revisions(),
+        )
+    except Exception as e:
+        logger.warning(f"Could not check migration status: {e!r}")
+        _migration_status = {
+            "state": MigrationState.UNKNOWN,
+            "current_revisions": [],
+            "head_revisions": [],
+        }
+        return _migration_status
+
+    is_up_to_date = set(current) == set(heads)
+    _migration_status = {
+        "state": MigrationState.UP_TO_DATE if is_up_to_date else MigrationState.OUT_OF_DATE,
+        "current_revisions": sorted(current),
+        "head_revisions": sorted(heads),
+    }
+
+    if not current and heads:
+        logger.warning("No migrations have been applied yet")
+    elif not is_up_to_date:
+        logger.warning(
+            f"Database migrations are out of date: current={sorted(current)}, heads={sorted(heads)}"
+        )
+    else:
+        logger.info(f"Current database migration version: {sorted(current) or 'none'}")
+
+    return _migration_status
+
+
+def get_migration_status() -> dict[str, Any] | None:
+    """Get the result of the last migration check, or None if it has not run yet."""
+    return _migration_status
@@ -0,0 +1,86 @@
+"""
+Connection pool instrumentation.
+
+Provides an asyncio queue pool that records how long callers wait to check out
+a connection, plus a helper that summarizes pool usage for health reporting.
+"""
+
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that tracks checkout wait time.
+
+    The measured time covers waiting for a free connection and, when the pool
+    is allowed to overflow, opening a new one. Counters are plain attributes so
+    reading them never takes a lock.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkout_count = 0
+        self.checkout_timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started_at
+            self.checkout_count += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+
+def get_pool_stats(pool: Pool) -> dict[str, Any]:
+    """
+    Summarize current pool usage.
+
+    Args:
+        pool: Pool attached to an engine (e.g., ``engine.pool``).
+
+    Returns:
+        Dictionary with pool size, checked-out and overflow connections, and
+        checkout wait statistics when the pool is instrumented.
+    """
+    stats: dict[str, Any] = {
+        "pool_class": type(pool).__name__,
+        "size": None,
+        "checked_in": None,
+        "checked_out": None,
+        "overflow": None,
+        "checkout_count": None,
+        "checkout_timeouts": None,
+        "avg_wait_ms": None,
+        "max_wait_ms": None,
+    }
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+
+    if not isinstance(pool, InstrumentedAsyncQueuePool):
+        return stats
+
+    avg_wait = pool.total_wait_seconds / pool.checkout_count if pool.checkout_count else 0.0
+    stats.update(
+        checkout_count=pool.checkout_count,
+        checkout_timeouts=pool.checkout_timeouts,
+        avg_wait_ms=round(avg_wait * 1000, 3),
+        max_wait_ms=round(pool.max_wait_seconds * 1000, 3),
+    )
+    return stats
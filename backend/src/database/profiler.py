@@ -0,0 +1,362 @@
+"""
+Opt-in query profiler.
+
+Attaches to engine cursor events and aggregates every statement by fingerprint
+(the SQL with literals and bind parameters replaced by ``?``): execution count,
+total/max duration and rows. Statements slower than a threshold are logged
+together with the route that issued them, and a request that runs the same
+fingerprint more than N times is flagged as a likely N+1 pattern.
+
+Everything is kept in memory, bounded (statistics for at most
+``max_fingerprints`` fingerprints, the least recently executed evicted first;
+the most recent ``max_records`` slow queries and N+1 incidents), and can be
+read in-process or dumped to JSON, e.g. to assert in a test that an endpoint runs a fixed number of queries::
+
+    profiler = get_query_profiler()
+    profiler.attach(engine)
+    with profiler.request_scope("list applications") as log:
+        await list_applications(...)
+    assert log.query_count <= 3
+    assert not profiler.n_plus_one_incidents()
+    profiler.dump_json("query-profile.json")
+"""
+
+import hashlib
+import logging
+import re
+import time
+from collections import Counter, OrderedDict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..datetime import format_datetime_iso, get_current_utc_datetime
+from .config import get_db_settings
+
+logger = logging.getLogger(__name__)
+
+# Key in Connection.info holding start times of in-flight cursor executions
+_QUERY_STARTED_AT_KEY = "profiler_query_started_at"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+|\?")
+# "?" optionally followed by a cast, e.g. "?::VARCHAR"
+_PLACEHOLDER = r"\?(?:::\w+)?"
+_PARAMETER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_ARRAY_LIST = re.compile(rf"\[\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\]")
+_REPEATED_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint_statement(statement: str) -> str:
+    """
+    Normalize a SQL statement so executions that differ only in values match.
+
+    Literals and bind parameters become ``?``, parameter lists such as
+    ``IN ($1, $2, $3)`` and multi-row ``VALUES`` collapse to ``(?)`` (and
+    ``ARRAY[...]`` to ``[?]``), and whitespace is collapsed.
+
+    Example:
+        >>> fingerprint_statement("SELECT * FROM post WHERE id IN ($1, $2) AND x = 'a'")
+        'SELECT * FROM post WHERE id IN (?) AND x = ?'
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PARAMETER_LIST.sub("(?)", normalized)
+    normalized = _ARRAY_LIST.sub("[?]", normalized)
+    normalized = _REPEATED_ROWS.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    """Short stable identifier of a fingerprint, for logs and JSON keys."""
+    return hashlib.sha1(fingerprint.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+class FingerprintStats:
+    """Aggregated executions of one statement fingerprint."""
+
+    __slots__ = ("count", "fingerprint", "max_ms", "rows", "total_ms")
+
+    def __init__(self, fingerprint: str) -> None:
+        self.fingerprint = fingerprint
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": fingerprint_id(self.fingerprint),
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "rows": self.rows,
+        }
+
+
+class RequestQueryLog:
+    """Queries issued within one request (or ``request_scope`` block)."""
+
+    __slots__ = ("fingerprints", "label", "query_count", "scope", "total_ms")
+
+    def __init__(self, label: str | None = None, scope: Scope | None = None) -> None:
+        self.label = label
+        self.scope = scope
+        self.fingerprints: Counter[str] = Counter()
+        self.query_count = 0
+        self.total_ms = 0.0
+
+    @property
+    def route(self) -> str | None:
+        """Route template of the request (resolved lazily, after routing), or the label."""
+        if self.scope is not None:
+            route = self.scope.get("route")
+            path = getattr(route, "path", None) or self.scope.get("path")
+            return f"{self.scope.get('method', '')} {path}".strip()
+        return self.label
+
+
+# Query log of the current request; None outside of profiled requests
+current_query_log: ContextVar[RequestQueryLog | None] = ContextVar(
+    "current_query_log", default=None
+)
+
+
+class QueryProfiler:
+    """Aggregates query statistics, slow queries and N+1 incidents for attached engines."""
+
+    def __init__(
+        self,
+        slow_query_threshold_ms: float,
+        n_plus_one_threshold: int,
+        max_records: int,
+        max_fingerprints: int,
+    ) -> None:
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.max_fingerprints = max_fingerprints
+        # Least recently executed first
+        self._stats: OrderedDict[str, FingerprintStats] = OrderedDict()
+        self._evicted_fingerprints = 0
+        self._slow_queries: deque[dict[str, Any]] = deque(maxlen=max_records)
+        self._n_plus_one: deque[dict[str, Any]] = deque(maxlen=max_records)
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Profile statements executed by ``engine``; safe to call more than once."""
+        sync_engine = engine.sync_engine
+        if event.contains(sync_engine, "before_cursor_execute", self._before_cursor_execute):
+            return
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+
+    def detach(self, engine: AsyncEngine) -> None:
+        """Stop profiling ``engine``."""
+        sync_engine = engine.sync_engine
+        if not event.contains(sync_engine, "before_cursor_execute", self._before_cursor_execute):
+            return
+        event.remove(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.remove(sync_engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(self, conn: Connection, *_: Any) -> None:
+        conn.info.setdefault(_QUERY_STARTED_AT_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        *_: Any,
+    ) -> None:
+        started = conn.info.get(_QUERY_STARTED_AT_KEY)
+        if not started:
+            return
+        self.record(statement, (time.perf_counter() - started.pop()) * 1000, cursor.rowcount)
+
+    def _handle_error(self, exception_context: ExceptionContext) -> None:
+        # A failed execution never reaches after_cursor_execute; drop its start time
+        conn = exception_context.connection
+        started = conn.info.get(_QUERY_STARTED_AT_KEY) if conn is not None else None
+        if started:
+            started.pop()
+
+    def record(self, statement: str, duration_ms: float, rows: int = -1) -> None:
+        """
+        Record one executed statement.
+
+        Args:
+            statement: SQL as sent to the driver.
+            duration_ms: Execution time in milliseconds.
+            rows: Rows returned or affected, or -1 if unknown.
+        """
+        fingerprint = fingerprint_statement(statement)
+        stats = self._stats.get(fingerprint)
+        if stats is None:
+            if len(self._stats) >= self.max_fingerprints:
+                self._stats.popitem(last=False)
+                self._evicted_fingerprints += 1
+            stats = self._stats[fingerprint] = FingerprintStats(fingerprint)
+        else:
+            self._stats.move_to_end(fingerprint)
+        stats.count += 1
+        stats.total_ms += duration_ms
+        stats.max_ms = max(stats.max_ms, duration_ms)
+        if rows > 0:
+            stats.rows += rows
+
+        query_log = current_query_log.get()
+        if query_log is not None:
+            query_log.fingerprints[fingerprint] += 1
+            query_log.query_count += 1
+            query_log.total_ms += duration_ms
+
+        if duration_ms >= self.slow_query_threshold_ms:
+            route = query_log.route if query_log is not None else None
+            self._slow_queries.append(
+                {
+                    "id": fingerprint_id(fingerprint),
+                    "fingerprint": fingerprint,
+                    "duration_ms": round(duration_ms, 3),
+                    "rows": rows,
+                    "route": route,
+                    "recorded_at": format_datetime_iso(get_current_utc_datetime()),
+                }
+            )
+            logger.warning(
+                f"Slow query ({duration_ms:.1f} ms, {rows} rows) "
+                f"from {route or 'outside a request'}: {fingerprint}"
+            )
+
+    @contextmanager
+    def request_scope(
+        self, label: str | None = None, scope: Scope | None = None
+    ) -> Iterator[RequestQueryLog]:
+        """
+        Group the queries run inside the block as one request.
+
+        On exit, fingerprints executed more than ``n_plus_one_threshold`` times
+        are recorded as N+1 incidents and logged.
+
+        Args:
+            label: Name reported for the block (e.g., a test name).
+            scope: ASGI scope of the HTTP request, used to report its route.
+
+        Yields:
+            The query log of the block.
+        """
+        query_log = RequestQueryLog(label=label, scope=scope)
+        token = current_query_log.set(query_log)
+        try:
+            yield query_log
+        finally:
+            current_query_log.reset(token)
+            self._check_n_plus_one(query_log)
+
+    def _check_n_plus_one(self, query_log: RequestQueryLog) -> None:
+        for fingerprint, count in query_log.fingerprints.items():
+            if count <= self.n_plus_one_threshold:
+                continue
+            route = query_log.route
+            self._n_plus_one.append(
+                {
+                    "id": fingerprint_id(fingerprint),
+                    "fingerprint": fingerprint,
+                    "count": count,
+                    "route": route,
+                    "recorded_at": format_datetime_iso(get_current_utc_datetime()),
+                }
+            )
+            logger.warning(
+                f"Possible N+1: {route or 'request'} ran the same statement {count} times: "
+                f"{fingerprint}"
+            )
+
+    def query_stats(self) -> list[dict[str, Any]]:
+        """Per-fingerprint statistics, most total time first."""
+        ranked = sorted(self._stats.values(), key=lambda stats: stats.total_ms, reverse=True)
+        return [stats.to_dict() for stats in ranked]
+
+    def slow_queries(self) -> list[dict[str, Any]]:
+        """Recent statements over the slow-query threshold, oldest first."""
+        return list(self._slow_queries)
+
+    def n_plus_one_incidents(self) -> list[dict[str, Any]]:
+        """Recent requests that repeated a fingerprint too often, oldest first."""
+        return list(self._n_plus_one)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Snapshot of everything recorded, with the active thresholds."""
+        return {
+            "slow_query_threshold_ms": self.slow_query_threshold_ms,
+            "n_plus_one_threshold": self.n_plus_one_threshold,
+            "evicted_fingerprints": self._evicted_fingerprints,
+            "queries": self.query_stats(),
+            "slow_queries": self.slow_queries(),
+            "n_plus_one": self.n_plus_one_incidents(),
+        }
+
+    def dump_json(self, path: str | Path | None = None) -> bytes:
+        """
+        Serialize ``to_dict()`` to JSON.
+
+        Args:
+            path: If given, also write the JSON to this file.
+
+        Returns:
+            The JSON document.
+        """
+        data = orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        if path is not None:
+            Path(path).write_bytes(data)
+        return data
+
+    def reset(self) -> None:
+        """Drop all recorded statistics and incidents."""
+        self._stats.clear()
+        self._evicted_fingerprints = 0
+        self._slow_queries.clear()
+        self._n_plus_one.clear()
+
+
+class QueryProfilerMiddleware:
+    """Run every HTTP request in a ``request_scope`` so its queries are grouped by route."""
+
+    def __init__(self, app: ASGIApp, profiler: QueryProfiler | None = None) -> None:
+        self.app = app
+        self.profiler = profiler or get_query_profiler()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with self.profiler.request_scope(scope=scope):
+            await self.app(scope, receive, send)
+
+
+@lru_cache
+def get_query_profiler() -> QueryProfiler:
+    """Get the application query profiler, configured from DatabaseConfig."""
+    settings = get_db_settings()
+    return QueryProfiler(
+        slow_query_threshold_ms=settings.db_slow_query_threshold_ms,
+        n_plus_one_threshold=settings.db_n_plus_one_threshold,
+        max_records=settings.db_profiler_max_records,
+        max_fingerprints=settings.db_profiler_max_fingerprints,
+    )
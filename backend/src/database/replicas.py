@@ -0,0 +1,104 @@
+"""
+Read replica routing.
+
+Spreads read-only sessions across replica engines in round-robin order. A replica
+that fails to hand out a connection is skipped for a cooldown period, and when no
+replica is usable reads fall back to the primary engine.
+"""
+
+import itertools
+import logging
+import time
+from typing import Any
+
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Errors that indicate the replica itself is unreachable or saturated (its pool
+# timed out on checkout), not a bad query
+REPLICA_CONNECTION_ERRORS = (OperationalError, InterfaceError, PoolTimeoutError, OSError)
+
+
+class ReplicaRouter:
+    """Round-robin replica selection with health-aware failover to the primary."""
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: list[AsyncEngine],
+        cooldown_seconds: float,
+        execution_options: dict[str, Any] | None = None,
+    ) -> None:
+        self.primary = primary
+        self.replicas = replicas
+        self.cooldown_seconds = cooldown_seconds
+        self._unhealthy_until: dict[int, float] = {}
+        self._cycle = itertools.cycle(range(len(replicas)))
+
+        # Engine proxies carrying the read-only execution options; they share
+        # the underlying pools with the engines they wrap.
+        options = execution_options or {}
+        self._primary_bind = primary.execution_options(**options)
+        self._replica_binds = [replica.execution_options(**options) for replica in replicas]
+
+    def mark_unhealthy(self, index: int) -> None:
+        """Skip the replica at ``index`` until its cooldown period has elapsed."""
+        self._unhealthy_until[index] = time.monotonic() + self.cooldown_seconds
+        logger.warning(
+            "Read replica %s marked unhealthy for %.1fs",
+            self.replicas[index].url.render_as_string(hide_password=True),
+            self.cooldown_seconds,
+        )
+
+    def healthy_replica_indexes(self) -> list[int]:
+        """Return indexes of healthy replicas, starting from the next one in rotation."""
+        if not self.replicas:
+            return []
+
+        now = time.monotonic()
+        start = next(self._cycle)
+        count = len(self.replicas)
+        return [
+            index % count
+            for index in range(start, start + count)
+            if self._unhealthy_until.get(index % count, 0.0) <= now
+        ]
+
+    async def open_session(self, session_factory: async_sessionmaker[AsyncSession]) -> AsyncSession:
+        """
+        Open a session bound to a healthy replica, or to the primary.
+
+        A connection is checked out eagerly so that an unreachable replica is
+        detected here and the next candidate is tried. Without replicas no
+        connection is checked out until the session is first used.
+        """
+        for index in self.healthy_replica_indexes():
+            session = session_factory(bind=self._replica_binds[index])
+            try:
+                await session.connection()
+            except REPLICA_CONNECTION_ERRORS:
+                await session.close()
+                self.mark_unhealthy(index)
+                continue
+            return session
+
+        return session_factory(bind=self._primary_bind)
+
+    async def dispose(self) -> None:
+        """Dispose all replica engines."""
+        for replica in self.replicas:
+            await replica.dispose()
+
+    def status(self) -> list[dict[str, str | bool]]:
+        """Describe each replica and whether it is currently in rotation."""
+        now = time.monotonic()
+        return [
+            {
+                "url": replica.url.render_as_string(hide_password=True),
+                "healthy": self._unhealthy_until.get(index, 0.0) <= now,
+            }
+            for index, replica in enumerate(self.replicas)
+        ]
@@ -0,0 +1,63 @@
+"""
+Write tracking for request-scoped sessions.
+
+Sessions created from ``TrackedSession`` remember whether they flushed or executed
+a non-SELECT statement in the current transaction, so request dependencies can
+commit only when something was actually written. Statements run on the
+session's connection (``await session.connection()``) bypass the session, so
+code writing that way calls ``mark_writes``.
+"""
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+
+# Session.info key set when the current transaction wrote data
+HAS_WRITES_KEY = "has_writes"
+
+
+class TrackedSession(Session):
+    """Session that records writes made in its current transaction."""
+
+
+@event.listens_for(TrackedSession, "after_flush")
+def _mark_flush(session: Session, flush_context: Any) -> None:  # noqa: ARG001
+    session.info[HAS_WRITES_KEY] = True
+
+
+@event.listens_for(TrackedSession, "do_orm_execute")
+def _mark_execute(orm_execute_state: ORMExecuteState) -> None:
+    # Core DML and textual SQL via session.execute() bypass the flush, so treat
+    # anything that is not a SELECT as a write.
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[HAS_WRITES_KEY] = True
+
+
+@event.listens_for(TrackedSession, "after_transaction_end")
+def _reset_writes(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(HAS_WRITES_KEY, None)
+
+
+def mark_writes(session: AsyncSession) -> None:
+    """Record that the current transaction wrote through the session's connection."""
+    session.info[HAS_WRITES_KEY] = True
+
+
+def has_pending_writes(session: AsyncSession) -> bool:
+    """
+    Check whether a session has anything to commit.
+
+    Args:
+        session: Async session created with ``sync_session_class=TrackedSession``.
+
+    Returns:
+        True if the session holds unflushed changes or already wrote in the
+        current transaction.
+    """
+    if session.new or session.dirty or session.deleted:
+        return True
+
+    return bool(session.info.get(HAS_WRITES_KEY))
@@ -5,6 +5,12 @@ for all datetime operations. All datetime objects should be in UTC unless explic
 converted for display purposes.
 """
 
+from .batch import (
+    format_datetime_iso_batch,
+    parse_date_iso_batch,
+    parse_datetime_iso_batch,
+    parse_time_iso_batch,
+)
 from .utils import (
     DATE_FORMAT,
     DATETIME_FORMAT,
@@ -29,10 +35,14 @@ __all__ = [
     "TIME_FORMAT",
     "format_date_iso",
     "format_datetime_iso",
+    "format_datetime_iso_batch",
     "format_time_iso",
     "get_current_utc_datetime",
     "now",
     "parse_date_iso",
+    "parse_date_iso_batch",
     "parse_datetime_iso",
+    "parse_datetime_iso_batch",
     "parse_time_iso",
+    "parse_time_iso_batch",
 ]
@@ -0,0 +1,231 @@
+"""
+Batch datetime parsing and formatting for bulk import/export.
+
+Each function takes a sequence of values and returns a list in the same order,
+with the same normalization rules as the single-value functions in ``utils``
+(UTC everywhere, naive values assumed UTC). Parse errors report the index and
+value that failed.
+
+When NumPy is installed, datetimes and dates can also be returned as
+``datetime64`` arrays (``as_array=True``), and ``datetime64`` arrays can be
+formatted directly. Values in the fixed ``DATETIME_FORMAT_UTC`` / ``DATE_FORMAT``
+layouts are then parsed and formatted in NumPy's C code rather than per value
+in Python. NumPy has no timezone support, so arrays hold naive UTC values.
+NumPy is imported on the first array call, not when this module is imported.
+"""
+
+import sys
+from collections.abc import Sequence
+from datetime import date, datetime, time
+from functools import lru_cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import DateParseError, DateTimeParseError, TimeParseError
+from .utils import (
+    format_datetime_iso,
+    parse_date_iso,
+    parse_datetime_iso,
+    parse_time_iso,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+# Length of "YYYY-MM-DDTHH:MM:SSZ" (DATETIME_FORMAT_UTC)
+_UTC_DATETIME_LENGTH = 20
+_DATE_LENGTH = 10
+# NumPy accepts year 0 (and signs or spaces in place of a digit), ``date`` does not
+_YEAR_ZERO = "0000"
+
+
+@lru_cache(maxsize=1)
+def _numpy() -> ModuleType:
+    """Import NumPy on first use; it is optional and slow to import."""
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError as e:
+        message = "NumPy is required for datetime64 array support"
+        raise ImportError(message) from e
+    return numpy
+
+
+def _is_fixed_date(value: Any) -> bool:
+    # "YYYY-MM-DD" in ASCII digits: what NumPy parses as ``parse_date_iso`` does
+    return (
+        isinstance(value, str)
+        and len(value) == _DATE_LENGTH
+        and value.isascii()
+        and value[4] == "-"
+        and value[7] == "-"
+        and (value[:4] + value[5:7] + value[8:]).isdigit()
+        and value[:4] != _YEAR_ZERO
+    )
+
+
+def _is_fixed_utc_datetime(value: Any) -> bool:
+    # "YYYY-MM-DDTHH:MM:SSZ" in ASCII digits
+    return (
+        isinstance(value, str)
+        and len(value) == _UTC_DATETIME_LENGTH
+        and _is_fixed_date(value[:_DATE_LENGTH])
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+        and value[-1] == "Z"
+        and value[11:19].replace(":", "").isdigit()
+        and value.isascii()
+    )
+
+
+def _is_datetime64_array(values: Any) -> bool:
+    # A NumPy array can only exist if NumPy was already imported by the caller
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(values, np.ndarray) and values.dtype.kind == "M"
+
+
+def parse_datetime_iso_batch(
+    values: Sequence[str],
+    *,
+    as_array: bool = False,
+) -> "list[datetime] | NDArray[np.datetime64]":
+    """
+    Parse ISO 8601 datetime strings.
+
+    Args:
+        values: ISO 8601 datetime strings (see ``parse_datetime_iso``).
+        as_array: Return a ``datetime64[us]`` NumPy array of naive UTC values
+            instead of a list of aware datetimes. Requires NumPy.
+
+    Returns:
+        Parsed datetimes in UTC, in input order.
+
+    Raises:
+        DateTimeParseError: If any value cannot be parsed; the message names
+            the first failing index and value.
+
+    Example:
+        >>> parse_datetime_iso_batch(["2024-01-01T00:00:00Z"])
+        [datetime.datetime(2024, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)]
+    """
+    if as_array:
+        return _parse_datetime_array(values)
+
+    parsed = []
+    for index, value in enumerate(values):
+        try:
+            parsed.append(parse_datetime_iso(value))
+        except (DateTimeParseError, AttributeError, TypeError) as e:
+            raise DateTimeParseError(value, index) from e
+    return parsed
+
+
+def _parse_datetime_array(values: Sequence[str]) -> "NDArray[np.datetime64]":
+    np = _numpy()
+    # Vectorized path: every value is "YYYY-MM-DDTHH:MM:SSZ"
+    if all(_is_fixed_utc_datetime(value) for value in values):
+        try:
+            return np.array([value[:-1] for value in values], dtype="datetime64[s]").astype(
+                "datetime64[us]"
+            )
+        except ValueError:
+            pass  # Fall through to the per-value path to report the failing index
+
+    parsed = parse_datetime_iso_batch(values)
+    return np.array([dt.replace(tzinfo=None) for dt in parsed], dtype="datetime64[us]")
+
+
+def format_datetime_iso_batch(
+    values: "Sequence[datetime] | NDArray[np.datetime64]",
+) -> list[str]:
+    """
+    Format datetimes to ISO 8601 strings with UTC timezone (Z suffix).
+
+    Args:
+        values: Datetimes (naive values are assumed UTC), or a ``datetime64``
+            NumPy array of UTC values. NaT entries are formatted as "NaT".
+
+    Returns:
+        ISO 8601 formatted strings (e.g., "2024-01-01T00:00:00Z"), in input order.
+
+    Example:
+        >>> from datetime import UTC
+        >>> format_datetime_iso_batch([datetime(2024, 1, 1, tzinfo=UTC)])
+        ['2024-01-01T00:00:00Z']
+    """
+    if _is_datetime64_array(values):
+        formatted = _numpy().datetime_as_string(values.astype("datetime64[s]"), unit="s")
+        return [value if value == "NaT" else value + "Z" for value in formatted.tolist()]
+
+    return [format_datetime_iso(dt) for dt in values]
+
+
+def parse_date_iso_batch(
+    values: Sequence[str],
+    *,
+    as_array: bool = False,
+) -> "list[date] | NDArray[np.datetime64]":
+    """
+    Parse ISO 8601 date strings.
+
+    Args:
+        values: ISO formatted date strings (e.g., "2024-01-01").
+        as_array: Return a ``datetime64[D]`` NumPy array instead of a list.
+            Requires NumPy.
+
+    Returns:
+        Parsed dates, in input order.
+
+    Raises:
+        DateParseError: If any value cannot be parsed; the message names the
+            first failing index and value.
+
+    Example:
+        >>> parse_date_iso_batch(["2024-01-01"])
+        [datetime.date(2024, 1, 1)]
+    """
+    np = _numpy() if as_array else None
+    if np is not None and all(_is_fixed_date(value) for value in values):
+        try:
+            return np.array(values, dtype="datetime64[D]")
+        except ValueError:
+            pass  # Fall through to the per-value path to report the failing index
+
+    parsed = []
+    for index, value in enumerate(values):
+        try:
+            parsed.append(parse_date_iso(value))
+        except (DateParseError, TypeError) as e:
+            raise DateParseError(value, index) from e
+
+    if np is not None:
+        return np.array(parsed, dtype="datetime64[D]")
+    return parsed
+
+
+def parse_time_iso_batch(values: Sequence[str]) -> list[time]:
+    """
+    Parse ISO 8601 time strings.
+
+    Args:
+        values: ISO formatted time strings (e.g., "12:30:45").
+
+    Returns:
+        Parsed times, in input order.
+
+    Raises:
+        TimeParseError: If any value cannot be parsed; the message names the
+            first failing index and value.
+
+    Example:
+        >>> parse_time_iso_batch(["12:30:45"])
+        [datetime.time(12, 30, 45)]
+    """
+    parsed = []
+    for index, value in enumerate(values):
+        try:
+            parsed.append(parse_time_iso(value))
+        except (TimeParseError, TypeError) as e:
+            raise TimeParseError(value, index) from e
+    return parsed
@@ -1,19 +1,33 @@
 """Custom exception classes for the application."""
 
 
-class DateTimeParseError(ValueError):
+class _ParseError(ValueError):
+    """Base parse error that can carry the failing value and its batch index."""
+
+    KIND = "value"
+
+    def __init__(self, value: object = None, index: int | None = None) -> None:
+        self.value = value
+        self.index = index
+        if index is None:
+            super().__init__()
+            return
+        super().__init__(f"Invalid {self.KIND} at index {index}: {value!r}")
+
+
+class DateTimeParseError(_ParseError):
     """Raised when a datetime string cannot be parsed."""
 
-    pass
+    KIND = "datetime"
 
 
-class DateParseError(ValueError):
+class DateParseError(_ParseError):
     """Raised when a date string cannot be parsed."""
 
-    pass
+    KIND = "date"
 
 
-class TimeParseError(ValueError):
+class TimeParseError(_ParseError):
     """Raised when a time string cannot be parsed."""
 
-    pass
+    KIND = "time"
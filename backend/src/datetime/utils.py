@@ -24,6 +24,22 @@ DATETIME_FORMAT_UTC = "%Y-%m-%dT%H:%M:%SZ"  # ISO 8601 UTC (Z suffix)
 DATE_FORMAT = "%Y-%m-%d"  # ISO date format
 TIME_FORMAT = "%H:%M:%S"  # ISO time format
 
+# Fixed layouts handled by the fast paths below: "YYYY-MM-DD" and "HH:MM:SS".
+# Values that do not match fall back to strptime/strftime with the format
+# constants above, so results are identical either way.
+_DATE_LENGTH = 10
+_TIME_LENGTH = 8
+# strftime("%Y") does not zero-pad years before 1000, isoformat() does
+_MIN_ISOFORMAT_YEAR = 1000
+
+
+def _is_fixed_date_layout(value: str) -> bool:
+    return len(value) == _DATE_LENGTH and value[4] == "-" and value[7] == "-"
+
+
+def _is_fixed_time_layout(value: str) -> bool:
+    return len(value) == _TIME_LENGTH and value[2] == ":" and value[5] == ":"
+
 
 def get_current_utc_datetime() -> datetime:
     """
@@ -86,11 +102,15 @@ def format_datetime_iso(dt: datetime) -> str:
     if dt.tzinfo is None:
         # If no timezone info, assume UTC (application default)
         dt = dt.replace(tzinfo=DEFAULT_TIMEZONE)
-    elif dt.tzinfo != DEFAULT_TIMEZONE:
+    elif dt.tzinfo is not DEFAULT_TIMEZONE:
         # Convert to UTC if not already (application default)
         dt = dt.astimezone(DEFAULT_TIMEZONE)
 
-    return dt.strftime(DATETIME_FORMAT_UTC)
+    if dt.year < _MIN_ISOFORMAT_YEAR:
+        return dt.strftime(DATETIME_FORMAT_UTC)
+
+    # Same output as strftime(DATETIME_FORMAT_UTC): swap the "+00:00" offset for "Z"
+    return dt.isoformat(timespec="seconds")[:-6] + "Z"
 
 
 def format_date_iso(d: date) -> str:
@@ -108,7 +128,10 @@ def format_date_iso(d: date) -> str:
         >>> format_date_iso(d)
         '2024-01-01'
     """
-    return d.strftime(DATE_FORMAT)
+    if d.year < _MIN_ISOFORMAT_YEAR:
+        return d.strftime(DATE_FORMAT)
+
+    return date.isoformat(d)
 
 
 def format_time_iso(t: time) -> str:
@@ -126,7 +149,10 @@ def format_time_iso(t: time) -> str:
         >>> format_time_iso(t)
         '12:30:45'
     """
-    return t.strftime(TIME_FORMAT)
+    if t.tzinfo is not None:
+        return t.strftime(TIME_FORMAT)
+
+    return t.isoformat(timespec="seconds")
 
 
 def parse_datetime_iso(dt_str: str) -> datetime:
@@ -194,6 +220,12 @@ def parse_date_iso(date_str: str) -> date:
         >>> isinstance(d, date)
         True
     """
+    if _is_fixed_date_layout(date_str):
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass  # Let strptime decide, it is more lenient (e.g. non-ASCII digits)
+
     try:
         return datetime.strptime(date_str, DATE_FORMAT).date()
     except ValueError as e:
@@ -218,6 +250,12 @@ def parse_time_iso(time_str: str) -> time:
         >>> isinstance(t, time)
         True
     """
+    if _is_fixed_time_layout(time_str):
+        try:
+            return time.fromisoformat(time_str)
+        except ValueError:
+            pass  # Let strptime decide, it is more lenient (e.g. non-ASCII digits)
+
     try:
         return datetime.strptime(time_str, TIME_FORMAT).time()
     except ValueError as e:
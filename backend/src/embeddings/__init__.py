@@ -0,0 +1,35 @@
+"""Skill and job description embeddings with in-process vector search."""
+
+from .config import EmbeddingsConfig, get_embeddings_settings
+from .constants import EmbeddingKind
+from .models import EmbeddingRecord
+from .router import router
+from .schemas import (
+    PassageMatch,
+    PassageSearchRequest,
+    PassageSearchResponse,
+    SimilarSkills,
+    SimilarSkillsRequest,
+    SimilarSkillsResponse,
+    SkillNeighbor,
+)
+from .service import EmbeddingService, get_embedding_service
+from .utils import chunk_text
+
+__all__ = [
+    "EmbeddingKind",
+    "EmbeddingRecord",
+    "EmbeddingService",
+    "EmbeddingsConfig",
+    "PassageMatch",
+    "PassageSearchRequest",
+    "PassageSearchResponse",
+    "SimilarSkills",
+    "SimilarSkillsRequest",
+    "SimilarSkillsResponse",
+    "SkillNeighbor",
+    "chunk_text",
+    "get_embedding_service",
+    "get_embeddings_settings",
+    "router",
+]
@@ -0,0 +1,55 @@
+"""Embedding configuration loaded from environment variables."""
+
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class EmbeddingsConfig(BaseSettings):
+    """Embedding configuration loaded from environment variables."""
+
+    # "module:attribute" of a zero-argument callable returning an Embedder; by
+    # default the offline hashing embedder (EMBEDDING_DIMENSIONS dimensions)
+    embedding_embedder: str | None = Field(default=None, alias="EMBEDDING_EMBEDDER")
+    embedding_dimensions: int = Field(default=256, ge=8, alias="EMBEDDING_DIMENSIONS")
+    # Texts per embedder call
+    embedding_batch_size: int = Field(default=64, ge=1, alias="EMBEDDING_BATCH_SIZE")
+    # Job descriptions are embedded in passages of about this many characters
+    embedding_chunk_chars: int = Field(default=1000, ge=100, alias="EMBEDDING_CHUNK_CHARS")
+
+    # Memory-mapped vector matrices, shared by the workers of a host
+    embedding_index_dir: Path = Field(
+        default=Path(tempfile.gettempdir()) / "resume-agent-embeddings",
+        alias="EMBEDDING_INDEX_DIR",
+    )
+    # How often the indexes load vectors stored by other workers
+    embedding_refresh_seconds: float = Field(default=30.0, ge=0, alias="EMBEDDING_REFRESH_SECONDS")
+    # Vectors kept in memory before they are merged into the mapped file
+    embedding_index_compact_rows: int = Field(
+        default=10_000, ge=1, alias="EMBEDDING_INDEX_COMPACT_ROWS"
+    )
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_embeddings_settings() -> EmbeddingsConfig:
+    """Get the global embedding configuration, loaded from the environment on first use."""
+    return EmbeddingsConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``embeddings_settings`` is built on first access
+    if name == "embeddings_settings":
+        return get_embeddings_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -0,0 +1,19 @@
+"""Constants for embeddings."""
+
+from enum import Enum
+
+
+class EmbeddingKind(str, Enum):
+    """What an embedded text is."""
+
+    SKILL = "skill"  # a canonical skill name
+    JOB_DESCRIPTION_CHUNK = "job_description_chunk"  # a passage of a job description
+
+
+# Vectors are stored as little-endian float32 bytes (bytea), dimension after dimension
+VECTOR_DTYPE = "<f4"
+
+KEY_MAX_LENGTH = 255
+
+# Kind of the background job that embeds the passages and skills of saved job descriptions
+EMBEDDINGS_INGEST_JOB = "embeddings.ingest"
@@ -0,0 +1,112 @@
+"""Embedding backends: texts in, one L2-normalizable float32 vector per text out."""
+
+import importlib
+import re
+import unicodedata
+import zlib
+from collections.abc import Sequence
+from typing import Any, Protocol
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .config import EmbeddingsConfig
+
+_WORD = re.compile(r"[^\W_][\w+#.]*")
+_SIGN_BIT = 0x80000000
+
+
+class Embedder(Protocol):
+    """Embeds a batch of texts."""
+
+    # Identifies the model in stored embeddings (e.g. "text-embedding-3-small")
+    model: str
+    dimensions: int
+
+    async def embed(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        """Vectors of ``texts``, as a ``(len(texts), dimensions)`` matrix."""
+        ...
+
+
+class HashingEmbedder:
+    """
+    Offline embedder: signed feature hashing of character trigrams.
+
+    Texts sharing many trigrams get close vectors, so spelling variants
+    ("Postgres", "PostgreSQL", "Postgre SQL") score high against each other and
+    unrelated names do not. It has no notion of meaning beyond spelling; aliases
+    such as "k8s" are resolved to their canonical skill before embedding. It
+    needs no model files or network access and is deterministic, so development
+    and tests run offline.
+
+    Example:
+        >>> embedder = HashingEmbedder(dimensions=256)
+        >>> a, b, c = embedder.embed_batch(["Postgres", "PostgreSQL", "Kafka"])
+        >>> bool(a @ b > 0.5 > a @ c)
+        True
+    """
+
+    def __init__(self, dimensions: int = 256) -> None:
+        self.dimensions = dimensions
+        self.model = f"hashing-v1-{dimensions}"
+
+    async def embed(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        return self.embed_batch(texts)
+
+    def embed_batch(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        """Synchronous ``embed``: rows are L2-normalized (zero for texts without words)."""
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            hashes = np.fromiter(
+                (zlib.crc32(feature.encode()) for feature in _features(text)), dtype=np.uint32
+            )
+            signs = np.where(hashes & _SIGN_BIT, -1.0, 1.0)
+            matrix[row] = np.bincount(hashes % self.dimensions, signs, self.dimensions)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, np.finfo(np.float32).tiny)
+
+
+def _features(text: str) -> list[str]:
+    features = []
+    for word in _WORD.findall(unicodedata.normalize("NFKC", text).casefold()):
+        padded = f"<{word}>"
+        features.extend(padded[start : start + 3] for start in range(len(padded) - 2))
+    return features
+
+
+class LangChainEmbedder:
+    """
+    Embedder backed by a LangChain ``Embeddings`` model.
+
+    The model object is built by the caller, so this module does not import
+    LangChain.
+
+    Example:
+        >>> from langchain_openai import OpenAIEmbeddings
+        >>> embedder = LangChainEmbedder(
+        ...     OpenAIEmbeddings(model="text-embedding-3-small"), "text-embedding-3-small", 1536
+        ... )
+    """
+
+    def __init__(self, embeddings: Any, model: str, dimensions: int) -> None:
+        self.model = model
+        self.dimensions = dimensions
+        self._embeddings = embeddings
+
+    async def embed(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        vectors = await self._embeddings.aembed_documents(list(texts))
+        return np.asarray(vectors, dtype=np.float32).reshape(len(texts), self.dimensions)
+
+
+def load_embedder(config: EmbeddingsConfig) -> Embedder:
+    """
+    Build the configured embedder.
+
+    Returns:
+        The result of calling ``EMBEDDING_EMBEDDER`` ("module:attribute"), or a
+        ``HashingEmbedder`` when it is not set.
+    """
+    if config.embedding_embedder is None:
+        return HashingEmbedder(config.embedding_dimensions)
+    module, _, attribute = config.embedding_embedder.partition(":")
+    return getattr(importlib.import_module(module), attribute)()
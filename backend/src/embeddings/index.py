@@ -0,0 +1,270 @@
+"""
+In-process top-k cosine search over embedding vectors.
+
+Vectors are kept L2-normalized, so cosine similarity is a dot product and a
+batch of queries against N vectors is one ``(N, d) @ (d, q)`` product per
+block of rows. Each block keeps only the k best rows per query (a partial
+selection), so memory stays bounded by the block size, however many vectors
+and queries there are.
+
+Most vectors live in a ``.npy`` file mapped read-only. Its pages belong to the
+OS page cache, shared by every worker process of the host that maps the same
+file, instead of being copied into each process's heap. A restarted worker
+maps the file again and only loads the vectors stored since it was written.
+Vectors added since then stay in memory until there are ``compact_rows`` of
+them; the index then writes a new file next to the old one and switches to it,
+and processes still mapping the old file keep reading it until they switch too.
+"""
+
+import contextlib
+import uuid
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import orjson
+from numpy.typing import NDArray
+
+from .constants import VECTOR_DTYPE
+
+# Rows scored per matrix product; bounds the (rows, queries) score block
+_BLOCK_ROWS = 65_536
+
+
+def normalize_rows(vectors: NDArray[Any]) -> NDArray[np.float32]:
+    """Float32 copy of ``vectors`` with unit-length rows (all-zero rows stay zero)."""
+    matrix = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, np.finfo(np.float32).tiny)
+
+
+class VectorIndex:
+    """
+    Unit vectors by key, searchable by cosine similarity.
+
+    Not thread-safe; mutate it from one thread (the event loop) and search it
+    from others through a ``view``.
+
+    Example:
+        >>> index = VectorIndex(Path("/tmp/skills"), dimensions=2)
+        >>> index.add(["a", "b"], np.array([[1.0, 0.0], [0.6, 0.8]]))
+        2
+        >>> index.search(np.array([[1.0, 0.1]]), k=1)
+        [[('a', 0.995...)]]
+    """
+
+    def __init__(self, path: Path, dimensions: int, compact_rows: int = 10_000) -> None:
+        # Files: <path>.json (keys, metadata, matrix file name) and <path>.<id>.npy
+        self.path = path
+        self.dimensions = dimensions
+        self.compact_rows = compact_rows
+        # Saved with the keys; e.g. how far the vectors were loaded from the database
+        self.metadata: dict[str, Any] = {}
+        self._keys: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._mapped: NDArray[np.float32] = np.zeros((0, dimensions), dtype=np.float32)
+        self._mapped_file: str | None = None
+        self._recent: list[NDArray[np.float32]] = []
+        self._recent_rows = 0
+        # Rows visible to this object; a view's keys and rows are shared and keep growing
+        self._size = 0
+
+    @classmethod
+    def open(cls, path: Path, dimensions: int, compact_rows: int = 10_000) -> "VectorIndex":
+        """
+        Map the index saved at ``path``, or start an empty one.
+
+        Files that are missing, unreadable or of another dimension are ignored.
+        """
+        index = cls(path, dimensions, compact_rows)
+        try:
+            manifest = orjson.loads(path.with_suffix(".json").read_bytes())
+            mapped = np.load(path.parent / manifest["matrix"], mmap_mode="r")
+        except (OSError, ValueError, KeyError, TypeError):
+            return index
+        keys = manifest.get("keys", [])
+        if mapped.shape != (len(keys), dimensions) or mapped.dtype != np.float32:
+            return index
+        index._mapped = mapped
+        index._mapped_file = manifest["matrix"]
+        index._keys = list(keys)
+        index._rows = {key: row for row, key in enumerate(index._keys)}
+        index._size = len(index._keys)
+        index.metadata = manifest.get("metadata", {})
+        return index
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        return self._rows.get(key, self._size) < self._size
+
+    def view(self) -> "VectorIndex":
+        """
+        Read-only index of the vectors added so far, searchable from another thread.
+
+        Takes constant time: keys and vectors are shared, not copied, and the
+        view ignores the ones this index adds later. Do not add to a view.
+        """
+        view = VectorIndex(self.path, self.dimensions, self.compact_rows)
+        view.metadata = dict(self.metadata)
+        view._keys = self._keys
+        view._rows = self._rows
+        view._mapped = self._mapped
+        view._mapped_file = self._mapped_file
+        view._recent = list(self._recent)
+        view._recent_rows = self._recent_rows
+        view._size = self._size
+        return view
+
+    def add(self, keys: Sequence[str], vectors: NDArray[Any]) -> int:
+        """
+        Add vectors under new keys; keys already in the index are skipped.
+
+        Args:
+            keys: One key per vector.
+            vectors: ``(len(keys), dimensions)`` matrix, normalized here.
+
+        Returns:
+            Number of vectors added.
+        """
+        new = [position for position, key in enumerate(keys) if key not in self._rows]
+        new = list({keys[position]: position for position in new}.values())
+        if not new:
+            return 0
+        matrix = normalize_rows(vectors)[new]
+        for position in new:
+            self._rows[keys[position]] = len(self._keys)
+            self._keys.append(keys[position])
+        self._size = len(self._keys)
+        self._recent.append(matrix)
+        self._recent_rows += len(new)
+        if self._recent_rows >= self.compact_rows:
+            self.compact()
+        return len(new)
+
+    def add_encoded(self, keys: Sequence[str], blobs: Sequence[bytes]) -> int:
+        """``add`` for vectors as stored in the database (see ``encode``)."""
+        matrix = np.frombuffer(b"".join(blobs), dtype=VECTOR_DTYPE)
+        return self.add(keys, matrix.reshape(len(blobs), self.dimensions))
+
+    @staticmethod
+    def encode(vectors: NDArray[Any]) -> list[bytes]:
+        """Normalized vectors as float32 bytes, one per row, for the database."""
+        matrix = normalize_rows(vectors).astype(VECTOR_DTYPE, copy=False)
+        return [row.tobytes() for row in matrix]
+
+    def search(
+        self,
+        queries: NDArray[Any],
+        k: int,
+        min_score: float = -1.0,
+        keys: Sequence[str] | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Most similar vectors of each query.
+
+        Args:
+            queries: ``(q, dimensions)`` matrix (or one vector), normalized here.
+            k: Number of results per query.
+            min_score: Leave out results with a lower cosine similarity.
+            keys: Only score the vectors of these keys (keys not in the index
+                are ignored); by default every vector.
+
+        Returns:
+            For each query, up to ``k`` (key, cosine similarity) pairs, best first.
+        """
+        queries = normalize_rows(queries)
+        query_count = len(queries)
+        if keys is None:
+            # Shared with views: only the first len(self) keys have rows in the blocks
+            candidates, count = self._keys, len(self)
+            blocks: Iterable[NDArray[np.float32]] = self._blocks()
+        else:
+            candidates = [key for key in dict.fromkeys(keys) if key in self]
+            count = len(candidates)
+            # Gathered block by block, so memory stays bounded by the block size
+            blocks = (
+                self.vectors(candidates[start : start + _BLOCK_ROWS])
+                for start in range(0, len(candidates), _BLOCK_ROWS)
+            )
+        if not count or k <= 0:
+            return [[] for _ in range(query_count)]
+
+        best_rows = np.empty((0, query_count), dtype=np.int64)
+        best_scores = np.empty((0, query_count), dtype=np.float32)
+        offset = 0
+        for block in blocks:
+            scores = block @ queries.T
+            if len(scores) > k:
+                top = np.argpartition(-scores, k - 1, axis=0)[:k]
+                scores = np.take_along_axis(scores, top, axis=0)
+            else:
+                top = np.broadcast_to(np.arange(len(scores))[:, None], scores.shape)
+            best_rows = np.concatenate([best_rows, top + offset])
+            best_scores = np.concatenate([best_scores, scores])
+            offset += len(block)
+
+        order = np.argsort(-best_scores, axis=0, kind="stable")[:k]
+        rows = np.take_along_axis(best_rows, order, axis=0)
+        scores = np.take_along_axis(best_scores, order, axis=0)
+        return [
+            [
+                (candidates[row], float(score))
+                for row, score in zip(
+                    rows[:, query].tolist(), scores[:, query].tolist(), strict=True
+                )
+                if score >= min_score
+            ]
+            for query in range(query_count)
+        ]
+
+    def vectors(self, keys: Sequence[str]) -> NDArray[np.float32]:
+        """Stored vectors of ``keys`` (which must be in the index), in order."""
+        vectors = np.empty((len(keys), self.dimensions), dtype=np.float32)
+        mapped_rows = len(self._mapped)
+        # At most compact_rows vectors
+        recent = np.concatenate(self._recent) if self._recent else self._mapped[:0]
+        for position, key in enumerate(keys):
+            row = self._rows[key]
+            vectors[position] = (
+                self._mapped[row] if row < mapped_rows else recent[row - mapped_rows]
+            )
+        return vectors
+
+    def compact(self) -> None:
+        """Write every vector to a new mapped file and switch to it."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        matrix_file = f"{self.path.name}.{uuid.uuid4().hex}.npy"
+        temporary = self.path.parent / f".{matrix_file}"
+        np.save(temporary, self._matrix())
+        temporary.replace(self.path.parent / matrix_file)
+        manifest = {"matrix": matrix_file, "keys": self._keys, "metadata": self.metadata}
+        manifest_path = self.path.with_suffix(".json")
+        temporary = manifest_path.with_name(f".{manifest_path.name}.{uuid.uuid4().hex}")
+        temporary.write_bytes(orjson.dumps(manifest))
+        temporary.replace(manifest_path)
+
+        previous = self._mapped_file
+        self._mapped = np.load(self.path.parent / matrix_file, mmap_mode="r")
+        self._mapped_file = matrix_file
+        self._recent = []
+        self._recent_rows = 0
+        if previous is not None:
+            # Processes still mapping it keep their mapping
+            with contextlib.suppress(OSError):
+                (self.path.parent / previous).unlink()
+
+    def _matrix(self) -> NDArray[np.float32]:
+        if not self._recent:
+            return self._mapped
+        return np.concatenate([self._mapped, *self._recent])
+
+    def _blocks(self) -> list[NDArray[np.float32]]:
+        blocks = [
+            self._mapped[start : start + _BLOCK_ROWS]
+            for start in range(0, len(self._mapped), _BLOCK_ROWS)
+        ]
+        blocks.extend(self._recent)
+        return blocks
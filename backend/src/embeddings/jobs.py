@@ -0,0 +1,24 @@
+"""
+Embedding job handlers.
+
+Imported by every worker: ``src.embeddings.jobs`` is in the default
+``JOB_HANDLER_MODULES``.
+"""
+
+from typing import Any
+
+from ..jobs import ClaimedJob, PermanentJobError, job_handler
+from .constants import EMBEDDINGS_INGEST_JOB
+from .service import get_embedding_service
+
+
+@job_handler(EMBEDDINGS_INGEST_JOB, timeout_seconds=600)
+async def embed_job_descriptions(job: ClaimedJob) -> dict[str, Any]:
+    """Embed the passages and skills of a user's job descriptions."""
+    if job.user_id is None:
+        message = "Embedding jobs belong to a user"
+        raise PermanentJobError(message)
+    texts = await get_embedding_service().ingest_documents(
+        job.user_id, job.payload.get("document_ids")
+    )
+    return {"texts": texts}
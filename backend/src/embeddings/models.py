@@ -0,0 +1,61 @@
+"""Embedding database models."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlmodel import Field, SQLModel
+
+from .constants import KEY_MAX_LENGTH, EmbeddingKind
+
+
+class EmbeddingRecord(SQLModel, table=True):
+    """
+    Embedding of a skill name or a job description passage.
+
+    Keyed by what was embedded (a canonical skill name, or a saved job
+    description's search document id and passage number) together with the
+    model, so switching embedders never mixes vectors of different models.
+    Passages belong to the owner of the job description and are only searched
+    on their behalf; skill names are shared. The vector is float32 ``bytea``,
+    which needs no extension: searches run in process memory, not in Postgres.
+    """
+
+    __tablename__ = "embedding"
+    __table_args__ = (
+        # Loading the vectors of one kind and model stored since a refresh
+        Index("embedding_kind_model_created_at_idx", "kind", "model", "created_at"),
+        # The passages of a user's job descriptions
+        Index(
+            "embedding_user_id_kind_model_idx",
+            "user_id",
+            "kind",
+            "model",
+            postgresql_where=text("user_id IS NOT NULL"),
+        ),
+    )
+
+    kind: EmbeddingKind = Field(sa_column=Column(String(32), primary_key=True))
+    model: str = Field(sa_column=Column(String(100), primary_key=True))
+    # Canonical skill name, or the job description's search document id
+    key: str = Field(sa_column=Column(String(KEY_MAX_LENGTH), primary_key=True))
+    # Passage number within the job description; 0 for skills
+    chunk: int = Field(sa_column=Column(SmallInteger, primary_key=True, server_default="0"))
+    # Owner of a passage; None for skills
+    user_id: int | None = Field(default=None, sa_column=Column(Integer, nullable=True))
+    text: str = Field(sa_column=Column(Text, nullable=False))
+    vector: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
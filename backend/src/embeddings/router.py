@@ -0,0 +1,83 @@
+"""Semantic skill and job description search endpoints."""
+
+from fastapi import APIRouter, Depends, status
+
+from ..auth import parse_jwt_data
+from ..auth.schemas import JWTData
+from .schemas import (
+    PassageSearchRequest,
+    PassageSearchResponse,
+    SimilarSkillsRequest,
+    SimilarSkillsResponse,
+)
+from .service import get_embedding_service
+
+router = APIRouter(
+    prefix="/embeddings", tags=["embeddings"], dependencies=[Depends(parse_jwt_data)]
+)
+
+
+@router.post(
+    "/skills/similar",
+    response_model=SimilarSkillsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Find similar skills",
+    description=(
+        "Returns, for each given skill, the skills from analyzed job descriptions "
+        "whose embeddings are closest to it: near-synonyms (Postgres, PostgreSQL) "
+        "and related skills. Aliases resolve to their canonical skill first; skills "
+        "never seen in a job description are embedded on the fly."
+    ),
+    responses={
+        200: {
+            "description": "Similar skills of each requested skill, most similar first",
+            "content": {
+                "application/json": {
+                    "example": SimilarSkillsResponse.model_config["json_schema_extra"]["example"]
+                }
+            },
+        }
+    },
+)
+async def find_similar_skills(request: SimilarSkillsRequest) -> SimilarSkillsResponse:
+    """
+    Similar skills endpoint.
+
+    Scores all requested skills against the skill index with one matrix
+    product and embeds only the skills it does not know.
+    """
+    return await get_embedding_service().similar_skills(request)
+
+
+@router.post(
+    "/job-descriptions/search",
+    response_model=PassageSearchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Search job descriptions by meaning",
+    description=(
+        "Embeds the text (e.g. a resume bullet) and returns the user's saved job "
+        "descriptions with the most similar passage, with that passage. Matches "
+        "wording that differs from the text, unlike full-text search. Job "
+        "descriptions are embedded by a background job shortly after they are saved."
+    ),
+    responses={
+        200: {
+            "description": "Best passage per job description, most similar first",
+            "content": {
+                "application/json": {
+                    "example": PassageSearchResponse.model_config["json_schema_extra"]["example"]
+                }
+            },
+        }
+    },
+)
+async def search_job_descriptions(
+    request: PassageSearchRequest, jwt_data: JWTData = Depends(parse_jwt_data)
+) -> PassageSearchResponse:
+    """
+    Passage search endpoint.
+
+    Embeds the text once and runs a top-k search over the passages of the
+    user's job descriptions only.
+    """
+    return await get_embedding_service().search_passages(request, jwt_data.user_id)
@@ -0,0 +1,106 @@
+"""Embedding search request and response models."""
+
+from pydantic import ConfigDict, Field
+
+from ..models import CustomBaseModel
+
+
+class SimilarSkillsRequest(CustomBaseModel):
+    """Skills to find near-synonyms and related skills for."""
+
+    skills: list[str] = Field(..., min_length=1, max_length=100, description="Skill names")
+    limit: int = Field(default=5, ge=1, le=50, description="Similar skills per skill")
+    min_score: float = Field(
+        default=0.5, ge=-1, le=1, description="Minimum cosine similarity of a similar skill"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"skills": ["Postgres", "k8s"], "limit": 5}}
+    )
+
+
+class SkillNeighbor(CustomBaseModel):
+    """A known skill close to the requested one."""
+
+    skill: str = Field(..., description="Canonical skill name")
+    score: float = Field(..., description="Cosine similarity (-1 to 1)")
+
+
+class SimilarSkills(CustomBaseModel):
+    """Skills similar to one requested skill."""
+
+    skill: str = Field(..., description="Skill as requested")
+    canonical: str = Field(..., description="Canonical name, after resolving aliases")
+    known: bool = Field(..., description="Whether the skill appears in analyzed job descriptions")
+    similar: list[SkillNeighbor] = Field(..., description="Most similar skills first")
+
+
+class SimilarSkillsResponse(CustomBaseModel):
+    """Similar skills of each requested skill, in request order."""
+
+    model: str = Field(..., description="Embedding model")
+    results: list[SimilarSkills] = Field(..., description="One entry per requested skill")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "model": "hashing-v1-256",
+                "results": [
+                    {
+                        "skill": "Postgres",
+                        "canonical": "PostgreSQL",
+                        "known": True,
+                        "similar": [{"skill": "PostgreSQL/PostGIS", "score": 0.81}],
+                    }
+                ],
+            }
+        }
+    )
+
+
+class PassageSearchRequest(CustomBaseModel):
+    """Text to find the most similar job description passages for."""
+
+    text: str = Field(
+        ..., min_length=1, max_length=10_000, description="E.g. a resume bullet or a skill list"
+    )
+    limit: int = Field(default=10, ge=1, le=100, description="Job descriptions to return")
+    min_score: float = Field(default=0.0, ge=-1, le=1, description="Minimum cosine similarity")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {"text": "Built data pipelines with Kafka and Postgres", "limit": 10}
+        }
+    )
+
+
+class PassageMatch(CustomBaseModel):
+    """The passage of a job description closest to the searched text."""
+
+    document_id: int = Field(..., description="Search document of the job description")
+    chunk: int = Field(..., description="Passage number within the job description")
+    text: str = Field(..., description="Passage text")
+    score: float = Field(..., description="Cosine similarity (-1 to 1)")
+
+
+class PassageSearchResponse(CustomBaseModel):
+    """Job descriptions with a passage similar to the searched text, best first."""
+
+    model: str = Field(..., description="Embedding model")
+    matches: list[PassageMatch] = Field(..., description="Best passage per job description")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "model": "hashing-v1-256",
+                "matches": [
+                    {
+                        "document_id": 42,
+                        "chunk": 2,
+                        "text": "Experience with Kafka and PostgreSQL in production",
+                        "score": 0.64,
+                    }
+                ],
+            }
+        }
+    )
@@ -0,0 +1,426 @@
+"""
+Embeddings of skills and job description passages, with semantic search.
+
+Saving a job description enqueues an ingestion job (``enqueue_embedding``) in
+the same transaction. The job embeds its passages, owned by its user, and its
+skills (under their canonical names) in batches of ``EMBEDDING_BATCH_SIZE``
+texts and stores them; texts that already have a vector are not embedded
+again. Searches run against in-process ``VectorIndex``es, one per kind, which
+load the vectors stored by other workers at most every
+``EMBEDDING_REFRESH_SECONDS``, like the skill gap index; a passage search only
+scores the passages of the caller's own job descriptions. Searches run in a
+worker thread on a view of the index, off the event loop. NumPy and the
+embedder are loaded when the service is first used, not when the application
+starts.
+"""
+
+import asyncio
+import re
+import time
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from sqlalchemy import String, cast, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ..ats.features import extract_features
+from ..database import get_engine
+from ..jobs import JobRead, get_job_queue
+from ..search.constants import DocumentKind
+from ..search.models import SearchDocument
+from ..skills.utils import normalize_job_description
+from ..skills.vocabulary import SkillVocabulary, normalize_skill_name
+from .config import EmbeddingsConfig, get_embeddings_settings
+from .constants import EMBEDDINGS_INGEST_JOB, KEY_MAX_LENGTH, EmbeddingKind
+from .models import EmbeddingRecord
+from .schemas import (
+    PassageMatch,
+    PassageSearchRequest,
+    PassageSearchResponse,
+    SimilarSkills,
+    SimilarSkillsRequest,
+    SimilarSkillsResponse,
+    SkillNeighbor,
+)
+from .utils import chunk_text
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .embedder import Embedder
+    from .index import VectorIndex
+
+_table = EmbeddingRecord.__table__
+
+# Rows are reloaded from this long before the newest one seen, so embeddings
+# that committed late with an earlier created_at are not missed (re-adding is a no-op)
+_REFRESH_OVERLAP = timedelta(seconds=60)
+_LOAD_BATCH_SIZE = 5000
+# Job descriptions read per query by an ingestion job
+_INGEST_BATCH_SIZE = 100
+# Passages fetched per requested job description, so that the passages of a
+# few very similar job descriptions do not crowd out the others
+_PASSAGES_PER_MATCH = 4
+# Index file names are derived from model names
+_UNSAFE_FILE_CHARACTERS = re.compile(r"[^\w-]")
+
+
+class _Text(NamedTuple):
+    kind: EmbeddingKind
+    key: str
+    chunk: int
+    text: str
+    user_id: int | None = None
+
+    @property
+    def index_key(self) -> str:
+        return _index_key(self.kind, self.key, self.chunk)
+
+
+def _index_key(kind: EmbeddingKind, key: str, chunk: int) -> str:
+    # Skills by name; passages by "<search document id>:<passage number>"
+    return key if kind is EmbeddingKind.SKILL else f"{key}:{chunk}"
+
+
+class EmbeddingService:
+    """Stores embeddings and keeps per-kind ``VectorIndex``es of them up to date."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        embedder: "Embedder",
+        indexes: dict[EmbeddingKind, "VectorIndex"],
+        config: EmbeddingsConfig,
+    ) -> None:
+        # The primary: a replica could lag past the refresh overlap
+        self._engine = engine
+        self.embedder = embedder
+        self.indexes = indexes
+        self._config = config
+        # Stored and analyzed skill names are interned, so spellings of a skill
+        # that is not in the alias table resolve to the stored one
+        self._vocabulary = SkillVocabulary()
+        self._refreshed_at: float | None = None  # time.monotonic()
+        self._inflight: asyncio.Task[None] | None = None
+
+    async def embed(self, texts: Sequence[str]) -> list["NDArray[Any]"]:
+        """Embed texts in batches of ``EMBEDDING_BATCH_SIZE``; one matrix per batch."""
+        size = self._config.embedding_batch_size
+        return [
+            await self.embedder.embed(texts[start : start + size])
+            for start in range(0, len(texts), size)
+        ]
+
+    def canonical_skill(self, name: str) -> str:
+        """Canonical name of a skill ("k8s": "Kubernetes"); unknown names are stripped."""
+        skill_id = self._vocabulary.lookup(name)
+        return name.strip() if skill_id is None else self._vocabulary.name(skill_id)
+
+    async def ingest_documents(self, user_id: int, document_ids: list[int] | None = None) -> int:
+        """
+        Embed and store the passages and skills of a user's saved job descriptions.
+
+        Job descriptions whose passages are already in the index are skipped,
+        so a repeated job does nothing. Skills are found as for the analytics
+        and ATS scores (``extract_features``), in a thread.
+
+        Args:
+            user_id: Owner of the job descriptions.
+            document_ids: Only these job descriptions (ignored if not the
+                user's); by default every one.
+
+        Returns:
+            Number of texts embedded.
+        """
+        statement = (
+            select(SearchDocument.id, SearchDocument.body)
+            .where(
+                SearchDocument.user_id == user_id,
+                SearchDocument.kind == DocumentKind.JOB_DESCRIPTION.value,
+            )
+            .order_by(SearchDocument.id)
+            .limit(_INGEST_BATCH_SIZE)
+        )
+        if document_ids is not None:
+            statement = statement.where(SearchDocument.id.in_(document_ids))
+
+        await self.refresh()
+        passages = self.indexes[EmbeddingKind.JOB_DESCRIPTION_CHUNK]
+        embedded = 0
+        last_id = 0
+        while True:
+            async with self._engine.connect() as conn:
+                rows = (await conn.execute(statement.where(SearchDocument.id > last_id))).all()
+            if not rows:
+                return embedded
+            last_id = rows[-1].id
+            rows = [
+                row
+                for row in rows
+                if _index_key(EmbeddingKind.JOB_DESCRIPTION_CHUNK, str(row.id), 0) not in passages
+            ]
+            texts = await asyncio.to_thread(_analyze, [row.body for row in rows])
+            for row, (text, skills) in zip(rows, texts, strict=True):
+                embedded += await self.ingest_job_description(user_id, row.id, text, skills)
+
+    async def ingest_job_description(
+        self, user_id: int, document_id: int, text: str, skills: Iterable[str]
+    ) -> int:
+        """
+        Embed and store the passages and skills of a saved job description.
+
+        Safe to repeat: stored embeddings are kept, and texts already in the
+        indexes are not embedded again.
+
+        Args:
+            user_id: Owner of the job description, and of its passages.
+            document_id: Search document of the job description.
+            text: Normalized job description.
+            skills: Skills of the job description, in any spelling.
+
+        Returns:
+            Number of texts embedded.
+        """
+        await self.refresh()
+        texts = []
+        key = str(document_id)
+        passages = self.indexes[EmbeddingKind.JOB_DESCRIPTION_CHUNK]
+        if _index_key(EmbeddingKind.JOB_DESCRIPTION_CHUNK, key, 0) not in passages:
+            texts.extend(
+                _Text(EmbeddingKind.JOB_DESCRIPTION_CHUNK, key, chunk, passage, user_id)
+                for chunk, passage in enumerate(
+                    chunk_text(text, self._config.embedding_chunk_chars)
+                )
+            )
+        names = dict.fromkeys(
+            self._vocabulary.name(self._vocabulary.intern(skill))
+            for skill in skills
+            if skill.strip() and len(skill) <= KEY_MAX_LENGTH
+        )
+        texts.extend(
+            _Text(EmbeddingKind.SKILL, name, 0, name)
+            for name in names
+            if name not in self.indexes[EmbeddingKind.SKILL]
+        )
+
+        start = 0
+        for vectors in await self.embed([item.text for item in texts]):
+            await self._store(texts[start : start + len(vectors)], vectors)
+            start += len(vectors)
+        return len(texts)
+
+    async def _store(self, texts: Sequence[_Text], vectors: "NDArray[Any]") -> None:
+        rows = []
+        added = []
+        for kind, index in self.indexes.items():
+            positions = [position for position, item in enumerate(texts) if item.kind is kind]
+            if not positions:
+                continue
+            blobs = index.encode(vectors[positions])
+            rows.extend(
+                {
+                    "kind": kind.value,
+                    "model": self.embedder.model,
+                    "key": texts[position].key,
+                    "chunk": texts[position].chunk,
+                    "text": texts[position].text,
+                    "user_id": texts[position].user_id,
+                    "vector": blob,
+                }
+                for position, blob in zip(positions, blobs, strict=True)
+            )
+            added.append((index, [texts[position].index_key for position in positions], blobs))
+
+        async with self._engine.begin() as conn:
+            await conn.execute(insert(_table).on_conflict_do_nothing(), rows)
+        for index, keys, blobs in added:
+            index.add_encoded(keys, blobs)
+
+    async def refresh(self, *, force: bool = False) -> None:
+        """Load embeddings stored since the last refresh, unless it is recent enough."""
+        if (
+            not force
+            and self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at < self._config.embedding_refresh_seconds
+        ):
+            return
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._load())
+        await asyncio.shield(self._inflight)
+
+    async def _load(self) -> None:
+        started_at = time.monotonic()
+        for kind, index in self.indexes.items():
+            statement = (
+                select(_table.c.key, _table.c.chunk, _table.c.vector, _table.c.created_at)
+                .where(_table.c.kind == kind.value, _table.c.model == self.embedder.model)
+                .order_by(_table.c.created_at)
+            )
+            # Saved with the index file, so a restarted worker resumes from there
+            loaded_until = index.metadata.get("loaded_until")
+            if loaded_until is not None:
+                since = datetime.fromisoformat(loaded_until) - _REFRESH_OVERLAP
+                statement = statement.where(_table.c.created_at > since)
+
+            async with self._engine.connect() as conn:
+                result = await conn.stream(statement)
+                async for rows in result.partitions(_LOAD_BATCH_SIZE):
+                    if kind is EmbeddingKind.SKILL:
+                        for row in rows:
+                            self._vocabulary.intern(row.key)
+                    index.metadata["loaded_until"] = rows[-1].created_at.isoformat()
+                    index.add_encoded(
+                        [_index_key(kind, row.key, row.chunk) for row in rows],
+                        [row.vector for row in rows],
+                    )
+        self._refreshed_at = started_at
+
+    async def similar_skills(self, request: SimilarSkillsRequest) -> SimilarSkillsResponse:
+        """Known skills closest to each requested skill, other than the skill itself."""
+        await self.refresh()
+        index = self.indexes[EmbeddingKind.SKILL]
+        canonical = [self.canonical_skill(skill) for skill in request.skills]
+        known = [name in index for name in canonical]
+
+        # Stored vectors of known skills; the others are embedded
+        stored = iter(index.vectors([name for name in canonical if name in index]))
+        unknown = [name for name, is_known in zip(canonical, known, strict=True) if not is_known]
+        embedded = iter([vector for batch in await self.embed(unknown) for vector in batch])
+        queries = [next(stored) if is_known else next(embedded) for is_known in known]
+
+        # One extra neighbor, since a known skill finds itself first
+        neighbors = await asyncio.to_thread(
+            index.view().search, queries, k=request.limit + 1, min_score=request.min_score
+        )
+        results = []
+        for skill, name, is_known, found in zip(
+            request.skills, canonical, known, neighbors, strict=True
+        ):
+            normalized = normalize_skill_name(name)
+            similar = [
+                SkillNeighbor(skill=neighbor, score=round(score, 4))
+                for neighbor, score in found
+                if normalize_skill_name(neighbor) != normalized
+            ]
+            results.append(
+                SimilarSkills(
+                    skill=skill, canonical=name, known=is_known, similar=similar[: request.limit]
+                )
+            )
+        return SimilarSkillsResponse(model=self.embedder.model, results=results)
+
+    async def search_passages(
+        self, request: PassageSearchRequest, user_id: int
+    ) -> PassageSearchResponse:
+        """A user's job descriptions whose best passage is most similar to a text, best first."""
+        await self.refresh()
+        passage = (
+            _table.c.kind == EmbeddingKind.JOB_DESCRIPTION_CHUNK.value,
+            _table.c.model == self.embedder.model,
+            _table.c.user_id == user_id,
+        )
+        # Only the passages of the user's job descriptions (not of deleted ones)
+        statement = select(_table.c.key, _table.c.chunk).where(
+            *passage,
+            _table.c.key.in_(
+                select(cast(SearchDocument.id, String)).where(
+                    SearchDocument.user_id == user_id,
+                    SearchDocument.kind == DocumentKind.JOB_DESCRIPTION.value,
+                )
+            ),
+        )
+        async with self._engine.connect() as conn:
+            keys = [
+                _index_key(EmbeddingKind.JOB_DESCRIPTION_CHUNK, row.key, row.chunk)
+                for row in await conn.execute(statement)
+            ]
+        if not keys:
+            return PassageSearchResponse(model=self.embedder.model, matches=[])
+
+        (query,) = await self.embed([request.text])
+        (found,) = await asyncio.to_thread(
+            self.indexes[EmbeddingKind.JOB_DESCRIPTION_CHUNK].view().search,
+            query,
+            k=request.limit * _PASSAGES_PER_MATCH,
+            min_score=request.min_score,
+            keys=keys,
+        )
+        best: dict[str, tuple[int, float]] = {}
+        for key, score in found:
+            document_id, _, chunk = key.rpartition(":")
+            best.setdefault(document_id, (int(chunk), score))
+            if len(best) == request.limit:
+                break
+        if not best:
+            return PassageSearchResponse(model=self.embedder.model, matches=[])
+
+        statement = select(_table.c.key, _table.c.chunk, _table.c.text).where(
+            *passage,
+            tuple_(_table.c.key, _table.c.chunk).in_(
+                [(document_id, chunk) for document_id, (chunk, _) in best.items()]
+            ),
+        )
+        async with self._engine.connect() as conn:
+            texts = {(row.key, row.chunk): row.text for row in await conn.execute(statement)}
+        matches = [
+            PassageMatch(
+                document_id=int(document_id),
+                chunk=chunk,
+                text=texts[document_id, chunk],
+                score=round(score, 4),
+            )
+            for document_id, (chunk, score) in best.items()
+            if (document_id, chunk) in texts
+        ]
+        return PassageSearchResponse(model=self.embedder.model, matches=matches)
+
+
+def _analyze(bodies: list[str]) -> list[tuple[str, list[str]]]:
+    # Normalized text and skills of each job description
+    return [
+        (normalize_job_description(body), sorted(extract_features(body).skills)) for body in bodies
+    ]
+
+
+async def enqueue_embedding(
+    user_id: int, document_ids: list[int] | None = None, session: AsyncSession | None = None
+) -> JobRead:
+    """
+    Enqueue the embedding of a user's job descriptions.
+
+    Args:
+        user_id: Owner of the job descriptions.
+        document_ids: These job descriptions; by default every one not embedded yet.
+        session: Enqueue in this session's transaction, e.g. the one saving
+            the job descriptions.
+
+    Returns:
+        The queued job.
+    """
+    job, _ = await get_job_queue().enqueue(
+        EMBEDDINGS_INGEST_JOB, {"document_ids": document_ids}, user_id=user_id, session=session
+    )
+    return job
+
+
+@lru_cache
+def get_embedding_service() -> EmbeddingService:
+    """Get the process-wide embedding service (loads NumPy and the embedder on first use)."""
+    from .embedder import load_embedder  # noqa: PLC0415
+    from .index import VectorIndex  # noqa: PLC0415
+
+    config = get_embeddings_settings()
+    embedder = load_embedder(config)
+    model = _UNSAFE_FILE_CHARACTERS.sub("_", embedder.model)
+    indexes = {
+        kind: VectorIndex.open(
+            config.embedding_index_dir / f"{kind.value}-{model}",
+            embedder.dimensions,
+            config.embedding_index_compact_rows,
+        )
+        for kind in EmbeddingKind
+    }
+    return EmbeddingService(get_engine(), embedder, indexes, config)
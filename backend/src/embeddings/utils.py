@@ -0,0 +1,42 @@
+"""Splitting job descriptions into passages to embed."""
+
+import re
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+|\n")
+
+
+def chunk_text(text: str, max_chars: int) -> list[str]:
+    """
+    Split a text into passages of at most about ``max_chars`` characters.
+
+    Paragraphs are kept together while they fit; longer ones are split between
+    sentences or lines, and a single overlong sentence is cut between words.
+    Each passage stays on one topic (a requirements list, a benefits section),
+    which is what a passage-level search should find.
+
+    Example:
+        >>> chunk_text("Python and SQL.\\n\\nWe offer remote work.", max_chars=25)
+        ['Python and SQL.', 'We offer remote work.']
+    """
+    pieces: list[str] = []
+    for paragraph in map(str.strip, _PARAGRAPH_BREAK.split(text.strip())):
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        for sentence in map(str.strip, _SENTENCE_END.split(paragraph)):
+            rest = sentence
+            while len(rest) > max_chars:
+                cut = rest.rfind(" ", 0, max_chars + 1)
+                cut = cut if cut > 0 else max_chars
+                pieces.append(rest[:cut])
+                rest = rest[cut:].strip()
+            pieces.append(rest)
+
+    chunks: list[str] = []
+    for piece in filter(None, pieces):
+        if chunks and len(chunks[-1]) + 1 + len(piece) <= max_chars:
+            chunks[-1] = f"{chunks[-1]}\n{piece}"
+        else:
+            chunks.append(piece)
+    return chunks
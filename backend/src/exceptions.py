@@ -0,0 +1,46 @@
+"""Global exceptions for the application."""
+
+from typing import Any
+
+from fastapi import HTTPException, status
+
+
+class DetailedHTTPException(HTTPException):
+    """Base HTTP exception with a class-level status code and detail message."""
+
+    STATUS_CODE = status.HTTP_500_INTERNAL_SERVER_ERROR
+    DETAIL = "Server error"
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(status_code=self.STATUS_CODE, detail=self.DETAIL, **kwargs)
+
+
+class BadRequest(DetailedHTTPException):
+    """Raised when the request is malformed."""
+
+    STATUS_CODE = status.HTTP_400_BAD_REQUEST
+    DETAIL = "Bad request"
+
+
+class NotAuthenticated(DetailedHTTPException):
+    """Raised when the request is missing valid credentials."""
+
+    STATUS_CODE = status.HTTP_401_UNAUTHORIZED
+    DETAIL = "User not authenticated"
+
+    def __init__(self) -> None:
+        super().__init__(headers={"WWW-Authenticate": "Bearer"})
+
+
+class PermissionDenied(DetailedHTTPException):
+    """Raised when the user is not allowed to perform the action."""
+
+    STATUS_CODE = status.HTTP_403_FORBIDDEN
+    DETAIL = "Permission denied"
+
+
+class NotFound(DetailedHTTPException):
+    """Raised when the requested resource does not exist."""
+
+    STATUS_CODE = status.HTTP_404_NOT_FOUND
+    DETAIL = "Not found"
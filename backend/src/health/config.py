@@ -0,0 +1,43 @@
+"""Health check configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class HealthConfig(BaseSettings):
+    """Health monitor configuration loaded from environment variables."""
+
+    # How often the background monitor probes the database
+    probe_interval_seconds: float = Field(default=5.0, gt=0, alias="HEALTH_PROBE_INTERVAL_SECONDS")
+    # How long a probe result is served before it is considered stale
+    probe_ttl_seconds: float = Field(default=15.0, gt=0, alias="HEALTH_PROBE_TTL_SECONDS")
+    # Upper bound on a single probe before the database is reported disconnected
+    probe_timeout_seconds: float = Field(default=2.0, gt=0, alias="HEALTH_PROBE_TIMEOUT_SECONDS")
+    # Minimum spacing between on-demand probes requested with ?fresh=true
+    probe_min_interval_seconds: float = Field(
+        default=1.0, ge=0, alias="HEALTH_PROBE_MIN_INTERVAL_SECONDS"
+    )
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_health_settings() -> HealthConfig:
+    """Get the global health configuration, loaded from the environment on first use."""
+    return HealthConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``health_settings`` is built on first access
+    if name == "health_settings":
+        return get_health_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
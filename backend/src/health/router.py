@@ -2,14 +2,16 @@
 
 import time
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
-from sqlalchemy import text
+from fastapi import APIRouter, Query, status
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 
-from ..database import engine
+from ..database import get_engine_pool_stats, get_migration_status
 from ..datetime import get_current_utc_datetime
+from ..metrics import metrics_registry
+from ..metrics.constants import PROMETHEUS_CONTENT_TYPE
 from .constants import DatabaseStatus, HealthStatus
-from .schemas import HealthDetail, HealthStatusResponse
+from .schemas import HealthDetail, HealthStatusResponse, MigrationStatus, PoolStats
+from .service import get_health_monitor
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -57,7 +59,10 @@ async def health_check() -> HealthStatusResponse:
     response_model=HealthDetail,
     status_code=status.HTTP_200_OK,
     summary="Detailed health check",
-    description="Returns detailed health information including database connectivity and uptime.",
+    description=(
+        "Returns detailed health information including database connectivity and uptime. "
+        "Database status comes from a background probe; pass fresh=true to probe now."
+    ),
     responses={
         200: {
             "description": "Service health details",
@@ -68,7 +73,25 @@ async def health_check() -> HealthStatusResponse:
                         "timestamp": "2024-01-01T00:00:00Z",
                         "version": "1.0.0",
                         "database": "connected",
+                        "database_latency_ms": 0.42,
+                        "database_checked_at": "2024-01-01T00:00:00Z",
                         "uptime_seconds": 3600.5,
+                        "pool": {
+                            "pool_class": "InstrumentedAsyncQueuePool",
+                            "size": 5,
+                            "checked_in": 4,
+                            "checked_out": 1,
+                            "overflow": -4,
+                            "checkout_count": 120,
+                            "checkout_timeouts": 0,
+                            "avg_wait_ms": 0.042,
+                            "max_wait_ms": 1.73,
+                        },
+                        "migrations": {
+                            "state": "up_to_date",
+                            "current_revisions": ["a1b2c3d4e5f6"],
+                            "head_revisions": ["a1b2c3d4e5f6"],
+                        },
                     }
                 }
             },
@@ -82,6 +105,8 @@ async def health_check() -> HealthStatusResponse:
                         "timestamp": "2024-01-01T00:00:00Z",
                         "version": "1.0.0",
                         "database": "disconnected",
+                        "database_latency_ms": None,
+                        "database_checked_at": "2024-01-01T00:00:00Z",
                         "uptime_seconds": 3600.5,
                     }
                 }
@@ -89,27 +114,31 @@ async def health_check() -> HealthStatusResponse:
         },
     },
 )
-async def health_check_detailed() -> JSONResponse:
+async def health_check_detailed(
+    fresh: bool = Query(
+        default=False,
+        description="Probe the database now instead of using the cached result (rate limited)",
+    ),
+) -> ORJSONResponse:
     """
     Detailed health check endpoint.
 
     Checks:
-    - Database connectivity
+    - Database connectivity (cached background probe)
+    - Connection pool usage
+    - Migration status (from the startup check)
     - Application uptime
 
     Returns 503 status if any component is unhealthy.
     """
     uptime_seconds = time.time() - APP_START_TIME
 
-    # Check database connectivity
-    try:
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
-        database_status = DatabaseStatus.CONNECTED
+    probe = await get_health_monitor().get_snapshot(fresh=fresh)
+    migration_status = get_migration_status()
+    if probe.status == DatabaseStatus.CONNECTED:
         overall_status = HealthStatus.HEALTHY
         http_status = status.HTTP_200_OK
-    except Exception:
-        database_status = DatabaseStatus.DISCONNECTED
+    else:
         overall_status = HealthStatus.UNHEALTHY
         http_status = status.HTTP_503_SERVICE_UNAVAILABLE
 
@@ -117,11 +146,58 @@ async def health_check_detailed() -> JSONResponse:
         status=overall_status,
         timestamp=get_current_utc_datetime(),
         version="1.0.0",
-        database=database_status,
+        database=probe.status,
+        database_latency_ms=probe.latency_ms,
+        database_checked_at=probe.checked_at,
         uptime_seconds=round(uptime_seconds, 2),
+        pool=PoolStats(**get_engine_pool_stats()),
+        migrations=MigrationStatus(**migration_status) if migration_status else None,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         content=health_detail.model_dump(mode="json"),
         status_code=http_status,
     )
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Request metrics",
+    description=(
+        "Returns per-route request latency and database time (p50/p95/p99) "
+        "in the Prometheus text exposition format."
+    ),
+    responses={
+        200: {
+            "description": "Metrics in Prometheus text format",
+            "content": {
+                PROMETHEUS_CONTENT_TYPE: {
+                    "example": (
+                        "# HELP http_request_duration_seconds HTTP request latency "
+                        "by route and status.\n"
+                        "# TYPE http_request_duration_seconds summary\n"
+                        'http_request_duration_seconds{method="GET",route="/v1/health",'
+                        'status="200",quantile="0.5"} 0.000412\n'
+                        'http_request_duration_seconds_sum{method="GET",route="/v1/health",'
+                        'status="200"} 0.052100\n'
+                        'http_request_duration_seconds_count{method="GET",route="/v1/health",'
+                        'status="200"} 120\n'
+                    )
+                }
+            },
+        },
+    },
+)
+async def metrics() -> PlainTextResponse:
+    """
+    Prometheus metrics endpoint.
+
+    Metrics are kept in memory per worker process, so each worker reports its
+    own requests. Returns empty series when METRICS_ENABLED is false.
+    """
+    return PlainTextResponse(
+        content=metrics_registry.render_prometheus(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
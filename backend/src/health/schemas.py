@@ -1,10 +1,9 @@
 """Health check response models."""
 
-from datetime import datetime
-
 from pydantic import ConfigDict, Field
 
-from ..models import CustomBaseModel
+from ..database import MigrationState
+from ..models import CustomBaseModel, UTCDatetime
 from .constants import DatabaseStatus, HealthStatus
 
 
@@ -15,7 +14,7 @@ class HealthStatusResponse(CustomBaseModel):
         ...,
         description="Health status of the service",
     )
-    timestamp: datetime = Field(
+    timestamp: UTCDatetime = Field(
         ...,
         description="Current server timestamp in ISO 8601 format (UTC)",
         examples=["2024-01-01T00:00:00Z"],
@@ -37,6 +36,78 @@ class HealthStatusResponse(CustomBaseModel):
     )
 
 
+class DatabaseProbe(CustomBaseModel):
+    """Result of a single database health probe."""
+
+    status: DatabaseStatus = Field(
+        ...,
+        description="Database connection status",
+    )
+    latency_ms: float | None = Field(
+        default=None,
+        description="Probe round-trip latency in milliseconds (null if the probe failed)",
+        examples=[0.42],
+    )
+    checked_at: UTCDatetime = Field(
+        ...,
+        description="When the probe completed, in ISO 8601 format (UTC)",
+        examples=["2024-01-01T00:00:00Z"],
+    )
+    error: str | None = Field(
+        default=None,
+        description="Error type if the probe failed",
+        examples=["TimeoutError"],
+    )
+
+
+class PoolStats(CustomBaseModel):
+    """Database connection pool statistics."""
+
+    pool_class: str = Field(
+        ...,
+        description="Connection pool implementation",
+        examples=["InstrumentedAsyncQueuePool"],
+    )
+    size: int | None = Field(default=None, description="Configured pool size")
+    checked_in: int | None = Field(default=None, description="Idle connections in the pool")
+    checked_out: int | None = Field(default=None, description="Connections currently in use")
+    overflow: int | None = Field(
+        default=None,
+        description="Connections opened beyond the pool size (negative while the pool fills)",
+    )
+    checkout_count: int | None = Field(
+        default=None, description="Total connection checkouts since startup"
+    )
+    checkout_timeouts: int | None = Field(
+        default=None, description="Checkouts that timed out waiting for a connection"
+    )
+    avg_wait_ms: float | None = Field(
+        default=None, description="Average checkout wait time in milliseconds"
+    )
+    max_wait_ms: float | None = Field(
+        default=None, description="Longest checkout wait time in milliseconds"
+    )
+
+
+class MigrationStatus(CustomBaseModel):
+    """Database migration status."""
+
+    state: MigrationState = Field(
+        ...,
+        description="Whether the database schema matches the migration scripts",
+    )
+    current_revisions: list[str] = Field(
+        default_factory=list,
+        description="Revisions recorded in the database",
+        examples=[["a1b2c3d4e5f6"]],
+    )
+    head_revisions: list[str] = Field(
+        default_factory=list,
+        description="Head revisions of the migration scripts",
+        examples=[["a1b2c3d4e5f6"]],
+    )
+
+
 class HealthDetail(CustomBaseModel):
     """Detailed health check response model."""
 
@@ -44,7 +115,7 @@ class HealthDetail(CustomBaseModel):
         ...,
         description="Overall health status of the service",
     )
-    timestamp: datetime = Field(
+    timestamp: UTCDatetime = Field(
         ...,
         description="Current server timestamp in ISO 8601 format (UTC)",
         examples=["2024-01-01T00:00:00Z"],
@@ -58,11 +129,29 @@ class HealthDetail(CustomBaseModel):
         ...,
         description="Database connection status",
     )
+    database_latency_ms: float | None = Field(
+        default=None,
+        description="Round-trip latency of the latest database probe in milliseconds",
+        examples=[0.42],
+    )
+    database_checked_at: UTCDatetime | None = Field(
+        default=None,
+        description="When the database was last probed, in ISO 8601 format (UTC)",
+        examples=["2024-01-01T00:00:00Z"],
+    )
     uptime_seconds: float = Field(
         ...,
         description="Application uptime in seconds",
         examples=[3600.5],
     )
+    pool: PoolStats | None = Field(
+        default=None,
+        description="Database connection pool statistics",
+    )
+    migrations: MigrationStatus | None = Field(
+        default=None,
+        description="Database migration status from the startup check",
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -71,7 +160,25 @@ class HealthDetail(CustomBaseModel):
                 "timestamp": "2024-01-01T00:00:00Z",
                 "version": "1.0.0",
                 "database": DatabaseStatus.CONNECTED,
+                "database_latency_ms": 0.42,
+                "database_checked_at": "2024-01-01T00:00:00Z",
                 "uptime_seconds": 3600.5,
+                "pool": {
+                    "pool_class": "InstrumentedAsyncQueuePool",
+                    "size": 5,
+                    "checked_in": 4,
+                    "checked_out": 1,
+                    "overflow": -4,
+                    "checkout_count": 120,
+                    "checkout_timeouts": 0,
+                    "avg_wait_ms": 0.042,
+                    "max_wait_ms": 1.73,
+                },
+                "migrations": {
+                    "state": MigrationState.UP_TO_DATE,
+                    "current_revisions": ["a1b2c3d4e5f6"],
+                    "head_revisions": ["a1b2c3d4e5f6"],
+                },
             }
         }
     )
@@ -0,0 +1,122 @@
+"""
+Background database health monitor.
+
+The monitor probes the database on a fixed interval and keeps the latest result
+in memory, so health endpoints read a cached snapshot instead of checking out a
+pooled connection on every request. On-demand probes are rate limited and
+concurrent callers share a single in-flight probe.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..database import get_engine
+from ..datetime import get_current_utc_datetime
+from .config import HealthConfig, get_health_settings
+from .constants import DatabaseStatus
+from .schemas import DatabaseProbe
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """Periodically probes the database and caches the latest result."""
+
+    def __init__(self, engine: AsyncEngine, config: HealthConfig) -> None:
+        # Probes run in autocommit so a check costs one round-trip (no BEGIN/ROLLBACK)
+        self._engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+        self._config = config
+        self._snapshot: DatabaseProbe | None = None
+        self._probed_at = 0.0  # time.monotonic() of the last completed probe
+        self._inflight: asyncio.Task[DatabaseProbe] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def probe(self) -> DatabaseProbe:
+        """Probe the database now and cache the result."""
+        started_at = time.perf_counter()
+        try:
+            async with asyncio.timeout(self._config.probe_timeout_seconds):
+                async with self._engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except Exception as e:
+            logger.warning(f"Database health probe failed: {e!r}")
+            snapshot = DatabaseProbe(
+                status=DatabaseStatus.DISCONNECTED,
+                latency_ms=None,
+                checked_at=get_current_utc_datetime(),
+                error=type(e).__name__,
+            )
+        else:
+            snapshot = DatabaseProbe(
+                status=DatabaseStatus.CONNECTED,
+                latency_ms=round((time.perf_counter() - started_at) * 1000, 3),
+                checked_at=get_current_utc_datetime(),
+            )
+
+        self._snapshot = snapshot
+        self._probed_at = time.monotonic()
+        return snapshot
+
+    async def get_snapshot(self, fresh: bool = False) -> DatabaseProbe:
+        """
+        Get the latest database probe result.
+
+        Args:
+            fresh: Probe now instead of reading the cache. Still rate limited by
+                ``HEALTH_PROBE_MIN_INTERVAL_SECONDS``.
+
+        Returns:
+            Cached probe result, refreshed first if it is missing, expired or
+            a fresh probe was requested.
+        """
+        age = time.monotonic() - self._probed_at
+        is_expired = self._snapshot is None or age > self._config.probe_ttl_seconds
+        is_refresh_allowed = age >= self._config.probe_min_interval_seconds
+        if self._snapshot is not None and not is_expired and not (fresh and is_refresh_allowed):
+            return self._snapshot
+
+        # Coalesce concurrent refreshes into one probe
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self.probe())
+        return await asyncio.shield(self._inflight)
+
+    async def _run(self) -> None:
+        while True:
+            await self.get_snapshot(fresh=True)
+            await asyncio.sleep(self._config.probe_interval_seconds)
+
+    def start(self) -> None:
+        """Start the background probe loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name="database-health-monitor")
+
+    async def stop(self) -> None:
+        """Stop the background probe loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
+@lru_cache
+def get_health_monitor() -> HealthMonitor:
+    """Get the health monitor for the application engine, started from the app lifespan."""
+    return HealthMonitor(get_engine(), get_health_settings())
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``health_monitor`` is built on first access
+    if name == "health_monitor":
+        return get_health_monitor()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -0,0 +1,29 @@
+"""Durable background jobs stored in Postgres, with in-process or standalone workers."""
+
+from .config import JobsConfig, get_jobs_settings
+from .constants import JobStatus
+from .exceptions import JobNotCancellable, JobNotFound, PermanentJobError
+from .queue import JobQueue, get_job_queue
+from .registry import ClaimedJob, JobHandlers, get_job_handlers, job_handler
+from .router import router
+from .schemas import JobRead
+from .worker import JobWorker, get_job_worker
+
+__all__ = [
+    "ClaimedJob",
+    "JobHandlers",
+    "JobNotCancellable",
+    "JobNotFound",
+    "JobQueue",
+    "JobRead",
+    "JobStatus",
+    "JobWorker",
+    "JobsConfig",
+    "PermanentJobError",
+    "get_job_handlers",
+    "get_job_queue",
+    "get_job_worker",
+    "get_jobs_settings",
+    "job_handler",
+    "router",
+]
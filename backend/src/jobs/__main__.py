@@ -0,0 +1,47 @@
+"""
+Standalone job worker process.
+
+Runs a ``JobWorker`` with the handlers of ``JOB_HANDLER_MODULES`` until SIGINT
+or SIGTERM, then finishes or requeues its running jobs and exits.
+
+Usage:
+    python -m src.jobs [--concurrency 4]
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from ..database import close_db, init_db
+from .config import get_jobs_settings
+from .queue import get_job_queue
+from .registry import get_job_handlers
+from .worker import JobWorker, import_handler_modules
+
+
+async def main(concurrency: int | None) -> None:
+    config = get_jobs_settings()
+    import_handler_modules(config.job_handler_modules)
+    await init_db()
+    worker = JobWorker(get_job_queue(), get_job_handlers(), config, concurrency=concurrency)
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopping.set)
+
+    worker.start()
+    try:
+        await stopping.wait()
+    finally:
+        await worker.stop()
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=None)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    asyncio.run(main(args.concurrency))
@@ -0,0 +1,65 @@
+"""Background job configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+from .constants import DEFAULT_HANDLER_MODULES
+
+
+class JobsConfig(BaseSettings):
+    """Background job configuration loaded from environment variables."""
+
+    # Run a worker inside every API process (otherwise run ``python -m src.jobs``)
+    job_worker_enabled: bool = Field(default=False, alias="JOB_WORKER_ENABLED")
+    # Jobs one worker runs at the same time; each briefly holds a pooled connection
+    # to record its outcome, so keep DB_POOL_SIZE above this for in-process workers
+    job_worker_concurrency: int = Field(default=4, ge=1, alias="JOB_WORKER_CONCURRENCY")
+    # Modules imported by workers to register their job handlers (JSON list);
+    # by default those of the jobs the application enqueues
+    job_handler_modules: list[str] = Field(
+        default_factory=lambda: list(DEFAULT_HANDLER_MODULES), alias="JOB_HANDLER_MODULES"
+    )
+
+    # Idle workers look for due jobs this often (enqueues also wake them via NOTIFY)
+    job_poll_interval_seconds: float = Field(default=5.0, gt=0, alias="JOB_POLL_INTERVAL_SECONDS")
+    # A running job is requeued if its worker does not renew the lease for this long
+    job_lease_seconds: float = Field(default=60.0, gt=0, alias="JOB_LEASE_SECONDS")
+    # Default per-run time limit, for handlers that do not set their own
+    job_timeout_seconds: float = Field(default=600.0, gt=0, alias="JOB_TIMEOUT_SECONDS")
+
+    # Attempts per job (including the first) unless the job sets its own
+    job_max_attempts: int = Field(default=5, ge=1, alias="JOB_MAX_ATTEMPTS")
+    # Delay before retry n is about base * 2**(n-1), capped at the maximum
+    job_retry_base_seconds: float = Field(default=5.0, gt=0, alias="JOB_RETRY_BASE_SECONDS")
+    job_retry_max_seconds: float = Field(default=3600.0, gt=0, alias="JOB_RETRY_MAX_SECONDS")
+
+    # On shutdown, running jobs get this long to finish before they are requeued
+    job_shutdown_grace_seconds: float = Field(
+        default=30.0, ge=0, alias="JOB_SHUTDOWN_GRACE_SECONDS"
+    )
+    # Delay before reconnecting the LISTEN connection after it fails
+    job_listen_retry_seconds: float = Field(default=5.0, gt=0, alias="JOB_LISTEN_RETRY_SECONDS")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_jobs_settings() -> JobsConfig:
+    """Get the global jobs configuration, loaded from the environment on first use."""
+    return JobsConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``jobs_settings`` is built on first access
+    if name == "jobs_settings":
+        return get_jobs_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
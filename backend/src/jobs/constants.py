@@ -0,0 +1,36 @@
+"""Constants for the background job queue."""
+
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a job."""
+
+    QUEUED = "queued"  # waiting for run_at and a free worker (also between retries)
+    RUNNING = "running"  # claimed by a worker holding a lease
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"  # out of attempts, or failed permanently
+    CANCELLED = "cancelled"  # cancelled while queued
+
+
+# Statuses a job never leaves
+FINISHED_STATUSES = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+# Modules of the application's own job handlers, imported by every worker unless
+# JOB_HANDLER_MODULES says otherwise: the kinds that requests enqueue
+DEFAULT_HANDLER_MODULES = (
+    "src.analytics.jobs",
+    "src.ats.jobs",
+    "src.embeddings.jobs",
+    "src.skills.jobs",
+)
+
+# Postgres channel notified when a job is enqueued (payload: the job kind), so
+# idle workers claim it at once instead of at their next poll
+JOB_NOTIFY_CHANNEL = "job_queue"
+
+# Stored error messages are truncated to this many characters
+MAX_ERROR_LENGTH = 2000
+
+# Error recorded when a worker stopped renewing its lease (crashed or was killed)
+LEASE_EXPIRED_ERROR = "Worker lease expired"
@@ -0,0 +1,22 @@
+"""Background job exceptions."""
+
+from fastapi import status
+
+from ..exceptions import DetailedHTTPException, NotFound
+
+
+class JobNotFound(NotFound):
+    """Raised when a job does not exist or belongs to another user."""
+
+    DETAIL = "Job not found"
+
+
+class JobNotCancellable(DetailedHTTPException):
+    """Raised when cancelling a job that is already running or finished."""
+
+    STATUS_CODE = status.HTTP_409_CONFLICT
+    DETAIL = "Only queued jobs can be cancelled"
+
+
+class PermanentJobError(Exception):
+    """Raised by a job handler to fail the job without retrying it."""
@@ -0,0 +1,99 @@
+"""Background job database models."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+from .constants import JobStatus
+
+
+class Job(SQLModel, table=True):
+    """
+    Queued, running or finished background job.
+
+    Workers claim due jobs with ``SELECT ... FOR UPDATE SKIP LOCKED``, so any
+    number of them can poll the table without blocking each other or claiming
+    the same job. A claimed job carries a lease (``locked_until``) that its
+    worker renews while it runs; a job whose lease expired is requeued.
+    """
+
+    __tablename__ = "job"
+    __table_args__ = (
+        # Claiming: the best due queued job, by priority then age
+        Index(
+            "job_dequeue_idx",
+            text("priority DESC"),
+            "run_at",
+            "id",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        # Requeueing jobs whose worker stopped renewing its lease
+        Index("job_lease_idx", "locked_until", postgresql_where=text("status = 'running'")),
+        # Listing a user's jobs, newest first
+        Index("job_user_id_created_at_idx", "user_id", "created_at", "id"),
+        # Enqueueing twice with the same key returns the first job; NULL user
+        # ids (system jobs) share one key space
+        Index(
+            "job_user_id_idempotency_key_idx",
+            "user_id",
+            "idempotency_key",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+            postgresql_where=text("idempotency_key IS NOT NULL"),
+        ),
+    )
+
+    id: int | None = Field(default=None, sa_column=Column(BigInteger, primary_key=True))
+    # Name of the registered handler that runs the job
+    kind: str = Field(sa_column=Column(String(100), nullable=False))
+    payload: dict[str, Any] = Field(
+        sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    )
+    status: JobStatus = Field(
+        sa_column=Column(String(16), nullable=False, server_default=JobStatus.QUEUED.value)
+    )
+    # Higher runs first
+    priority: int = Field(sa_column=Column(SmallInteger, nullable=False, server_default="0"))
+    user_id: int | None = Field(default=None, sa_column=Column(Integer, nullable=True))
+    idempotency_key: str | None = Field(default=None, sa_column=Column(String(255), nullable=True))
+
+    attempts: int = Field(sa_column=Column(SmallInteger, nullable=False, server_default="0"))
+    max_attempts: int = Field(sa_column=Column(SmallInteger, nullable=False))
+    # Not claimed before this (enqueue delay, retry backoff)
+    run_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
+    locked_by: str | None = Field(default=None, sa_column=Column(String(100), nullable=True))
+    locked_until: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+
+    result: Any | None = Field(default=None, sa_column=Column(JSONB, nullable=True))
+    # Error of the last failed attempt
+    error: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
+    started_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+    finished_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
@@ -0,0 +1,379 @@
+"""
+Postgres-backed job queue operations.
+
+Every operation is one statement in autocommit, except ``enqueue`` with a
+session, which joins the caller's transaction: the job (and the NOTIFY that
+wakes workers) only becomes visible if the transaction commits, so a job is
+never run for a change that was rolled back.
+"""
+
+import random
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+from sqlalchemy import Interval, Select, Update, bindparam, case, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from ..database import get_engine, mark_writes
+from .config import JobsConfig, get_jobs_settings
+from .constants import JOB_NOTIFY_CHANNEL, LEASE_EXPIRED_ERROR, MAX_ERROR_LENGTH, JobStatus
+from .exceptions import JobNotCancellable, JobNotFound
+from .models import Job
+from .registry import ClaimedJob
+from .schemas import JobRead
+
+_table = Job.__table__
+_c = _table.c
+
+_CLAIMED_COLUMNS = (_c.id, _c.kind, _c.payload, _c.attempts, _c.max_attempts, _c.user_id)
+
+
+def _enqueue_statement(statement: Any) -> Select[Any]:
+    # One round trip: insert, then NOTIFY workers of each inserted row (none
+    # when an idempotent insert conflicts); the NOTIFY is sent on commit
+    inserted = (
+        statement.values(
+            kind=bindparam("kind"),
+            payload=bindparam("payload"),
+            priority=bindparam("priority"),
+            user_id=bindparam("user_id"),
+            idempotency_key=bindparam("idempotency_key"),
+            max_attempts=bindparam("max_attempts"),
+            run_at=func.now() + bindparam("delay", type_=Interval()),
+        )
+        .returning(*_table.c)
+        .cte("inserted")
+    )
+    return select(inserted, func.pg_notify(JOB_NOTIFY_CHANNEL, inserted.c.kind))
+
+
+# Built once: the core insert is compiled once and cached, unlike the dialect
+# insert that ON CONFLICT needs, which is only used with an idempotency key
+_ENQUEUE = _enqueue_statement(insert(_table))
+_ENQUEUE_IDEMPOTENT = _enqueue_statement(
+    pg_insert(_table).on_conflict_do_nothing(
+        index_elements=[_c.user_id, _c.idempotency_key],
+        index_where=_c.idempotency_key.is_not(None),
+    )
+)
+
+
+def _claim_statement(*, by_kind: bool) -> Update:
+    candidates = (
+        select(_c.id)
+        .where(_c.status == JobStatus.QUEUED.value, _c.run_at <= func.now())
+        .order_by(_c.priority.desc(), _c.run_at, _c.id)
+        .limit(bindparam("limit"))
+        .with_for_update(skip_locked=True)
+    )
+    if by_kind:
+        candidates = candidates.where(_c.kind.in_(bindparam("kinds", expanding=True)))
+    candidates = candidates.cte("candidates")
+    return (
+        update(_table)
+        .where(_c.id == candidates.c.id)
+        .values(
+            status=JobStatus.RUNNING.value,
+            attempts=_c.attempts + 1,
+            locked_by=bindparam("worker"),
+            locked_until=func.now() + bindparam("lease", type_=Interval()),
+            started_at=func.now(),
+        )
+        .returning(*_CLAIMED_COLUMNS)
+    )
+
+
+def _finish_statement(**values: Any) -> Update:
+    # Only the lease holder may record the outcome of a run
+    return (
+        update(_table)
+        .where(
+            _c.id == bindparam("job_id"),
+            _c.status == JobStatus.RUNNING.value,
+            _c.locked_by == bindparam("worker"),
+        )
+        .values(locked_by=None, locked_until=None, **values)
+    )
+
+
+# Prebuilt with bind parameters, the statements workers run for every job are
+# constructed and cache-keyed once instead of once per call
+_CLAIM = _claim_statement(by_kind=False)
+_CLAIM_KINDS = _claim_statement(by_kind=True)
+_COMPLETE = _finish_statement(
+    status=JobStatus.SUCCEEDED.value,
+    result=bindparam("job_result", type_=_c.result.type),
+    error=None,
+    finished_at=func.now(),
+)
+_RETRY = _finish_statement(
+    status=JobStatus.QUEUED.value,
+    error=bindparam("job_error"),
+    run_at=func.now() + bindparam("delay", type_=Interval()),
+)
+_FAIL = _finish_statement(
+    status=JobStatus.FAILED.value, error=bindparam("job_error"), finished_at=func.now()
+)
+
+
+class JobQueue:
+    """Enqueues, claims and finishes jobs in the ``job`` table."""
+
+    def __init__(self, engine: AsyncEngine, config: JobsConfig) -> None:
+        # Always the primary: workers and pollers must see the latest status
+        self._engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+        self._config = config
+        self._lease = timedelta(seconds=config.job_lease_seconds)
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: dict[str, Any] | None = None,
+        *,
+        priority: int = 0,
+        user_id: int | None = None,
+        idempotency_key: str | None = None,
+        delay_seconds: float = 0.0,
+        max_attempts: int | None = None,
+        session: AsyncSession | None = None,
+    ) -> tuple[JobRead, bool]:
+        """
+        Add a job to the queue.
+
+        Args:
+            kind: Job kind; a worker with a handler for it runs the job.
+            payload: JSON-serializable handler input.
+            priority: Higher priorities are claimed first (-32768 to 32767).
+            user_id: Owner, who can poll and cancel the job.
+            idempotency_key: If the owner already enqueued a job with this key,
+                that job is returned instead of adding another.
+            delay_seconds: Do not run the job before this delay.
+            max_attempts: Runs before the job fails (default: ``JOB_MAX_ATTEMPTS``).
+            session: Enqueue in this session's transaction (visible on commit);
+                without one the job is enqueued immediately.
+
+        Returns:
+            The job, and whether it was created (False for an idempotent repeat).
+        """
+        parameters = {
+            "kind": kind,
+            "payload": to_jsonable_python(payload or {}),
+            "priority": priority,
+            "user_id": user_id,
+            "idempotency_key": idempotency_key,
+            "max_attempts": max_attempts or self._config.job_max_attempts,
+            "delay": timedelta(seconds=max(delay_seconds, 0.0)),
+        }
+        if session is not None:
+            conn = await session.connection()
+            # Written on the session's connection: the session must still commit
+            mark_writes(session)
+            return await self._enqueue(conn, parameters)
+        async with self._engine.connect() as conn:
+            return await self._enqueue(conn, parameters)
+
+    async def _enqueue(
+        self, conn: AsyncConnection, parameters: dict[str, Any]
+    ) -> tuple[JobRead, bool]:
+        if parameters["idempotency_key"] is None:
+            row = (await conn.execute(_ENQUEUE, parameters)).one()
+            return JobRead.model_validate(row), True
+
+        row = (await conn.execute(_ENQUEUE_IDEMPOTENT, parameters)).first()
+        if row is not None:
+            return JobRead.model_validate(row), True
+        # Idempotent repeat: return the job enqueued with this key
+        existing = select(_table).where(
+            _c.user_id.is_not_distinct_from(parameters["user_id"]),
+            _c.idempotency_key == parameters["idempotency_key"],
+        )
+        row = (await conn.execute(existing)).one()
+        return JobRead.model_validate(row), False
+
+    async def get(self, job_id: int, *, user_id: int | None = None) -> JobRead:
+        """
+        Get a job's current state.
+
+        Raises:
+            JobNotFound: If there is no such job (owned by ``user_id``, if given).
+        """
+        statement = select(_table).where(_c.id == job_id)
+        if user_id is not None:
+            statement = statement.where(_c.user_id == user_id)
+        async with self._engine.connect() as conn:
+            row = (await conn.execute(statement)).first()
+        if row is None:
+            raise JobNotFound
+        return JobRead.model_validate(row)
+
+    async def cancel(self, job_id: int, *, user_id: int | None = None) -> JobRead:
+        """
+        Cancel a queued job.
+
+        Raises:
+            JobNotFound: If there is no such job (owned by ``user_id``, if given).
+            JobNotCancellable: If the job is already running or finished.
+        """
+        statement = (
+            update(_table)
+            .where(_c.id == job_id, _c.status == JobStatus.QUEUED.value)
+            .values(status=JobStatus.CANCELLED.value, finished_at=func.now())
+            .returning(*_table.c)
+        )
+        if user_id is not None:
+            statement = statement.where(_c.user_id == user_id)
+        async with self._engine.connect() as conn:
+            row = (await conn.execute(statement)).first()
+        if row is None:
+            await self.get(job_id, user_id=user_id)  # JobNotFound if missing
+            raise JobNotCancellable
+        return JobRead.model_validate(row)
+
+    async def claim(
+        self, worker: str, limit: int, kinds: list[str] | None = None
+    ) -> list[ClaimedJob]:
+        """
+        Claim up to ``limit`` due jobs for ``worker``, best priority first.
+
+        Rows locked by another worker's claim in progress are skipped instead of
+        waited for, so concurrent workers never block each other or share a job.
+
+        Args:
+            worker: Worker name, recorded as the lease holder.
+            limit: Maximum number of jobs to claim.
+            kinds: Only claim these kinds (default: any).
+        """
+        statement = _CLAIM if kinds is None else _CLAIM_KINDS
+        parameters = {"worker": worker, "limit": limit, "lease": self._lease, "kinds": kinds}
+        async with self._engine.connect() as conn:
+            rows = (await conn.execute(statement, parameters)).all()
+        return [ClaimedJob(*row) for row in rows]
+
+    async def complete(self, job: ClaimedJob, worker: str, result: Any) -> bool:
+        """
+        Mark a job succeeded.
+
+        Returns:
+            False if ``worker`` no longer held the job's lease (it expired and the
+            job was requeued or claimed again), in which case nothing changed.
+        """
+        return await self._finish(_COMPLETE, job, worker, job_result=to_jsonable_python(result))
+
+    async def fail(self, job: ClaimedJob, worker: str, error: str, *, retry: bool) -> bool:
+        """
+        Record a failed run: requeue the job with backoff, or fail it for good.
+
+        Args:
+            job: The claimed job.
+            worker: Lease holder.
+            error: Error message (truncated).
+            retry: Whether the job may run again (ignored once out of attempts).
+
+        Returns:
+            False if ``worker`` no longer held the job's lease.
+        """
+        error = error[:MAX_ERROR_LENGTH]
+        if retry and job.attempts < job.max_attempts:
+            delay = timedelta(seconds=self.retry_delay(job.attempts))
+            return await self._finish(_RETRY, job, worker, job_error=error, delay=delay)
+        return await self._finish(_FAIL, job, worker, job_error=error)
+
+    def retry_delay(self, attempts: int) -> float:
+        """
+        Seconds before retrying a job that failed ``attempts`` times.
+
+        Exponential with "equal jitter": half the delay is fixed and half random,
+        so retries of jobs that failed together (e.g. during an outage) spread out.
+        """
+        delay = min(
+            self._config.job_retry_max_seconds,
+            self._config.job_retry_base_seconds * 2 ** (attempts - 1),
+        )
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _finish(
+        self, statement: Update, job: ClaimedJob, worker: str, **parameters: Any
+    ) -> bool:
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                statement, {"job_id": job.id, "worker": worker, **parameters}
+            )
+        return result.rowcount == 1
+
+    async def renew_leases(self, worker: str, job_ids: list[int]) -> None:
+        """Extend the leases of jobs ``worker`` is still running."""
+        statement = (
+            update(_table)
+            .where(_c.id.in_(job_ids), _c.status == JobStatus.RUNNING.value, _c.locked_by == worker)
+            .values(locked_until=func.now() + self._lease)
+        )
+        async with self._engine.connect() as conn:
+            await conn.execute(statement)
+
+    async def release(self, worker: str, job_ids: list[int]) -> None:
+        """Requeue jobs interrupted by a shutdown, without counting the attempt."""
+        statement = (
+            update(_table)
+            .where(_c.id.in_(job_ids), _c.status == JobStatus.RUNNING.value, _c.locked_by == worker)
+            .values(
+                status=JobStatus.QUEUED.value,
+                attempts=_c.attempts - 1,
+                run_at=func.now(),
+                locked_by=None,
+                locked_until=None,
+            )
+        )
+        async with self._engine.connect() as conn:
+            await conn.execute(statement)
+
+    async def requeue_expired(self) -> int:
+        """
+        Requeue running jobs whose lease expired (their worker died or hung).
+
+        The interrupted run counts as an attempt, so a job that keeps killing
+        its worker eventually fails instead of looping.
+
+        Returns:
+            Number of jobs requeued or failed.
+        """
+        out_of_attempts = _c.attempts >= _c.max_attempts
+        statement = (
+            update(_table)
+            .where(_c.status == JobStatus.RUNNING.value, _c.locked_until < func.now())
+            .values(
+                status=case(
+                    (out_of_attempts, JobStatus.FAILED.value), else_=JobStatus.QUEUED.value
+                ),
+                finished_at=case((out_of_attempts, func.now()), else_=None),
+                run_at=func.now(),
+                error=LEASE_EXPIRED_ERROR,
+                locked_by=None,
+                locked_until=None,
+            )
+        )
+        async with self._engine.connect() as conn:
+            result = await conn.execute(statement)
+        return result.rowcount
+
+    async def counts(self) -> dict[JobStatus, int]:
+        """Number of jobs by status."""
+        statement = select(_c.status, func.count()).group_by(_c.status)
+        async with self._engine.connect() as conn:
+            rows = (await conn.execute(statement)).all()
+        counts = dict.fromkeys(JobStatus, 0)
+        for status, count in rows:
+            counts[JobStatus(status)] = count
+        return counts
+
+
+@lru_cache
+def get_job_queue() -> JobQueue:
+    """Get the job queue on the primary engine."""
+    return JobQueue(get_engine(), get_jobs_settings())
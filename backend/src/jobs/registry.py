@@ -0,0 +1,101 @@
+"""
+Job handler registry.
+
+Handlers are registered by kind with the ``job_handler`` decorator, in modules
+that workers import at startup (``JOB_HANDLER_MODULES``)::
+
+    @job_handler("analytics.skills", timeout_seconds=600)
+    async def extract_document_skills(job: ClaimedJob) -> dict[str, Any]:
+        config = get_analytics_settings()
+        documents = await extract_skills(get_engine(), job.user_id, config)
+        return {"documents": documents}
+
+A handler receives the claimed job and returns a JSON-serializable result.
+Jobs run at least once: a job may run again after its worker lost the lease
+(crash, timeout, lost connection), so handlers must be safe to repeat.
+"""
+
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any
+
+HandlerFunction = Callable[["ClaimedJob"], Awaitable[Any]]
+
+
+class ClaimedJob:
+    """A job claimed by a worker, as passed to its handler."""
+
+    __slots__ = ("attempts", "id", "kind", "max_attempts", "payload", "user_id")
+
+    def __init__(
+        self,
+        id: int,
+        kind: str,
+        payload: dict[str, Any],
+        attempts: int,
+        max_attempts: int,
+        user_id: int | None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.payload = payload
+        self.attempts = attempts  # including this run
+        self.max_attempts = max_attempts
+        self.user_id = user_id
+
+
+class JobHandler:
+    """A registered handler and its run settings."""
+
+    __slots__ = ("function", "kind", "timeout_seconds")
+
+    def __init__(self, kind: str, function: HandlerFunction, timeout_seconds: float | None) -> None:
+        self.kind = kind
+        self.function = function
+        self.timeout_seconds = timeout_seconds  # None: JOB_TIMEOUT_SECONDS
+
+
+class JobHandlers:
+    """Handlers by job kind."""
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, JobHandler] = {}
+
+    def __contains__(self, kind: str) -> bool:
+        return kind in self._handlers
+
+    def get(self, kind: str) -> JobHandler | None:
+        return self._handlers.get(kind)
+
+    def kinds(self) -> list[str]:
+        return sorted(self._handlers)
+
+    def register(self, kind: str, function: HandlerFunction, timeout_seconds: float | None) -> None:
+        if kind in self._handlers and self._handlers[kind].function is not function:
+            message = f"A handler is already registered for job kind {kind!r}"
+            raise ValueError(message)
+        self._handlers[kind] = JobHandler(kind, function, timeout_seconds)
+
+
+@lru_cache
+def get_job_handlers() -> JobHandlers:
+    """Get the process-wide handler registry."""
+    return JobHandlers()
+
+
+def job_handler(
+    kind: str, *, timeout_seconds: float | None = None
+) -> Callable[[HandlerFunction], HandlerFunction]:
+    """
+    Register an async function as the handler of ``kind`` jobs.
+
+    Args:
+        kind: Job kind, as passed to ``JobQueue.enqueue``.
+        timeout_seconds: Time limit per run (default: ``JOB_TIMEOUT_SECONDS``).
+    """
+
+    def decorator(function: HandlerFunction) -> HandlerFunction:
+        get_job_handlers().register(kind, function, timeout_seconds)
+        return function
+
+    return decorator
@@ -0,0 +1,134 @@
+"""Background job status endpoints."""
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..auth import parse_jwt_data
+from ..auth.schemas import JWTData
+from ..database import get_db_session
+from ..pagination import CursorPage, KeysetParams, get_keyset_params, paginate
+from .constants import JobStatus
+from .models import Job
+from .queue import get_job_queue
+from .schemas import JobRead
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+_JOB_EXAMPLE = JobRead.model_config["json_schema_extra"]["example"]
+_NOT_FOUND = {
+    "description": "No such job, or it belongs to another user",
+    "content": {"application/json": {"example": {"detail": "Job not found"}}},
+}
+
+
+@router.get(
+    "",
+    response_model=CursorPage[JobRead],
+    status_code=status.HTTP_200_OK,
+    summary="List jobs",
+    description="Returns the user's jobs, newest first, optionally filtered by kind and status.",
+    responses={
+        200: {
+            "description": "A page of jobs",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "items": [_JOB_EXAMPLE],
+                        "next_cursor": None,
+                        "has_more": False,
+                        "estimated_total": None,
+                    }
+                }
+            },
+        }
+    },
+)
+async def list_jobs(
+    kind: str | None = Query(None, max_length=100, description="Only jobs of this kind"),
+    job_status: JobStatus | None = Query(None, alias="status", description="Only this status"),
+    params: KeysetParams = Depends(get_keyset_params),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_db_session),
+) -> CursorPage[JobRead]:
+    """
+    Job list endpoint.
+
+    Keyset-paginated over the (user_id, created_at, id) index.
+    """
+    statement = select(Job).where(Job.user_id == jwt_data.user_id)
+    if kind is not None:
+        statement = statement.where(Job.kind == kind)
+    if job_status is not None:
+        statement = statement.where(Job.status == job_status.value)
+    return await paginate(
+        session,
+        statement,
+        order_by=[Job.created_at.desc(), Job.id.desc()],
+        params=params,
+    )
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobRead,
+    status_code=status.HTTP_200_OK,
+    summary="Get job status",
+    description=(
+        "Returns the status of a job, with its result once it succeeded or the error of "
+        "its last failed attempt. Poll until the status is succeeded, failed or cancelled."
+    ),
+    responses={
+        200: {
+            "description": "Current state of the job",
+            "content": {"application/json": {"example": _JOB_EXAMPLE}},
+        },
+        404: _NOT_FOUND,
+    },
+)
+async def get_job(job_id: int, jwt_data: JWTData = Depends(parse_jwt_data)) -> JobRead:
+    """
+    Job status endpoint.
+
+    One primary-key lookup on the primary, so the status is never stale.
+    """
+    return await get_job_queue().get(job_id, user_id=jwt_data.user_id)
+
+
+@router.delete(
+    "/{job_id}",
+    response_model=JobRead,
+    status_code=status.HTTP_200_OK,
+    summary="Cancel job",
+    description="Cancels a job that has not started yet. Running jobs cannot be cancelled.",
+    responses={
+        200: {
+            "description": "The cancelled job",
+            "content": {
+                "application/json": {
+                    "example": {
+                        **_JOB_EXAMPLE,
+                        "status": "cancelled",
+                        "attempts": 0,
+                        "result": None,
+                        "started_at": None,
+                    }
+                }
+            },
+        },
+        404: _NOT_FOUND,
+        409: {
+            "description": "The job is already running or finished",
+            "content": {
+                "application/json": {"example": {"detail": "Only queued jobs can be cancelled"}}
+            },
+        },
+    },
+)
+async def cancel_job(job_id: int, jwt_data: JWTData = Depends(parse_jwt_data)) -> JobRead:
+    """
+    Job cancellation endpoint.
+
+    A single conditional update: the job is cancelled only if no worker has claimed it.
+    """
+    return await get_job_queue().cancel(job_id, user_id=jwt_data.user_id)
@@ -0,0 +1,47 @@
+"""Background job response models."""
+
+from typing import Any
+
+from pydantic import ConfigDict, Field
+
+from ..models import CustomBaseModel, UTCDatetime
+from .constants import JobStatus
+
+
+class JobRead(CustomBaseModel):
+    """State of a background job, for status polling."""
+
+    id: int = Field(..., description="Job ID")
+    kind: str = Field(..., description="Type of work")
+    status: JobStatus = Field(..., description="Lifecycle status")
+    priority: int = Field(..., description="Higher priorities run first")
+    attempts: int = Field(..., description="Runs started so far")
+    max_attempts: int = Field(..., description="Runs allowed before the job fails")
+    run_at: UTCDatetime = Field(..., description="Earliest time of the next run, while queued")
+    result: Any | None = Field(default=None, description="Handler result, once succeeded")
+    error: str | None = Field(default=None, description="Error of the last failed run")
+    created_at: UTCDatetime = Field(..., description="When the job was enqueued")
+    started_at: UTCDatetime | None = Field(default=None, description="When the last run started")
+    finished_at: UTCDatetime | None = Field(
+        default=None, description="When the job succeeded, failed or was cancelled"
+    )
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 1042,
+                "kind": "resume.render_pdf",
+                "status": "succeeded",
+                "priority": 0,
+                "attempts": 1,
+                "max_attempts": 5,
+                "run_at": "2026-01-01T00:00:00Z",
+                "result": {"pdf_key": "5d41402abc4b2a76b9719d911017c592"},
+                "error": None,
+                "created_at": "2026-01-01T00:00:00Z",
+                "started_at": "2026-01-01T00:00:01Z",
+                "finished_at": "2026-01-01T00:00:03Z",
+            }
+        },
+    )
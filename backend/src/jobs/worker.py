@@ -0,0 +1,225 @@
+"""
+Job worker: claims due jobs and runs their handlers.
+
+A worker runs up to ``JOB_WORKER_CONCURRENCY`` jobs at a time on the event loop
+it is started on: inside an API process (``JOB_WORKER_ENABLED``) or in its own
+process (``python -m src.jobs``). It claims as many jobs as it has free slots in
+one statement, then waits until a slot frees up, an enqueue is announced over
+LISTEN/NOTIFY or the poll interval passes. Missed notifications only delay
+jobs until the next poll.
+
+While jobs run, the worker renews their leases and requeues jobs whose lease
+expired in any worker. On shutdown, jobs still running after the grace period
+are cancelled and put back in the queue without counting the attempt.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import logging
+import os
+import socket
+import time
+from functools import lru_cache
+from typing import Any
+
+from .config import JobsConfig, get_jobs_settings
+from .constants import JOB_NOTIFY_CHANNEL
+from .exceptions import PermanentJobError
+from .queue import JobQueue, get_job_queue
+from .registry import ClaimedJob, JobHandlers, get_job_handlers
+
+logger = logging.getLogger(__name__)
+
+
+def import_handler_modules(modules: list[str]) -> None:
+    """Import the modules that register job handlers."""
+    for module in modules:
+        importlib.import_module(module)
+
+
+class JobWorker:
+    """Runs jobs of the registered kinds from the queue."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: JobHandlers,
+        config: JobsConfig,
+        *,
+        name: str | None = None,
+        concurrency: int | None = None,
+    ) -> None:
+        self._queue = queue
+        self._handlers = handlers
+        self._config = config
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency = concurrency or config.job_worker_concurrency
+        self._running: dict[int, asyncio.Task[None]] = {}
+        # Set when there may be work to claim: NOTIFY, a finished job, reconnect
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+        self.succeeded = 0
+        self.failed = 0  # runs that raised (retried or not)
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    def start(self) -> None:
+        """Start claiming and running jobs."""
+        if self._tasks:
+            return
+        kinds = self._handlers.kinds()
+        if not kinds:
+            logger.warning(f"Job worker {self.name} has no handlers registered; not starting")
+            return
+        logger.info(f"Job worker {self.name} running {', '.join(kinds)}")
+        self._tasks = [
+            asyncio.create_task(self._claim_loop(kinds), name="job-worker-claim"),
+            asyncio.create_task(self._lease_loop(), name="job-worker-leases"),
+            asyncio.create_task(self._listen(), name="job-worker-listener"),
+        ]
+
+    async def stop(self) -> None:
+        """Stop claiming, let running jobs finish within the grace period, requeue the rest."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        if not self._running:
+            return
+
+        _, pending = await asyncio.wait(
+            self._running.values(), timeout=self._config.job_shutdown_grace_seconds
+        )
+        if not pending:
+            return
+        interrupted = [job_id for job_id, task in self._running.items() if task in pending]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        try:
+            await self._queue.release(self.name, interrupted)
+        except Exception as e:
+            # Their leases expire and they are requeued by another worker
+            logger.warning(f"Could not requeue {len(interrupted)} interrupted jobs: {e!r}")
+        else:
+            logger.info(f"Requeued {len(interrupted)} jobs interrupted by shutdown")
+
+    async def _claim_loop(self, kinds: list[str]) -> None:
+        poll_interval = self._config.job_poll_interval_seconds
+        while True:
+            self._wakeup.clear()
+            free = self.concurrency - len(self._running)
+            if free > 0:
+                try:
+                    jobs = await self._queue.claim(self.name, free, kinds)
+                except Exception as e:
+                    logger.warning(f"Claiming jobs failed: {e!r}")
+                    jobs = []
+                for job in jobs:
+                    task = asyncio.create_task(self._execute(job), name=f"job-{job.id}")
+                    self._running[job.id] = task
+                    task.add_done_callback(lambda _, job_id=job.id: self._finished(job_id))
+                if jobs and len(jobs) == free:
+                    # Every slot is busy: wait for one to free up
+                    await self._wakeup.wait()
+                    continue
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(poll_interval):
+                    await self._wakeup.wait()
+
+    def _finished(self, job_id: int) -> None:
+        self._running.pop(job_id, None)
+        self._wakeup.set()
+
+    async def _execute(self, job: ClaimedJob) -> None:
+        handler = self._handlers.get(job.kind)
+        timeout = handler.timeout_seconds or self._config.job_timeout_seconds
+        started_at = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                result = await handler.function(job)
+        except PermanentJobError as e:
+            await self._record_failure(job, f"{type(e).__name__}: {e}", retry=False)
+        except TimeoutError:
+            await self._record_failure(job, f"Timed out after {timeout:g} s", retry=True)
+        except Exception as e:
+            logger.warning(f"Job {job.id} ({job.kind}) attempt {job.attempts} failed: {e!r}")
+            await self._record_failure(job, f"{type(e).__name__}: {e}", retry=True)
+        else:
+            self.succeeded += 1
+            elapsed = time.perf_counter() - started_at
+            logger.debug(f"Job {job.id} ({job.kind}) succeeded in {elapsed:.3f} s")
+            await self._record(self._queue.complete(job, self.name, result), job)
+
+    async def _record_failure(self, job: ClaimedJob, error: str, *, retry: bool) -> None:
+        self.failed += 1
+        await self._record(self._queue.fail(job, self.name, error, retry=retry), job)
+
+    async def _record(self, update: Any, job: ClaimedJob) -> None:
+        try:
+            held = await update
+        except Exception as e:
+            # The lease expires and the job runs again (handlers are idempotent)
+            logger.warning(f"Could not record the outcome of job {job.id}: {e!r}")
+            return
+        if not held:
+            logger.warning(f"Job {job.id} finished after its lease expired; outcome discarded")
+
+    async def _lease_loop(self) -> None:
+        # Renew well before leases expire; requeue jobs of workers that died
+        interval = self._config.job_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if self._running:
+                    await self._queue.renew_leases(self.name, list(self._running))
+                if await self._queue.requeue_expired():
+                    self._wakeup.set()
+            except Exception as e:
+                logger.warning(f"Renewing job leases failed: {e!r}")
+
+    async def _listen(self) -> None:
+        import asyncpg  # noqa: PLC0415
+
+        # asyncpg takes a libpq-style DSN; the SQLAlchemy URL names the dialect
+        url = self._queue.engine.url
+        dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+        while True:
+            try:
+                connection = await asyncpg.connect(dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Job queue listener cannot connect: {e!r}")
+                await asyncio.sleep(self._config.job_listen_retry_seconds)
+                continue
+
+            try:
+                await self._serve(connection)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Job queue listener failed: {e!r}")
+            finally:
+                with contextlib.suppress(Exception):
+                    await connection.close(timeout=1)
+            logger.warning("Job queue listener disconnected, reconnecting")
+            await asyncio.sleep(self._config.job_listen_retry_seconds)
+
+    async def _serve(self, connection: Any) -> None:
+        # Wake the claim loop on every enqueue until ``connection`` closes
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+        await connection.add_listener(JOB_NOTIFY_CHANNEL, lambda *_: self._wakeup.set())
+        # Jobs enqueued while disconnected were not announced
+        self._wakeup.set()
+        await closed.wait()
+
+
+@lru_cache
+def get_job_worker() -> JobWorker:
+    """Get the worker for this process, with the handlers of ``JOB_HANDLER_MODULES``."""
+    config = get_jobs_settings()
+    import_handler_modules(config.job_handler_modules)
+    return JobWorker(get_job_queue(), get_job_handlers(), config)
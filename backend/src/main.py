@@ -1,62 +1,64 @@
 import logging
-import os
-import subprocess
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-
-from .database import close_db, init_db
+from fastapi.responses import ORJSONResponse
+
+from .ats import close_ats_scorer
+from .cache import get_cache_settings, get_response_cache
+from .database import (
+    QueryProfilerMiddleware,
+    check_migrations,
+    close_db,
+    get_db_settings,
+    get_engine,
+    get_query_profiler,
+    get_replica_router,
+    init_db,
+)
 from .datetime import get_current_utc_datetime
 from .health.constants import HealthStatus
 from .health.schemas import HealthStatusResponse
+from .health.service import get_health_monitor
+from .jobs import get_job_worker, get_jobs_settings
+from .metrics import MetricsMiddleware, get_metrics_settings, instrument_engine
 from .routes.v1 import router as v1_router
 
 logger = logging.getLogger(__name__)
 
 
-async def check_migrations() -> None:
-    """Check migration status in development mode."""
-    if os.getenv("DEBUG", "False").lower() != "true":
-        return
-
-    try:
-        result = subprocess.run(
-            ["alembic", "current"],
-            check=False,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-    except subprocess.TimeoutExpired:
-        logger.warning("Migration check timed out")
-        return
-    except FileNotFoundError:
-        logger.warning("Alembic not found in PATH, skipping migration check")
-        return
-    except Exception as e:
-        logger.warning(f"Error checking migrations: {e}")
-        return
-
-    if result.returncode != 0:
-        logger.warning(f"Could not check migration status: {result.stderr}")
-        return
-
-    current_version = result.stdout.strip()
-    if current_version:
-        logger.info(f"Current database migration version: {current_version}")
-    else:
-        logger.warning("No migrations have been applied yet")
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # noqa: ARG001
     """Lifespan context manager for application startup and shutdown."""
     # Startup
     await init_db()
-    # Check migrations in development mode (non-blocking)
+    engines = (get_engine(), *get_replica_router().replicas)
+    if get_metrics_settings().metrics_enabled:
+        # Attribute query time (primary and replicas) to the request that issued it
+        for engine in engines:
+            instrument_engine(engine)
+    if get_db_settings().db_profiler_enabled:
+        for engine in engines:
+            get_query_profiler().attach(engine)
+    # Compare the database revision with the migration heads (in-process, cached)
     await check_migrations()
+    health_monitor = get_health_monitor()
+    health_monitor.start()
+    if get_cache_settings().cache_enabled:
+        # Receive tag invalidations from other workers
+        get_response_cache().start()
+    if get_jobs_settings().job_worker_enabled:
+        # Run background jobs in this process (or run ``python -m src.jobs``)
+        get_job_worker().start()
     yield
     # Shutdown
+    if get_jobs_settings().job_worker_enabled:
+        await get_job_worker().stop()
+    # Scoring worker processes, once no request or job can use them
+    close_ats_scorer()
+    await health_monitor.stop()
+    if get_cache_settings().cache_enabled:
+        await get_response_cache().stop()
     await close_db()
 
 
@@ -65,8 +67,14 @@ app = FastAPI(
     description="API for Resume Agent application",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+if get_metrics_settings().metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+if get_db_settings().db_profiler_enabled:
+    app.add_middleware(QueryProfilerMiddleware)
+
 # Include v1 API routes
 app.include_router(v1_router)
 
@@ -0,0 +1,24 @@
+"""Request metrics module."""
+
+from .config import MetricsConfig, get_metrics_settings
+from .histogram import LatencyHistogram
+from .middleware import MetricsMiddleware
+from .service import (
+    MetricsRegistry,
+    RequestTimings,
+    current_request_timings,
+    instrument_engine,
+    metrics_registry,
+)
+
+__all__ = [
+    "LatencyHistogram",
+    "MetricsConfig",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "RequestTimings",
+    "current_request_timings",
+    "get_metrics_settings",
+    "instrument_engine",
+    "metrics_registry",
+]
@@ -0,0 +1,35 @@
+"""Request metrics configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class MetricsConfig(BaseSettings):
+    """Request metrics configuration loaded from environment variables."""
+
+    # Record per-route latency and database time for every HTTP request
+    metrics_enabled: bool = Field(default=True, alias="METRICS_ENABLED")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_metrics_settings() -> MetricsConfig:
+    """Get the global metrics configuration, loaded from the environment on first use."""
+    return MetricsConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``metrics_settings`` is built on first access
+    if name == "metrics_settings":
+        return get_metrics_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
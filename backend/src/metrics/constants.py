@@ -0,0 +1,10 @@
+"""Constants for request metrics."""
+
+# Percentiles reported for every histogram (as Prometheus summary quantiles)
+REPORTED_PERCENTILES = (50.0, 95.0, 99.0)
+
+# Route label for requests that matched no route, so unknown paths
+# (scanners, typos) cannot create unbounded label sets
+UNMATCHED_ROUTE = "unmatched"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
@@ -0,0 +1,49 @@
+"""Request timing middleware."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .constants import UNMATCHED_ROUTE
+from .service import MetricsRegistry, RequestTimings, current_request_timings, metrics_registry
+
+
+class MetricsMiddleware:
+    """
+    Record latency and database time of every HTTP request per route and status.
+
+    A plain ASGI middleware rather than ``BaseHTTPMiddleware``, which would add a
+    task and a memory stream per request. Requests are labelled with the route
+    template (e.g. ``/v1/users/{user_id}``), not the raw path. The latency covers
+    the whole response, including streamed bodies.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = metrics_registry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Unhandled exceptions are turned into a 500 by the outer error middleware
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        timings = RequestTimings()
+        token = current_request_timings.set(timings)
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started_at
+            current_request_timings.reset(token)
+            # The router stores the matched route in the scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            self.registry.observe(scope["method"], route, status_code, duration, timings)
@@ -0,0 +1,177 @@
+"""
+In-memory request metrics.
+
+Keeps one latency histogram and one database-time histogram per
+(method, route, status) and renders them in the Prometheus text format.
+Database time is measured with SQLAlchemy cursor events and attributed to the
+request that issued the query through a context variable, so handlers and
+services need no changes.
+"""
+
+import time
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .constants import REPORTED_PERCENTILES
+from .histogram import LatencyHistogram
+
+# Key in Connection.info holding start times of in-flight cursor executions
+_QUERY_STARTED_AT_KEY = "metrics_query_started_at"
+
+
+class RequestTimings:
+    """Database time accumulated by the request currently being served."""
+
+    __slots__ = ("db_queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.db_seconds = 0.0
+        self.db_queries = 0
+
+
+# Timings of the current request; None outside of instrumented requests
+current_request_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "current_request_timings", default=None
+)
+
+
+class RouteMetrics:
+    """Histograms for one (method, route, status) combination."""
+
+    __slots__ = ("db_queries", "db_time", "latency")
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.db_time = LatencyHistogram()
+        self.db_queries = 0
+
+
+class MetricsRegistry:
+    """Per-route request metrics, updated from the event loop thread."""
+
+    def __init__(self) -> None:
+        self._routes: dict[tuple[str, str, int], RouteMetrics] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration_seconds: float,
+        timings: RequestTimings,
+    ) -> None:
+        """Record a finished request."""
+        key = (method, route, status_code)
+        metrics = self._routes.get(key)
+        if metrics is None:
+            metrics = self._routes[key] = RouteMetrics()
+        metrics.latency.record(duration_seconds)
+        metrics.db_time.record(timings.db_seconds)
+        metrics.db_queries += timings.db_queries
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        self._routes.clear()
+
+    def render_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Histograms are exposed as summaries with p50/p95/p99 quantiles, since
+        the fine-grained HDR buckets would make an unwieldy number of series.
+
+        Returns:
+            Exposition text, one sample per line.
+        """
+        routes = sorted(self._routes.items())
+        lines = [
+            "# HELP http_request_duration_seconds HTTP request latency by route and status.",
+            "# TYPE http_request_duration_seconds summary",
+        ]
+        for key, metrics in routes:
+            lines.extend(_summary_lines("http_request_duration_seconds", key, metrics.latency))
+
+        lines += [
+            "# HELP http_request_db_duration_seconds Database time per HTTP request.",
+            "# TYPE http_request_db_duration_seconds summary",
+        ]
+        for key, metrics in routes:
+            lines.extend(_summary_lines("http_request_db_duration_seconds", key, metrics.db_time))
+
+        lines += [
+            "# HELP http_request_db_queries_total Database queries issued by HTTP requests.",
+            "# TYPE http_request_db_queries_total counter",
+        ]
+        lines.extend(
+            f"http_request_db_queries_total{{{_labels(key)}}} {metrics.db_queries}"
+            for key, metrics in routes
+        )
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(key: tuple[str, str, int]) -> str:
+    method, route, status_code = key
+    return f'method="{_escape_label(method)}",route="{_escape_label(route)}",status="{status_code}"'
+
+
+def _summary_lines(name: str, key: tuple[str, str, int], histogram: LatencyHistogram) -> list[str]:
+    labels = _labels(key)
+    values = histogram.percentiles(REPORTED_PERCENTILES)
+    lines = [
+        f'{name}{{{labels},quantile="{percent / 100:g}"}} {value:.6f}'
+        for percent, value in zip(REPORTED_PERCENTILES, values, strict=True)
+    ]
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum_seconds:.6f}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def _before_cursor_execute(conn: Connection, *_: Any) -> None:
+    if current_request_timings.get() is not None:
+        conn.info.setdefault(_QUERY_STARTED_AT_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Connection, *_: Any) -> None:
+    timings = current_request_timings.get()
+    started = conn.info.get(_QUERY_STARTED_AT_KEY)
+    if timings is None or not started:
+        return
+    timings.db_seconds += time.perf_counter() - started.pop()
+    timings.db_queries += 1
+
+
+def _handle_error(exception_context: ExceptionContext) -> None:
+    # A failed execution never reaches after_cursor_execute; drop its start time
+    conn = exception_context.connection
+    if current_request_timings.get() is None or conn is None:
+        return
+    started = conn.info.get(_QUERY_STARTED_AT_KEY)
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Attribute the engine's query time to the current request.
+
+    Safe to call more than once per engine. Queries issued outside of a
+    request (background tasks, startup) are not timed.
+    """
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+# Global registry fed by MetricsMiddleware
+metrics_registry = MetricsRegistry()
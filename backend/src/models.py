@@ -1,10 +1,9 @@
 """Global base models for the application."""
 
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PlainSerializer
 
 from .datetime import format_datetime_iso
 
@@ -22,6 +21,15 @@ def datetime_to_utc_str(dt: datetime) -> str:
     return format_datetime_iso(dt)
 
 
+# Datetime field type serialized to UTC string format in JSON mode.
+# The serializer runs inside pydantic-core for every occurrence, including
+# datetimes in nested models and containers.
+UTCDatetime = Annotated[
+    datetime,
+    PlainSerializer(datetime_to_utc_str, return_type=str, when_used="json"),
+]
+
+
 class CustomBaseModel(BaseModel):
     """
     Custom base model for all Pydantic models in the application.
@@ -31,32 +39,16 @@ class CustomBaseModel(BaseModel):
     - Serializable dict method for JSON-safe serialization
     - Common configuration for all models
 
-    All datetime fields are automatically serialized to UTC string format
-    when using model_dump(mode="json") or serializable_dict().
+    Annotate datetime fields with ``UTCDatetime`` to have them serialized to UTC
+    string format when using model_dump(mode="json"), model_dump_json(),
+    serializable_dict() or as a FastAPI response model.
     """
 
     model_config = ConfigDict(
         populate_by_name=True,
     )
 
-    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
-        """
-        Override model_dump to ensure datetime fields are serialized correctly.
-
-        When mode="json" is used, datetime fields are converted to UTC strings.
-        """
-        result = super().model_dump(**kwargs)
-        mode = kwargs.get("mode", "python")
-
-        if mode == "json":
-            # Convert datetime fields to UTC strings
-            for key, value in result.items():
-                if isinstance(value, datetime):
-                    result[key] = datetime_to_utc_str(value)
-
-        return result
-
-    def serializable_dict(self, **kwargs) -> dict:
+    def serializable_dict(self, **kwargs: Any) -> dict[str, Any]:
         """
         Return a dict which contains only serializable fields.
 
@@ -69,5 +61,4 @@ class CustomBaseModel(BaseModel):
         Returns:
             Dictionary with all serializable fields.
         """
-        default_dict = self.model_dump(mode="json", **kwargs)
-        return jsonable_encoder(default_dict)
+        return self.model_dump(mode="json", **kwargs)
@@ -0,0 +1,357 @@
+"""
+Keyset (cursor) pagination for SQLAlchemy/SQLModel selects.
+
+Instead of ``LIMIT/OFFSET``, each page continues from the sort key of the last
+row of the previous page (``WHERE (created_at, id) < (:created_at, :id)``), so
+every page costs the same index range scan no matter how deep the client pages.
+
+The position is handed to clients as an opaque cursor: the JSON-encoded sort key
+signed with HMAC-SHA256, so clients cannot forge or tamper with positions.
+
+Usage:
+    @router.get("", response_model=CursorPage[ApplicationRead])
+    async def list_applications(
+        params: KeysetParams = Depends(get_keyset_params),
+        session: AsyncSession = Depends(get_read_db_session),
+    ) -> CursorPage[ApplicationRead]:
+        statement = select(Application).where(Application.user_id == user_id)
+        return await paginate(
+            session,
+            statement,
+            order_by=[Application.created_at.desc(), Application.id.desc()],
+            params=params,
+        )
+
+The ``order_by`` columns must be NOT NULL, must uniquely identify a row (end with
+the primary key) and should be backed by a matching composite index.
+"""
+
+import base64
+import hashlib
+import hmac
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any, Generic, TypeVar
+
+import orjson
+from fastapi import Query
+from pydantic import Field, TypeAdapter, ValidationError
+from sqlalchemy import ColumnElement, Select, and_, or_, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy.sql.operators import desc_op
+
+from .config import get_settings
+from .exceptions import BadRequest
+from .models import CustomBaseModel
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Truncated HMAC-SHA256; 128 bits is plenty to detect tampering
+CURSOR_SIGNATURE_BYTES = 16
+
+
+class InvalidCursor(BadRequest):
+    """Raised when a pagination cursor is malformed, tampered with or out of date."""
+
+    DETAIL = "Invalid pagination cursor"
+
+
+class KeysetParams(CustomBaseModel):
+    """Keyset pagination request parameters."""
+
+    limit: int = Field(
+        default=DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of items to return",
+    )
+    after: list[Any] | None = Field(
+        default=None,
+        description="Decoded sort key of the last item of the previous page",
+    )
+    order_fingerprint: str | None = Field(
+        default=None,
+        description="Fingerprint of the ordering the cursor was issued for",
+    )
+    include_total: bool = Field(
+        default=False,
+        description="Whether to include an estimated total row count",
+    )
+
+
+class CursorPage(CustomBaseModel, Generic[T]):
+    """A page of items with an opaque cursor to the next page."""
+
+    items: list[T] = Field(..., description="Items in this page")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page, or null if this is the last page",
+    )
+    has_more: bool = Field(..., description="Whether more items follow this page")
+    estimated_total: int | None = Field(
+        default=None,
+        description="Planner estimate of the total number of items (not an exact count)",
+    )
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    digest = hmac.new(get_settings().cursor_secret.encode(), payload, hashlib.sha256).digest()
+    return digest[:CURSOR_SIGNATURE_BYTES]
+
+
+def encode_cursor(values: Sequence[Any], fingerprint: str) -> str:
+    """
+    Encode a sort key into an opaque, signed cursor.
+
+    Args:
+        values: Sort key values of the last row in the page.
+        fingerprint: Fingerprint of the ordering (see ``order_fingerprint``).
+
+    Returns:
+        URL-safe cursor string.
+    """
+    payload = orjson.dumps({"k": list(values), "o": fingerprint}, default=str)
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(cursor: str) -> tuple[list[Any], str]:
+    """
+    Verify and decode a cursor.
+
+    Args:
+        cursor: Cursor produced by ``encode_cursor``.
+
+    Returns:
+        Tuple of (JSON sort key values, ordering fingerprint).
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or its signature does not match.
+    """
+    try:
+        encoded_payload, encoded_signature = cursor.split(".", 1)
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except ValueError as e:
+        raise InvalidCursor from e
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidCursor
+
+    try:
+        data = orjson.loads(payload)
+        return list(data["k"]), str(data["o"])
+    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+        raise InvalidCursor from e
+
+
+def get_keyset_params(
+    limit: int = Query(
+        default=DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of items to return",
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque cursor from the previous page's next_cursor",
+    ),
+    include_total: bool = Query(
+        default=False,
+        description="Include an estimated total row count (from planner statistics)",
+    ),
+) -> KeysetParams:
+    """
+    FastAPI dependency that parses keyset pagination query parameters.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or has been tampered with.
+    """
+    if cursor is None:
+        return KeysetParams(limit=limit, include_total=include_total)
+
+    after, fingerprint = decode_cursor(cursor)
+    return KeysetParams(
+        limit=limit,
+        after=after,
+        order_fingerprint=fingerprint,
+        include_total=include_total,
+    )
+
+
+def _split_order_by(
+    order_by: Sequence[ColumnElement[Any]],
+) -> list[tuple[ColumnElement[Any], bool]]:
+    """Split ``order_by`` expressions into (column, is_descending) pairs."""
+    keys = []
+    for expression in order_by:
+        if isinstance(expression, UnaryExpression) and expression.modifier is not None:
+            keys.append((expression.element, expression.modifier is desc_op))
+        else:
+            keys.append((expression, False))
+    return keys
+
+
+def order_fingerprint(order_by: Sequence[ColumnElement[Any]]) -> str:
+    """Short, stable fingerprint of an ordering, used to reject cursors from other sorts."""
+    description = ",".join(
+        f"{column}:{'desc' if is_desc else 'asc'}" for column, is_desc in _split_order_by(order_by)
+    )
+    return hashlib.sha256(description.encode()).hexdigest()[:12]
+
+
+@lru_cache(maxsize=64)
+def _type_adapter(python_type: type) -> TypeAdapter[Any]:
+    return TypeAdapter(python_type)
+
+
+def _coerce_key_value(column: ColumnElement[Any], value: Any) -> Any:
+    """Convert a JSON-decoded cursor value back to the column's Python type."""
+    if value is None:
+        return None
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    try:
+        return _type_adapter(python_type).validate_python(value)
+    except ValidationError as e:
+        raise InvalidCursor from e
+
+
+def _keyset_condition(
+    keys: list[tuple[ColumnElement[Any], bool]],
+    values: list[Any],
+) -> ColumnElement[bool]:
+    """Build the WHERE condition selecting rows after the given sort key."""
+    directions = {is_desc for _, is_desc in keys}
+    columns = [column for column, _ in keys]
+
+    # Same direction on every key: a row-value comparison the planner can turn
+    # into a single index range scan.
+    if len(directions) == 1:
+        if directions == {True}:
+            return tuple_(*columns) < tuple_(*values)
+        return tuple_(*columns) > tuple_(*values)
+
+    # Mixed directions: (a > x) OR (a = x AND b < y) OR ...
+    clauses = []
+    for index, (column, is_desc) in enumerate(keys):
+        equal_prefix = [columns[i] == values[i] for i in range(index)]
+        comparison = column < values[index] if is_desc else column > values[index]
+        clauses.append(and_(*equal_prefix, comparison))
+    return or_(*clauses)
+
+
+async def estimate_total(session: AsyncSession, statement: Select[Any]) -> int | None:
+    """
+    Estimate the number of rows a select returns without running COUNT(*).
+
+    Unfiltered single-table selects read ``pg_class.reltuples``; anything else
+    uses the planner's row estimate from ``EXPLAIN``. Both depend on up-to-date
+    statistics (autovacuum/ANALYZE) and are approximate by design.
+
+    Returns:
+        Estimated row count, or None if the table has never been analyzed.
+    """
+    froms = statement.get_final_froms()
+    table_name = getattr(froms[0], "fullname", None) if len(froms) == 1 else None
+    if table_name is not None and statement.whereclause is None:
+        result = await session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": table_name},
+        )
+        estimate = result.scalar_one_or_none()
+        return estimate if estimate is not None and estimate >= 0 else None
+
+    connection = await session.connection()
+    compiled = statement.compile(dialect=connection.dialect)
+    parameters = tuple(compiled.params[name] for name in compiled.positiontup or ())
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", parameters)
+    plan = result.scalar_one()
+    if isinstance(plan, str | bytes):
+        plan = orjson.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def paginate(
+    session: AsyncSession,
+    statement: Select[Any],
+    order_by: Sequence[ColumnElement[Any]],
+    params: KeysetParams,
+) -> CursorPage[Any]:
+    """
+    Fetch one page of a select using keyset pagination.
+
+    Args:
+        session: Database session.
+        statement: Select to paginate, with filters but without ordering/limit.
+        order_by: Sort expressions (columns, optionally ``.desc()``/``.asc()``).
+            Together they must uniquely identify a row, e.g. end with the primary key.
+        params: Parameters from ``get_keyset_params``.
+
+    Returns:
+        Page with the selected entities, or dicts keyed by column name for
+        multi-column selects.
+
+    Raises:
+        InvalidCursor: If the cursor was issued for a different ordering or its
+            values do not match the sort columns.
+    """
+    keys = _split_order_by(order_by)
+    fingerprint = order_fingerprint(order_by)
+    # Entities, not their columns: ``select(Model)`` yields one model per row
+    selected_count = len(statement.column_descriptions)
+
+    # Carry the sort key alongside each row so the next cursor can be built
+    # without knowing the shape of the selected entities.
+    paged = statement.add_columns(
+        *(column.label(f"_keyset_{index}") for index, (column, _) in enumerate(keys))
+    )
+
+    if params.after is not None:
+        if params.order_fingerprint != fingerprint or len(params.after) != len(keys):
+            raise InvalidCursor
+        values = [
+            _coerce_key_value(column, value)
+            for (column, _), value in zip(keys, params.after, strict=True)
+        ]
+        paged = paged.where(_keyset_condition(keys, values))
+
+    paged = paged.order_by(*order_by).limit(params.limit + 1)
+    rows = (await session.execute(paged)).all()
+
+    has_more = len(rows) > params.limit
+    rows = rows[: params.limit]
+    items = [
+        row[0]
+        if selected_count == 1
+        else dict(zip(row._fields, row[:selected_count], strict=False))
+        for row in rows
+    ]
+
+    next_cursor = None
+    if has_more and rows:
+        next_cursor = encode_cursor(rows[-1][selected_count:], fingerprint)
+
+    estimated_total = await estimate_total(session, statement) if params.include_total else None
+
+    return CursorPage(
+        items=items,
+        next_cursor=next_cursor,
+        has_more=has_more,
+        estimated_total=estimated_total,
+    )
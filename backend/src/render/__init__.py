@@ -0,0 +1,23 @@
+"""LaTeX-to-PDF rendering off the event loop, with back-pressure and a PDF cache."""
+
+from .cache import PdfCache, render_key
+from .config import RenderConfig, get_render_settings
+from .engine import LatexEngine
+from .exceptions import PdfNotFound, RenderFailed, RenderQueueFull, RenderTimeout
+from .service import RenderResult, RenderService, build_render_service, get_render_service
+
+__all__ = [
+    "LatexEngine",
+    "PdfCache",
+    "PdfNotFound",
+    "RenderConfig",
+    "RenderFailed",
+    "RenderQueueFull",
+    "RenderResult",
+    "RenderService",
+    "RenderTimeout",
+    "build_render_service",
+    "get_render_service",
+    "get_render_settings",
+    "render_key",
+]
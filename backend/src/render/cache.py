@@ -0,0 +1,112 @@
+"""
+Content-addressed PDF cache on local disk.
+
+A PDF is stored under the hash of everything that determines it (template,
+document source and engine), so an entry never goes stale and exporting an
+unchanged resume again is a file read. Files are written to a temporary name
+and renamed, so readers (other workers included) never see a partial PDF.
+Reads update the file's modification time, and pruning deletes the least
+recently used PDFs first.
+
+The methods do blocking file I/O; call them from a worker thread.
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from .constants import CACHE_PRUNE_RATIO
+
+logger = logging.getLogger(__name__)
+
+
+def render_key(template: str, tex: str, engine: str) -> str:
+    """Hash of a render's inputs (64 hex characters)."""
+    digest = hashlib.blake2b(digest_size=32)
+    for part in (template, engine, tex):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class PdfCache:
+    """PDFs keyed by ``render_key``, bounded in total size."""
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._size: int | None = None  # scanned on the first write
+        self._prune_lock = threading.Lock()
+
+    def path(self, key: str) -> Path:
+        # Two-level fan-out keeps directories small
+        return self.directory / key[:2] / f"{key}.pdf"
+
+    def get(self, key: str) -> bytes | None:
+        """The cached PDF, or None."""
+        path = self.path(key)
+        try:
+            pdf = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # Mark as recently used; the file may have been pruned meanwhile
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        return pdf
+
+    def set(self, key: str, pdf: bytes) -> None:
+        """Store a PDF, then prune if the cache outgrew its limit."""
+        if self.max_bytes == 0 or len(pdf) > self.max_bytes:
+            return
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        temporary = Path(name)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(pdf)
+            temporary.replace(path)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(pdf)
+        if self._size > self.max_bytes:
+            self.prune()
+
+    def prune(self) -> None:
+        """Delete the least recently used PDFs until the cache is well below its limit."""
+        with self._prune_lock:
+            files = []
+            for path in self.directory.glob("*/*.pdf"):
+                with contextlib.suppress(FileNotFoundError):
+                    stat = path.stat()
+                    files.append((stat.st_mtime, stat.st_size, path))
+            size = sum(file_size for _, file_size, _ in files)
+            target = self.max_bytes * CACHE_PRUNE_RATIO
+            files.sort()
+            removed = 0
+            for _, file_size, path in files:
+                if size <= target:
+                    break
+                with contextlib.suppress(FileNotFoundError):
+                    path.unlink()
+                    removed += 1
+                size -= file_size
+            self._size = size
+        if removed:
+            logger.info(f"Pruned {removed} PDFs from the render cache")
+
+    def _scan_size(self) -> int:
+        size = 0
+        for path in self.directory.glob("*/*.pdf"):
+            with contextlib.suppress(FileNotFoundError):
+                size += path.stat().st_size
+        return size
@@ -0,0 +1,59 @@
+"""LaTeX rendering configuration loaded from environment variables."""
+
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class RenderConfig(BaseSettings):
+    """LaTeX rendering configuration loaded from environment variables."""
+
+    # TeX engine executable (pdflatex, xelatex or lualatex)
+    latex_engine: str = Field(default="pdflatex", alias="LATEX_ENGINE")
+    # Engine processes running at the same time, per worker
+    render_workers: int = Field(
+        default_factory=lambda: min(4, os.cpu_count() or 1), ge=1, alias="RENDER_WORKERS"
+    )
+    # Renders waiting for an engine process; more are rejected with 429
+    render_queue_size: int = Field(default=16, ge=0, alias="RENDER_QUEUE_SIZE")
+    # Engine time per document (including building its format); the engine is killed after it
+    render_timeout_seconds: float = Field(default=30.0, gt=0, alias="RENDER_TIMEOUT_SECONDS")
+    # Retry-After sent with 429 responses
+    render_retry_after_seconds: int = Field(default=5, ge=1, alias="RENDER_RETRY_AFTER_SECONDS")
+
+    # PDFs by hash of (template, document) and preamble format files
+    render_cache_dir: Path = Field(
+        default=Path(tempfile.gettempdir()) / "resume-agent-render", alias="RENDER_CACHE_DIR"
+    )
+    # Total size of cached PDFs; the least recently used are deleted beyond it
+    render_cache_max_bytes: int = Field(
+        default=512 * 1024 * 1024, ge=0, alias="RENDER_CACHE_MAX_BYTES"
+    )
+    # Dump each preamble into a format file once and compile documents with it
+    render_preload_formats: bool = Field(default=True, alias="RENDER_PRELOAD_FORMATS")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_render_settings() -> RenderConfig:
+    """Get the global rendering configuration, loaded from the environment on first use."""
+    return RenderConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``render_settings`` is built on first access
+    if name == "render_settings":
+        return get_render_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -0,0 +1,37 @@
+"""Constants for LaTeX-to-PDF rendering."""
+
+# Name of the document inside each job's scratch directory
+DOCUMENT_NAME = "document"
+
+# Everything before this is the preamble, which is preloaded into a format file
+BEGIN_DOCUMENT = r"\begin{document}"
+
+# LaTeX package that dumps a document's preamble into a format file
+# (``&pdflatex mylatexformat.ltx document.tex``); a document compiled with that
+# format skips its preamble
+FORMAT_DUMPER = "mylatexformat.ltx"
+
+# Render keys (``render_key``): blake2b-256 hex digests
+RENDER_KEY_PATTERN = r"^[0-9a-f]{64}$"
+
+# Subdirectory of the render cache directory holding the format files
+FORMATS_DIRNAME = "formats"
+# Subdirectory of the render cache directory holding the PDFs
+PDFS_DIRNAME = "pdfs"
+# Subdirectory of the render cache directory holding the engines' scratch directories
+WORK_DIRNAME = "tmp"
+
+# Engine flags used for every run: never stop for input, stop at the first
+# error and never run shell commands from the document
+ENGINE_FLAGS = ("-interaction=nonstopmode", "-halt-on-error", "-no-shell-escape")
+
+# kpathsea settings for every run: documents may only read and write files
+# below the scratch directory (and the TeX distribution)
+ENGINE_ENVIRONMENT = {"openin_any": "p", "openout_any": "p"}
+
+# Lines of the engine log reported when a document does not compile
+LOG_TAIL_LINES = 20
+
+# When the PDF cache outgrows its limit, the least recently used PDFs are
+# deleted until it is this fraction of the limit
+CACHE_PRUNE_RATIO = 0.9
@@ -0,0 +1,220 @@
+"""
+TeX engine runs, off the event loop.
+
+Each document is compiled by a child engine process in its own scratch
+directory; the event loop only waits for the process, and file I/O runs in
+worker threads. A run that is cancelled (timeout, shutdown) kills the engine's
+whole process group.
+
+Preambles are the slow part of a LaTeX run (loading fonts and packages) and
+every resume of a template shares one. With ``preload_formats``, the first
+document with a given preamble dumps it into a format file (``mylatexformat``),
+and later documents start from that format and skip their preamble. Format
+files are named by the hash of the engine and preamble and kept next to the
+PDF cache, so they survive restarts and are shared by every worker.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import signal
+import tempfile
+from pathlib import Path
+
+from .constants import (
+    BEGIN_DOCUMENT,
+    DOCUMENT_NAME,
+    ENGINE_ENVIRONMENT,
+    ENGINE_FLAGS,
+    FORMAT_DUMPER,
+    LOG_TAIL_LINES,
+)
+from .exceptions import RenderFailed
+
+logger = logging.getLogger(__name__)
+
+
+class LatexEngine:
+    """Compiles LaTeX documents to PDF with a TeX engine executable."""
+
+    def __init__(
+        self,
+        command: str,
+        work_dir: Path,
+        format_dir: Path,
+        *,
+        preload_formats: bool = True,
+        format_timeout: float = 60.0,
+    ) -> None:
+        self.command = command
+        self._work_dir = work_dir
+        self._format_dir = format_dir
+        self._preload_formats = preload_formats
+        # Builds are shared by every waiting render, so they carry their own timeout
+        self._format_timeout = format_timeout
+        # Base format the preamble is dumped from (``&pdflatex``, ``&xelatex``, ...)
+        self._base_format = Path(command).stem
+        self._env = {
+            **os.environ,
+            **ENGINE_ENVIRONMENT,
+            # Trailing separator: then the distribution's own formats
+            "TEXFORMATS": f"{format_dir}{os.pathsep}",
+        }
+        self._format_builds: dict[str, asyncio.Task[bool]] = {}
+        # Preambles that could not be dumped; compiled in full from then on
+        self._unavailable_formats: set[str] = set()
+        self.formats_built = 0
+        self.format_hits = 0
+
+    async def compile(self, tex: str) -> bytes:
+        """
+        Compile a document to PDF.
+
+        Raises:
+            RenderFailed: If the engine reports an error or produces no PDF.
+        """
+        format_name = await self._format_for(tex)
+        if format_name is not None:
+            pdf = await self._compile(tex, format_name, report=False)
+            if pdf is not None:
+                self.format_hits += 1
+                return pdf
+            # The format may be stale (e.g. TeX distribution upgraded); a
+            # document that fails without it too is reported as failed below
+            pdf = await self._compile(tex, None, report=False)
+            if pdf is None:
+                raise RenderFailed
+            logger.warning(f"Format {format_name} failed where a full run worked; not using it")
+            self._unavailable_formats.add(format_name)
+            await asyncio.to_thread(self._discard_format, format_name)
+            return pdf
+
+        pdf = await self._compile(tex, None, report=True)
+        if pdf is None:
+            raise RenderFailed
+        return pdf
+
+    async def warm(self, tex: str) -> bool:
+        """Build the format file for a document's preamble ahead of its first render."""
+        return await self._format_for(tex) is not None
+
+    async def _format_for(self, tex: str) -> str | None:
+        if not self._preload_formats:
+            return None
+        end = tex.find(BEGIN_DOCUMENT)
+        if end < 0:
+            return None
+        name = self.format_name(tex[:end])
+        if name in self._unavailable_formats:
+            return None
+        if await asyncio.to_thread((self._format_dir / f"{name}.fmt").exists):
+            return name
+
+        task = self._format_builds.get(name)
+        if task is None:
+            task = asyncio.create_task(self._build_format(name, tex))
+            self._format_builds[name] = task
+            task.add_done_callback(lambda _: self._format_builds.pop(name, None))
+        # Shielded: one caller timing out must not abort the build for the others
+        return name if await asyncio.shield(task) else None
+
+    def format_name(self, preamble: str) -> str:
+        digest = hashlib.blake2b(f"{self.command}\0{preamble}".encode(), digest_size=12)
+        return f"preamble-{digest.hexdigest()}"
+
+    async def _build_format(self, name: str, tex: str) -> bool:
+        directory = await asyncio.to_thread(self._prepare, tex)
+        try:
+            async with asyncio.timeout(self._format_timeout):
+                returncode = await self._run(
+                    [
+                        self.command,
+                        "-ini",
+                        *ENGINE_FLAGS,
+                        f"-jobname={name}",
+                        f"&{self._base_format}",
+                        FORMAT_DUMPER,
+                        f"{DOCUMENT_NAME}.tex",
+                    ],
+                    directory,
+                )
+            built = directory / f"{name}.fmt"
+            if returncode != 0 or not await asyncio.to_thread(built.exists):
+                tail = await asyncio.to_thread(_log_tail, directory / f"{name}.log")
+                logger.warning(f"Could not build format {name}, compiling in full:\n{tail}")
+                self._unavailable_formats.add(name)
+                return False
+            await asyncio.to_thread(self._install_format, built)
+        except TimeoutError:
+            logger.warning(f"Building format {name} timed out, compiling in full")
+            return False
+        finally:
+            await asyncio.to_thread(shutil.rmtree, directory, True)
+        self.formats_built += 1
+        return True
+
+    async def _compile(self, tex: str, format_name: str | None, *, report: bool) -> bytes | None:
+        directory = await asyncio.to_thread(self._prepare, tex)
+        try:
+            arguments = [self.command, *ENGINE_FLAGS]
+            if format_name is not None:
+                arguments.append(f"-fmt={format_name}")
+            arguments.append(f"{DOCUMENT_NAME}.tex")
+            returncode = await self._run(arguments, directory)
+
+            pdf_path = directory / f"{DOCUMENT_NAME}.pdf"
+            if returncode == 0:
+                with contextlib.suppress(FileNotFoundError):
+                    return await asyncio.to_thread(pdf_path.read_bytes)
+            if report:
+                tail = await asyncio.to_thread(_log_tail, directory / f"{DOCUMENT_NAME}.log")
+                logger.warning(f"LaTeX document failed to compile (exit {returncode}):\n{tail}")
+            return None
+        finally:
+            await asyncio.to_thread(shutil.rmtree, directory, True)
+
+    async def _run(self, arguments: list[str], directory: Path) -> int:
+        process = await asyncio.create_subprocess_exec(
+            *arguments,
+            cwd=directory,
+            env=self._env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            # Own process group, so a kill also reaches anything the engine started
+            start_new_session=True,
+        )
+        try:
+            return await process.wait()
+        finally:
+            if process.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(process.pid, signal.SIGKILL)
+                await process.wait()
+
+    def _prepare(self, tex: str) -> Path:
+        # Scratch directories on the same filesystem as the formats, so a built
+        # format can be moved into place atomically
+        self._work_dir.mkdir(parents=True, exist_ok=True)
+        directory = Path(tempfile.mkdtemp(prefix="render-", dir=self._work_dir))
+        (directory / f"{DOCUMENT_NAME}.tex").write_text(tex, encoding="utf-8")
+        return directory
+
+    def _install_format(self, built: Path) -> None:
+        self._format_dir.mkdir(parents=True, exist_ok=True)
+        built.replace(self._format_dir / built.name)
+
+    def _discard_format(self, name: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            (self._format_dir / f"{name}.fmt").unlink()
+
+
+def _log_tail(path: Path) -> str:
+    try:
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except FileNotFoundError:
+        return "(no log)"
+    return "\n".join(lines[-LOG_TAIL_LINES:])
@@ -0,0 +1,35 @@
+"""LaTeX rendering exceptions."""
+
+from fastapi import status
+
+from ..exceptions import DetailedHTTPException, NotFound
+
+
+class RenderQueueFull(DetailedHTTPException):
+    """Raised when every engine process is busy and the render queue is full."""
+
+    STATUS_CODE = status.HTTP_429_TOO_MANY_REQUESTS
+    DETAIL = "Too many documents are being rendered, try again later"
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(headers={"Retry-After": str(retry_after)})
+
+
+class RenderTimeout(DetailedHTTPException):
+    """Raised when the TeX engine does not finish a document in time."""
+
+    STATUS_CODE = status.HTTP_504_GATEWAY_TIMEOUT
+    DETAIL = "Rendering the document timed out"
+
+
+class RenderFailed(DetailedHTTPException):
+    """Raised when the TeX engine cannot compile a document."""
+
+    STATUS_CODE = status.HTTP_422_UNPROCESSABLE_CONTENT
+    DETAIL = "The document could not be rendered"
+
+
+class PdfNotFound(NotFound):
+    """Raised when a PDF is not in the render cache (never rendered, or evicted)."""
+
+    DETAIL = "PDF not found"
@@ -0,0 +1,159 @@
+"""
+Bounded LaTeX-to-PDF rendering.
+
+At most ``RENDER_WORKERS`` engine processes run at a time per worker and at most
+``RENDER_QUEUE_SIZE`` renders wait for one; beyond that, requests are rejected
+with 429 right away instead of piling up behind minutes of queued work. Every
+run is limited to ``RENDER_TIMEOUT_SECONDS``, after which its engine is killed.
+
+PDFs are cached on disk by hash of (template, document, engine), and identical
+renders that arrive while one is running share it, so only the first export of
+a document reaches the queue.
+"""
+
+import asyncio
+import logging
+from functools import lru_cache
+
+from .cache import PdfCache, render_key
+from .config import RenderConfig, get_render_settings
+from .constants import FORMATS_DIRNAME, PDFS_DIRNAME, WORK_DIRNAME
+from .engine import LatexEngine
+from .exceptions import RenderQueueFull, RenderTimeout
+
+logger = logging.getLogger(__name__)
+
+
+class RenderResult:
+    """A rendered PDF."""
+
+    __slots__ = ("cached", "key", "pdf")
+
+    def __init__(self, key: str, pdf: bytes, cached: bool) -> None:
+        self.key = key  # content hash; usable as an ETag
+        self.pdf = pdf
+        self.cached = cached  # False only for the request that ran the engine
+
+
+class RenderService:
+    """Renders LaTeX documents to PDF with bounded concurrency, a queue limit and a cache."""
+
+    def __init__(self, engine: LatexEngine, cache: PdfCache, config: RenderConfig) -> None:
+        self.engine = engine
+        self._cache = cache
+        self._config = config
+        self._slots = asyncio.Semaphore(config.render_workers)
+        # Running plus waiting renders
+        self._capacity = config.render_workers + config.render_queue_size
+        self._admitted = 0
+        self._inflight: dict[str, asyncio.Task[bytes]] = {}
+        self.renders = 0  # engine runs that produced a PDF
+        self.hits = 0  # served from the disk cache
+        self.coalesced = 0  # joined an identical render in flight
+        self.rejected = 0  # 429
+        self.timeouts = 0
+
+    @property
+    def queued(self) -> int:
+        """Renders admitted and not finished (running or waiting)."""
+        return self._admitted
+
+    async def render(self, tex: str, *, template: str = "") -> RenderResult:
+        """
+        Render a LaTeX document to PDF, from the cache when possible.
+
+        Args:
+            tex: Complete LaTeX document.
+            template: Name and version of the template the document was
+                generated from; part of the cache key.
+
+        Returns:
+            The PDF and its cache key.
+
+        Raises:
+            RenderQueueFull: If the engines are busy and the queue is full.
+            RenderTimeout: If the engine ran out of time.
+            RenderFailed: If the document does not compile.
+        """
+        key = self.key(tex, template=template)
+        pdf = await asyncio.to_thread(self._cache.get, key)
+        if pdf is not None:
+            self.hits += 1
+            return RenderResult(key, pdf, cached=True)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return RenderResult(key, await asyncio.shield(task), cached=True)
+
+        if self._admitted >= self._capacity:
+            self.rejected += 1
+            raise RenderQueueFull(self._config.render_retry_after_seconds)
+        self._admitted += 1
+        task = asyncio.create_task(self._render(key, tex))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        # Shielded: a client that goes away must not cancel a render others wait on
+        return RenderResult(key, await asyncio.shield(task), cached=False)
+
+    async def cached(self, key: str) -> bytes | None:
+        """A PDF rendered earlier, or None if it never was or was evicted since."""
+        return await asyncio.to_thread(self._cache.get, key)
+
+    def key(self, tex: str, *, template: str = "") -> str:
+        """Cache key of a render, known before rendering (e.g. to answer If-None-Match)."""
+        return render_key(template, tex, self.engine.command)
+
+    async def warm(self, tex: str) -> bool:
+        """
+        Prepare the format file for a template's preamble before the first export.
+
+        Args:
+            tex: Any document generated from the template.
+
+        Returns:
+            Whether documents with this preamble are compiled from a format file.
+        """
+        return await self.engine.warm(tex)
+
+    def _forget(self, key: str, task: asyncio.Task[bytes]) -> None:
+        # Here rather than in _render, which never runs for a task cancelled
+        # before it started
+        self._admitted -= 1
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve a failure even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _render(self, key: str, tex: str) -> bytes:
+        async with self._slots:
+            try:
+                async with asyncio.timeout(self._config.render_timeout_seconds):
+                    pdf = await self.engine.compile(tex)
+            except TimeoutError:
+                self.timeouts += 1
+                logger.warning(f"Render {key} killed after {self._config.render_timeout_seconds} s")
+                raise RenderTimeout from None
+        self.renders += 1
+        await asyncio.to_thread(self._cache.set, key, pdf)
+        return pdf
+
+
+def build_render_service(config: RenderConfig) -> RenderService:
+    """Create a render service with its engine and cache below ``RENDER_CACHE_DIR``."""
+    engine = LatexEngine(
+        config.latex_engine,
+        config.render_cache_dir / WORK_DIRNAME,
+        config.render_cache_dir / FORMATS_DIRNAME,
+        preload_formats=config.render_preload_formats,
+        format_timeout=config.render_timeout_seconds,
+    )
+    cache = PdfCache(config.render_cache_dir / PDFS_DIRNAME, config.render_cache_max_bytes)
+    return RenderService(engine, cache, config)
+
+
+@lru_cache
+def get_render_service() -> RenderService:
+    """Get the process-wide render service."""
+    return build_render_service(get_render_settings())
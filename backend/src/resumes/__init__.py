@@ -0,0 +1,41 @@
+"""Resume versions stored as snapshots plus section-level deltas, with diffs."""
+
+from .config import ResumesConfig, get_resumes_settings
+from .constants import LineChange, SectionStatus, VersionKind
+from .delta import apply_delta, compute_delta
+from .diff import diff_sections
+from .models import Resume, ResumeDiff, ResumeVersion
+from .router import router
+from .schemas import (
+    DiffRow,
+    ResumeCreate,
+    ResumeDiffRead,
+    ResumeRead,
+    ResumeVersionCreate,
+    ResumeVersionDetail,
+    ResumeVersionRead,
+    SectionDiff,
+)
+
+__all__ = [
+    "DiffRow",
+    "LineChange",
+    "Resume",
+    "ResumeCreate",
+    "ResumeDiff",
+    "ResumeDiffRead",
+    "ResumeRead",
+    "ResumeVersion",
+    "ResumeVersionCreate",
+    "ResumeVersionDetail",
+    "ResumeVersionRead",
+    "ResumesConfig",
+    "SectionDiff",
+    "SectionStatus",
+    "VersionKind",
+    "apply_delta",
+    "compute_delta",
+    "diff_sections",
+    "get_resumes_settings",
+    "router",
+]
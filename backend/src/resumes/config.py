@@ -0,0 +1,36 @@
+"""Resume versioning configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ResumesConfig(BaseSettings):
+    """Resume versioning configuration loaded from environment variables."""
+
+    # Every Nth version is stored in full; the others as deltas, so reading a
+    # version applies at most N - 1 deltas
+    resume_snapshot_interval: int = Field(default=20, ge=1, alias="RESUME_SNAPSHOT_INTERVAL")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_resumes_settings() -> ResumesConfig:
+    """Get the global resume versioning configuration, loaded from the environment on first use."""
+    return ResumesConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``resumes_settings`` is built on first access
+    if name == "resumes_settings":
+        return get_resumes_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -0,0 +1,38 @@
+"""Constants for resume versioning."""
+
+from enum import Enum
+
+
+class VersionKind(str, Enum):
+    """How a resume version is stored."""
+
+    SNAPSHOT = "snapshot"  # every section
+    DELTA = "delta"  # section-level changes from the previous version
+
+
+class SectionStatus(str, Enum):
+    """How a section changed between two versions."""
+
+    UNCHANGED = "unchanged"
+    MODIFIED = "modified"
+    ADDED = "added"
+    REMOVED = "removed"
+
+
+class LineChange(str, Enum):
+    """How a line of a modified section changed (one side-by-side row)."""
+
+    EQUAL = "equal"
+    REPLACE = "replace"
+    INSERT = "insert"
+    DELETE = "delete"
+
+
+NAME_MAX_LENGTH = 255
+MESSAGE_MAX_LENGTH = 255
+
+# Delta operations: [KEEP, n] keeps the next n sections of the previous version,
+# [DELETE, n] drops them and [INSERT, [section, ...]] adds sections
+KEEP = "="
+DELETE = "-"
+INSERT = "+"
@@ -0,0 +1,85 @@
+"""
+Section-level deltas between resume versions.
+
+Sections are compared exactly (kind, title and content), so a delta keeps
+runs of unchanged sections by count and only spells out the sections that were
+added or edited: an edited bullet costs one section, whatever the size of the
+resume. Any edit counts, down to whitespace, so a version reads back exactly as
+it was saved. Applying a delta takes time proportional to its operations plus
+the sections copied.
+"""
+
+from collections.abc import Sequence
+from difflib import SequenceMatcher
+from typing import Any
+
+from ..tailoring.constants import SectionKind
+from ..tailoring.utils import hash_section
+from .constants import DELETE, INSERT, KEEP
+
+# A section as stored: {"kind", "title", "content"}
+Section = dict[str, Any]
+Delta = list[list[Any]]
+
+
+def section_hashes(sections: Sequence[Section]) -> list[str]:
+    """
+    Content hash of each section (whitespace-only edits do not count).
+
+    For diffs shown to users only: a delta must keep every edit (see
+    ``compute_delta``).
+    """
+    return [
+        hash_section(SectionKind(section["kind"]), section["title"], section["content"])
+        for section in sections
+    ]
+
+
+def _section_keys(sections: Sequence[Section]) -> list[tuple[str, str, str]]:
+    # Exact: compared as saved, without any normalization
+    return [(section["kind"], section["title"], section["content"]) for section in sections]
+
+
+def compute_delta(old: Sequence[Section], new: Sequence[Section]) -> Delta:
+    """
+    Operations turning the ``old`` sections into the ``new`` ones.
+
+    Example:
+        >>> a = {"kind": "summary", "title": "", "content": "A"}
+        >>> b = {"kind": "skills", "title": "Skills", "content": "- SQL"}
+        >>> c = {"kind": "skills", "title": "Skills", "content": "- SQL\\n- Go"}
+        >>> compute_delta([a, b], [a, c])
+        [['=', 1], ['-', 1], ['+', [{'kind': 'skills', 'title': 'Skills', 'content': '- SQL\\n- Go'}]]]
+        >>> indented = {**b, "content": "    - SQL"}
+        >>> apply_delta([a, b], compute_delta([a, b], [a, indented])) == [a, indented]
+        True
+    """
+    matcher = SequenceMatcher(None, _section_keys(old), _section_keys(new), autojunk=False)
+    delta: Delta = []
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag == "equal":
+            delta.append([KEEP, old_end - old_start])
+            continue
+        if old_end > old_start:
+            delta.append([DELETE, old_end - old_start])
+        if new_end > new_start:
+            delta.append([INSERT, list(new[new_start:new_end])])
+    return delta
+
+
+def apply_delta(old: Sequence[Section], delta: Delta) -> list[Section]:
+    """The sections of the next version, from the previous ones and their delta."""
+    sections: list[Section] = []
+    position = 0
+    for operation, argument in delta:
+        if operation == KEEP:
+            sections.extend(old[position : position + argument])
+            position += argument
+        elif operation == DELETE:
+            position += argument
+        elif operation == INSERT:
+            sections.extend(argument)
+        else:
+            message = f"Unknown delta operation {operation!r}"
+            raise ValueError(message)
+    return sections
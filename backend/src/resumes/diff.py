@@ -0,0 +1,93 @@
+"""
+Side-by-side diffs between resume versions.
+
+Sections are matched by content hash first, so unchanged sections cost nothing
+and carry no lines. Among the rest, a removed and an added section of the same
+kind and title are paired as one modified section, and only those are diffed
+line by line, as rows with the old line on the left and the new on the right.
+"""
+
+from collections.abc import Sequence
+from difflib import SequenceMatcher
+from itertools import zip_longest
+from typing import Any
+
+from .constants import LineChange, SectionStatus
+from .delta import Section, section_hashes
+
+
+def _lines(section: Section) -> list[str]:
+    return section["content"].splitlines()
+
+
+def _rows(old: Section, new: Section) -> list[dict[str, Any]]:
+    left, right = _lines(old), _lines(new)
+    rows = []
+    matcher = SequenceMatcher(None, left, right, autojunk=False)
+    for tag, left_start, left_end, right_start, right_end in matcher.get_opcodes():
+        pairs = zip_longest(left[left_start:left_end], right[right_start:right_end])
+        rows.extend(
+            {"change": LineChange(tag).value, "left": left_line, "right": right_line}
+            for left_line, right_line in pairs
+        )
+    return rows
+
+
+def _entry(status: SectionStatus, section: Section, rows: list[Any]) -> dict[str, Any]:
+    return {
+        "status": status.value,
+        "kind": section["kind"],
+        "title": section["title"],
+        "rows": rows,
+    }
+
+
+def diff_sections(old: Sequence[Section], new: Sequence[Section]) -> dict[str, Any]:
+    """
+    Side-by-side diff of two versions' sections, in the new version's order.
+
+    Returns:
+        ``{"sections": [...], "added", "removed", "modified", "unchanged"}``;
+        each section has a status, kind, title and, unless unchanged, rows of
+        ``{"change", "left", "right"}`` (a side is None where a line only
+        exists on the other one). Removed sections come where they were.
+    """
+    matcher = SequenceMatcher(None, section_hashes(old), section_hashes(new), autojunk=False)
+    sections = []
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag == "equal":
+            sections.extend(
+                _entry(SectionStatus.UNCHANGED, section, []) for section in new[new_start:new_end]
+            )
+            continue
+        removed = list(old[old_start:old_end])
+        for section in new[new_start:new_end]:
+            partner = next(
+                (
+                    candidate
+                    for candidate in removed
+                    if (candidate["kind"], candidate["title"])
+                    == (section["kind"], section["title"])
+                ),
+                None,
+            )
+            if partner is None:
+                rows = [
+                    {"change": LineChange.INSERT.value, "left": None, "right": line}
+                    for line in _lines(section)
+                ]
+                sections.append(_entry(SectionStatus.ADDED, section, rows))
+            else:
+                removed.remove(partner)
+                sections.append(_entry(SectionStatus.MODIFIED, section, _rows(partner, section)))
+        for section in removed:
+            rows = [
+                {"change": LineChange.DELETE.value, "left": line, "right": None}
+                for line in _lines(section)
+            ]
+            sections.append(_entry(SectionStatus.REMOVED, section, rows))
+
+    counts = {status.value: 0 for status in SectionStatus}
+    for section in sections:
+        counts[section["status"]] += 1
+    return {"sections": sections, **counts}
@@ -0,0 +1,15 @@
+"""Resume versioning exceptions."""
+
+from ..exceptions import NotFound
+
+
+class ResumeNotFound(NotFound):
+    """Raised when a resume does not exist or belongs to another user."""
+
+    DETAIL = "Resume not found"
+
+
+class ResumeVersionNotFound(NotFound):
+    """Raised when a resume has no such version."""
+
+    DETAIL = "Resume version not found"
@@ -0,0 +1,80 @@
+"""Resume versioning database models."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, SmallInteger, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+from .constants import MESSAGE_MAX_LENGTH, NAME_MAX_LENGTH, VersionKind
+
+
+class Resume(SQLModel, table=True):
+    """A user's resume; its content lives in its versions."""
+
+    __tablename__ = "resume"
+    __table_args__ = (
+        # A user's resumes in id order
+        Index("resume_user_id_id_idx", "user_id", "id"),
+    )
+
+    id: int | None = Field(default=None, sa_column=Column(BigInteger, primary_key=True))
+    user_id: int = Field(sa_column=Column(Integer, nullable=False))
+    name: str = Field(sa_column=Column(String(NAME_MAX_LENGTH), nullable=False))
+    latest_version: int = Field(sa_column=Column(Integer, nullable=False))
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
+
+
+class ResumeVersion(SQLModel, table=True):
+    """
+    One version of a resume: a full snapshot, or a delta from the previous one.
+
+    Every ``RESUME_SNAPSHOT_INTERVAL``-th version (starting with the first) is a
+    snapshot; a version is read from the snapshot at or below it plus the
+    deltas after that, all in one primary key range scan.
+    """
+
+    __tablename__ = "resume_version"
+
+    resume_id: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    version: int = Field(sa_column=Column(Integer, primary_key=True))
+    kind: VersionKind = Field(sa_column=Column(String(16), nullable=False))
+    # Snapshot: the sections; delta: the operations (see delta.py)
+    payload: Any = Field(sa_column=Column(JSONB, nullable=False))
+    section_count: int = Field(sa_column=Column(SmallInteger, nullable=False))
+    message: str | None = Field(
+        default=None, sa_column=Column(String(MESSAGE_MAX_LENGTH), nullable=True)
+    )
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
+
+
+class ResumeDiff(SQLModel, table=True):
+    """
+    Side-by-side diff between two versions of a resume.
+
+    The diff from each version to the next is computed when the version is
+    saved; diffs between other versions are computed on first request. Versions
+    never change, so neither do their diffs.
+    """
+
+    __tablename__ = "resume_diff"
+
+    resume_id: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    from_version: int = Field(sa_column=Column(Integer, primary_key=True))
+    to_version: int = Field(sa_column=Column(Integer, primary_key=True))
+    diff: dict[str, Any] = Field(sa_column=Column(JSONB, nullable=False))
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
@@ -0,0 +1,279 @@
+"""Resume versioning endpoints."""
+
+from fastapi import APIRouter, Depends, Path, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..auth import parse_jwt_data
+from ..auth.schemas import JWTData
+from ..cache.routing import etag_matches
+from ..database import get_db_session, get_read_db_session
+from ..pagination import CursorPage, KeysetParams, get_keyset_params, paginate
+from ..render import get_render_service
+from ..tailoring.latex import TEMPLATE
+from .config import get_resumes_settings
+from .schemas import (
+    ResumeCreate,
+    ResumeDiffRead,
+    ResumeRead,
+    ResumeVersionCreate,
+    ResumeVersionDetail,
+    ResumeVersionRead,
+)
+from .service import (
+    add_version,
+    create_resume,
+    get_diff,
+    get_resume,
+    get_version,
+    version_latex,
+    versions_statement,
+)
+
+router = APIRouter(prefix="/resumes", tags=["resumes"])
+
+_NOT_FOUND = {
+    "description": "The resume or version does not exist",
+    "content": {"application/json": {"example": {"detail": "Resume not found"}}},
+}
+
+
+@router.post(
+    "",
+    response_model=ResumeRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create a resume",
+    description="Creates a resume; its sections are saved as version 1.",
+    responses={
+        201: {
+            "description": "The new resume",
+            "content": {
+                "application/json": {
+                    "example": ResumeRead.model_config["json_schema_extra"]["example"]
+                }
+            },
+        }
+    },
+)
+async def create_resume_endpoint(
+    resume: ResumeCreate,
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_db_session),
+) -> ResumeRead:
+    """
+    Resume creation endpoint.
+
+    Two INSERTs: the resume and its first snapshot.
+    """
+    return await create_resume(session, jwt_data.user_id, resume)
+
+
+@router.post(
+    "/{resume_id}/versions",
+    response_model=ResumeVersionRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Save a resume version",
+    description=(
+        "Saves every section of the resume as its next version. Only the sections "
+        "that changed since the previous version are stored, and the diff from the "
+        "previous version is ready as soon as this returns."
+    ),
+    responses={
+        201: {
+            "description": "The new version",
+            "content": {
+                "application/json": {
+                    "example": ResumeVersionRead.model_config["json_schema_extra"]["example"]
+                }
+            },
+        },
+        404: _NOT_FOUND,
+    },
+)
+async def add_version_endpoint(
+    version: ResumeVersionCreate,
+    resume_id: int = Path(..., description="Resume ID"),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_db_session),
+) -> ResumeVersionRead:
+    """
+    Version creation endpoint.
+
+    Locks the resume row, so concurrent saves get consecutive version numbers.
+    """
+    return await add_version(session, jwt_data.user_id, resume_id, version, get_resumes_settings())
+
+
+@router.get(
+    "/{resume_id}/versions",
+    response_model=CursorPage[ResumeVersionRead],
+    status_code=status.HTTP_200_OK,
+    summary="List resume versions",
+    description="Lists the versions of a resume, newest first, without their content.",
+    responses={
+        200: {
+            "description": "A page of versions",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "items": [ResumeVersionRead.model_config["json_schema_extra"]["example"]],
+                        "next_cursor": None,
+                        "has_more": False,
+                        "estimated_total": None,
+                    }
+                }
+            },
+        },
+        404: _NOT_FOUND,
+    },
+)
+async def list_versions(
+    resume_id: int = Path(..., description="Resume ID"),
+    params: KeysetParams = Depends(get_keyset_params),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> CursorPage[ResumeVersionRead]:
+    """
+    Version list endpoint.
+
+    Keyset-paginated on the (resume_id, version) primary key.
+    """
+    await get_resume(session, jwt_data.user_id, resume_id)
+    statement, order_by = versions_statement(resume_id)
+    return await paginate(session, statement, order_by=order_by, params=params)
+
+
+@router.get(
+    "/{resume_id}/versions/{version}",
+    response_model=ResumeVersionDetail,
+    status_code=status.HTTP_200_OK,
+    summary="Get a resume version",
+    description="Returns a version of a resume with all of its sections.",
+    responses={
+        200: {
+            "description": "The version",
+            "content": {
+                "application/json": {
+                    "example": ResumeVersionDetail.model_config["json_schema_extra"]["example"]
+                }
+            },
+        },
+        404: _NOT_FOUND,
+    },
+)
+async def get_version_endpoint(
+    resume_id: int = Path(..., description="Resume ID"),
+    version: int = Path(..., ge=1, description="Version number"),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> ResumeVersionDetail:
+    """
+    Version endpoint.
+
+    Reads the nearest snapshot and the deltas after it in one range scan.
+    """
+    return await get_version(session, jwt_data.user_id, resume_id, version)
+
+
+@router.get(
+    "/{resume_id}/versions/{version}/pdf",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="Export a resume version as PDF",
+    description=(
+        "Renders a version of a resume to PDF with the tailored resume template. PDFs "
+        "are cached by content, so exporting an unchanged document again is served "
+        "from the cache; send the ETag back in If-None-Match to get 304 instead. When "
+        "too many documents are being rendered, the request is rejected with 429 and "
+        "Retry-After."
+    ),
+    responses={
+        200: {"description": "The PDF", "content": {"application/pdf": {}}},
+        304: {"description": "The PDF has not changed"},
+        404: _NOT_FOUND,
+        422: {
+            "description": "The document could not be rendered",
+            "content": {
+                "application/json": {"example": {"detail": "The document could not be rendered"}}
+            },
+        },
+        429: {
+            "description": "Too many documents are being rendered",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Too many documents are being rendered, try again later"}
+                }
+            },
+        },
+        504: {
+            "description": "Rendering timed out",
+            "content": {
+                "application/json": {"example": {"detail": "Rendering the document timed out"}}
+            },
+        },
+    },
+)
+async def export_version_pdf(
+    request: Request,
+    resume_id: int = Path(..., description="Resume ID"),
+    version: int = Path(..., ge=1, description="Version number"),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """
+    Version PDF endpoint.
+
+    Releases the database connection before rendering, and skips rendering
+    altogether when the client already has the PDF.
+    """
+    tex = await version_latex(session, jwt_data.user_id, resume_id, version)
+    await session.close()
+    render_service = get_render_service()
+    headers = {
+        "ETag": f'"{render_service.key(tex, template=TEMPLATE)}"',
+        "Content-Disposition": f'inline; filename="resume-{resume_id}-v{version}.pdf"',
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    result = await render_service.render(tex, template=TEMPLATE)
+    return Response(content=result.pdf, media_type="application/pdf", headers=headers)
+
+
+@router.get(
+    "/{resume_id}/diff",
+    response_model=ResumeDiffRead,
+    status_code=status.HTTP_200_OK,
+    summary="Compare resume versions",
+    description=(
+        "Side-by-side diff between two versions of a resume: each section is "
+        "unchanged, modified, added or removed, and modified sections are compared "
+        "line by line. By default the latest version is compared with the one before."
+    ),
+    responses={
+        200: {
+            "description": "The diff",
+            "content": {
+                "application/json": {
+                    "example": ResumeDiffRead.model_config["json_schema_extra"]["example"]
+                }
+            },
+        },
+        404: _NOT_FOUND,
+    },
+)
+async def get_diff_endpoint(
+    resume_id: int = Path(..., description="Resume ID"),
+    from_version: int | None = Query(
+        None, ge=1, description="Old version; by default the one before to_version"
+    ),
+    to_version: int | None = Query(None, ge=1, description="New version; by default the latest"),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_db_session),
+) -> ResumeDiffRead:
+    """
+    Diff endpoint.
+
+    Diffs between consecutive versions are stored when the newer one is saved;
+    others are computed and stored on first request. Either way, a primary key
+    lookup from then on.
+    """
+    return await get_diff(session, jwt_data.user_id, resume_id, from_version, to_version)
@@ -0,0 +1,167 @@
+"""Resume versioning request and response models."""
+
+from pydantic import ConfigDict, Field
+
+from ..models import CustomBaseModel, UTCDatetime
+from ..tailoring.constants import MAX_SECTIONS, SectionKind
+from ..tailoring.schemas import ResumeSection
+from .constants import MESSAGE_MAX_LENGTH, NAME_MAX_LENGTH, LineChange, SectionStatus, VersionKind
+
+_SECTIONS_EXAMPLE = [
+    {"kind": "header", "title": "", "content": "Ada Lovelace\nada@example.com"},
+    {
+        "kind": "experience",
+        "title": "Experience",
+        "content": "Engineer, Acme (2020-2024)\n- Built billing services",
+    },
+]
+
+
+class ResumeVersionCreate(CustomBaseModel):
+    """The full content of a new resume version."""
+
+    sections: list[ResumeSection] = Field(..., min_length=1, max_length=MAX_SECTIONS)
+    message: str | None = Field(
+        default=None, max_length=MESSAGE_MAX_LENGTH, description="What changed"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {"sections": _SECTIONS_EXAMPLE, "message": "Tailored for Acme"}
+        }
+    )
+
+
+class ResumeCreate(ResumeVersionCreate):
+    """A new resume and its first version."""
+
+    name: str = Field(..., min_length=1, max_length=NAME_MAX_LENGTH, description="Resume name")
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"name": "Backend", "sections": _SECTIONS_EXAMPLE}}
+    )
+
+
+class ResumeRead(CustomBaseModel):
+    """A resume, without its content."""
+
+    id: int = Field(..., description="Resume ID")
+    name: str = Field(..., description="Resume name")
+    latest_version: int = Field(..., description="Number of the newest version")
+    created_at: UTCDatetime = Field(..., description="When the resume was created")
+    updated_at: UTCDatetime = Field(..., description="When the newest version was saved")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 7,
+                "name": "Backend",
+                "latest_version": 12,
+                "created_at": "2026-01-01T00:00:00Z",
+                "updated_at": "2026-02-01T00:00:00Z",
+            }
+        },
+    )
+
+
+class ResumeVersionRead(CustomBaseModel):
+    """A version of a resume, without its content."""
+
+    version: int = Field(..., description="Version number, from 1")
+    kind: VersionKind = Field(..., description="Stored as a snapshot or as a delta")
+    section_count: int = Field(..., description="Sections in this version")
+    message: str | None = Field(default=None, description="What changed")
+    created_at: UTCDatetime = Field(..., description="When the version was saved")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "version": 12,
+                "kind": "delta",
+                "section_count": 6,
+                "message": "Tailored for Acme",
+                "created_at": "2026-02-01T00:00:00Z",
+            }
+        },
+    )
+
+
+class ResumeVersionDetail(ResumeVersionRead):
+    """A version of a resume with its sections."""
+
+    sections: list[ResumeSection] = Field(..., description="Sections, in order")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                **ResumeVersionRead.model_config["json_schema_extra"]["example"],
+                "sections": _SECTIONS_EXAMPLE,
+            }
+        }
+    )
+
+
+class DiffRow(CustomBaseModel):
+    """One row of a side-by-side diff."""
+
+    change: LineChange = Field(..., description="How the line changed")
+    left: str | None = Field(default=None, description="Line in the old version")
+    right: str | None = Field(default=None, description="Line in the new version")
+
+
+class SectionDiff(CustomBaseModel):
+    """How one section changed."""
+
+    status: SectionStatus = Field(..., description="unchanged, modified, added or removed")
+    kind: SectionKind = Field(..., description="What the section holds")
+    title: str = Field(..., description="Heading")
+    rows: list[DiffRow] = Field(..., description="Side-by-side lines; empty when unchanged")
+
+
+class ResumeDiffRead(CustomBaseModel):
+    """Side-by-side diff between two versions of a resume."""
+
+    from_version: int = Field(..., description="Old version (left side)")
+    to_version: int = Field(..., description="New version (right side)")
+    added: int = Field(..., description="Sections only in the new version")
+    removed: int = Field(..., description="Sections only in the old version")
+    modified: int = Field(..., description="Sections edited between the versions")
+    unchanged: int = Field(..., description="Sections identical in both versions")
+    sections: list[SectionDiff] = Field(
+        ..., description="In the new version's order; removed sections where they were"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "from_version": 11,
+                "to_version": 12,
+                "added": 0,
+                "removed": 0,
+                "modified": 1,
+                "unchanged": 1,
+                "sections": [
+                    {"status": "unchanged", "kind": "header", "title": "", "rows": []},
+                    {
+                        "status": "modified",
+                        "kind": "experience",
+                        "title": "Experience",
+                        "rows": [
+                            {
+                                "change": "equal",
+                                "left": "Engineer, Acme (2020-2024)",
+                                "right": "Engineer, Acme (2020-2024)",
+                            },
+                            {
+                                "change": "replace",
+                                "left": "- Built billing services",
+                                "right": "- Built billing services in Python and Kafka",
+                            },
+                        ],
+                    },
+                ],
+            }
+        }
+    )
@@ -0,0 +1,361 @@
+"""
+Resume versions stored as periodic snapshots plus section-level deltas.
+
+Saving a version stores either every section (each
+``RESUME_SNAPSHOT_INTERVAL``-th version) or the delta from the previous
+version, which for a typical edit is one section. Reading version v fetches
+the latest snapshot at or below v and the deltas after it in one primary key
+range scan and applies them, so the work is bounded by the interval and the
+size of the changes, not by the number of versions.
+
+The diff from each version to the next is computed while saving it, when both
+versions are at hand; diffs between any other two versions are computed once,
+on first request. Diffs are stored, so serving one is a primary key lookup.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..tailoring.constants import SectionKind
+from ..tailoring.latex import resume_document, section_latex
+from .config import ResumesConfig
+from .constants import VersionKind
+from .delta import Section, apply_delta, compute_delta
+from .diff import diff_sections
+from .exceptions import ResumeNotFound, ResumeVersionNotFound
+from .models import Resume, ResumeDiff, ResumeVersion
+from .schemas import (
+    ResumeCreate,
+    ResumeDiffRead,
+    ResumeRead,
+    ResumeVersionCreate,
+    ResumeVersionDetail,
+    ResumeVersionRead,
+)
+
+_VERSION_COLUMNS = (
+    ResumeVersion.version,
+    ResumeVersion.kind,
+    ResumeVersion.section_count,
+    ResumeVersion.message,
+    ResumeVersion.created_at,
+)
+
+
+async def get_resume(
+    session: AsyncSession, user_id: int, resume_id: int, *, for_update: bool = False
+) -> Resume:
+    """
+    A user's resume.
+
+    Raises:
+        ResumeNotFound: If the resume does not exist or belongs to another user.
+    """
+    statement = select(Resume).where(Resume.id == resume_id, Resume.user_id == user_id)
+    if for_update:
+        # Serializes the versions saved to one resume
+        statement = statement.with_for_update()
+    resume = (await session.execute(statement)).scalar_one_or_none()
+    if resume is None:
+        raise ResumeNotFound
+    return resume
+
+
+async def read_sections(session: AsyncSession, resume_id: int, version: int) -> list[Section]:
+    """
+    Reconstruct the sections of a version.
+
+    Raises:
+        ResumeVersionNotFound: If the resume has no such version.
+    """
+    # The nearest snapshot: a backward scan of the primary key from the version
+    snapshot = (
+        select(func.max(ResumeVersion.version))
+        .where(
+            ResumeVersion.resume_id == resume_id,
+            ResumeVersion.version <= version,
+            ResumeVersion.kind == VersionKind.SNAPSHOT.value,
+        )
+        .scalar_subquery()
+    )
+    statement = (
+        select(ResumeVersion.kind, ResumeVersion.payload)
+        .where(
+            ResumeVersion.resume_id == resume_id,
+            ResumeVersion.version >= snapshot,
+            ResumeVersion.version <= version,
+        )
+        .order_by(ResumeVersion.version)
+    )
+    rows = (await session.execute(statement)).all()
+    if not rows:
+        raise ResumeVersionNotFound
+    (_, sections), *deltas = rows
+    for _, delta in deltas:
+        sections = apply_delta(sections, delta)
+    return sections
+
+
+async def read_latest_sections(
+    session: AsyncSession, resume_ids: Sequence[int]
+) -> dict[int, list[Section]]:
+    """
+    Reconstruct the latest version of several resumes in one query.
+
+    Like ``read_sections``, reads each resume's latest snapshot and the deltas
+    after it. Ids of no resume are left out.
+    """
+    snapshot = (
+        select(func.max(ResumeVersion.version))
+        .where(
+            ResumeVersion.resume_id == Resume.id,
+            ResumeVersion.version <= Resume.latest_version,
+            ResumeVersion.kind == VersionKind.SNAPSHOT.value,
+        )
+        .correlate(Resume)
+        .scalar_subquery()
+    )
+    statement = (
+        select(ResumeVersion.resume_id, ResumeVersion.kind, ResumeVersion.payload)
+        .join(Resume, Resume.id == ResumeVersion.resume_id)
+        .where(
+            Resume.id.in_(resume_ids),
+            ResumeVersion.version >= snapshot,
+            ResumeVersion.version <= Resume.latest_version,
+        )
+        .order_by(ResumeVersion.resume_id, ResumeVersion.version)
+    )
+    sections: dict[int, list[Section]] = {}
+    for resume_id, kind, payload in await session.execute(statement):
+        if kind == VersionKind.SNAPSHOT.value:
+            sections[resume_id] = payload
+        else:
+            sections[resume_id] = apply_delta(sections[resume_id], payload)
+    return sections
+
+
+async def read_all_sections(
+    session: AsyncSession, resume_ids: Sequence[int]
+) -> dict[int, list[list[Section]]]:
+    """Reconstruct every version of several resumes, oldest first, in one scan."""
+    statement = (
+        select(ResumeVersion.resume_id, ResumeVersion.kind, ResumeVersion.payload)
+        .where(ResumeVersion.resume_id.in_(resume_ids))
+        .order_by(ResumeVersion.resume_id, ResumeVersion.version)
+    )
+    versions: dict[int, list[list[Section]]] = {}
+    for resume_id, kind, payload in await session.execute(statement):
+        resume_versions = versions.setdefault(resume_id, [])
+        if kind == VersionKind.SNAPSHOT.value:
+            resume_versions.append(payload)
+        else:
+            resume_versions.append(apply_delta(resume_versions[-1], payload))
+    return versions
+
+
+async def _insert_version(
+    session: AsyncSession,
+    resume_id: int,
+    version: int,
+    sections: list[Section],
+    payload: Any,
+    message: str | None,
+    kind: VersionKind,
+) -> ResumeVersionRead:
+    result = await session.execute(
+        insert(ResumeVersion)
+        .values(
+            resume_id=resume_id,
+            version=version,
+            kind=kind.value,
+            payload=payload,
+            section_count=len(sections),
+            message=message,
+        )
+        .returning(*_VERSION_COLUMNS)
+    )
+    return ResumeVersionRead.model_validate(result.mappings().one())
+
+
+async def create_resume(session: AsyncSession, user_id: int, data: ResumeCreate) -> ResumeRead:
+    """
+    Create a resume with its first version (a snapshot).
+
+    Args:
+        session: Database session (committed by the request dependency).
+        user_id: Owner of the resume.
+        data: Name and sections.
+
+    Returns:
+        The new resume.
+    """
+    result = await session.execute(
+        insert(Resume)
+        .values(user_id=user_id, name=data.name, latest_version=1)
+        .returning(
+            Resume.id, Resume.name, Resume.latest_version, Resume.created_at, Resume.updated_at
+        )
+    )
+    resume = ResumeRead.model_validate(result.mappings().one())
+    sections = [section.model_dump(mode="json") for section in data.sections]
+    await _insert_version(
+        session, resume.id, 1, sections, sections, data.message, VersionKind.SNAPSHOT
+    )
+    return resume
+
+
+async def add_version(
+    session: AsyncSession,
+    user_id: int,
+    resume_id: int,
+    data: ResumeVersionCreate,
+    config: ResumesConfig,
+) -> ResumeVersionRead:
+    """
+    Save a new version of a resume, with its diff from the previous version.
+
+    Args:
+        session: Database session (committed by the request dependency).
+        user_id: Owner of the resume.
+        resume_id: The resume.
+        data: Every section of the new version.
+        config: Snapshot interval.
+
+    Returns:
+        The new version.
+
+    Raises:
+        ResumeNotFound: If the resume does not exist or belongs to another user.
+    """
+    resume = await get_resume(session, user_id, resume_id, for_update=True)
+    previous = await read_sections(session, resume_id, resume.latest_version)
+    sections = [section.model_dump(mode="json") for section in data.sections]
+    version = resume.latest_version + 1
+
+    if (version - 1) % config.resume_snapshot_interval == 0:
+        kind, payload = VersionKind.SNAPSHOT, sections
+    else:
+        kind, payload = VersionKind.DELTA, compute_delta(previous, sections)
+    read = await _insert_version(session, resume_id, version, sections, payload, data.message, kind)
+    await session.execute(
+        insert(ResumeDiff).values(
+            resume_id=resume_id,
+            from_version=version - 1,
+            to_version=version,
+            diff=diff_sections(previous, sections),
+        )
+    )
+    await session.execute(
+        update(Resume)
+        .where(Resume.id == resume_id)
+        .values(latest_version=version, updated_at=func.now())
+    )
+    return read
+
+
+def versions_statement(resume_id: int) -> tuple[Select[Any], list[ColumnElement[Any]]]:
+    """A resume's versions for ``paginate``, newest first."""
+    statement = select(*_VERSION_COLUMNS).where(ResumeVersion.resume_id == resume_id)
+    return statement, [ResumeVersion.version.desc()]
+
+
+async def get_version(
+    session: AsyncSession, user_id: int, resume_id: int, version: int
+) -> ResumeVersionDetail:
+    """
+    A version of a user's resume, with its sections.
+
+    Raises:
+        ResumeNotFound: If the resume does not exist or belongs to another user.
+        ResumeVersionNotFound: If the resume has no such version.
+    """
+    await get_resume(session, user_id, resume_id)
+    result = await session.execute(
+        select(*_VERSION_COLUMNS).where(
+            ResumeVersion.resume_id == resume_id, ResumeVersion.version == version
+        )
+    )
+    row = result.mappings().one_or_none()
+    if row is None:
+        raise ResumeVersionNotFound
+    sections = await read_sections(session, resume_id, version)
+    return ResumeVersionDetail.model_validate({**row, "sections": sections})
+
+
+async def version_latex(session: AsyncSession, user_id: int, resume_id: int, version: int) -> str:
+    """
+    LaTeX document of a version of a user's resume (the tailored resume template).
+
+    Raises:
+        ResumeNotFound: If the resume does not exist or belongs to another user.
+        ResumeVersionNotFound: If the resume has no such version.
+    """
+    resume = await get_resume(session, user_id, resume_id)
+    if version > resume.latest_version:
+        raise ResumeVersionNotFound
+    sections = await read_sections(session, resume_id, version)
+    return resume_document(
+        section_latex(SectionKind(section["kind"]), section["title"], section["content"])
+        for section in sections
+    )
+
+
+async def get_diff(
+    session: AsyncSession,
+    user_id: int,
+    resume_id: int,
+    from_version: int | None = None,
+    to_version: int | None = None,
+) -> ResumeDiffRead:
+    """
+    Side-by-side diff between two versions of a user's resume.
+
+    Args:
+        session: Database session (committed by the request dependency when
+            the diff was computed and stored).
+        user_id: Owner of the resume.
+        resume_id: The resume.
+        from_version: Old version; by default the one before ``to_version``.
+        to_version: New version; by default the latest.
+
+    Returns:
+        The diff; ``from_version`` may also be the newer version.
+
+    Raises:
+        ResumeNotFound: If the resume does not exist or belongs to another user.
+        ResumeVersionNotFound: If either version does not exist.
+    """
+    resume = await get_resume(session, user_id, resume_id)
+    to_version = resume.latest_version if to_version is None else to_version
+    from_version = max(to_version - 1, 1) if from_version is None else from_version
+    if not (
+        1 <= from_version <= resume.latest_version and 1 <= to_version <= resume.latest_version
+    ):
+        raise ResumeVersionNotFound
+
+    result = await session.execute(
+        select(ResumeDiff.diff).where(
+            ResumeDiff.resume_id == resume_id,
+            ResumeDiff.from_version == from_version,
+            ResumeDiff.to_version == to_version,
+        )
+    )
+    diff = result.scalar_one_or_none()
+    if diff is None:
+        old = await read_sections(session, resume_id, from_version)
+        new = await read_sections(session, resume_id, to_version)
+        diff = diff_sections(old, new)
+        await session.execute(
+            pg_insert(ResumeDiff)
+            .values(
+                resume_id=resume_id, from_version=from_version, to_version=to_version, diff=diff
+            )
+            .on_conflict_do_nothing()
+        )
+    return ResumeDiffRead.model_validate(
+        {**diff, "from_version": from_version, "to_version": to_version}
+    )
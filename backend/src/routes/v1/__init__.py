@@ -2,10 +2,30 @@
 
 from fastapi import APIRouter
 
+from src.analytics import router as analytics_router
+from src.applications import router as applications_router
+from src.ats import router as ats_router
+from src.auth import router as auth_router
+from src.embeddings import router as embeddings_router
 from src.health import router as health_router
+from src.jobs import router as jobs_router
+from src.resumes import router as resumes_router
+from src.search import router as search_router
+from src.skills import router as skills_router
+from src.tailoring import router as tailoring_router
 
 # Create the main v1 router
 router = APIRouter(prefix="/v1", tags=["v1"])
 
 # Include all v1 sub-routers
 router.include_router(health_router)
+router.include_router(auth_router)
+router.include_router(skills_router)
+router.include_router(jobs_router)
+router.include_router(applications_router)
+router.include_router(search_router)
+router.include_router(embeddings_router)
+router.include_router(resumes_router)
+router.include_router(tailoring_router)
+router.include_router(ats_router)
+router.include_router(analytics_router)
@@ -0,0 +1,21 @@
+"""Full-text and fuzzy search over saved job descriptions and tailored resumes."""
+
+from .config import SearchConfig, get_search_settings
+from .constants import DocumentKind
+from .models import SearchDocument
+from .router import router
+from .schemas import SearchDocumentCreate, SearchDocumentRead, SearchHit
+from .service import save_document, search_statement
+
+__all__ = [
+    "DocumentKind",
+    "SearchConfig",
+    "SearchDocument",
+    "SearchDocumentCreate",
+    "SearchDocumentRead",
+    "SearchHit",
+    "get_search_settings",
+    "router",
+    "save_document",
+    "search_statement",
+]
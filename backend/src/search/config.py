@@ -0,0 +1,38 @@
+"""Search configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class SearchConfig(BaseSettings):
+    """Search configuration loaded from environment variables."""
+
+    # Highlights: up to this many excerpts of the body, of this many words each
+    search_highlight_max_fragments: int = Field(
+        default=2, ge=0, alias="SEARCH_HIGHLIGHT_MAX_FRAGMENTS"
+    )
+    search_highlight_max_words: int = Field(default=30, ge=2, alias="SEARCH_HIGHLIGHT_MAX_WORDS")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_search_settings() -> SearchConfig:
+    """Get the global search configuration, loaded from the environment on first use."""
+    return SearchConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``search_settings`` is built on first access
+    if name == "search_settings":
+        return get_search_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
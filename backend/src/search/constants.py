@@ -0,0 +1,22 @@
+"""Constants for document search."""
+
+from enum import Enum
+
+
+class DocumentKind(str, Enum):
+    """What a searchable document is."""
+
+    JOB_DESCRIPTION = "job_description"
+    RESUME = "resume"  # a tailored resume
+
+
+# Text search configuration: English stemming and stop words
+TEXT_SEARCH_CONFIG = "english"
+
+TITLE_MAX_LENGTH = 255
+# A tsvector holds at most 1 MB of lexemes; resumes and postings are far smaller
+BODY_MAX_LENGTH = 100_000
+
+# Wrapped around matched words in highlights
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
@@ -0,0 +1,91 @@
+"""Searchable document database models."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Computed,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlmodel import Field, SQLModel
+
+from .constants import TEXT_SEARCH_CONFIG, TITLE_MAX_LENGTH, DocumentKind
+
+# Title and company outrank the body (weight A vs B). Postgres keeps the column
+# up to date on every insert and update.
+_SEARCH_VECTOR = " || ".join(
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}'::regconfig, {source}), '{weight}')"
+    for source, weight in (
+        ("coalesce(title, '')", "A"),
+        ("coalesce(company, '')", "A"),
+        ("body", "B"),
+    )
+)
+
+
+class SearchDocument(SQLModel, table=True):
+    """
+    A saved job description or tailored resume, indexed for search.
+
+    Every index leads with ``user_id`` (GIN over an integer needs the
+    ``btree_gin`` extension), so a search only visits the user's own entries
+    however many documents other users have.
+    """
+
+    __tablename__ = "search_document"
+    __table_args__ = (
+        # Full-text search
+        Index(
+            "search_document_user_id_search_vector_idx",
+            "user_id",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        # Fuzzy and substring company matches (pg_trgm)
+        Index(
+            "search_document_user_id_company_idx",
+            "user_id",
+            "company",
+            postgresql_using="gin",
+            postgresql_ops={"company": "gin_trgm_ops"},
+        ),
+        # A user's job descriptions by content (skill gap comparisons)
+        Index(
+            "search_document_user_id_content_hash_idx",
+            "user_id",
+            "content_hash",
+            postgresql_where=text("content_hash IS NOT NULL"),
+        ),
+    )
+
+    id: int | None = Field(default=None, sa_column=Column(BigInteger, primary_key=True))
+    user_id: int = Field(sa_column=Column(Integer, nullable=False))
+    kind: DocumentKind = Field(sa_column=Column(String(32), nullable=False))
+    title: str = Field(sa_column=Column(String(TITLE_MAX_LENGTH), nullable=False))
+    company: str | None = Field(
+        default=None, sa_column=Column(String(TITLE_MAX_LENGTH), nullable=True)
+    )
+    body: str = Field(sa_column=Column(Text, nullable=False))
+    # Job descriptions: hash of the normalized body, the key of its skill analysis
+    content_hash: str | None = Field(default=None, sa_column=Column(String(64), nullable=True))
+    search_vector: str | None = Field(
+        default=None,
+        sa_column=Column(TSVECTOR, Computed(_SEARCH_VECTOR, persisted=True), nullable=False),
+    )
+
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
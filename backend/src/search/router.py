@@ -0,0 +1,115 @@
+"""Document search endpoints."""
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..auth import parse_jwt_data
+from ..auth.schemas import JWTData
+from ..database import get_db_session, get_read_db_session
+from ..pagination import CursorPage, KeysetParams, get_keyset_params, paginate
+from .config import get_search_settings
+from .constants import TITLE_MAX_LENGTH, DocumentKind
+from .schemas import SearchDocumentCreate, SearchDocumentRead, SearchHit
+from .service import save_document, search_statement
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+# Longer queries are never useful and only cost parsing time
+_QUERY_MAX_LENGTH = 500
+
+
+@router.get(
+    "",
+    response_model=CursorPage[SearchHit],
+    status_code=status.HTTP_200_OK,
+    summary="Search documents",
+    description=(
+        "Searches the user's saved job descriptions and tailored resumes, best matches "
+        "first. q uses web search syntax: words must all match (in any form, e.g. "
+        'managing matches manager), "quoted phrases" match in order, or and -word '
+        "exclude. Title and company count more than the body. Each hit has excerpts "
+        "of the body with the matches highlighted."
+    ),
+    responses={
+        200: {
+            "description": "A page of hits",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "items": [SearchHit.model_config["json_schema_extra"]["example"]],
+                        "next_cursor": None,
+                        "has_more": False,
+                        "estimated_total": None,
+                    }
+                }
+            },
+        }
+    },
+)
+async def search_documents(
+    q: str = Query(..., min_length=1, max_length=_QUERY_MAX_LENGTH, description="Search terms"),
+    kind: DocumentKind | None = Query(None, description="Only documents of this kind"),
+    company: str | None = Query(
+        None,
+        min_length=1,
+        max_length=TITLE_MAX_LENGTH,
+        description="Only documents for this company; tolerates typos and partial names",
+    ),
+    params: KeysetParams = Depends(get_keyset_params),
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> CursorPage[SearchHit]:
+    """
+    Document search endpoint.
+
+    GIN index lookups for the user's matches, keyset-paginated on (rank, id).
+    """
+    statement, order_by = search_statement(
+        jwt_data.user_id, q, get_search_settings(), kind=kind, company=company
+    )
+    return await paginate(session, statement, order_by=order_by, params=params)
+
+
+@router.post(
+    "/documents",
+    response_model=SearchDocumentRead,
+    status_code=status.HTTP_201_CREATED,
+    summary="Save a document",
+    description=(
+        "Saves a job description or tailored resume; it is searchable right away. The "
+        "skills of a job description are extracted for analytics by a background job."
+    ),
+    responses={
+        201: {
+            "description": "The saved document",
+            "content": {
+                "application/json": {
+                    "example": SearchDocumentRead.model_config["json_schema_extra"]["example"]
+                }
+            },
+        }
+    },
+)
+async def create_document(
+    document: SearchDocumentCreate,
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_db_session),
+) -> SearchDocumentRead:
+    """
+    Document creation endpoint.
+
+    One INSERT; Postgres derives the search vector and updates the indexes.
+    A job description also enqueues its skill extraction, skill analysis and
+    embedding, in the same transaction.
+    """
+    # Not at module level: analytics, embeddings and skills read search documents
+    from ..analytics.service import enqueue_skill_extraction  # noqa: PLC0415
+    from ..embeddings.service import enqueue_embedding  # noqa: PLC0415
+    from ..skills.service import enqueue_skill_analysis  # noqa: PLC0415
+
+    saved = await save_document(session, jwt_data.user_id, document)
+    if document.kind == DocumentKind.JOB_DESCRIPTION:
+        await enqueue_skill_extraction(jwt_data.user_id, [saved.id], session=session)
+        await enqueue_embedding(jwt_data.user_id, [saved.id], session=session)
+        await enqueue_skill_analysis(jwt_data.user_id, [saved.id], session=session)
+    return saved
@@ -0,0 +1,76 @@
+"""Search request and response models."""
+
+from pydantic import ConfigDict, Field
+
+from ..models import CustomBaseModel, UTCDatetime
+from .constants import BODY_MAX_LENGTH, TITLE_MAX_LENGTH, DocumentKind
+
+
+class SearchDocumentCreate(CustomBaseModel):
+    """A job description or tailored resume to make searchable."""
+
+    kind: DocumentKind = Field(..., description="What the document is")
+    title: str = Field(
+        ..., min_length=1, max_length=TITLE_MAX_LENGTH, description="Position or resume name"
+    )
+    company: str | None = Field(
+        default=None, max_length=TITLE_MAX_LENGTH, description="Company the document is for"
+    )
+    body: str = Field(..., min_length=1, max_length=BODY_MAX_LENGTH, description="Full text")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "kind": "job_description",
+                "title": "Senior Backend Engineer",
+                "company": "Acme",
+                "body": "We are looking for a backend engineer with Python and PostgreSQL...",
+            }
+        }
+    )
+
+
+class SearchDocumentRead(CustomBaseModel):
+    """A searchable document, without its body."""
+
+    id: int = Field(..., description="Document ID")
+    kind: DocumentKind = Field(..., description="What the document is")
+    title: str = Field(..., description="Position or resume name")
+    company: str | None = Field(default=None, description="Company the document is for")
+    created_at: UTCDatetime = Field(..., description="When the document was saved")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 311,
+                "kind": "job_description",
+                "title": "Senior Backend Engineer",
+                "company": "Acme",
+                "created_at": "2026-01-01T00:00:00Z",
+            }
+        },
+    )
+
+
+class SearchHit(SearchDocumentRead):
+    """A document matching a search, with its relevance and highlighted excerpts."""
+
+    rank: float = Field(..., description="Relevance; higher is better")
+    highlight: str = Field(
+        ...,
+        description=(
+            "Excerpts of the body around the matches, which are wrapped in <mark> tags. "
+            "The rest is the stored text as is: escape it before rendering as HTML."
+        ),
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                **SearchDocumentRead.model_config["json_schema_extra"]["example"],
+                "rank": 0.42,
+                "highlight": "a backend engineer with <mark>Python</mark> and PostgreSQL",
+            }
+        }
+    )
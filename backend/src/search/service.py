@@ -0,0 +1,128 @@
+"""
+Ranked full-text search over a user's documents.
+
+Queries use web search syntax (``websearch_to_tsquery``): words are ANDed,
+``"quoted phrases"`` match in order, ``or`` and ``-word`` work as expected.
+Matches are found through the GIN index on the generated ``search_vector``
+column and ranked with ``ts_rank_cd`` (cover density, normalized by document
+length). The optional company filter is a fuzzy ``pg_trgm`` word-similarity
+match, so "gogle" finds Google.
+
+Results are keyset-paginated on (rank, id): each page continues below the last
+hit's rank instead of re-ranking and skipping the earlier pages.
+"""
+
+from typing import Any
+
+from sqlalchemy import REAL, ColumnElement, Select, Text, func, insert, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..skills.utils import hash_job_description, normalize_job_description
+from .config import SearchConfig
+from .constants import HIGHLIGHT_START, HIGHLIGHT_STOP, TEXT_SEARCH_CONFIG, DocumentKind
+from .models import SearchDocument
+from .schemas import SearchDocumentCreate, SearchDocumentRead
+
+# ts_rank_cd normalization: divide by 1 + log(document length), so long resumes
+# do not outrank short postings just by repeating words
+_RANK_NORMALIZATION = 1
+
+_REGCONFIG = literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig")
+_READ_COLUMNS = (
+    SearchDocument.id,
+    SearchDocument.kind,
+    SearchDocument.title,
+    SearchDocument.company,
+    SearchDocument.created_at,
+)
+
+
+def _highlight_options(config: SearchConfig) -> str:
+    max_words = config.search_highlight_max_words
+    return (
+        f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords={max_words}, "
+        f"MinWords={max_words // 2}, MaxFragments={config.search_highlight_max_fragments}"
+    )
+
+
+def search_statement(
+    user_id: int,
+    query: str,
+    config: SearchConfig,
+    kind: DocumentKind | None = None,
+    company: str | None = None,
+) -> tuple[Select[Any], list[ColumnElement[Any]]]:
+    """
+    Build a search over a user's documents, for ``paginate``.
+
+    Args:
+        user_id: Owner of the documents.
+        query: Search terms, in web search syntax.
+        config: Highlight settings.
+        kind: Only documents of this kind.
+        company: Only documents whose company fuzzily matches this name.
+
+    Returns:
+        Tuple of (select of hits without ordering, keyset ordering: rank then id,
+        both descending).
+    """
+    tsquery = func.websearch_to_tsquery(_REGCONFIG, query)
+    rank = func.ts_rank_cd(SearchDocument.search_vector, tsquery, _RANK_NORMALIZATION, type_=REAL)
+    # In the select list only: Postgres computes it after sorting and limiting,
+    # so only for the hits of the page
+    highlight = func.ts_headline(
+        _REGCONFIG, SearchDocument.body, tsquery, _highlight_options(config), type_=Text
+    )
+
+    statement = select(*_READ_COLUMNS, rank.label("rank"), highlight.label("highlight")).where(
+        SearchDocument.user_id == user_id,
+        SearchDocument.search_vector.op("@@")(tsquery),
+    )
+    if kind is not None:
+        statement = statement.where(SearchDocument.kind == kind.value)
+    if company is not None:
+        # Word similarity above pg_trgm.word_similarity_threshold (0.6 by default)
+        statement = statement.where(SearchDocument.company.op("%>")(company))
+    return statement, [rank.desc(), SearchDocument.id.desc()]
+
+
+async def save_document(
+    session: AsyncSession, user_id: int, document: SearchDocumentCreate
+) -> SearchDocumentRead:
+    """
+    Save a document; it is searchable as soon as the transaction commits.
+
+    Args:
+        session: Database session (committed by the request dependency).
+        user_id: Owner of the document.
+        document: The document.
+
+    Returns:
+        The saved document.
+    """
+    content_hash = None
+    if document.kind == DocumentKind.JOB_DESCRIPTION:
+        content_hash = hash_job_description(normalize_job_description(document.body))
+    result = await session.execute(
+        insert(SearchDocument)
+        .values(
+            user_id=user_id,
+            kind=document.kind.value,
+            title=document.title,
+            company=document.company,
+            body=document.body,
+            content_hash=content_hash,
+        )
+        .returning(*_READ_COLUMNS)
+    )
+    return SearchDocumentRead.model_validate(result.mappings().one())
+
+
+async def job_description_hashes(session: AsyncSession, user_id: int) -> list[str]:
+    """Content hashes of a user's saved job descriptions, without duplicates."""
+    statement = (
+        select(SearchDocument.content_hash)
+        .where(SearchDocument.user_id == user_id, SearchDocument.content_hash.is_not(None))
+        .distinct()
+    )
+    return list((await session.scalars(statement)).all())
@@ -0,0 +1,42 @@
+"""Skill analysis (content-addressed LLM extraction) and skill gap comparison."""
+
+from .config import SkillsConfig, get_skills_settings
+from .exceptions import EmptyJobDescription
+from .extractor import (
+    ChatModelSkillExtractor,
+    KeywordSkillExtractor,
+    SkillExtractor,
+    load_skill_extractor,
+)
+from .gap import SkillGapService, get_skill_gap_service
+from .prompts import SKILL_EXTRACTION_PROMPT_VERSION
+from .router import router
+from .schemas import SkillAnalysis, SkillAnalysisResult, SkillGapRequest, SkillGapResponse
+from .service import SkillAnalysisService, enqueue_skill_analysis, get_skill_analysis_service
+from .utils import hash_job_description, normalize_job_description
+from .vocabulary import SkillVocabulary, normalize_skill_name
+
+__all__ = [
+    "SKILL_EXTRACTION_PROMPT_VERSION",
+    "ChatModelSkillExtractor",
+    "EmptyJobDescription",
+    "KeywordSkillExtractor",
+    "SkillAnalysis",
+    "SkillAnalysisResult",
+    "SkillAnalysisService",
+    "SkillExtractor",
+    "SkillGapRequest",
+    "SkillGapResponse",
+    "SkillGapService",
+    "SkillVocabulary",
+    "SkillsConfig",
+    "enqueue_skill_analysis",
+    "get_skill_analysis_service",
+    "get_skill_gap_service",
+    "get_skills_settings",
+    "hash_job_description",
+    "load_skill_extractor",
+    "normalize_job_description",
+    "normalize_skill_name",
+    "router",
+]
@@ -0,0 +1,38 @@
+"""Skill analysis configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class SkillsConfig(BaseSettings):
+    """Skill analysis configuration loaded from environment variables."""
+
+    # "module:attribute" of a zero-argument callable returning a SkillExtractor, e.g.
+    # a ChatModelSkillExtractor; by default the offline keyword extractor
+    skill_extractor: str | None = Field(default=None, alias="SKILL_EXTRACTOR")
+    # How often the skill gap index loads newly analyzed job descriptions
+    skill_gap_refresh_seconds: float = Field(default=30.0, ge=0, alias="SKILL_GAP_REFRESH_SECONDS")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_skills_settings() -> SkillsConfig:
+    """Get the global skills configuration, loaded from the environment on first use."""
+    return SkillsConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``skills_settings`` is built on first access
+    if name == "skills_settings":
+        return get_skills_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
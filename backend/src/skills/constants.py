@@ -0,0 +1,44 @@
+"""Constants for skill analysis and skill gap comparison."""
+
+# Canonical skill name -> alternative spellings. Names are matched after
+# ``normalize_skill_name``, so case, spacing and trailing dots do not need entries.
+SKILL_ALIASES: dict[str, tuple[str, ...]] = {
+    "JavaScript": ("js", "ecmascript", "es6"),
+    "TypeScript": ("ts",),
+    "Node.js": ("node", "nodejs", "node js"),
+    "React": ("react.js", "reactjs"),
+    "Vue.js": ("vue", "vuejs"),
+    "Next.js": ("next", "nextjs"),
+    "Python": ("python3", "py"),
+    "Go": ("golang",),
+    "C#": ("csharp", "c sharp"),
+    "C++": ("cpp", "cplusplus"),
+    ".NET": ("dotnet", "dot net"),
+    "PostgreSQL": ("postgres", "psql", "pgsql"),
+    "MySQL": ("my sql",),
+    "MongoDB": ("mongo",),
+    "Elasticsearch": ("elastic search", "es"),
+    "Kubernetes": ("k8s", "kube"),
+    "Amazon Web Services": ("aws",),
+    "Google Cloud Platform": ("gcp", "google cloud"),
+    "Microsoft Azure": ("azure",),
+    "CI/CD": ("ci cd", "ci/cd pipelines", "continuous integration", "continuous delivery"),
+    "Machine Learning": ("ml",),
+    "Artificial Intelligence": ("ai",),
+    "Natural Language Processing": ("nlp",),
+    "Large Language Models": ("llm", "llms"),
+    "REST APIs": ("rest", "restful", "rest api", "restful apis"),
+    "GraphQL": ("gql",),
+    "SQL": ("structured query language",),
+    "Amazon S3": ("s3",),
+    "Git": ("github", "gitlab", "version control"),
+}
+
+# Kind of the background job that analyzes the skills of saved job descriptions
+SKILL_ANALYSIS_JOB = "skills.analyze"
+
+# Bits per word of the skill bitsets
+BITSET_WORD_BITS = 64
+
+# Cache tag of the skill demand responses, invalidated when new analyses load
+SKILL_DEMAND_CACHE_TAG = "skill-demand"
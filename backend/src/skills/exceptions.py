@@ -0,0 +1,9 @@
+"""Skill analysis exceptions."""
+
+from ..exceptions import BadRequest
+
+
+class EmptyJobDescription(BadRequest):
+    """Raised when a job description has no text after normalization."""
+
+    DETAIL = "Job description is empty"
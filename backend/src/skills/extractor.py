@@ -0,0 +1,75 @@
+"""Skill extraction backends (the LLM call behind a skill analysis)."""
+
+import importlib
+from typing import Any, Protocol
+
+from .config import SkillsConfig
+from .prompts import SKILL_EXTRACTION_PROMPT
+from .schemas import SkillAnalysis
+
+
+class SkillExtractor(Protocol):
+    """Extracts skills from a normalized job description."""
+
+    # Identifies the model in the analysis cache key (e.g. "gpt-4o-mini")
+    model: str
+
+    async def extract(self, job_description: str) -> SkillAnalysis: ...
+
+
+class ChatModelSkillExtractor:
+    """
+    Skill extractor backed by a LangChain chat model.
+
+    Any chat model supporting structured output works; the model object is built
+    by the caller, so this module does not import LangChain.
+
+    Example:
+        >>> from langchain.chat_models import init_chat_model
+        >>> extractor = ChatModelSkillExtractor(init_chat_model("gpt-4o-mini"), "gpt-4o-mini")
+    """
+
+    def __init__(self, chat_model: Any, model: str) -> None:
+        self.model = model
+        self._runnable = chat_model.with_structured_output(SkillAnalysis)
+
+    async def extract(self, job_description: str) -> SkillAnalysis:
+        return await self._runnable.ainvoke(
+            [("system", SKILL_EXTRACTION_PROMPT), ("human", job_description)]
+        )
+
+
+class KeywordSkillExtractor:
+    """
+    Offline skill extractor: the known skills (and their aliases) the text names.
+
+    Finds skills as the ATS scorer does, with no model or network access, so
+    development and tests run offline. Suggests no related skills.
+
+    Example:
+        >>> import asyncio
+        >>> asyncio.run(KeywordSkillExtractor().extract("Python and k8s")).skills
+        ['Kubernetes', 'Python']
+    """
+
+    model = "keyword-v1"
+
+    async def extract(self, job_description: str) -> SkillAnalysis:
+        # Not at module level: the ATS package reads skill constants
+        from ..ats.features import extract_features  # noqa: PLC0415
+
+        return SkillAnalysis(skills=sorted(extract_features(job_description).skills))
+
+
+def load_skill_extractor(config: SkillsConfig) -> SkillExtractor:
+    """
+    Build the configured skill extractor.
+
+    Returns:
+        The result of calling ``SKILL_EXTRACTOR`` ("module:attribute"), or a
+        ``KeywordSkillExtractor`` when it is not set.
+    """
+    if config.skill_extractor is None:
+        return KeywordSkillExtractor()
+    module, _, attribute = config.skill_extractor.partition(":")
+    return getattr(importlib.import_module(module), attribute)()
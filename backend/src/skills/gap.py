@@ -0,0 +1,117 @@
+"""
+Skill gap comparison against the analyzed job descriptions a user saved.
+
+The index lives in process memory and is filled from ``skill_analysis``.
+Analyses never change, so a refresh only loads rows created since the previous
+one; refreshes run at most every ``SKILL_GAP_REFRESH_SECONDS`` and concurrent
+requests share one. NumPy is imported when the service is first used, not when
+the application starts.
+"""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..cache import get_cache_settings, get_response_cache
+from ..database import get_engine
+from .config import SkillsConfig, get_skills_settings
+from .constants import SKILL_DEMAND_CACHE_TAG
+from .models import SkillAnalysisRecord
+from .prompts import SKILL_EXTRACTION_PROMPT_VERSION
+from .schemas import SkillDemandResponse, SkillGapRequest, SkillGapResponse
+
+if TYPE_CHECKING:
+    from .index import SkillGapIndex
+
+_table = SkillAnalysisRecord.__table__
+
+# Rows are reloaded from this long before the newest one seen, so analyses that
+# committed late with an earlier created_at are not missed (re-adding is a no-op)
+_REFRESH_OVERLAP = timedelta(seconds=60)
+_LOAD_BATCH_SIZE = 5000
+
+
+class SkillGapService:
+    """Keeps a ``SkillGapIndex`` of analyzed job descriptions up to date and queries it."""
+
+    def __init__(self, engine: AsyncEngine, index: "SkillGapIndex", config: SkillsConfig) -> None:
+        # The primary: a replica could lag past the refresh overlap. Not in
+        # autocommit, since rows are streamed through a server-side cursor.
+        self._engine = engine
+        self.index = index
+        self._config = config
+        self._loaded_until: datetime | None = None
+        self._refreshed_at: float | None = None  # time.monotonic()
+        self._inflight: asyncio.Task[None] | None = None
+
+    async def refresh(self, *, force: bool = False) -> None:
+        """Load analyses created since the last refresh, unless it is recent enough."""
+        if (
+            not force
+            and self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at < self._config.skill_gap_refresh_seconds
+        ):
+            return
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._load())
+        await asyncio.shield(self._inflight)
+
+    async def _load(self) -> None:
+        statement = (
+            select(
+                _table.c.content_hash, _table.c.skills, _table.c.related_skills, _table.c.created_at
+            )
+            .where(_table.c.prompt_version == SKILL_EXTRACTION_PROMPT_VERSION)
+            .order_by(_table.c.created_at)
+        )
+        if self._loaded_until is not None:
+            statement = statement.where(_table.c.created_at > self._loaded_until - _REFRESH_OVERLAP)
+
+        started_at = time.monotonic()
+        jobs = len(self.index)
+        async with self._engine.connect() as conn:
+            result = await conn.stream(statement)
+            async for rows in result.partitions(_LOAD_BATCH_SIZE):
+                for row in rows:
+                    self.index.add(row.content_hash, row.skills, row.related_skills)
+                    self._loaded_until = max(self._loaded_until or row.created_at, row.created_at)
+        self._refreshed_at = started_at
+        # Cached demand responses (of every worker) count fewer job descriptions
+        if len(self.index) > jobs and get_cache_settings().cache_enabled:
+            await get_response_cache().invalidate(SKILL_DEMAND_CACHE_TAG)
+
+    async def compare(self, request: SkillGapRequest, job_ids: Sequence[str]) -> SkillGapResponse:
+        """
+        Compare a user's skills with analyzed job descriptions.
+
+        Args:
+            request: The skills, and how many matches to return.
+            job_ids: Content hashes of the job descriptions to compare with
+                (the caller's); those not analyzed are ignored.
+        """
+        await self.refresh()
+        return self.index.compare(
+            request.skills,
+            job_ids=job_ids,
+            limit=request.limit,
+            min_coverage=request.min_coverage,
+        )
+
+    async def demand(self, limit: int) -> SkillDemandResponse:
+        """Most required skills across the analyzed job descriptions."""
+        await self.refresh()
+        return self.index.demand(limit)
+
+
+@lru_cache
+def get_skill_gap_service() -> SkillGapService:
+    """Get the process-wide skill gap service (imports NumPy on first use)."""
+    from .index import SkillGapIndex  # noqa: PLC0415
+
+    return SkillGapService(get_engine(), SkillGapIndex(), get_skills_settings())
@@ -0,0 +1,304 @@
+"""
+In-memory skill gap index over analyzed job descriptions.
+
+Every job description is a row; its required skills are stored twice:
+
+- as a bitset row of a ``(jobs, words)`` uint64 matrix (one bit per skill id),
+  kept column-major so the words a user's skills fall in are contiguous;
+- in an inverted index from skill id to the rows that require it.
+
+Comparing a user with N jobs is one vectorized pass: the matched-skill count of
+every row is either the popcount of the row AND the user's bitset, restricted to
+the words the user has bits in, or a ``bincount`` over the posting lists of the
+user's skills, whichever touches less memory. Only the best rows are decoded
+into skill names.
+"""
+
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .constants import BITSET_WORD_BITS
+from .schemas import SkillDemand, SkillDemandResponse, SkillGapMatch, SkillGapResponse
+from .vocabulary import SkillVocabulary, normalize_skill_name
+
+_INITIAL_ROWS = 1024
+_INITIAL_WORDS = 4
+
+
+class SkillGapIndex:
+    """
+    Skill bitsets and posting lists of job descriptions, keyed by job id.
+
+    Not thread-safe; mutate and query from the event loop.
+
+    Example:
+        >>> index = SkillGapIndex()
+        >>> index.add("job-1", ["Python", "postgres", "Kafka"], related=["Docker"])
+        >>> report = index.compare(["python", "PostgreSQL", "docker"])
+        >>> report.matches[0].missing_skills, report.matches[0].related_skills
+        (['Kafka'], ['Docker'])
+    """
+
+    def __init__(self, vocabulary: SkillVocabulary | None = None) -> None:
+        self.vocabulary = vocabulary or SkillVocabulary()
+        self._job_ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        # Skill ids per row, for decoding the best matches
+        self._required: list[tuple[int, ...]] = []
+        self._related: list[tuple[int, ...]] = []
+        self._bits: NDArray[np.uint64] = np.zeros(
+            (_INITIAL_ROWS, _INITIAL_WORDS), dtype=np.uint64, order="F"
+        )
+        self._required_counts: NDArray[np.int32] = np.zeros(_INITIAL_ROWS, dtype=np.int32)
+        self._postings: dict[int, list[int]] = {}
+        # Posting lists as arrays, rebuilt lazily after a skill's list changes
+        self._posting_arrays: dict[int, NDArray[np.int32]] = {}
+
+    def __len__(self) -> int:
+        return len(self._job_ids)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._rows
+
+    def add(self, job_id: str, required: Iterable[str], related: Iterable[str] = ()) -> None:
+        """
+        Add a job description, or replace the skills of one already indexed.
+
+        Args:
+            job_id: Job description id (the skill analysis content hash).
+            required: Skills the job description asks for.
+            related: Skills commonly expected for the role but not mentioned.
+        """
+        required_ids = self._intern(required)
+        related_ids = tuple(
+            skill_id for skill_id in self._intern(related) if skill_id not in required_ids
+        )
+
+        row = self._rows.get(job_id)
+        if row is None:
+            row = len(self._job_ids)
+            self._ensure_rows(row + 1)
+            self._job_ids.append(job_id)
+            self._rows[job_id] = row
+            self._required.append(())
+            self._related.append(())
+        elif self._required[row] == required_ids:
+            self._related[row] = related_ids
+            return
+        else:
+            self._clear_row(row)
+
+        if required_ids:
+            self._ensure_words(max(required_ids) // BITSET_WORD_BITS + 1)
+        # Build the row's words as Python ints, then write each word once
+        words: dict[int, int] = {}
+        for skill_id in required_ids:
+            word, bit = divmod(skill_id, BITSET_WORD_BITS)
+            words[word] = words.get(word, 0) | (1 << bit)
+            self._postings.setdefault(skill_id, []).append(row)
+            self._posting_arrays.pop(skill_id, None)
+        for word, mask in words.items():
+            self._bits[row, word] = mask
+        self._required[row] = required_ids
+        self._related[row] = related_ids
+        self._required_counts[row] = len(required_ids)
+
+    def compare(
+        self,
+        skills: Iterable[str],
+        *,
+        job_ids: Sequence[str] | None = None,
+        limit: int = 20,
+        min_coverage: float = 0.0,
+    ) -> SkillGapResponse:
+        """
+        Rank job descriptions by the share of their required skills the user has.
+
+        Args:
+            skills: The user's skills (any spelling or alias).
+            job_ids: Compare only with these job descriptions (unknown ids are
+                ignored); all of them by default.
+            limit: Number of matches to return.
+            min_coverage: Leave out job descriptions with a lower coverage.
+
+        Returns:
+            Best matches by coverage, then by number of matched skills.
+        """
+        user_ids, unknown = self.resolve(skills)
+        if job_ids is None:
+            rows = None
+            compared = len(self._job_ids)
+        else:
+            rows = np.fromiter(
+                (self._rows[job_id] for job_id in job_ids if job_id in self._rows), dtype=np.int64
+            )
+            compared = len(rows)
+
+        matched = self.matched_counts(user_ids, rows)
+        required = self._required_counts[: len(self._job_ids)]
+        if rows is not None:
+            required = required[rows]
+        coverage = matched / np.maximum(required, 1)
+        candidates = np.flatnonzero((coverage >= min_coverage) & (required > 0))
+        if len(candidates) > limit:
+            # Partial selection: keep rows at least as good as the limit-th best
+            # coverage (ties included), then sort only those
+            threshold = -np.partition(-coverage[candidates], limit - 1)[limit - 1]
+            candidates = candidates[coverage[candidates] >= threshold]
+        order = np.lexsort((-matched[candidates], -coverage[candidates]))
+        positions = candidates[order[:limit]]
+
+        user_set = set(user_ids)
+        matches = []
+        for position in positions.tolist():
+            row = position if rows is None else int(rows[position])
+            matches.append(self._describe(row, float(coverage[position]), user_set))
+        return SkillGapResponse(compared=compared, unknown_skills=unknown, matches=matches)
+
+    def matched_counts(
+        self, user_ids: Sequence[int], rows: NDArray[np.int64] | None = None
+    ) -> NDArray[np.int32]:
+        """
+        Number of each job's required skills among ``user_ids``, in one vectorized pass.
+
+        Args:
+            user_ids: Skill ids of the user.
+            rows: Rows to compute (default: every job, in row order).
+
+        Returns:
+            Matched-skill counts aligned with ``rows``.
+        """
+        job_count = len(self._job_ids)
+        size = job_count if rows is None else len(rows)
+        if not user_ids or size == 0:
+            return np.zeros(size, dtype=np.int32)
+
+        words = self._user_words(user_ids)
+        bitset_cost = size * len(words)
+        posting_cost = sum(len(self._postings.get(skill_id, ())) for skill_id in user_ids)
+        if posting_cost < bitset_cost:
+            counts = self._count_by_postings(user_ids, job_count)
+            return counts if rows is None else counts[rows]
+        return self._count_by_bitsets(words, rows)
+
+    def matched_counts_bitset(
+        self, user_ids: Sequence[int], rows: NDArray[np.int64] | None = None
+    ) -> NDArray[np.int32]:
+        """``matched_counts`` always computed from the bitsets (for benchmarks)."""
+        return self._count_by_bitsets(self._user_words(user_ids), rows)
+
+    def matched_counts_postings(self, user_ids: Sequence[int]) -> NDArray[np.int32]:
+        """``matched_counts`` always computed from the posting lists (for benchmarks)."""
+        return self._count_by_postings(user_ids, len(self._job_ids))
+
+    def demand(self, limit: int = 20) -> SkillDemandResponse:
+        """Most required skills, by the length of their posting lists."""
+        total = len(self._job_ids)
+        ranked = sorted(self._postings.items(), key=lambda item: len(item[1]), reverse=True)
+        skills = [
+            SkillDemand(
+                skill=self.vocabulary.name(skill_id),
+                job_count=len(job_rows),
+                share=round(len(job_rows) / total, 4),
+            )
+            for skill_id, job_rows in ranked[:limit]
+            if job_rows
+        ]
+        return SkillDemandResponse(total_jobs=total, skills=skills)
+
+    def resolve(self, skills: Iterable[str]) -> tuple[list[int], list[str]]:
+        """Ids of ``skills`` in the vocabulary, and the names that are not in it."""
+        user_ids: dict[int, None] = {}
+        unknown = []
+        for name in skills:
+            if not normalize_skill_name(name):
+                continue
+            skill_id = self.vocabulary.lookup(name)
+            if skill_id is None:
+                unknown.append(name.strip())
+            else:
+                user_ids[skill_id] = None
+        return list(user_ids), unknown
+
+    def _user_words(self, user_ids: Sequence[int]) -> dict[int, np.uint64]:
+        words: dict[int, int] = {}
+        for skill_id in user_ids:
+            word, bit = divmod(skill_id, BITSET_WORD_BITS)
+            if word < self._bits.shape[1]:
+                words[word] = words.get(word, 0) | (1 << bit)
+        return {word: np.uint64(mask) for word, mask in words.items()}
+
+    def _count_by_bitsets(
+        self, words: dict[int, np.uint64], rows: NDArray[np.int64] | None
+    ) -> NDArray[np.int32]:
+        size = len(self._job_ids) if rows is None else len(rows)
+        counts = np.zeros(size, dtype=np.int32)
+        for word, mask in words.items():
+            # Contiguous column (column-major storage)
+            column = self._bits[: len(self._job_ids), word]
+            if rows is not None:
+                column = column[rows]
+            counts += np.bitwise_count(column & mask)
+        return counts
+
+    def _count_by_postings(self, user_ids: Sequence[int], job_count: int) -> NDArray[np.int32]:
+        arrays = [self._posting_array(skill_id) for skill_id in user_ids]
+        if not arrays:
+            return np.zeros(job_count, dtype=np.int32)
+        return np.bincount(np.concatenate(arrays), minlength=job_count).astype(np.int32)
+
+    def _posting_array(self, skill_id: int) -> NDArray[np.int32]:
+        array = self._posting_arrays.get(skill_id)
+        if array is None:
+            array = np.array(self._postings.get(skill_id, ()), dtype=np.int32)
+            self._posting_arrays[skill_id] = array
+        return array
+
+    def _describe(self, row: int, coverage: float, user_set: set[int]) -> SkillGapMatch:
+        name = self.vocabulary.name
+        required = self._required[row]
+        return SkillGapMatch(
+            content_hash=self._job_ids[row],
+            coverage=round(coverage, 4),
+            matched_skills=[name(skill_id) for skill_id in required if skill_id in user_set],
+            missing_skills=[name(skill_id) for skill_id in required if skill_id not in user_set],
+            related_skills=[
+                name(skill_id) for skill_id in self._related[row] if skill_id in user_set
+            ],
+        )
+
+    def _intern(self, skills: Iterable[str]) -> tuple[int, ...]:
+        ids: dict[int, None] = {}
+        for name in skills:
+            if normalize_skill_name(name):
+                ids[self.vocabulary.intern(name)] = None
+        return tuple(ids)
+
+    def _clear_row(self, row: int) -> None:
+        for skill_id in self._required[row]:
+            self._postings[skill_id].remove(row)
+            self._posting_arrays.pop(skill_id, None)
+        self._bits[row, :] = 0
+        self._required_counts[row] = 0
+
+    def _ensure_rows(self, rows: int) -> None:
+        capacity = self._bits.shape[0]
+        if rows <= capacity:
+            return
+        capacity = max(rows, capacity * 2)
+        bits = np.zeros((capacity, self._bits.shape[1]), dtype=np.uint64, order="F")
+        bits[: self._bits.shape[0]] = self._bits
+        self._bits = bits
+        counts = np.zeros(capacity, dtype=np.int32)
+        counts[: len(self._required_counts)] = self._required_counts
+        self._required_counts = counts
+
+    def _ensure_words(self, words: int) -> None:
+        current = self._bits.shape[1]
+        if words <= current:
+            return
+        bits = np.zeros((self._bits.shape[0], max(words, current * 2)), dtype=np.uint64, order="F")
+        bits[:, :current] = self._bits
+        self._bits = bits
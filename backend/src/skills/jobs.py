@@ -0,0 +1,24 @@
+"""
+Skill analysis job handler.
+
+Imported by every worker: ``src.skills.jobs`` is in the default
+``JOB_HANDLER_MODULES``.
+"""
+
+from typing import Any
+
+from ..jobs import ClaimedJob, PermanentJobError, job_handler
+from .constants import SKILL_ANALYSIS_JOB
+from .service import get_skill_analysis_service
+
+
+@job_handler(SKILL_ANALYSIS_JOB, timeout_seconds=600)
+async def analyze_job_descriptions(job: ClaimedJob) -> dict[str, Any]:
+    """Analyze the skills of a user's job descriptions."""
+    if job.user_id is None:
+        message = "Skill analysis jobs belong to a user"
+        raise PermanentJobError(message)
+    analyzed = await get_skill_analysis_service().analyze_documents(
+        job.user_id, job.payload.get("document_ids")
+    )
+    return {"analyzed": analyzed}
@@ -0,0 +1,29 @@
+"""Skill analysis database models."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import Field, SQLModel
+
+
+class SkillAnalysisRecord(SQLModel, table=True):
+    """
+    Content-addressed skill analysis of a job description.
+
+    Keyed by the hash of the normalized text together with the model and prompt
+    version that produced it, so identical postings submitted by different users
+    share one analysis, and changing the model or prompt never serves stale output.
+    """
+
+    __tablename__ = "skill_analysis"
+
+    content_hash: str = Field(sa_column=Column(String(64), primary_key=True))
+    model: str = Field(sa_column=Column(String(100), primary_key=True))
+    prompt_version: str = Field(sa_column=Column(String(32), primary_key=True))
+    skills: list[str] = Field(sa_column=Column(ARRAY(Text), nullable=False))
+    related_skills: list[str] = Field(sa_column=Column(ARRAY(Text), nullable=False))
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
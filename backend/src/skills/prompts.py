@@ -0,0 +1,18 @@
+"""Prompts used for skill analysis."""
+
+# Part of the analysis cache key: bump it whenever the prompt (or the output
+# schema) changes, so results produced by the old prompt are not reused
+SKILL_EXTRACTION_PROMPT_VERSION = "1"
+
+SKILL_EXTRACTION_PROMPT = """\
+You analyze job descriptions for a job seeker.
+
+From the job description, list:
+- skills: the technical skills, tools, technologies and methodologies the role
+  explicitly requires or prefers, one short canonical name each (e.g. "Python",
+  "PostgreSQL", "CI/CD"), without duplicates.
+- related_skills: skills that are not mentioned but are commonly expected for
+  this role given the listed skills (e.g. "SQL" for a role asking for
+  PostgreSQL), at most 10, none repeated from skills.
+
+Ignore benefits, company descriptions and application instructions."""
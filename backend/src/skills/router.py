@@ -0,0 +1,111 @@
+"""Skill gap endpoints."""
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..auth import parse_jwt_data
+from ..auth.schemas import JWTData
+from ..cache import CachedRoute, cache_response
+from ..database import get_read_db_session
+from .constants import SKILL_DEMAND_CACHE_TAG
+from .gap import get_skill_gap_service
+from .schemas import SkillDemandResponse, SkillGapRequest, SkillGapResponse
+
+router = APIRouter(prefix="/skills", tags=["skills"], route_class=CachedRoute)
+
+
+@router.post(
+    "/gap",
+    response_model=SkillGapResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Compare skills with job descriptions",
+    description=(
+        "Compares the given skills with every analyzed job description the user saved "
+        "(or the ones of them listed in content_hashes) in one pass and returns the "
+        "best matches with the matched, missing and related skills of each. Skill "
+        "names are matched case-insensitively and through aliases (e.g. k8s, "
+        "Kubernetes)."
+    ),
+    responses={
+        200: {
+            "description": "Best-matching job descriptions, highest coverage first",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "compared": 250,
+                        "unknown_skills": ["COBOL"],
+                        "matches": [
+                            {
+                                "content_hash": "9f86d0818...",
+                                "coverage": 0.75,
+                                "matched_skills": ["Python", "PostgreSQL", "Docker"],
+                                "missing_skills": ["Kafka"],
+                                "related_skills": ["Kubernetes"],
+                            }
+                        ],
+                    }
+                }
+            },
+        }
+    },
+)
+async def compare_skills(
+    request: SkillGapRequest,
+    jwt_data: JWTData = Depends(parse_jwt_data),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> SkillGapResponse:
+    """
+    Skill gap comparison endpoint.
+
+    Reads the content hashes of the user's job descriptions (an index-only
+    scan), then scores them with one vectorized pass over the skill index and
+    decodes only the returned matches.
+    """
+    # Not at module level: search hashes job descriptions with skills.utils
+    from ..search.service import job_description_hashes  # noqa: PLC0415
+
+    job_ids = await job_description_hashes(session, jwt_data.user_id)
+    if request.content_hashes is not None:
+        own = set(job_ids)
+        # Each job description once, however often it was requested
+        job_ids = [
+            content_hash
+            for content_hash in dict.fromkeys(request.content_hashes)
+            if content_hash in own
+        ]
+    return await get_skill_gap_service().compare(request, job_ids)
+
+
+@router.get(
+    "/demand",
+    response_model=SkillDemandResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Most requested skills",
+    description="Returns the skills required by the most analyzed job descriptions.",
+    responses={
+        200: {
+            "description": "Most requested skills first",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "total_jobs": 250,
+                        "skills": [
+                            {"skill": "Python", "job_count": 180, "share": 0.72},
+                            {"skill": "SQL", "job_count": 150, "share": 0.6},
+                        ],
+                    }
+                }
+            },
+        }
+    },
+)
+@cache_response(ttl_seconds=60, tags=(SKILL_DEMAND_CACHE_TAG,), shared=True)
+async def get_skill_demand(
+    limit: int = Query(20, ge=1, le=200, description="Number of skills to return"),
+) -> SkillDemandResponse:
+    """
+    Skill demand endpoint.
+
+    Reads posting list lengths from the skill index; responses are cached.
+    """
+    return await get_skill_gap_service().demand(limit)
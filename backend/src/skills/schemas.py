@@ -0,0 +1,147 @@
+"""Skill analysis request and response models."""
+
+from pydantic import ConfigDict, Field, field_validator
+
+from ..models import CustomBaseModel, UTCDatetime
+
+
+class SkillAnalysis(CustomBaseModel):
+    """Skills extracted from a job description (the LLM's structured output)."""
+
+    skills: list[str] = Field(
+        default_factory=list, description="Skills the job description asks for"
+    )
+    related_skills: list[str] = Field(
+        default_factory=list, description="Skills commonly expected but not mentioned"
+    )
+
+    @field_validator("skills", "related_skills")
+    @classmethod
+    def deduplicate(cls, value: list[str]) -> list[str]:
+        """Strip names and drop empty and repeated (case-insensitive) entries, keeping order."""
+        seen: set[str] = set()
+        skills = []
+        for skill in value:
+            name = skill.strip()
+            if name and name.casefold() not in seen:
+                seen.add(name.casefold())
+                skills.append(name)
+        return skills
+
+
+class SkillAnalysisResult(SkillAnalysis):
+    """Skill analysis together with the cache key it is stored under."""
+
+    content_hash: str = Field(..., description="SHA-256 of the normalized job description")
+    model: str = Field(..., description="Model that produced the analysis")
+    prompt_version: str = Field(..., description="Version of the extraction prompt")
+    cached: bool = Field(..., description="Whether the analysis was reused instead of computed")
+    created_at: UTCDatetime = Field(..., description="When the analysis was computed")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "skills": ["Python", "FastAPI", "PostgreSQL"],
+                "related_skills": ["SQL", "REST APIs"],
+                "content_hash": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+                "model": "gpt-4o-mini",
+                "prompt_version": "1",
+                "cached": True,
+                "created_at": "2026-01-01T00:00:00Z",
+            }
+        },
+    )
+
+
+class SkillGapRequest(CustomBaseModel):
+    """Skills of a user to compare against analyzed job descriptions."""
+
+    skills: list[str] = Field(..., min_length=1, max_length=500, description="User skills")
+    content_hashes: list[str] | None = Field(
+        default=None,
+        max_length=10_000,
+        description=(
+            "Compare only against these of your job descriptions (default: all your analyzed ones)"
+        ),
+    )
+    limit: int = Field(default=20, ge=1, le=100, description="Number of best matches to return")
+    min_coverage: float = Field(
+        default=0.0, ge=0, le=1, description="Minimum share of required skills the user has"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "skills": ["Python", "postgres", "Docker", "k8s"],
+                "limit": 20,
+                "min_coverage": 0.5,
+            }
+        }
+    )
+
+
+class SkillGapMatch(CustomBaseModel):
+    """Comparison of the user's skills with one job description."""
+
+    content_hash: str = Field(..., description="Job description (skill analysis) hash")
+    coverage: float = Field(..., description="Share of required skills the user has (0-1)")
+    matched_skills: list[str] = Field(..., description="Required skills the user has")
+    missing_skills: list[str] = Field(..., description="Required skills the user lacks")
+    related_skills: list[str] = Field(
+        ..., description="Related (not required) skills the user has that strengthen the match"
+    )
+
+
+class SkillGapResponse(CustomBaseModel):
+    """Best-matching job descriptions for a set of skills."""
+
+    compared: int = Field(..., description="Number of job descriptions compared")
+    unknown_skills: list[str] = Field(
+        ..., description="User skills not found in the skill vocabulary"
+    )
+    matches: list[SkillGapMatch] = Field(..., description="Best matches, highest coverage first")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "compared": 250,
+                "unknown_skills": ["COBOL"],
+                "matches": [
+                    {
+                        "content_hash": "9f86d0818...",
+                        "coverage": 0.75,
+                        "matched_skills": ["Python", "PostgreSQL", "Docker"],
+                        "missing_skills": ["Kafka"],
+                        "related_skills": ["Kubernetes"],
+                    }
+                ],
+            }
+        }
+    )
+
+
+class SkillDemand(CustomBaseModel):
+    """How often a skill is required across analyzed job descriptions."""
+
+    skill: str = Field(..., description="Canonical skill name")
+    job_count: int = Field(..., description="Job descriptions requiring the skill")
+    share: float = Field(..., description="Share of all analyzed job descriptions (0-1)")
+
+
+class SkillDemandResponse(CustomBaseModel):
+    """Most requested skills across analyzed job descriptions."""
+
+    total_jobs: int = Field(..., description="Number of analyzed job descriptions")
+    skills: list[SkillDemand] = Field(..., description="Most requested skills first")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "total_jobs": 250,
+                "skills": [
+                    {"skill": "Python", "job_count": 180, "share": 0.72},
+                    {"skill": "SQL", "job_count": 150, "share": 0.6},
+                ],
+            }
+        }
+    )
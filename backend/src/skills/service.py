@@ -0,0 +1,231 @@
+"""
+Content-addressed skill analysis.
+
+Job descriptions are normalized and hashed, and each analysis is stored under
+(content hash, model, prompt version). Submitting a posting that was already
+analyzed, by anyone, costs one primary-key lookup instead of an LLM call.
+Stored analyses never change, so recently used ones are also kept in a bounded
+in-process LRU without any invalidation. Concurrent requests for the same key
+share a single in-flight lookup and LLM call (single-flight); across workers,
+simultaneous first requests may both call the LLM, and the first insert wins.
+
+Saving a job description enqueues its analysis (``enqueue_skill_analysis``) in
+the same transaction; the skill gap index and skill demand read the stored
+analyses.
+"""
+
+import asyncio
+from collections import OrderedDict
+from functools import lru_cache
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ..database import get_engine
+from ..datetime import get_current_utc_datetime
+from ..jobs import JobRead, get_job_queue
+from ..search.constants import DocumentKind
+from ..search.models import SearchDocument
+from .config import get_skills_settings
+from .constants import SKILL_ANALYSIS_JOB
+from .exceptions import EmptyJobDescription
+from .extractor import SkillExtractor, load_skill_extractor
+from .models import SkillAnalysisRecord
+from .prompts import SKILL_EXTRACTION_PROMPT_VERSION
+from .schemas import SkillAnalysisResult
+from .utils import hash_job_description, normalize_job_description
+
+_table = SkillAnalysisRecord.__table__
+
+# (content hash, model, prompt version)
+AnalysisKey = tuple[str, str, str]
+# Job descriptions read per query by an analysis job
+_DOCUMENT_BATCH_SIZE = 100
+
+
+class SkillAnalysisService:
+    """Analyze job descriptions once per distinct text, model and prompt version."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        extractor: SkillExtractor,
+        memory_cache_size: int = 1024,
+    ) -> None:
+        # Single statements in autocommit (no BEGIN/COMMIT); always the primary,
+        # so an analysis stored by another worker is visible immediately
+        self._engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+        self._extractor = extractor
+        self._inflight: dict[AnalysisKey, asyncio.Task[SkillAnalysisResult]] = {}
+        self._memory: OrderedDict[AnalysisKey, SkillAnalysisResult] = OrderedDict()
+        self._memory_cache_size = memory_cache_size
+        self.memory_hits = 0  # served from the in-process LRU
+        self.hits = 0  # served from the table
+        self.misses = 0  # LLM calls
+        self.coalesced = 0  # joined an in-flight analysis
+
+    async def analyze(self, job_description: str) -> SkillAnalysisResult:
+        """
+        Get the skill analysis of a job description, computing it only if needed.
+
+        Args:
+            job_description: Job description text as submitted.
+
+        Returns:
+            The analysis; ``cached`` is False only for the request that ran the LLM.
+
+        Raises:
+            EmptyJobDescription: If the text is empty after normalization.
+        """
+        text = normalize_job_description(job_description)
+        if not text:
+            raise EmptyJobDescription
+        key = (hash_job_description(text), self._extractor.model, SKILL_EXTRACTION_PROMPT_VERSION)
+
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return result
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            result = await asyncio.shield(task)
+            return result.model_copy(update={"cached": True})
+
+        task = asyncio.create_task(self._load_or_extract(key, text))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        # Shielded: a cancelled request must not cancel the LLM call others wait on
+        return await asyncio.shield(task)
+
+    async def analyze_documents(self, user_id: int, document_ids: list[int] | None = None) -> int:
+        """
+        Analyze a user's saved job descriptions (``SKILL_ANALYSIS_JOB``).
+
+        Job descriptions analyzed before, by anyone, cost a lookup, so a
+        repeated job calls the LLM for none of them.
+
+        Args:
+            user_id: Owner of the job descriptions.
+            document_ids: Only these job descriptions (ignored if not the
+                user's); by default every one.
+
+        Returns:
+            Job descriptions analyzed by the LLM.
+        """
+        statement = (
+            select(SearchDocument.id, SearchDocument.body)
+            .where(
+                SearchDocument.user_id == user_id,
+                SearchDocument.kind == DocumentKind.JOB_DESCRIPTION.value,
+            )
+            .order_by(SearchDocument.id)
+            .limit(_DOCUMENT_BATCH_SIZE)
+        )
+        if document_ids is not None:
+            statement = statement.where(SearchDocument.id.in_(document_ids))
+
+        analyzed = 0
+        last_id = 0
+        while True:
+            async with self._engine.connect() as conn:
+                rows = (await conn.execute(statement.where(SearchDocument.id > last_id))).all()
+            if not rows:
+                return analyzed
+            last_id = rows[-1].id
+            for row in rows:
+                try:
+                    result = await self.analyze(row.body)
+                except EmptyJobDescription:
+                    continue
+                analyzed += not result.cached
+
+    def _forget(self, key: AnalysisKey, task: asyncio.Task[SkillAnalysisResult]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        # Also marks a failure as retrieved even if every waiter was cancelled;
+        # waiters that are still there receive it from the shield
+        if task.exception() is None and self._memory_cache_size > 0:
+            self._memory[key] = task.result().model_copy(update={"cached": True})
+            if len(self._memory) > self._memory_cache_size:
+                self._memory.popitem(last=False)
+
+    async def _load_or_extract(self, key: AnalysisKey, text: str) -> SkillAnalysisResult:
+        content_hash, model, prompt_version = key
+        statement = select(_table.c.skills, _table.c.related_skills, _table.c.created_at).where(
+            _table.c.content_hash == content_hash,
+            _table.c.model == model,
+            _table.c.prompt_version == prompt_version,
+        )
+        async with self._engine.connect() as conn:
+            row = (await conn.execute(statement)).first()
+        if row is not None:
+            self.hits += 1
+            return SkillAnalysisResult(
+                skills=row.skills,
+                related_skills=row.related_skills,
+                content_hash=content_hash,
+                model=model,
+                prompt_version=prompt_version,
+                cached=True,
+                created_at=row.created_at,
+            )
+
+        self.misses += 1
+        analysis = await self._extractor.extract(text)
+        created_at = get_current_utc_datetime()
+        statement = (
+            insert(_table)
+            .values(
+                content_hash=content_hash,
+                model=model,
+                prompt_version=prompt_version,
+                skills=analysis.skills,
+                related_skills=analysis.related_skills,
+                created_at=created_at,
+            )
+            .on_conflict_do_nothing()
+        )
+        async with self._engine.connect() as conn:
+            await conn.execute(statement)
+        return SkillAnalysisResult(
+            skills=analysis.skills,
+            related_skills=analysis.related_skills,
+            content_hash=content_hash,
+            model=model,
+            prompt_version=prompt_version,
+            cached=False,
+            created_at=created_at,
+        )
+
+
+async def enqueue_skill_analysis(
+    user_id: int, document_ids: list[int] | None = None, session: AsyncSession | None = None
+) -> JobRead:
+    """
+    Enqueue the skill analysis of a user's job descriptions.
+
+    Args:
+        user_id: Owner of the job descriptions.
+        document_ids: These job descriptions; by default every one.
+        session: Enqueue in this session's transaction, e.g. the one saving
+            the job descriptions.
+
+    Returns:
+        The queued job.
+    """
+    job, _ = await get_job_queue().enqueue(
+        SKILL_ANALYSIS_JOB, {"document_ids": document_ids}, user_id=user_id, session=session
+    )
+    return job
+
+
+@lru_cache
+def get_skill_analysis_service() -> SkillAnalysisService:
+    """Get the process-wide skill analysis service, with the configured extractor."""
+    return SkillAnalysisService(get_engine(), load_skill_extractor(get_skills_settings()))
@@ -0,0 +1,34 @@
+"""Job description normalization and hashing."""
+
+import hashlib
+import re
+import unicodedata
+
+_HORIZONTAL_WHITESPACE = re.compile(r"[^\S\n]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+# Zero-width characters that survive NFKC (often pasted from web pages)
+_ZERO_WIDTH = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff"))
+
+
+def normalize_job_description(text: str) -> str:
+    """
+    Normalize a job description so trivially different copies hash the same.
+
+    Applies NFKC (e.g. non-breaking spaces and full-width characters), removes
+    zero-width characters, normalizes line endings, collapses runs of spaces and
+    tabs, strips every line and keeps at most one blank line between paragraphs.
+    Letter case is preserved: it can distinguish skills ("Go" and "go").
+
+    Example:
+        >>> normalize_job_description("  Python\\u00a0developer \\r\\n\\r\\n\\r\\n\\tSQL  ")
+        'Python developer\\n\\nSQL'
+    """
+    text = unicodedata.normalize("NFKC", text).translate(_ZERO_WIDTH)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = (_HORIZONTAL_WHITESPACE.sub(" ", line).strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def hash_job_description(normalized_text: str) -> str:
+    """SHA-256 hex digest of a normalized job description."""
+    return hashlib.sha256(normalized_text.encode()).hexdigest()
@@ -0,0 +1,74 @@
+"""Normalized skill vocabulary with alias mapping."""
+
+import re
+import unicodedata
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+
+from .constants import SKILL_ALIASES
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+# Skill names repeat across job descriptions, so most calls are cache hits
+@lru_cache(maxsize=16384)
+def normalize_skill_name(name: str) -> str:
+    """
+    Normalize a skill name for matching.
+
+    Applies NFKC, case-folds, collapses whitespace and strips surrounding
+    whitespace and trailing periods. Symbols that distinguish skills ("C++",
+    "C#", ".NET") are kept.
+
+    Example:
+        >>> normalize_skill_name("  PostgreSQL. ")
+        'postgresql'
+    """
+    name = unicodedata.normalize("NFKC", name).casefold()
+    return _WHITESPACE.sub(" ", name).strip().rstrip(".").strip()
+
+
+class SkillVocabulary:
+    """
+    Bidirectional mapping between skill names and dense integer ids.
+
+    Aliases resolve to the id of their canonical skill. Skills that are not in
+    the alias table get an id when first interned, displayed with the spelling
+    they were first seen with.
+
+    Example:
+        >>> vocabulary = SkillVocabulary()
+        >>> vocabulary.intern("k8s") == vocabulary.lookup("Kubernetes")
+        True
+        >>> vocabulary.name(vocabulary.intern("kubernetes"))
+        'Kubernetes'
+    """
+
+    def __init__(self, aliases: Mapping[str, Iterable[str]] = SKILL_ALIASES) -> None:
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        for canonical, alternatives in aliases.items():
+            skill_id = self.intern(canonical)
+            for alias in alternatives:
+                self._ids.setdefault(normalize_skill_name(alias), skill_id)
+
+    def lookup(self, name: str) -> int | None:
+        """Id of a known skill, or None."""
+        return self._ids.get(normalize_skill_name(name))
+
+    def intern(self, name: str) -> int:
+        """Id of a skill, adding it to the vocabulary if it is new."""
+        key = normalize_skill_name(name)
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            skill_id = len(self._names)
+            self._ids[key] = skill_id
+            self._names.append(name.strip())
+        return skill_id
+
+    def name(self, skill_id: int) -> str:
+        """Display name of a skill id."""
+        return self._names[skill_id]
+
+    def __len__(self) -> int:
+        return len(self._names)
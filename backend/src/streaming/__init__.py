@@ -0,0 +1,19 @@
+"""Server-Sent Event responses for streaming pipeline output."""
+
+from .config import StreamingConfig, get_streaming_settings
+from .constants import EVENT_STREAM_MEDIA_TYPE, StreamEventType
+from .graph import StreamingGraph, graph_events
+from .sse import EventStreamResponse, StreamEvent, accepts_event_stream, encode_events
+
+__all__ = [
+    "EVENT_STREAM_MEDIA_TYPE",
+    "EventStreamResponse",
+    "StreamEvent",
+    "StreamEventType",
+    "StreamingConfig",
+    "StreamingGraph",
+    "accepts_event_stream",
+    "encode_events",
+    "get_streaming_settings",
+    "graph_events",
+]
@@ -0,0 +1,37 @@
+"""Event stream configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class StreamingConfig(BaseSettings):
+    """Event stream configuration loaded from environment variables."""
+
+    # Send a keep-alive comment when no event was sent for this long
+    stream_ping_interval_seconds: float = Field(
+        default=15.0, gt=0, alias="STREAM_PING_INTERVAL_SECONDS"
+    )
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_streaming_settings() -> StreamingConfig:
+    """Get the global streaming configuration, loaded from the environment on first use."""
+    return StreamingConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``streaming_settings`` is built on first access
+    if name == "streaming_settings":
+        return get_streaming_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -0,0 +1,29 @@
+"""Constants for Server-Sent Event streams."""
+
+from enum import Enum
+
+
+class StreamEventType(str, Enum):
+    """Event names sent on a stream (the SSE ``event`` field)."""
+
+    NODE = "node"  # a pipeline step finished; data holds its output
+    TOKEN = "token"  # a chunk of model output
+    ERROR = "error"  # the pipeline failed; the stream ends
+    DONE = "done"  # the pipeline finished; the stream ends
+
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+EVENT_STREAM_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Disable response buffering in nginx, which would hold back every event
+    "X-Accel-Buffering": "no",
+}
+
+# SSE comment line sent when no event was produced for a while, so proxies and
+# load balancers do not close the idle connection
+PING_COMMENT = b": ping\n\n"
+
+# Events buffered between the pipeline and the client; a slow client pauses
+# the pipeline instead of growing memory
+EVENT_QUEUE_SIZE = 64
@@ -0,0 +1,69 @@
+"""
+Server-Sent Events from a LangGraph pipeline.
+
+Uses the graph's own streaming (``astream`` with the ``messages`` and ``updates``
+modes), so every token of every model call is forwarded as it is generated and
+every node's output as soon as the node finishes. LangGraph is not imported
+here: anything with a compatible ``astream`` works, including the fakes used by
+the benchmarks.
+"""
+
+from collections.abc import AsyncIterator
+from typing import Any, Protocol
+
+from .constants import StreamEventType
+from .sse import StreamEvent
+
+# LangGraph stream modes: message chunks from model calls, node outputs
+_MESSAGES = "messages"
+_UPDATES = "updates"
+
+
+class StreamingGraph(Protocol):
+    """The part of a compiled LangGraph graph used for streaming."""
+
+    def astream(
+        self, input: Any, config: Any = None, *, stream_mode: Any = None
+    ) -> AsyncIterator[Any]: ...
+
+
+async def graph_events(
+    graph: StreamingGraph,
+    inputs: Any,
+    config: dict[str, Any] | None = None,
+    *,
+    tokens: bool = True,
+) -> AsyncIterator[StreamEvent]:
+    """
+    Stream a graph run as ``node`` and ``token`` events.
+
+    Cancelling the iteration (as ``EventStreamResponse`` does when the client
+    disconnects) closes the graph's stream, which cancels the running node and
+    its model call.
+
+    Args:
+        graph: Compiled graph.
+        inputs: Graph input.
+        config: Run config (thread id, callbacks, ...).
+        tokens: Forward model tokens; node outputs only when False.
+
+    Yields:
+        ``token`` events ``{"node", "content"}`` and ``node`` events ``{"node", "output"}``.
+    """
+    modes = [_MESSAGES, _UPDATES] if tokens else [_UPDATES]
+    stream = graph.astream(inputs, config, stream_mode=modes)
+    try:
+        async for mode, chunk in stream:
+            if mode == _MESSAGES:
+                message, metadata = chunk
+                content = getattr(message, "content", message)
+                if content:
+                    node = metadata.get("langgraph_node") if metadata else None
+                    yield StreamEvent(StreamEventType.TOKEN, {"node": node, "content": content})
+            elif mode == _UPDATES:
+                for node, output in chunk.items():
+                    yield StreamEvent(StreamEventType.NODE, {"node": node, "output": output})
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -0,0 +1,183 @@
+"""
+Server-Sent Event responses for long-running pipelines.
+
+The pipeline runs in its own task and hands events to the response through a
+small queue, so the response can send keep-alive pings while the pipeline is
+busy and the pipeline is paused while a slow client catches up. When the client
+disconnects, the response stops waiting for the next event and the pipeline
+task is cancelled, which stops the upstream model calls.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+import anyio
+import orjson
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
+
+from .config import get_streaming_settings
+from .constants import (
+    EVENT_QUEUE_SIZE,
+    EVENT_STREAM_HEADERS,
+    EVENT_STREAM_MEDIA_TYPE,
+    PING_COMMENT,
+    StreamEventType,
+)
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the pipeline in the event queue
+_END = object()
+
+
+class StreamEvent:
+    """One Server-Sent Event."""
+
+    __slots__ = ("data", "event", "id")
+
+    def __init__(self, event: StreamEventType | str, data: Any, id: str | None = None) -> None:
+        self.event = event
+        self.data = data
+        self.id = id
+
+    def encode(self) -> bytes:
+        """
+        Serialize the event in the ``text/event-stream`` format.
+
+        The data is JSON on a single line (orjson never emits newlines).
+
+        Example:
+            >>> StreamEvent(StreamEventType.TOKEN, {"content": "Hi"}).encode()
+            b'event: token\\ndata: {"content":"Hi"}\\n\\n'
+        """
+        event = self.event.value if isinstance(self.event, StreamEventType) else self.event
+        data = orjson.dumps(self.data, default=_to_jsonable)
+        prefix = b"" if self.id is None else f"id: {self.id}\n".encode()
+        return prefix + b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+def _to_jsonable(value: Any) -> Any:
+    # Pydantic models (schemas, LangChain messages); anything else as text
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+def accepts_event_stream(request: Request) -> bool:
+    """Whether the client asked for Server-Sent Events (``Accept: text/event-stream``)."""
+    return EVENT_STREAM_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def encode_events(
+    events: AsyncIterable[StreamEvent], *, ping_interval: float
+) -> AsyncIterator[bytes]:
+    """
+    Encode a pipeline's events, with pings while it is idle and a final event.
+
+    The pipeline is consumed by a separate task. The stream ends with a ``done``
+    event, or an ``error`` event if the pipeline raised. Closing or cancelling
+    this generator cancels the pipeline task.
+
+    Args:
+        events: The pipeline's events.
+        ping_interval: Seconds without an event before a ping comment is sent.
+
+    Yields:
+        Encoded events and pings.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+
+    async def produce() -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_END)
+
+    producer = asyncio.create_task(produce(), name="event-stream-producer")
+    try:
+        while True:
+            try:
+                async with asyncio.timeout(ping_interval):
+                    item = await queue.get()
+            except TimeoutError:
+                yield PING_COMMENT
+                continue
+
+            if item is _END:
+                yield StreamEvent(StreamEventType.DONE, {}).encode()
+                return
+            if isinstance(item, Exception):
+                yield _error_event(item).encode()
+                return
+            yield item.encode()
+    finally:
+        if not producer.done():
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+
+
+def _error_event(error: Exception) -> StreamEvent:
+    if isinstance(error, HTTPException):
+        return StreamEvent(StreamEventType.ERROR, {"detail": error.detail})
+    logger.error("Event stream pipeline failed", exc_info=error)
+    return StreamEvent(StreamEventType.ERROR, {"detail": "Server error"})
+
+
+class EventStreamResponse(StreamingResponse):
+    """
+    Server-Sent Events response that cancels its pipeline when the client leaves.
+
+    Starlette only notices a disconnect when a write fails (ASGI spec 2.4), which
+    never happens while the pipeline is thinking. This response always listens
+    for ``http.disconnect`` alongside the stream and cancels the stream, and
+    with it the pipeline task, as soon as the client goes away.
+
+    Example:
+        >>> @router.post("/resumes/{resume_id}/tailor")
+        ... async def tailor(resume_id: int) -> EventStreamResponse:
+        ...     return EventStreamResponse(graph_events(graph, {"resume_id": resume_id}))
+    """
+
+    media_type = EVENT_STREAM_MEDIA_TYPE
+
+    def __init__(
+        self,
+        events: AsyncIterable[StreamEvent],
+        *,
+        ping_interval: float | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        if ping_interval is None:
+            ping_interval = get_streaming_settings().stream_ping_interval_seconds
+        super().__init__(
+            encode_events(events, ping_interval=ping_interval),
+            headers={**EVENT_STREAM_HEADERS, **(headers or {})},
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG002
+        async with anyio.create_task_group() as task_group:
+
+            async def stream() -> None:
+                # OSError: the connection was closed while writing
+                with contextlib.suppress(OSError):
+                    await self.stream_response(send)
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(stream)
+            await self.listen_for_disconnect(receive)
+            task_group.cancel_scope.cancel()
+
+        if self.background is not None:
+            await self.background()
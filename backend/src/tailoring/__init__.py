@@ -0,0 +1,52 @@
+"""Incremental resume tailoring: only changed sections reach the LLM."""
+
+from .config import TailoringConfig, get_tailoring_settings
+from .constants import SectionKind
+from .latex import TEMPLATE, escape_latex, resume_document, section_latex
+from .models import TailoredSectionRecord
+from .prompts import SECTION_TAILORING_PROMPT_VERSION
+from .router import router
+from .schemas import (
+    ResumeSection,
+    SectionTailoring,
+    TailoredResume,
+    TailoredSection,
+    TailoringReport,
+    TailoringRun,
+    TailorResumeRequest,
+)
+from .service import TailoringService, get_tailoring_service
+from .tailorer import (
+    ChatModelSectionTailorer,
+    KeywordSectionTailorer,
+    SectionTailorer,
+    load_tailorer,
+)
+from .utils import hash_section
+
+__all__ = [
+    "SECTION_TAILORING_PROMPT_VERSION",
+    "TEMPLATE",
+    "ChatModelSectionTailorer",
+    "KeywordSectionTailorer",
+    "ResumeSection",
+    "SectionKind",
+    "SectionTailorer",
+    "SectionTailoring",
+    "TailorResumeRequest",
+    "TailoredResume",
+    "TailoredSection",
+    "TailoredSectionRecord",
+    "TailoringConfig",
+    "TailoringReport",
+    "TailoringRun",
+    "TailoringService",
+    "escape_latex",
+    "get_tailoring_service",
+    "get_tailoring_settings",
+    "hash_section",
+    "load_tailorer",
+    "resume_document",
+    "router",
+    "section_latex",
+]
@@ -0,0 +1,38 @@
+"""Resume tailoring configuration loaded from environment variables."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class TailoringConfig(BaseSettings):
+    """Resume tailoring configuration loaded from environment variables."""
+
+    # "module:attribute" of a zero-argument callable returning a SectionTailorer;
+    # by default the offline keyword tailorer, which only reorders list items
+    tailoring_tailorer: str | None = Field(default=None, alias="TAILORING_TAILORER")
+    # LLM calls running at the same time for one resume
+    tailoring_max_concurrency: int = Field(default=4, ge=1, alias="TAILORING_MAX_CONCURRENCY")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        populate_by_name = True
+        extra = "ignore"  # Ignore extra environment variables not defined in the model
+
+
+@lru_cache
+def get_tailoring_settings() -> TailoringConfig:
+    """Get the global tailoring configuration, loaded from the environment on first use."""
+    return TailoringConfig()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy global instance (PEP 562); ``tailoring_settings`` is built on first access
+    if name == "tailoring_settings":
+        return get_tailoring_settings()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
@@ -0,0 +1,26 @@
+"""Constants for resume tailoring."""
+
+from enum import Enum
+
+
+class SectionKind(str, Enum):
+    """What a resume section holds."""
+
+    HEADER = "header"  # name and contact details; never tailored
+    SUMMARY = "summary"
+    EXPERIENCE = "experience"
+    PROJECTS = "projects"
+    SKILLS = "skills"
+    EDUCATION = "education"
+    OTHER = "other"
+
+
+# Sections copied into the tailored resume as written
+UNTAILORED_KINDS = frozenset({SectionKind.HEADER})
+
+SECTION_TITLE_MAX_LENGTH = 100
+SECTION_CONTENT_MAX_LENGTH = 20_000
+MAX_SECTIONS = 50
+
+# Lines starting with one of these are list items (bullets)
+BULLET_MARKERS = ("- ", "* ", "• ")
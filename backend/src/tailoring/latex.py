@@ -0,0 +1,99 @@
+"""
+LaTeX for tailored resumes, one fragment per section.
+
+Each section is converted on its own, so re-tailoring a resume only converts
+the sections that changed (tailored sections store their fragment); the
+document is the template's preamble followed by the fragments in order. An
+unchanged document has an unchanged render key, so its PDF comes from the
+render cache.
+"""
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+from ..skills.utils import normalize_job_description
+from .constants import BULLET_MARKERS, SectionKind
+
+# Name and version of the template, for the render cache key: bump the version
+# whenever the preamble or the fragments change
+TEMPLATE = "tailored-resume-v1"
+
+PREAMBLE = r"""\documentclass[11pt]{article}
+\usepackage[margin=0.75in]{geometry}
+\usepackage[T1]{fontenc}
+\usepackage[utf8]{inputenc}
+\usepackage{lmodern}
+\usepackage{enumitem}
+\setlist[itemize]{leftmargin=*,itemsep=1pt,topsep=2pt}
+\pagestyle{empty}
+\setlength{\parindent}{0pt}
+"""
+
+_SPECIAL_CHARACTERS = {
+    "\\": r"\textbackslash{}",
+    "{": r"\{",
+    "}": r"\}",
+    "$": r"\$",
+    "&": r"\&",
+    "#": r"\#",
+    "^": r"\textasciicircum{}",
+    "_": r"\_",
+    "~": r"\textasciitilde{}",
+    "%": r"\%",
+}
+_SPECIAL = re.compile("|".join(map(re.escape, _SPECIAL_CHARACTERS)))
+_HEADER_SEPARATOR = r" $\cdot$ "
+
+
+def escape_latex(text: str) -> str:
+    r"""
+    Escape text for use in a LaTeX document.
+
+    Example:
+        >>> escape_latex("C# & 100% of R&D_ops")
+        'C\\# \\& 100\\% of R\\&D\\_ops'
+    """
+    return _SPECIAL.sub(lambda match: _SPECIAL_CHARACTERS[match.group()], text)
+
+
+@lru_cache(maxsize=4096)
+def section_latex(kind: SectionKind, title: str, content: str) -> str:
+    """
+    LaTeX fragment of a resume section.
+
+    The header's first line is the candidate's name and its other lines are
+    joined on one line; in other sections, lines starting with a bullet marker
+    ("- ", "* ", "• ") become list items and other lines paragraphs.
+    """
+    lines = [line for line in normalize_job_description(content).split("\n") if line]
+    if kind is SectionKind.HEADER:
+        name, *details = lines or [""]
+        return (
+            "\\begin{center}\n"
+            f"{{\\LARGE\\bfseries {escape_latex(name)}}}\\\\[2pt]\n"
+            f"{_HEADER_SEPARATOR.join(map(escape_latex, details))}\n"
+            "\\end{center}\n"
+        )
+
+    parts = [f"\\section*{{{escape_latex(title.strip())}}}"]
+    in_list = False
+    for line in lines:
+        marker = next((marker for marker in BULLET_MARKERS if line.startswith(marker)), None)
+        if marker is not None and not in_list:
+            parts.append("\\begin{itemize}")
+        elif marker is None and in_list:
+            parts.append("\\end{itemize}")
+        in_list = marker is not None
+        if in_list:
+            parts.append(f"  \\item {escape_latex(line[len(marker) :].strip())}")
+        else:
+            parts.append(f"{escape_latex(line)}\\par")
+    if in_list:
+        parts.append("\\end{itemize}")
+    return "\n".join(parts) + "\n"
+
+
+def resume_document(fragments: Iterable[str]) -> str:
+    """Complete LaTeX document from section fragments, in order."""
+    return f"{PREAMBLE}\\begin{{document}}\n{''.join(fragments)}\\end{{document}}\n"
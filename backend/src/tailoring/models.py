@@ -0,0 +1,33 @@
+"""Resume tailoring database models."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, func
+from sqlmodel import Field, SQLModel
+
+
+class TailoredSectionRecord(SQLModel, table=True):
+    """
+    A resume section tailored to a job description, with its LaTeX.
+
+    Keyed by the hashes of the section and of the normalized job description
+    together with the model and prompt version, so re-tailoring a resume reuses
+    every section that did not change, for anyone. The tokens and time of the
+    LLM call are kept to report what each reuse saved.
+    """
+
+    __tablename__ = "tailored_section"
+
+    section_hash: str = Field(sa_column=Column(String(64), primary_key=True))
+    job_description_hash: str = Field(sa_column=Column(String(64), primary_key=True))
+    model: str = Field(sa_column=Column(String(100), primary_key=True))
+    prompt_version: str = Field(sa_column=Column(String(32), primary_key=True))
+    content: str = Field(sa_column=Column(Text, nullable=False))
+    latex: str = Field(sa_column=Column(Text, nullable=False))
+    input_tokens: int = Field(sa_column=Column(Integer, nullable=False))
+    output_tokens: int = Field(sa_column=Column(Integer, nullable=False))
+    latency_ms: int = Field(sa_column=Column(Integer, nullable=False))
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
@@ -0,0 +1,16 @@
+"""Prompts used for resume tailoring."""
+
+# Part of the tailored section cache key: bump it whenever the prompt changes,
+# so sections tailored with the old prompt are not reused
+SECTION_TAILORING_PROMPT_VERSION = "1"
+
+SECTION_TAILORING_PROMPT = """\
+You tailor one section of a job seeker's resume to a job description.
+
+Rewrite the section so the experience most relevant to the job comes first and
+uses the job description's terminology where it is accurate. Keep every fact
+true: never invent employers, titles, dates, numbers, skills or achievements.
+Keep the format: one item per line, list items starting with "- ". Write plain
+text in the candidate's voice, without markdown, commentary or a heading.
+
+Reply with the rewritten section only."""
@@ -0,0 +1,173 @@
+"""Resume tailoring endpoints."""
+
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Path, Request, Response, status
+
+from ..auth import parse_jwt_data
+from ..cache.routing import etag_matches
+from ..render import PdfNotFound, get_render_service
+from ..render.constants import RENDER_KEY_PATTERN
+from ..streaming import (
+    EVENT_STREAM_MEDIA_TYPE,
+    EventStreamResponse,
+    StreamEvent,
+    StreamEventType,
+    accepts_event_stream,
+)
+from .latex import TEMPLATE
+from .schemas import TailoredResume, TailoringRun, TailorResumeRequest
+from .service import get_tailoring_service
+
+router = APIRouter(prefix="/tailoring", tags=["tailoring"], dependencies=[Depends(parse_jwt_data)])
+
+_RENDER_ERRORS = {
+    422: {
+        "description": "The job description is empty or the document could not be rendered",
+        "content": {
+            "application/json": {"example": {"detail": "The document could not be rendered"}}
+        },
+    },
+    429: {
+        "description": "Too many documents are being rendered",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Too many documents are being rendered, try again later"}
+            }
+        },
+    },
+    504: {
+        "description": "Rendering timed out",
+        "content": {
+            "application/json": {"example": {"detail": "Rendering the document timed out"}}
+        },
+    },
+}
+
+
+@router.post(
+    "/resumes",
+    response_model=TailoringRun,
+    status_code=status.HTTP_200_OK,
+    summary="Tailor a resume to a job description",
+    description=(
+        "Tailors each section of the resume to the job description (the header is "
+        "kept as written), renders the result to PDF and returns the tailored "
+        "sections, their LaTeX source and a report of the tokens and time spent and "
+        "saved. Sections tailored earlier for the same job description are reused, "
+        "and an unchanged document is served from the render cache. Download the PDF "
+        "with GET /v1/tailoring/pdfs/{pdf_key}. With Accept: text/event-stream the run "
+        "is streamed instead: a node event with the tailored resume (node tailor), "
+        "one with the PDF (node render, output pdf_key and pdf_cached), then done, "
+        "or error if a step failed; closing the stream stops the run."
+    ),
+    responses={
+        200: {
+            "description": "The tailored resume",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "resume": {
+                            "job_description_hash": "9f86d0818...",
+                            "model": "gpt-4o-mini",
+                            "prompt_version": "v1",
+                            "sections": [],
+                            "latex": "\\documentclass[11pt]{article}...",
+                            "report": {
+                                "sections": 5,
+                                "tailored": 1,
+                                "reused": 3,
+                                "input_tokens": 900,
+                                "output_tokens": 350,
+                                "tokens_saved": 3900,
+                                "llm_seconds": 2.1,
+                                "llm_seconds_saved": 7.4,
+                                "seconds": 2.4,
+                            },
+                        },
+                        "pdf_key": "4f1c0e...",
+                        "pdf_cached": False,
+                    }
+                },
+                EVENT_STREAM_MEDIA_TYPE: {
+                    "example": (
+                        'event: node\ndata: {"node":"tailor","output":{"job_description_hash":'
+                        '"9f86d0818...","sections":[],"report":{"tailored":1,"reused":3}}}\n\n'
+                        'event: node\ndata: {"node":"render","output":{"pdf_key":"4f1c0e...",'
+                        '"pdf_cached":false}}\n\n'
+                        "event: done\ndata: {}\n\n"
+                    )
+                },
+            },
+        },
+        **_RENDER_ERRORS,
+    },
+)
+async def tailor_resume(
+    request: TailorResumeRequest,
+    http_request: Request,
+) -> TailoringRun | EventStreamResponse:
+    """
+    Tailoring endpoint.
+
+    Sends only the sections without a stored tailoring to the tailorer, then
+    renders the document through the bounded render queue. Streamed runs send
+    keep-alive pings while the tailorer works and are cancelled when the
+    client disconnects.
+    """
+    if accepts_event_stream(http_request):
+        return EventStreamResponse(_tailoring_events(request))
+    resume = await get_tailoring_service().tailor(request)
+    return await _render(resume)
+
+
+async def _render(resume: TailoredResume) -> TailoringRun:
+    result = await get_render_service().render(resume.latex, template=TEMPLATE)
+    return TailoringRun(resume=resume, pdf_key=result.key, pdf_cached=result.cached)
+
+
+async def _tailoring_events(request: TailorResumeRequest) -> AsyncIterator[StreamEvent]:
+    resume = await get_tailoring_service().tailor(request)
+    yield StreamEvent(StreamEventType.NODE, {"node": "tailor", "output": resume})
+    run = await _render(resume)
+    output = {"pdf_key": run.pdf_key, "pdf_cached": run.pdf_cached}
+    yield StreamEvent(StreamEventType.NODE, {"node": "render", "output": output})
+
+
+@router.get(
+    "/pdfs/{pdf_key}",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="Download a tailored resume PDF",
+    description=(
+        "Returns a PDF rendered by POST /v1/tailoring/resumes. PDFs are kept in the "
+        "render cache, so one not downloaded for a long time may be gone: tailor the "
+        "resume again to render it again (its sections are reused). The key is the "
+        "ETag; send it in If-None-Match to get 304."
+    ),
+    responses={
+        200: {"description": "The PDF", "content": {"application/pdf": {}}},
+        304: {"description": "The PDF has not changed"},
+        404: {
+            "description": "The PDF is not in the render cache",
+            "content": {"application/json": {"example": {"detail": "PDF not found"}}},
+        },
+    },
+)
+async def get_pdf(
+    request: Request,
+    pdf_key: str = Path(..., pattern=RENDER_KEY_PATTERN, description="pdf_key of a tailoring"),
+) -> Response:
+    """
+    PDF download endpoint.
+
+    A file read from the render cache; PDFs never change, so a matching
+    If-None-Match needs no read at all.
+    """
+    headers = {"ETag": f'"{pdf_key}"'}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    pdf = await get_render_service().cached(pdf_key)
+    if pdf is None:
+        raise PdfNotFound
+    return Response(content=pdf, media_type="application/pdf", headers=headers)
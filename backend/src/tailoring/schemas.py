@@ -0,0 +1,99 @@
+"""Resume tailoring request and response models."""
+
+from pydantic import ConfigDict, Field
+
+from ..models import CustomBaseModel
+from .constants import (
+    MAX_SECTIONS,
+    SECTION_CONTENT_MAX_LENGTH,
+    SECTION_TITLE_MAX_LENGTH,
+    SectionKind,
+)
+
+
+class ResumeSection(CustomBaseModel):
+    """One section of a resume, as the user wrote it."""
+
+    kind: SectionKind = Field(..., description="What the section holds")
+    title: str = Field(
+        default="", max_length=SECTION_TITLE_MAX_LENGTH, description="Heading, e.g. Experience"
+    )
+    content: str = Field(
+        ...,
+        max_length=SECTION_CONTENT_MAX_LENGTH,
+        description='Plain text, one item per line; list items start with "- "',
+    )
+
+
+class TailorResumeRequest(CustomBaseModel):
+    """A resume, section by section, and the job description to tailor it to."""
+
+    job_description: str = Field(..., min_length=1, max_length=100_000)
+    sections: list[ResumeSection] = Field(..., min_length=1, max_length=MAX_SECTIONS)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "job_description": "Backend engineer: Python, PostgreSQL, Kafka...",
+                "sections": [
+                    {"kind": "header", "content": "Ada Lovelace\nada@example.com"},
+                    {
+                        "kind": "experience",
+                        "title": "Experience",
+                        "content": "Engineer, Acme (2020-2024)\n- Built billing services",
+                    },
+                ],
+            }
+        }
+    )
+
+
+class SectionTailoring(CustomBaseModel):
+    """A tailored section as returned by the LLM, with the tokens it took."""
+
+    content: str = Field(..., description="Tailored section text")
+    input_tokens: int = Field(default=0, ge=0)
+    output_tokens: int = Field(default=0, ge=0)
+
+
+class TailoredSection(CustomBaseModel):
+    """A section of the tailored resume."""
+
+    kind: SectionKind = Field(..., description="What the section holds")
+    title: str = Field(..., description="Heading")
+    content: str = Field(..., description="Tailored text (the original for the header)")
+    section_hash: str = Field(..., description="SHA-256 of the original section")
+    cached: bool = Field(..., description="Whether this run reused an earlier tailoring")
+
+
+class TailoringReport(CustomBaseModel):
+    """What a tailoring run computed, and what reusing earlier work saved."""
+
+    sections: int = Field(..., description="Sections in the resume")
+    tailored: int = Field(..., description="Sections sent to the LLM by this run")
+    reused: int = Field(..., description="Sections tailored earlier, for this job description")
+    input_tokens: int = Field(..., description="LLM input tokens spent by this run")
+    output_tokens: int = Field(..., description="LLM output tokens spent by this run")
+    tokens_saved: int = Field(..., description="Tokens the reused sections took originally")
+    llm_seconds: float = Field(..., description="Time of this run's LLM calls, added up")
+    llm_seconds_saved: float = Field(..., description="Time the reused sections' calls took")
+    seconds: float = Field(..., description="Duration of the run")
+
+
+class TailoredResume(CustomBaseModel):
+    """A resume tailored to a job description, with its LaTeX source."""
+
+    job_description_hash: str = Field(..., description="SHA-256 of the normalized job description")
+    model: str = Field(..., description="Model that tailored the sections")
+    prompt_version: str = Field(..., description="Version of the tailoring prompt")
+    sections: list[TailoredSection] = Field(..., description="In the order of the request")
+    latex: str = Field(..., description="Complete LaTeX document")
+    report: TailoringReport
+
+
+class TailoringRun(CustomBaseModel):
+    """A tailored resume and its rendered PDF."""
+
+    resume: TailoredResume
+    pdf_key: str = Field(..., description="Get the PDF with GET /v1/tailoring/pdfs/{pdf_key}")
+    pdf_cached: bool = Field(..., description="Whether the PDF came from the render cache")
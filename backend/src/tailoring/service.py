@@ -0,0 +1,253 @@
+"""
+Incremental resume tailoring.
+
+A resume is tailored section by section, and each tailored section is stored
+under (section hash, job description hash, model, prompt version). Tailoring
+the resume again, after the user edited one bullet or for the same posting
+pasted with different whitespace, sends only the sections whose hash has no
+stored tailoring to the LLM, and converts only those to LaTeX; the others are
+read in one query. The header is never tailored. Concurrent runs needing the
+same section share one LLM call, like skill analyses.
+"""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..database import get_engine
+from ..skills.exceptions import EmptyJobDescription
+from ..skills.utils import hash_job_description, normalize_job_description
+from .config import TailoringConfig, get_tailoring_settings
+from .constants import UNTAILORED_KINDS
+from .latex import resume_document, section_latex
+from .models import TailoredSectionRecord
+from .prompts import SECTION_TAILORING_PROMPT_VERSION
+from .schemas import (
+    ResumeSection,
+    TailoredResume,
+    TailoredSection,
+    TailoringReport,
+    TailorResumeRequest,
+)
+from .tailorer import SectionTailorer, load_tailorer
+from .utils import hash_section
+
+_table = TailoredSectionRecord.__table__
+
+# (section hash, job description hash, model, prompt version)
+SectionKey = tuple[str, str, str, str]
+
+
+class _Tailored(NamedTuple):
+    content: str
+    latex: str
+    input_tokens: int
+    output_tokens: int
+    latency_ms: int
+    cached: bool
+
+
+class TailoringService:
+    """Tailor resumes to job descriptions, calling the LLM only for changed sections."""
+
+    def __init__(
+        self, engine: AsyncEngine, tailorer: SectionTailorer, config: TailoringConfig
+    ) -> None:
+        # Single statements in autocommit; always the primary, so a section
+        # tailored by another worker is visible immediately
+        self._engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+        self._tailorer = tailorer
+        self._config = config
+        self._inflight: dict[SectionKey, asyncio.Task[_Tailored]] = {}
+        self.tailored = 0  # LLM calls
+        self.reused = 0  # served from the table
+        self.coalesced = 0  # joined an in-flight tailoring
+
+    async def tailor(self, request: TailorResumeRequest) -> TailoredResume:
+        """
+        Tailor a resume to a job description, reusing every unchanged section.
+
+        Args:
+            request: The resume's sections and the job description.
+
+        Returns:
+            The tailored sections, the LaTeX document (render it with
+            ``RenderService.render(latex, template=TEMPLATE)``) and a report
+            of the tokens and time spent and saved.
+
+        Raises:
+            EmptyJobDescription: If the job description is empty after normalization.
+        """
+        started = time.perf_counter()
+        text = normalize_job_description(request.job_description)
+        if not text:
+            raise EmptyJobDescription
+        job_description_hash = hash_job_description(text)
+        model = self._tailorer.model
+
+        hashes = [
+            hash_section(section.kind, section.title, section.content)
+            for section in request.sections
+        ]
+        pending = {
+            section_hash: section
+            for section_hash, section in zip(hashes, request.sections, strict=True)
+            if section.kind not in UNTAILORED_KINDS
+        }
+        results = await self._load(job_description_hash, list(pending))
+
+        semaphore = asyncio.Semaphore(self._config.tailoring_max_concurrency)
+
+        async def tailor_section(section_hash: str) -> _Tailored:
+            async with semaphore:
+                key = (section_hash, job_description_hash, model, SECTION_TAILORING_PROMPT_VERSION)
+                return await self._tailor_shared(key, pending[section_hash], text)
+
+        dirty = [section_hash for section_hash in pending if section_hash not in results]
+        tailored = await asyncio.gather(*map(tailor_section, dirty))
+        results.update(zip(dirty, tailored, strict=True))
+
+        sections = []
+        fragments = []
+        for section_hash, section in zip(hashes, request.sections, strict=True):
+            result = results.get(section_hash)
+            if result is None:  # not tailored
+                content = section.content
+                fragments.append(section_latex(section.kind, section.title, section.content))
+            else:
+                content = result.content
+                fragments.append(result.latex)
+            sections.append(
+                TailoredSection(
+                    kind=section.kind,
+                    title=section.title,
+                    content=content,
+                    section_hash=section_hash,
+                    cached=result is not None and result.cached,
+                )
+            )
+
+        spent = [result for result in results.values() if not result.cached]
+        saved = [result for result in results.values() if result.cached]
+        report = TailoringReport(
+            sections=len(sections),
+            tailored=len(spent),
+            reused=len(saved),
+            input_tokens=sum(result.input_tokens for result in spent),
+            output_tokens=sum(result.output_tokens for result in spent),
+            tokens_saved=sum(result.input_tokens + result.output_tokens for result in saved),
+            llm_seconds=sum(result.latency_ms for result in spent) / 1000,
+            llm_seconds_saved=sum(result.latency_ms for result in saved) / 1000,
+            seconds=round(time.perf_counter() - started, 3),
+        )
+        return TailoredResume(
+            job_description_hash=job_description_hash,
+            model=model,
+            prompt_version=SECTION_TAILORING_PROMPT_VERSION,
+            sections=sections,
+            latex=resume_document(fragments),
+            report=report,
+        )
+
+    async def _load(
+        self, job_description_hash: str, section_hashes: Sequence[str]
+    ) -> dict[str, _Tailored]:
+        if not section_hashes:
+            return {}
+        statement = select(
+            _table.c.section_hash,
+            _table.c.content,
+            _table.c.latex,
+            _table.c.input_tokens,
+            _table.c.output_tokens,
+            _table.c.latency_ms,
+        ).where(
+            _table.c.section_hash.in_(section_hashes),
+            _table.c.job_description_hash == job_description_hash,
+            _table.c.model == self._tailorer.model,
+            _table.c.prompt_version == SECTION_TAILORING_PROMPT_VERSION,
+        )
+        async with self._engine.connect() as conn:
+            rows = (await conn.execute(statement)).all()
+        self.reused += len(rows)
+        return {
+            row.section_hash: _Tailored(
+                row.content,
+                row.latex,
+                row.input_tokens,
+                row.output_tokens,
+                row.latency_ms,
+                cached=True,
+            )
+            for row in rows
+        }
+
+    async def _tailor_shared(self, key: SectionKey, section: ResumeSection, text: str) -> _Tailored:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return (await asyncio.shield(task))._replace(cached=True)
+
+        task = asyncio.create_task(self._tailor_and_store(key, section, text))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        # Shielded: a cancelled run must not cancel the LLM call others wait on
+        return await asyncio.shield(task)
+
+    def _forget(self, key: SectionKey, task: asyncio.Task[_Tailored]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve a failure even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _tailor_and_store(
+        self, key: SectionKey, section: ResumeSection, text: str
+    ) -> _Tailored:
+        section_hash, job_description_hash, model, prompt_version = key
+        self.tailored += 1
+        started = time.perf_counter()
+        tailoring = await self._tailorer.tailor(section, text)
+        latency_ms = round((time.perf_counter() - started) * 1000)
+        latex = section_latex(section.kind, section.title, tailoring.content)
+
+        # Stored as soon as it is ready, so a run that fails on a later section
+        # still saves the LLM calls that succeeded
+        statement = (
+            insert(_table)
+            .values(
+                section_hash=section_hash,
+                job_description_hash=job_description_hash,
+                model=model,
+                prompt_version=prompt_version,
+                content=tailoring.content,
+                latex=latex,
+                input_tokens=tailoring.input_tokens,
+                output_tokens=tailoring.output_tokens,
+                latency_ms=latency_ms,
+            )
+            .on_conflict_do_nothing()
+        )
+        async with self._engine.connect() as conn:
+            await conn.execute(statement)
+        return _Tailored(
+            tailoring.content,
+            latex,
+            tailoring.input_tokens,
+            tailoring.output_tokens,
+            latency_ms,
+            cached=False,
+        )
+
+
+@lru_cache
+def get_tailoring_service() -> TailoringService:
+    """Get the process-wide tailoring service, with the ``TAILORING_TAILORER`` backend."""
+    config = get_tailoring_settings()
+    return TailoringService(get_engine(), load_tailorer(config), config)
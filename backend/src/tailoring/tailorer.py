@@ -0,0 +1,136 @@
+"""Section tailoring backends (the LLM call behind a tailored section)."""
+
+import importlib
+import re
+from typing import Any, Protocol
+
+from .config import TailoringConfig
+from .constants import BULLET_MARKERS
+from .prompts import SECTION_TAILORING_PROMPT
+from .schemas import ResumeSection, SectionTailoring
+
+# Words, keeping "C#", "C++" and "Node.js" whole but not a sentence's final period
+_WORD = re.compile(r"[^\W_](?:[\w+#]|\.(?=\w))*")
+# Too common in job descriptions to tell list items apart
+_STOP_WORDS = frozenset(
+    [
+        "a",
+        "an",
+        "and",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "in",
+        "is",
+        "of",
+        "on",
+        "or",
+        "our",
+        "the",
+        "to",
+        "we",
+        "will",
+        "with",
+        "you",
+        "your",
+    ]
+)
+
+
+class SectionTailorer(Protocol):
+    """Tailors one resume section to a normalized job description."""
+
+    # Identifies the model in the tailored section cache key (e.g. "gpt-4o-mini")
+    model: str
+
+    async def tailor(self, section: ResumeSection, job_description: str) -> SectionTailoring: ...
+
+
+class ChatModelSectionTailorer:
+    """
+    Section tailorer backed by a LangChain chat model.
+
+    Token counts come from the reply's ``usage_metadata`` (0 when the model
+    does not report them). The model object is built by the caller, so this
+    module does not import LangChain.
+
+    Example:
+        >>> from langchain.chat_models import init_chat_model
+        >>> tailorer = ChatModelSectionTailorer(init_chat_model("gpt-4o-mini"), "gpt-4o-mini")
+    """
+
+    def __init__(self, chat_model: Any, model: str) -> None:
+        self.model = model
+        self._chat_model = chat_model
+
+    async def tailor(self, section: ResumeSection, job_description: str) -> SectionTailoring:
+        message = await self._chat_model.ainvoke(
+            [
+                ("system", SECTION_TAILORING_PROMPT),
+                (
+                    "human",
+                    f"Job description:\n{job_description}\n\n"
+                    f"Resume section ({section.kind.value}): {section.title}\n{section.content}",
+                ),
+            ]
+        )
+        usage = getattr(message, "usage_metadata", None) or {}
+        return SectionTailoring(
+            content=str(message.content).strip(),
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+        )
+
+
+class KeywordSectionTailorer:
+    """
+    Offline section tailorer: the list items matching the job description go first.
+
+    Within each run of list items, items are stably sorted by how many distinct
+    words they share with the job description; nothing is rewritten, added or
+    removed. It needs no model or network access and is deterministic, so
+    development and tests run offline.
+
+    Example:
+        >>> import asyncio
+        >>> section = ResumeSection(kind="experience", content="- Built a CRM\\n- Ran Kafka")
+        >>> asyncio.run(KeywordSectionTailorer().tailor(section, "Kafka streams")).content
+        '- Ran Kafka\\n- Built a CRM'
+    """
+
+    model = "keyword-order-v1"
+
+    async def tailor(self, section: ResumeSection, job_description: str) -> SectionTailoring:
+        wanted = _words(job_description)
+        lines: list[str] = []
+        items: list[str] = []
+        for line in [*section.content.split("\n"), ""]:
+            if line.strip().startswith(BULLET_MARKERS):
+                items.append(line)
+                continue
+            items.sort(key=lambda item: -len(_words(item) & wanted))
+            lines.extend(items)
+            items.clear()
+            lines.append(line)
+        return SectionTailoring(content="\n".join(lines[:-1]))
+
+
+def _words(text: str) -> set[str]:
+    return set(_WORD.findall(text.casefold())) - _STOP_WORDS
+
+
+def load_tailorer(config: TailoringConfig) -> SectionTailorer:
+    """
+    Build the configured section tailorer.
+
+    Returns:
+        The result of calling ``TAILORING_TAILORER`` ("module:attribute"), or a
+        ``KeywordSectionTailorer`` when it is not set.
+    """
+    if config.tailoring_tailorer is None:
+        return KeywordSectionTailorer()
+    module, _, attribute = config.tailoring_tailorer.partition(":")
+    return getattr(importlib.import_module(module), attribute)()
@@ -0,0 +1,25 @@
+"""Resume section hashing."""
+
+import hashlib
+
+from ..skills.utils import normalize_job_description
+from .constants import SectionKind
+
+
+def hash_section(kind: SectionKind, title: str, content: str) -> str:
+    """
+    SHA-256 hex digest of a section, ignoring whitespace-only differences.
+
+    The content is normalized like a job description, so re-indenting a bullet
+    or adding trailing spaces does not make a section dirty.
+
+    Example:
+        >>> a = hash_section(SectionKind.SKILLS, "Skills", "- Python\\n- SQL")
+        >>> a == hash_section(SectionKind.SKILLS, " Skills", "- Python  \\r\\n- SQL\\n")
+        True
+    """
+    digest = hashlib.sha256()
+    for part in (kind.value, title.strip(), normalize_job_description(content)):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()